@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Cost-Ordered Alert Rules
+========================
+Alert rules are AND-chains of predicates, and a fixture alerts on the first
+rule (in priority order) whose predicates all pass.
+
+Each predicate has a cost class:
+- ``FREE``: in-memory values already computed this cycle (minute, corners, momentum)
+- ``CACHED``: in-process caches that may touch a backing store (alert dedup store)
+- ``NETWORK``: SportMonks calls (corner odds, draw price)
+
+Predicates run cheapest-first across all rules still alive. Each one runs at
+most once per fixture, even when several rules share it. A network predicate
+only runs once every cheaper predicate of some surviving rule has passed, so
+fixtures that fail the momentum or corner gates never spend odds calls.
+
+When a failure removes the last rule that needed a network predicate, that
+predicate's ``api_calls`` are credited to the failing predicate.
+``RuleEngine.report()`` and the ``latecorners_rule_api_calls_saved_total``
+metric show how many calls each gate saved.
+"""
+
+import inspect
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import metrics
+
+FREE, CACHED, NETWORK = 0, 1, 2
+
+# Late Momentum thresholds (alert window is 85-89')
+ALERT_WINDOW = (85, 89)
+MIN_COMBINED_MOMENTUM = 75
+MIN_TOTAL_CORNERS = 9
+MAX_DRAW_ODDS = 1.50
+
+rule_api_calls_saved = metrics.registry.counter(
+    'latecorners_rule_api_calls_saved_total', 'SportMonks calls skipped because a cheaper predicate failed',
+    ['predicate'])
+
+
+@dataclass
+class Predicate:
+    """One condition. ``check(ctx)`` returns a bool (or an awaitable of one)"""
+    name: str
+    cost: int
+    check: Callable[['RuleContext'], Any]
+    api_calls: int = 0  # SportMonks calls one evaluation costs
+
+
+@dataclass
+class Rule:
+    name: str
+    predicates: Sequence[Predicate]
+
+
+@dataclass
+class RuleContext:
+    """Per-fixture inputs; network predicates store what they fetch in ``values``"""
+    fixture_id: int
+    minute: int
+    total_corners: int
+    combined_momentum: int
+    values: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class RuleOutcome:
+    rule: Optional[str]               # Name of the rule that passed, or None
+    results: Dict[str, bool]          # Predicates evaluated -> result
+    failed: List[str]                 # Predicates that failed, in evaluation order
+    api_calls: int = 0
+    api_calls_saved: int = 0
+
+
+class RuleEngine:
+    """Evaluates prioritized rules with cheapest-first short-circuiting"""
+
+    def __init__(self, rules: Sequence[Rule]):
+        self.rules = list(rules)
+        self._lock = threading.Lock()
+        self._evaluated: Dict[str, int] = {}
+        self._failed: Dict[str, int] = {}
+        self._saved: Dict[str, int] = {}
+        self._spent = 0
+
+    async def evaluate(self, ctx: RuleContext) -> RuleOutcome:
+        results: Dict[str, bool] = {}
+        failed: List[str] = []
+        eliminated_by: Dict[str, str] = {}  # rule name -> predicate whose failure removed it (in order)
+        alive = list(self.rules)
+        winner = None
+
+        while alive:
+            # The highest-priority surviving rule wins as soon as all its predicates have passed
+            if all(results.get(p.name) for p in alive[0].predicates):
+                winner = alive[0]
+                break
+            pending = [p for rule in alive for p in rule.predicates if p.name not in results]
+            predicate = min(pending, key=lambda p: p.cost)  # Stable: earlier rules break ties
+            outcome = predicate.check(ctx)
+            if inspect.isawaitable(outcome):
+                outcome = await outcome
+            results[predicate.name] = bool(outcome)
+            if not outcome:
+                failed.append(predicate.name)
+                for rule in alive:
+                    if any(p.name == predicate.name for p in rule.predicates):
+                        eliminated_by[rule.name] = predicate.name
+                alive = [rule for rule in alive if rule.name not in eliminated_by]
+
+        predicates = {p.name: p for rule in self.rules for p in rule.predicates}
+        spent = sum(p.api_calls for name, p in predicates.items() if name in results)
+        saved: Dict[str, int] = {}
+        for name, predicate in predicates.items():
+            if not predicate.api_calls or name in results:
+                continue
+            # Credit the failure that removed the last rule needing this call (a win saves nothing)
+            needed_by = {rule.name for rule in self.rules if any(p.name == name for p in rule.predicates)}
+            if needed_by.issubset(eliminated_by):
+                by = [eliminated_by[rule_name] for rule_name in eliminated_by if rule_name in needed_by][-1]
+                saved[by] = saved.get(by, 0) + predicate.api_calls
+
+        with self._lock:
+            for name, result in results.items():
+                self._evaluated[name] = self._evaluated.get(name, 0) + 1
+                if not result:
+                    self._failed[name] = self._failed.get(name, 0) + 1
+            for name, calls in saved.items():
+                self._saved[name] = self._saved.get(name, 0) + calls
+            self._spent += spent
+        for name, calls in saved.items():
+            rule_api_calls_saved.inc(calls, predicate=name)
+
+        return RuleOutcome(rule=winner.name if winner else None, results=results, failed=failed,
+                           api_calls=spent, api_calls_saved=sum(saved.values()))
+
+    def report(self) -> Dict[str, Any]:
+        """Per-predicate evaluations, failures and API calls saved since start"""
+        with self._lock:
+            return {
+                'api_calls': self._spent,
+                'api_calls_saved': sum(self._saved.values()),
+                'predicates': {
+                    name: {'evaluated': count, 'failed': self._failed.get(name, 0),
+                           'api_calls_saved': self._saved.get(name, 0)}
+                    for name, count in self._evaluated.items()
+                },
+            }
+
+
+def late_momentum_rules(is_alerted: Callable[[int], bool],
+                        fetch_corner_odds: Callable[[int], Any],
+                        fetch_draw_odds: Callable[[int], Any]) -> List[Rule]:
+    """
+    The two Late Momentum rules, in priority order. Fetchers may be sync or async;
+    their results are kept in ``ctx.values['corner_odds']`` / ``ctx.values['draw_odds']``.
+    """
+    async def _resolve(value):
+        return await value if inspect.isawaitable(value) else value
+
+    async def corner_odds(ctx: RuleContext) -> bool:
+        ctx.values['corner_odds'] = await _resolve(fetch_corner_odds(ctx.fixture_id))
+        return bool(ctx.values['corner_odds'])
+
+    async def draw_price(ctx: RuleContext) -> bool:
+        ctx.values['draw_odds'] = await _resolve(fetch_draw_odds(ctx.fixture_id))
+        return ctx.values['draw_odds'] is not None and ctx.values['draw_odds'] <= MAX_DRAW_ODDS
+
+    window = Predicate('alert_window', FREE, lambda ctx: ALERT_WINDOW[0] <= ctx.minute <= ALERT_WINDOW[1])
+    not_alerted = Predicate('not_alerted', CACHED, lambda ctx: not is_alerted(ctx.fixture_id))
+    momentum = Predicate('momentum', FREE, lambda ctx: ctx.combined_momentum >= MIN_COMBINED_MOMENTUM)
+    corners = Predicate('corners', FREE, lambda ctx: ctx.total_corners >= MIN_TOTAL_CORNERS)
+    odds = Predicate('corner_odds', NETWORK, corner_odds, api_calls=1)
+    draw = Predicate('draw_price', NETWORK, draw_price, api_calls=2)  # Fulltime Result: up to two requests
+
+    return [
+        Rule('LATE_MOMENTUM', [window, not_alerted, momentum, corners, odds]),
+        Rule('LATE_MOMENTUM_DRAW', [window, not_alerted, momentum, odds, draw]),
+    ]
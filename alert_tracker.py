@@ -15,7 +15,14 @@ class AlertTracker:
     """Track and save alerts from the new systems (Late Momentum and Draw Odds)."""
     
     def __init__(self):
-        self.db = get_database()
+        self._db = None
+    
+    @property
+    def db(self):
+        """Database connection, opened on first use"""
+        if self._db is None:
+            self._db = get_database()
+        return self._db
     
     def save_elite_alert(self, match_data: Dict, tier: str, score: float, conditions: list,
                         momentum_indicators: Dict = None, detected_patterns: List[Dict] = None) -> bool:
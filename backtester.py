@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Late Momentum Backtester
+========================
+Replays minute-by-minute snapshots through ``MomentumTracker`` and the two
+alert rules from ``LateCornerMonitor._monitor_single_match``:
+
+- Late Momentum: 85-89', corner odds available, corners >= 9, combined Momentum10 >= 75
+- Draw odds:     85-89', corner odds available, draw odds <= 1.50, combined Momentum10 >= 75
+
+Building a dataset is the only per-fixture Python work. Every snapshot is fed
+to ``MomentumTracker``, but scores are only computed for the alert-window
+minutes. The result is a set of (fixtures x window-minutes) NumPy arrays.
+Threshold sweeps then run fully vectorized over fixtures x minutes x
+thresholds, so re-evaluating a season for hundreds of combinations takes
+seconds.
+
+Each simulated alert fires at the first window minute where either rule
+holds, once per fixture (the idempotency rule). It is graded like
+ResultChecker: Over (corners at alert + 1), WIN if final > line, REFUND if
+equal, LOSS otherwise.
+
+Sources: snapshot_store day files (``--store``), feed_recorder logs
+(``--recording``) or synthetic match days (``--synthetic``). Datasets can be
+saved as ``.npz`` and reloaded.
+
+    python backtester.py --recording recordings/day.jsonl.gz --momentum 50:100:5 --corners 6:12 --draw 1.3:1.7:0.05
+"""
+
+import argparse
+import json
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from momentum_tracker import MomentumTracker
+
+# Alert window used by the live engine (inclusive)
+ALERT_WINDOW = (85, 89)
+# Fixtures must have been seen at least this late for their final corner count to be trusted
+MIN_FINAL_MINUTE = 90
+# Live rule thresholds (the baseline every sweep is compared against)
+DEFAULT_MOMENTUM_THRESHOLD = 75
+DEFAULT_CORNER_THRESHOLD = 9
+DEFAULT_DRAW_THRESHOLD = 1.50
+# Over line = corners at alert + LINE_OFFSET (whole-number lines, so equal means refund)
+LINE_OFFSET = 1
+DRAW_LABELS = {'x', 'draw', 'tie'}
+FULLTIME_RESULT_MARKET_ID = 1
+
+
+class BacktestDataset:
+    """Alert-window arrays (fixtures x window minutes) plus each fixture's final corner count"""
+
+    def __init__(self, fixture_ids: np.ndarray, momentum: np.ndarray, corners: np.ndarray,
+                 draw_odds: np.ndarray, has_odds: np.ndarray, observed: np.ndarray, final_corners: np.ndarray):
+        self.fixture_ids = fixture_ids
+        self.momentum = momentum
+        self.corners = corners
+        self.draw_odds = draw_odds
+        self.has_odds = has_odds
+        self.observed = observed
+        self.final_corners = final_corners
+
+    def __len__(self) -> int:
+        return len(self.fixture_ids)
+
+    def save(self, path: str) -> None:
+        np.savez_compressed(path, fixture_ids=self.fixture_ids, momentum=self.momentum, corners=self.corners,
+                            draw_odds=self.draw_odds, has_odds=self.has_odds, observed=self.observed,
+                            final_corners=self.final_corners)
+
+    @classmethod
+    def load(cls, path: str) -> 'BacktestDataset':
+        with np.load(path) as data:
+            return cls(**{name: data[name] for name in data.files})
+
+
+class DatasetBuilder:
+    """Collects snapshots in any order, then runs MomentumTracker per fixture in minute order"""
+
+    def __init__(self, window: Tuple[int, int] = ALERT_WINDOW, momentum_window_minutes: int = 10):
+        self.window = window
+        self.momentum_window_minutes = momentum_window_minutes
+        # fixture_id -> minute -> (home, away, total_corners)
+        self._snapshots: Dict[int, Dict[int, Tuple[Dict, Dict, int]]] = defaultdict(dict)
+        # fixture_id -> minute -> value (forward-filled later)
+        self._has_odds: Dict[int, Dict[int, bool]] = defaultdict(dict)
+        self._draw_odds: Dict[int, Dict[int, float]] = defaultdict(dict)
+
+    def add_snapshot(self, fixture_id: int, minute: int, home: Dict, away: Dict, total_corners: int) -> None:
+        """Latest snapshot per minute wins, like the live tracker's view at the end of each minute"""
+        self._snapshots[fixture_id][minute] = (home, away, total_corners)
+
+    def add_odds(self, fixture_id: int, minute: int, has_corner_odds: Optional[bool] = None,
+                 draw_odds: Optional[float] = None) -> None:
+        if has_corner_odds is not None:
+            self._has_odds[fixture_id][minute] = has_corner_odds
+        if draw_odds is not None:
+            self._draw_odds[fixture_id][minute] = draw_odds
+
+    def add_dashboard_matches(self, matches: Iterable[Dict]) -> None:
+        """Snapshots from dashboard match dicts - exactly what the live engine receives"""
+        for m in matches:
+            home = m['statistics'].get('home', {})
+            away = m['statistics'].get('away', {})
+            corners = int(home.get('corners', 0) or 0) + int(away.get('corners', 0) or 0)
+            self.add_snapshot(m['match_id'], m['minute'], home, away, corners)
+
+    @staticmethod
+    def _forward_fill(values: Dict[int, object], minute: int, default):
+        known = [m for m in values if m <= minute]
+        return values[max(known)] if known else default
+
+    def build(self) -> BacktestDataset:
+        lo, hi = self.window
+        width = hi - lo + 1
+        fixture_ids: List[int] = []
+        rows = {name: [] for name in ('momentum', 'corners', 'draw_odds', 'has_odds', 'observed')}
+        finals: List[int] = []
+
+        for fixture_id, by_minute in self._snapshots.items():
+            minutes = sorted(by_minute)
+            if minutes[-1] < MIN_FINAL_MINUTE:
+                continue  # Never saw the end - can't grade it
+
+            tracker = MomentumTracker(window_minutes=self.momentum_window_minutes)
+            momentum = np.zeros(width, dtype=np.int32)
+            corners = np.zeros(width, dtype=np.int16)
+            observed = np.zeros(width, dtype=bool)
+            for minute in minutes:
+                home, away, total_corners = by_minute[minute]
+                tracker.add_snapshot(fixture_id, minute, _momentum_stats(home), _momentum_stats(away))
+                if lo <= minute <= hi:
+                    scores = tracker.compute_scores(fixture_id)
+                    momentum[minute - lo] = scores['home']['total'] + scores['away']['total']
+                    corners[minute - lo] = total_corners
+                    observed[minute - lo] = True
+
+            window_minutes = range(lo, hi + 1)
+            has_odds = np.array([bool(self._forward_fill(self._has_odds[fixture_id], m, False))
+                                 for m in window_minutes])
+            draw_odds = np.array([self._forward_fill(self._draw_odds[fixture_id], m, np.nan)
+                                  for m in window_minutes], dtype=np.float32)
+
+            fixture_ids.append(fixture_id)
+            rows['momentum'].append(momentum)
+            rows['corners'].append(corners)
+            rows['draw_odds'].append(draw_odds)
+            rows['has_odds'].append(has_odds)
+            rows['observed'].append(observed)
+            finals.append(by_minute[minutes[-1]][2])
+
+        def stack(name, dtype):
+            return np.array(rows[name], dtype=dtype).reshape(len(fixture_ids), width)
+
+        return BacktestDataset(
+            fixture_ids=np.array(fixture_ids, dtype=np.int64),
+            momentum=stack('momentum', np.int32),
+            corners=stack('corners', np.int16),
+            draw_odds=stack('draw_odds', np.float32),
+            has_odds=stack('has_odds', bool),
+            observed=stack('observed', bool),
+            final_corners=np.array(finals, dtype=np.int16),
+        )
+
+
+def _momentum_stats(team: Dict) -> Dict[str, int]:
+    return {
+        'shots_on_target': team.get('shots_on_target', 0),
+        'shots_off_target': team.get('shots_off_target', 0),
+        'dangerous_attacks': team.get('dangerous_attacks', 0),
+        'possession': team.get('possession', 0),
+    }
+
+
+def _draw_price(all_odds: List[Dict]) -> Optional[float]:
+    """Lowest Fulltime Result draw price in an inplay odds list (what get_live_draw_odds looks for)"""
+    prices = []
+    for odds in all_odds:
+        if odds.get('market_id') == FULLTIME_RESULT_MARKET_ID and (odds.get('label') or '').strip().lower() in DRAW_LABELS:
+            try:
+                prices.append(float(odds.get('value')))
+            except (TypeError, ValueError):
+                pass
+    return min(prices) if prices else None
+
+
+def dataset_from_recording(path: str, window: Tuple[int, int] = ALERT_WINDOW) -> BacktestDataset:
+    """Build a dataset from a feed_recorder log (inplay frames + odds frames)"""
+    import web_dashboard
+    from feed_recorder import read_frames
+
+    builder = DatasetBuilder(window)
+    current_minute: Dict[int, int] = {}
+    for frame in read_frames(path):
+        body = frame.get('body') or {}
+        data = body.get('data') if isinstance(body, dict) else None
+        if not data or frame.get('status', 200) != 200:
+            continue
+        if frame['path'] == '/livescores/inplay':
+            matches = web_dashboard.parse_live_matches(data)
+            builder.add_dashboard_matches(matches)
+            current_minute.update((m['match_id'], m['minute']) for m in matches)
+        elif frame['path'].startswith('/odds/inplay/fixtures/'):
+            fixture_id = int(frame['path'].rsplit('/', 1)[-1])
+            if fixture_id in current_minute:
+                builder.add_odds(fixture_id, current_minute[fixture_id],
+                                 has_corner_odds=web_dashboard.parse_corner_odds(data)['available'],
+                                 draw_odds=_draw_price(data))
+    return builder.build()
+
+
+def dataset_from_store(directory: str, start: str, end: Optional[str] = None,
+                       window: Tuple[int, int] = ALERT_WINDOW) -> BacktestDataset:
+    """Build a dataset from snapshot_store day files (``start``/``end`` are YYYY-MM-DD)"""
+    from snapshot_store import TEAM_FIELDS, SnapshotStore
+
+    records = SnapshotStore(directory).read_range(start, end)
+    builder = DatasetBuilder(window)
+    for record in records[np.argsort(records['ts'], kind='stable')]:
+        home, away = ({name: max(0, int(record[f"{side}_{name}"])) for name in TEAM_FIELDS}
+                      for side in ('home', 'away'))
+        fixture_id, minute = int(record['fixture_id']), int(record['minute'])
+        builder.add_snapshot(fixture_id, minute, home, away, home['corners'] + away['corners'])
+        builder.add_odds(fixture_id, minute, has_corner_odds=bool(record['corner_odds_available']))
+    return builder.build()
+
+
+def dataset_from_synthetic(fixtures: int = 500, cycles: int = 400, seed: int = 42,
+                           window: Tuple[int, int] = ALERT_WINDOW) -> BacktestDataset:
+    """Build a dataset from a synthetic match day (odds always offered in the 70-90' window)"""
+    import web_dashboard
+    from synthetic_feed import SyntheticMatchDay
+
+    day = SyntheticMatchDay(fixtures=fixtures, seed=seed, minutes_per_cycle=1.0)
+    builder = DatasetBuilder(window)
+    for _ in range(cycles):
+        matches = web_dashboard.parse_live_matches(day.inplay_payload()['data'])
+        builder.add_dashboard_matches(matches)
+        for m in matches:
+            if 70 <= m['minute'] <= 90:
+                builder.add_odds(m['match_id'], m['minute'], has_corner_odds=True)
+        day.advance()
+    return builder.build()
+
+
+def sweep(dataset: BacktestDataset, momentum_thresholds: Sequence[float] = (DEFAULT_MOMENTUM_THRESHOLD,),
+          corner_thresholds: Sequence[int] = (DEFAULT_CORNER_THRESHOLD,),
+          draw_thresholds: Sequence[float] = (DEFAULT_DRAW_THRESHOLD,),
+          line_offset: int = LINE_OFFSET) -> List[Dict]:
+    """Evaluate every threshold combination; one result dict per (momentum, corners, draw)"""
+    mom_t = np.asarray(momentum_thresholds, dtype=np.float64)
+    cor_t = np.asarray(corner_thresholds, dtype=np.float64)
+    drw_t = np.asarray(draw_thresholds, dtype=np.float64)
+    n_fixtures, width = dataset.momentum.shape
+
+    eligible = dataset.observed & dataset.has_odds                    # (F, W)
+    draw = np.where(np.isnan(dataset.draw_odds), np.inf, dataset.draw_odds)
+    # Threshold-independent of momentum: (C, F, W) and (D, F, W)
+    corners_ok = dataset.corners[None, :, :] >= cor_t[:, None, None]
+    draw_ok = draw[None, :, :] <= drw_t[:, None, None]
+    final = dataset.final_corners.astype(np.int32)
+    fixture_index = np.arange(n_fixtures)
+
+    results: List[Dict] = []
+    for momentum_threshold in mom_t:
+        base = eligible & (dataset.momentum >= momentum_threshold)      # (F, W)
+        late = base[None, :, :] & corners_ok                            # (C, F, W)
+        by_draw = base[None, :, :] & draw_ok                            # (D, F, W)
+        fired = late[:, None, :, :] | by_draw[None, :, :, :]            # (C, D, F, W)
+
+        any_fired = fired.any(axis=-1)                                  # (C, D, F)
+        first = fired.argmax(axis=-1)                                   # (C, D, F)
+        corners_at_alert = dataset.corners[fixture_index[None, None, :], first].astype(np.int32)
+        line = corners_at_alert + line_offset
+        wins = any_fired & (final[None, None, :] > line)
+        refunds = any_fired & (final[None, None, :] == line)
+        via_late = any_fired & np.take_along_axis(
+            np.broadcast_to(late[:, None, :, :], fired.shape), first[..., None], axis=-1)[..., 0]
+
+        alerts = any_fired.sum(axis=-1)
+        n_wins = wins.sum(axis=-1)
+        n_refunds = refunds.sum(axis=-1)
+        n_late = via_late.sum(axis=-1)
+        for ci, corner_threshold in enumerate(cor_t):
+            for di, draw_threshold in enumerate(drw_t):
+                a, w, r = int(alerts[ci, di]), int(n_wins[ci, di]), int(n_refunds[ci, di])
+                losses = a - w - r
+                results.append({
+                    'momentum_threshold': float(momentum_threshold),
+                    'corner_threshold': int(corner_threshold),
+                    'draw_threshold': round(float(draw_threshold), 4),
+                    'alerts': a,
+                    'late_momentum_alerts': int(n_late[ci, di]),
+                    'draw_alerts': a - int(n_late[ci, di]),
+                    'wins': w,
+                    'refunds': r,
+                    'losses': losses,
+                    'hit_rate': round(w / a, 4) if a else None,
+                    'refund_rate': round(r / a, 4) if a else None,
+                    'win_rate_excl_refunds': round(w / (w + losses), 4) if (w + losses) else None,
+                })
+    return results
+
+
+def _parse_range(spec: str, cast=float) -> List:
+    """'75' -> [75]; '60:100:5' -> [60, 65, ..., 100] (inclusive)"""
+    parts = [cast(p) for p in spec.split(':')]
+    if len(parts) == 1:
+        return parts
+    start, stop = parts[0], parts[1]
+    step = parts[2] if len(parts) > 2 else cast(1)
+    return [cast(round(v, 6)) for v in np.arange(start, stop + step / 2, step)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backtest the Late Momentum alert rules with threshold sweeps')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--recording', help='feed_recorder log to build the dataset from')
+    source.add_argument('--dataset', help='previously saved .npz dataset')
+    source.add_argument('--store', help='snapshot_store directory (use with --start/--end)')
+    source.add_argument('--synthetic', type=int, metavar='FIXTURES', help='use a synthetic match day')
+    parser.add_argument('--start', help='first day to read from --store (YYYY-MM-DD)')
+    parser.add_argument('--end', help='last day to read from --store (defaults to --start)')
+    parser.add_argument('--save-dataset', help='write the built dataset to this .npz path')
+    parser.add_argument('--momentum', default=str(DEFAULT_MOMENTUM_THRESHOLD), help='value or start:stop[:step]')
+    parser.add_argument('--corners', default=str(DEFAULT_CORNER_THRESHOLD), help='value or start:stop[:step]')
+    parser.add_argument('--draw', default=f"{DEFAULT_DRAW_THRESHOLD}", help='value or start:stop[:step]')
+    parser.add_argument('--top', type=int, default=10, help='combinations to print, by hit rate')
+    parser.add_argument('--output', help='write every combination as JSON here')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.dataset:
+        dataset = BacktestDataset.load(args.dataset)
+    elif args.store:
+        if not args.start:
+            parser.error('--store needs --start')
+        dataset = dataset_from_store(args.store, args.start, args.end)
+    elif args.recording:
+        dataset = dataset_from_recording(args.recording)
+    else:
+        dataset = dataset_from_synthetic(fixtures=args.synthetic)
+    built = time.perf_counter()
+    if args.save_dataset:
+        dataset.save(args.save_dataset)
+
+    results = sweep(dataset, _parse_range(args.momentum), _parse_range(args.corners, int), _parse_range(args.draw))
+    swept = time.perf_counter()
+
+    print(f"📊 {len(dataset)} gradeable fixtures | dataset {built - started:.2f}s | "
+          f"{len(results)} combinations swept in {swept - built:.3f}s")
+    ranked = sorted((r for r in results if r['alerts']), key=lambda r: (r['hit_rate'], r['alerts']), reverse=True)
+    for r in ranked[:args.top]:
+        print(f"   MOM≥{r['momentum_threshold']:g} CORNERS≥{r['corner_threshold']} DRAW≤{r['draw_threshold']:g}: "
+              f"{r['alerts']} alerts | hit {r['hit_rate']:.1%} | refund {r['refund_rate']:.1%}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'fixtures': len(dataset), 'results': results}, f, indent=2)
+        print(f"✅ Sweep written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
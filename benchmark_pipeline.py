@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark
+==================
+Measures each stage of the live pipeline on synthetic match days
+(synthetic_feed.py) at increasing numbers of concurrent fixtures. No network.
+
+Stages, timed per update cycle:
+- decode:     json.loads of the raw /livescores/inplay body
+- parse:      web_dashboard.parse_live_matches (raw fixtures -> dashboard matches)
+- momentum:   MomentumTracker.add_snapshot + compute_scores for every fixture
+- momentum_batch: the same scores from BatchMomentumEngine (one vectorized call)
+- odds_index: decode + web_dashboard.parse_corner_odds for every 70-90' fixture
+- evaluation: the engine's per-fixture path (dashboard -> SportMonks format -> MatchStats)
+- render:     LiveSnapshotPublisher.publish + gzip body for /api/live-matches
+
+Payload generation happens before timing. Results are written as JSON.
+
+    python benchmark_pipeline.py --scales 50,500,5000 --cycles 5 --output benchmark.json
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+DEFAULT_SCALES = (50, 500, 5000)
+STAGES = ('decode', 'parse', 'momentum', 'momentum_batch', 'odds_index', 'evaluation', 'render')
+
+
+def _prepare_environment() -> None:
+    """The engine's config validation needs these; nothing here talks to the network"""
+    os.environ.setdefault('SPORTMONKS_API_KEY', 'benchmark')
+    os.environ.setdefault('TELEGRAM_BOT_TOKEN', 'benchmark')
+    os.environ.setdefault('TELEGRAM_CHAT_ID', 'benchmark')
+    os.environ['IDEMPOTENCY_PERSIST'] = 'false'
+    os.environ['MOMENTUM_CHECKPOINT_PATH'] = ''
+    os.environ['MOMENTUM_CHECKPOINT_DB'] = 'false'
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def _summarize(latencies_ms: List[float], items: List[int]) -> Dict:
+    total_seconds = sum(latencies_ms) / 1000
+    total_items = sum(items)
+    return {
+        'p50_ms': round(_percentile(latencies_ms, 50), 3),
+        'p95_ms': round(_percentile(latencies_ms, 95), 3),
+        'max_ms': round(max(latencies_ms), 3),
+        'items_per_cycle': round(total_items / len(items), 1),
+        'throughput_per_s': round(total_items / total_seconds, 1) if total_seconds > 0 else None,
+    }
+
+
+def _timed(fn: Callable[[], int]):
+    start = time.perf_counter()
+    items = fn()
+    return (time.perf_counter() - start) * 1000, items
+
+
+def run_scale(fixtures: int, cycles: int, seed: int = 42) -> Dict:
+    """Benchmark every stage over ``cycles`` update cycles with ``fixtures`` concurrent fixtures"""
+    import web_dashboard
+    from live_snapshot import LiveSnapshotPublisher
+    from main import LateCornerMonitor
+    from momentum_batch import BatchMomentumEngine
+    from momentum_tracker import MomentumTracker
+    from synthetic_feed import SyntheticMatchDay
+
+    day = SyntheticMatchDay(fixtures=fixtures, seed=seed)
+    # Pre-generate and pre-encode every payload so generation cost is excluded
+    inplay_bodies: List[str] = []
+    odds_bodies: List[List[str]] = []
+    for _ in range(cycles):
+        inplay_bodies.append(json.dumps(day.inplay_payload()))
+        odds_bodies.append([json.dumps(day.odds_payload(fid)) for fid in day.fixtures_in_window()])
+        day.advance()
+
+    tracker = MomentumTracker(window_minutes=10)
+    batch_engine = BatchMomentumEngine(window_minutes=10)
+    monitor = LateCornerMonitor(send_alert=lambda **kwargs: True, track_alert=lambda **kwargs: True)
+    publisher = LiveSnapshotPublisher()
+    timings: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+    counts: Dict[str, List[int]] = {stage: [] for stage in STAGES}
+
+    gc.collect()
+    for cycle in range(cycles):
+        state: Dict = {}
+
+        def decode():
+            state['raw'] = json.loads(inplay_bodies[cycle])['data']
+            return len(state['raw'])
+
+        def parse():
+            state['matches'] = web_dashboard.parse_live_matches(state['raw'])
+            return len(state['matches'])
+
+        def momentum():
+            for m in state['matches']:
+                home, away = m['statistics']['home'], m['statistics']['away']
+                tracker.add_snapshot(
+                    fixture_id=m['match_id'], minute=m['minute'],
+                    home={'shots_on_target': home.get('shots_on_target', 0), 'shots_off_target': 0,
+                          'dangerous_attacks': home.get('dangerous_attacks', 0), 'possession': home.get('possession', 0)},
+                    away={'shots_on_target': away.get('shots_on_target', 0), 'shots_off_target': 0,
+                          'dangerous_attacks': away.get('dangerous_attacks', 0), 'possession': away.get('possession', 0)},
+                )
+                tracker.compute_scores(m['match_id'])
+            return len(state['matches'])
+
+        def momentum_batch():
+            batch_engine.add_dashboard_matches(state['matches'])
+            batch_engine.compute_all()
+            return len(state['matches'])
+
+        def odds_index():
+            for body in odds_bodies[cycle]:
+                web_dashboard.parse_corner_odds(json.loads(body)['data'])
+            return len(odds_bodies[cycle])
+
+        def evaluation():
+            for m in state['matches']:
+                monitor._parse_match_data_from_shared(monitor._convert_dashboard_to_sportmonks_format(m))
+            return len(state['matches'])
+
+        def render():
+            publisher.publish(state['matches'], {'total_live': len(state['matches'])})
+            publisher.live_matches_body().select('gzip')
+            return len(state['matches'])
+
+        for stage, fn in (('decode', decode), ('parse', parse), ('momentum', momentum),
+                          ('momentum_batch', momentum_batch), ('odds_index', odds_index),
+                          ('evaluation', evaluation), ('render', render)):
+            elapsed_ms, items = _timed(fn)
+            timings[stage].append(elapsed_ms)
+            counts[stage].append(items)
+
+    stages = {stage: _summarize(timings[stage], counts[stage]) for stage in STAGES}
+    cycle_totals = [sum(timings[stage][i] for stage in STAGES) for i in range(cycles)]
+    return {
+        'fixtures': fixtures,
+        'cycles': cycles,
+        'inplay_body_bytes': round(sum(len(b) for b in inplay_bodies) / cycles),
+        'stages': stages,
+        'cycle_total_ms': {'p50': round(_percentile(cycle_totals, 50), 3), 'max': round(max(cycle_totals), 3)},
+        'slowest_stage': max(STAGES, key=lambda s: stages[s]['p50_ms']),
+    }
+
+
+def run_benchmark(scales=DEFAULT_SCALES, cycles: int = 5, seed: int = 42) -> Dict:
+    _prepare_environment()
+    return {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'seed': seed,
+        'results': [run_scale(n, cycles, seed) for n in scales],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the live pipeline on synthetic match days')
+    parser.add_argument('--scales', default=','.join(str(n) for n in DEFAULT_SCALES),
+                        help='comma-separated concurrent fixture counts')
+    parser.add_argument('--cycles', type=int, default=5, help='update cycles per scale')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='write JSON here instead of stdout')
+    args = parser.parse_args()
+
+    # Per-fixture debug/info logging would dominate the timings
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    scales = [int(n) for n in args.scales.split(',') if n.strip()]
+    report = json.dumps(run_benchmark(scales, args.cycles, args.seed), indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report + '\n')
+        print(f"✅ Benchmark written to {args.output}")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
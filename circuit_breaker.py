@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Circuit Breaker
+===============
+One breaker per SportMonks endpoint class (``livescores``, ``odds``,
+``fixtures``), shared by every caller in the process.
+
+- closed: requests go through; ``CIRCUIT_FAILURE_THRESHOLD`` consecutive
+  failures (timeouts, connection errors, 5xx) open the circuit
+- open: requests fail fast without touching the network, for
+  ``CIRCUIT_RESET_SECONDS``
+- half-open: one probe request is let through; success closes the
+  circuit, failure opens it for another ``CIRCUIT_RESET_SECONDS``. A probe
+  that never reports back frees its slot after the same interval.
+
+Callers check ``allow()`` right before a request and report the outcome,
+usually with ``with breaker.guard(): ...``. While a circuit is open the
+dashboard keeps serving its last good snapshot, marked with its age.
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import requests
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', '2'))
+CIRCUIT_RESET_SECONDS = float(os.getenv('CIRCUIT_RESET_SECONDS', '60'))
+
+CLOSED, HALF_OPEN, OPEN = 'closed', 'half_open', 'open'
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+# Exceptions that may count as the endpoint failing (HTTPError comes from raise_for_status)
+FAILURE_EXCEPTIONS = (requests.exceptions.RequestException,)
+
+circuit_state = metrics.registry.gauge(
+    'latecorners_circuit_state', 'SportMonks circuit breaker state (0 closed, 1 half-open, 2 open)', ['endpoint'])
+circuit_rejections_total = metrics.registry.counter(
+    'latecorners_circuit_rejections_total', 'Requests failed fast by an open circuit', ['endpoint'])
+
+
+def is_outage(error: BaseException) -> bool:
+    """Timeouts, connection errors and 5xx; a 4xx means the endpoint answered"""
+    response = getattr(error, 'response', None)
+    return response is None or response.status_code >= 500
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with a single half-open probe"""
+
+    def __init__(self, name: str, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 reset_seconds: float = CIRCUIT_RESET_SECONDS):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_at: Optional[float] = None
+        self._lock = threading.Lock()
+        circuit_state.set(_STATE_VALUES[CLOSED], endpoint=name)
+
+    def _set_state(self, state: str) -> None:
+        if state != self.state:
+            logger.warning(f"⚡ CIRCUIT {self.name}: {self.state} -> {state}")
+        self.state = state
+        circuit_state.set(_STATE_VALUES[state], endpoint=self.name)
+
+    def allow(self, now: Optional[float] = None) -> bool:
+        """May a request be made now? (in half-open, True only for the probe)"""
+        now = time.time() if now is None else now
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and now - self.opened_at >= self.reset_seconds:
+                self._set_state(HALF_OPEN)
+                self._probe_at = None
+            if self.state == HALF_OPEN and (self._probe_at is None or now - self._probe_at >= self.reset_seconds):
+                self._probe_at = now
+                return True
+        circuit_rejections_total.inc(endpoint=self.name)
+        return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._probe_at = None
+            self._set_state(CLOSED)
+
+    def record_failure(self, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.opened_at = now
+                self._probe_at = None
+                self._set_state(OPEN)
+
+    @contextmanager
+    def guard(self, now: Optional[float] = None):
+        """Record the outcome of the request made inside the block"""
+        try:
+            yield
+        except FAILURE_EXCEPTIONS as e:
+            if is_outage(e):
+                self.record_failure(now)
+            else:
+                self.record_success()
+            raise
+        self.record_success()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def circuit_breaker(endpoint: str) -> CircuitBreaker:
+    """The process-wide breaker for an endpoint class"""
+    with _breakers_lock:
+        breaker = _breakers.get(endpoint)
+        if breaker is None:
+            breaker = _breakers[endpoint] = CircuitBreaker(endpoint)
+        return breaker
+
+
+def circuit_report() -> Dict[str, Dict]:
+    """State of every breaker (for status endpoints)"""
+    return {name: {'state': breaker.state, 'failures': breaker.failures, 'opened_at': breaker.opened_at}
+            for name, breaker in _breakers.items()}
@@ -2,9 +2,23 @@
 """
 Combined runner for both alert system and web dashboard
 SHARED DATA ARCHITECTURE: Dashboard provides data, Alert system consumes it
+
+Modes:
+    python combined_runner.py                 # dev: everything in one process (Flask dev server)
+    python combined_runner.py --production    # supervisor: ingest + engine(s) + web processes
+    python combined_runner.py --role ingest   # run a single role (engine / web likewise)
+
+Production roles talk over the local snapshot bus (snapshot_bus.py):
+- ingest: the only process calling SportMonks; publishes live data, answers odds requests
+- engine: evaluates alerts on published data; ENGINE_PROCESSES shards fixtures by id
+- web:    multi-worker WSGI dashboard serving the published snapshots
+Each role is restarted on its own with backoff, and no role shares a GIL with another.
 """
 
 import asyncio
+import multiprocessing
+import shutil
+import subprocess
 import threading
 import time
 import os
@@ -14,14 +28,15 @@ import logging
 
 # Add current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from log_setup import configure_logging
 
-# Setup logging for combined runner
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Setup logging for combined runner (JSON lines by default - see log_setup)
+configure_logging()
 logger = logging.getLogger('combined_runner')
 
+# Alert system restart backoff (seconds)
+ALERT_RESTART_DELAY = 30
+
 def run_alert_system():
     """Run the main alert system in background thread (reads from dashboard's shared data)"""
     logger.info("🚨 STARTING: Alert system thread (SHARED DATA mode)...")
@@ -30,19 +45,21 @@ def run_alert_system():
     logger.info("⏳ WAITING: 10 seconds for dashboard to populate shared data...")
     time.sleep(10)
     
-    try:
-        from main import main as main_monitor
-        logger.info("🚨 RUNNING: Alert system main loop (using shared dashboard data)...")
-        asyncio.run(main_monitor())
-    except Exception as e:
-        logger.error(f"🚨 FATAL ERROR: Alert system crashed: {e}")
-        import traceback
-        logger.error(f"🚨 TRACEBACK: {traceback.format_exc()}")
+    # Restart in a loop (not by recursion) so repeated crashes can't grow the stack
+    while True:
+        try:
+            from main import main as main_monitor
+            logger.info("🚨 RUNNING: Alert system main loop (using shared dashboard data)...")
+            asyncio.run(main_monitor())
+            logger.warning("🚨 Alert system main loop returned")
+        except Exception as e:
+            logger.error(f"🚨 FATAL ERROR: Alert system crashed: {e}")
+            import traceback
+            logger.error(f"🚨 TRACEBACK: {traceback.format_exc()}")
         # Don't exit - keep trying to restart
-        logger.info("🚨 WAITING: 30 seconds before restart attempt...")
-        time.sleep(30)
+        logger.info(f"🚨 WAITING: {ALERT_RESTART_DELAY} seconds before restart attempt...")
+        time.sleep(ALERT_RESTART_DELAY)
         logger.info("🚨 RESTARTING: Alert system...")
-        run_alert_system()  # Recursive restart
 
 def run_web_dashboard():
     """Run the web dashboard (PRIMARY DATA SOURCE for shared architecture)"""
@@ -68,7 +85,178 @@ def run_web_dashboard():
         logger.error(f"🌐 FATAL ERROR: Dashboard crashed: {e}")
         raise
 
+# Production mode settings
+WEB_WORKERS = int(os.getenv('WEB_WORKERS', '2'))
+WEB_THREADS = int(os.getenv('WEB_THREADS', '16'))  # Each open SSE stream holds one thread
+ENGINE_PROCESSES = max(1, int(os.getenv('ENGINE_PROCESSES', '1')))
+SUPERVISOR_CHECK_SECONDS = 5
+# Per-role restart backoff: doubles on each quick crash, resets after a stable run
+RESTART_BACKOFF_MIN = 5
+RESTART_BACKOFF_MAX = 300
+STABLE_RUN_SECONDS = 600
+ROLES = ('ingest', 'engine', 'web')
+
+def run_ingest_role():
+    """Ingest role: owns the SportMonks budget, publishes live data and answers odds requests"""
+    logger.info("📊 STARTING: Ingest role...")
+    from web_dashboard import (live_publisher, start_dashboard_background_thread, check_corner_odds_available,
+                               get_draw_odds, record_engine_metrics, render_metrics)
+    from snapshot_bus import start_snapshot_server, start_service_server
+
+    # Bus first so the very first published version reaches subscribers
+    start_snapshot_server(live_publisher)
+    start_service_server({
+        'corner_odds': check_corner_odds_available,
+        'draw_odds': get_draw_odds,
+        'metrics': render_metrics,  # Web workers' /metrics
+        'engine_metrics': record_engine_metrics,  # Engines' series, merged into /metrics
+    })
+    start_dashboard_background_thread()
+
+    while True:
+        time.sleep(60)
+        logger.info(f"❤️ INGEST: published v{live_publisher.version}")
+
+def run_engine_role(shard_index: int = 0, shards: int = 1):
+    """Engine role: evaluates alerts on published snapshots (fixtures where id % shards == shard_index)"""
+    # main reads these at import time
+    os.environ['ENGINE_SHARDS'] = str(shards)
+    os.environ['ENGINE_SHARD_INDEX'] = str(shard_index)
+    logger.info(f"🚨 STARTING: Engine role (shard {shard_index + 1}/{shards})...")
+    from snapshot_bus import start_snapshot_subscriber, connect_service_client
+
+    start_snapshot_subscriber()
+    connect_service_client()
+    run_alert_system()
+
+def _start_web_process():
+    """Web role: multi-worker gunicorn serving wsgi:app (Flask threaded server if unavailable)"""
+    port = int(os.environ.get('PORT', 8080))
+    # Half of each worker's threads for SSE streams; extra viewers poll, so /api/* and /health always answer
+    os.environ.setdefault('SSE_MAX_STREAMS', str(max(1, WEB_THREADS // 2)))
+    gunicorn = shutil.which('gunicorn')
+    if gunicorn:
+        cmd = [
+            gunicorn, 'wsgi:app',
+            '--bind', f'0.0.0.0:{port}',
+            '--workers', str(WEB_WORKERS),
+            '--worker-class', 'gthread',
+            '--threads', str(WEB_THREADS),
+            '--timeout', '120',
+        ]
+        logger.info(f"🌐 RUNNING: gunicorn with {WEB_WORKERS} workers x {WEB_THREADS} threads on port {port}")
+    else:
+        logger.warning("⚠️ gunicorn not installed - serving wsgi:app with Flask's threaded server")
+        cmd = [
+            sys.executable, '-c',
+            f"from wsgi import app; app.run(host='0.0.0.0', port={port}, threaded=True, debug=False, use_reloader=False)",
+        ]
+    return subprocess.Popen(cmd, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+class _SupervisedRole:
+    """One supervised process plus its restart bookkeeping"""
+
+    def __init__(self, name, start):
+        self.name = name
+        self._start = start
+        self.process = None
+        self.started_at = 0.0
+        self.backoff = RESTART_BACKOFF_MIN
+        self.restart_at = None
+        self.restarts = 0
+
+    def start(self):
+        self.process = self._start()
+        self.started_at = time.time()
+        self.restart_at = None
+
+    def exit_code(self):
+        if isinstance(self.process, subprocess.Popen):
+            return self.process.poll()
+        return None if self.process.is_alive() else self.process.exitcode
+
+    def stop(self):
+        if self.process is not None and self.exit_code() is None:
+            self.process.terminate()
+
+    def check(self):
+        """Schedule a restart when the process exits; perform it once the backoff has passed"""
+        now = time.time()
+        if self.restart_at is None:
+            code = self.exit_code()
+            if code is None:
+                return
+            if now - self.started_at >= STABLE_RUN_SECONDS:
+                self.backoff = RESTART_BACKOFF_MIN
+            self.restart_at = now + self.backoff
+            logger.error(f"❌ {self.name} exited (code {code}) - restarting in {self.backoff}s")
+            self.backoff = min(self.backoff * 2, RESTART_BACKOFF_MAX)
+        elif now >= self.restart_at:
+            self.restarts += 1
+            logger.info(f"🔁 RESTARTING: {self.name} (restart #{self.restarts})")
+            self.start()
+
+def _process_starter(target, name, *args):
+    def start():
+        process = multiprocessing.Process(target=target, args=args, name=name)
+        process.start()
+        return process
+    return start
+
+def run_production():
+    """Supervise ingest, engine and web processes, restarting each one independently"""
+    logger.info("STARTING: Late Corner System (PRODUCTION supervisor)...")
+    logger.info("=" * 50)
+    logger.info("📊 INGEST: single SportMonks connection, publishes over the snapshot bus")
+    logger.info(f"🚨 ENGINE: {ENGINE_PROCESSES} process(es), fixtures sharded by id")
+    logger.info(f"🌐 WEB: {WEB_WORKERS} WSGI workers reading shared snapshots")
+    logger.info("=" * 50)
+
+    # Children inherit the bus key through the environment
+    from snapshot_bus import ensure_bus_authkey
+    ensure_bus_authkey()
+
+    roles = [_SupervisedRole('ingest', _process_starter(run_ingest_role, 'ingest'))]
+    for shard_index in range(ENGINE_PROCESSES):
+        roles.append(_SupervisedRole(
+            f'engine-{shard_index}',
+            _process_starter(run_engine_role, f'engine-{shard_index}', shard_index, ENGINE_PROCESSES),
+        ))
+    roles.append(_SupervisedRole('web', _start_web_process))
+
+    for role in roles:
+        role.start()
+
+    try:
+        while True:
+            time.sleep(SUPERVISOR_CHECK_SECONDS)
+            for role in roles:
+                role.check()
+    except KeyboardInterrupt:
+        logger.info("👋 Shutting down production system gracefully...")
+    finally:
+        for role in roles:
+            role.stop()
+
+def run_single_role(role: str):
+    """Run one role in this process (for scaling roles as separate services)"""
+    if role == 'ingest':
+        run_ingest_role()
+    elif role == 'engine':
+        run_engine_role(int(os.getenv('ENGINE_SHARD_INDEX', '0')), int(os.getenv('ENGINE_SHARDS', '1')))
+    elif role == 'web':
+        sys.exit(_start_web_process().wait())
+    else:
+        raise SystemExit(f"Unknown role {role!r} (expected one of {', '.join(ROLES)})")
+
 if __name__ == "__main__":
+    if '--role' in sys.argv:
+        run_single_role(sys.argv[sys.argv.index('--role') + 1] if sys.argv[-1] != '--role' else '')
+        sys.exit(0)
+    if '--production' in sys.argv or os.getenv('SERVING_MODE', '').lower() == 'production':
+        run_production()
+        sys.exit(0)
+
     logger.info("STARTING: Combined Late Corner System...")
     logger.info("=" * 50)
     logger.info("📊 ARCHITECTURE: Shared Data System")
@@ -1,20 +1,24 @@
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+def _env(name: str, default: str = ''):
+    """Read when a Config is created, not when this module is imported"""
+    return field(default_factory=lambda: os.getenv(name, default))
+
 @dataclass
 class Config:
     # API Configuration
-    SPORTMONKS_API_KEY: str = os.getenv('SPORTMONKS_API_KEY', '')
-    SPORTMONKS_BASE_URL: str = 'https://api.sportmonks.com/v3/football'
+    SPORTMONKS_API_KEY: str = _env('SPORTMONKS_API_KEY')
+    SPORTMONKS_BASE_URL: str = _env('SPORTMONKS_BASE_URL', 'https://api.sportmonks.com/v3/football')
     
     # Telegram Configuration
-    TELEGRAM_BOT_TOKEN: str = os.getenv('TELEGRAM_BOT_TOKEN', '')
-    TELEGRAM_CHAT_ID: str = os.getenv('TELEGRAM_CHAT_ID', '')
+    TELEGRAM_BOT_TOKEN: str = _env('TELEGRAM_BOT_TOKEN')
+    TELEGRAM_CHAT_ID: str = _env('TELEGRAM_CHAT_ID')
     
     # Scoring System Configuration
     ALERT_THRESHOLD: int = 6  # Minimum score to trigger alert
@@ -0,0 +1,9 @@
+"""
+Shared pytest setup: offline credential defaults, set before any test module imports config
+"""
+
+import os
+
+# Same placeholders as feed_replay / benchmark_pipeline; real values in the environment win
+for _name in ('SPORTMONKS_API_KEY', 'TELEGRAM_BOT_TOKEN', 'TELEGRAM_CHAT_ID'):
+    os.environ.setdefault(_name, 'offline')
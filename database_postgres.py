@@ -51,7 +51,8 @@ class PostgreSQLDatabase:
                     final_corners INTEGER DEFAULT NULL,
                     result VARCHAR(20) DEFAULT NULL,
                     checked_at TIMESTAMP DEFAULT NULL,
-                    match_finished BOOLEAN DEFAULT FALSE
+                    match_finished BOOLEAN DEFAULT FALSE,
+                    alert_key VARCHAR(64) DEFAULT NULL
                 )
             """)
             
@@ -64,12 +65,49 @@ class PostgreSQLDatabase:
                 ON alerts(fixture_id)
             """)
             
+            # Unique index on alert_key for idempotent alert sends
+            cursor.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_alerts_alert_key 
+                ON alerts(alert_key) WHERE alert_key IS NOT NULL
+            """)
+            
             # Create index on match_finished for pending queries
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_alerts_finished 
                 ON alerts(match_finished)
             """)
             
+            # Sent-alert idempotency keys, one row per key in every namespace (see idempotency_store)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS alert_keys (
+                    alert_key VARCHAR(64) PRIMARY KEY,
+                    namespace VARCHAR(32) NOT NULL,
+                    fixture_id INTEGER,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_alert_keys_created_at 
+                ON alert_keys(created_at)
+            """)
+            
+            # Keys recorded on alert rows before the alert_keys table existed
+            cursor.execute("""
+                INSERT INTO alert_keys (alert_key, namespace, fixture_id, created_at)
+                SELECT alert_key, split_part(alert_key, ':', 1), fixture_id, timestamp
+                FROM alerts WHERE alert_key IS NOT NULL
+                ON CONFLICT (alert_key) DO NOTHING
+            """)
+            
+            # Momentum tracker checkpoints (one row per engine shard, overwritten in place)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS momentum_checkpoints (
+                    name VARCHAR(64) PRIMARY KEY,
+                    saved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    data BYTEA NOT NULL
+                )
+            """)
+            
             conn.commit()
             cursor.close()
             conn.close()
@@ -81,11 +119,11 @@ class PostgreSQLDatabase:
             raise
 
     def truncate_alerts(self) -> bool:
-        """Remove all rows from alerts table (for resetting)."""
+        """Remove all rows from alerts table and its idempotency keys (for resetting)."""
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
-            cursor.execute("TRUNCATE TABLE alerts RESTART IDENTITY;")
+            cursor.execute("TRUNCATE TABLE alerts, alert_keys RESTART IDENTITY;")
             conn.commit()
             cursor.close()
             conn.close()
@@ -119,6 +157,26 @@ class PostgreSQLDatabase:
             logger.error(f"❌ Migration failed: {e}")
             # Don't raise - migrations are non-critical for basic functionality
 
+        # Migration: Add alert_key column (idempotency key) if it doesn't exist
+        try:
+            cursor.execute("""
+                SELECT column_name FROM information_schema.columns 
+                WHERE table_name = 'alerts' AND column_name = 'alert_key'
+            """)
+            
+            if not cursor.fetchone():
+                logger.info("🔄 MIGRATION: Adding alert_key column...")
+                cursor.execute("""
+                    ALTER TABLE alerts 
+                    ADD COLUMN alert_key VARCHAR(64) DEFAULT NULL
+                """)
+                logger.info("✅ MIGRATION: alert_key column added")
+            else:
+                logger.debug("⏭️ MIGRATION: alert_key column already exists")
+                
+        except Exception as e:
+            logger.error(f"❌ Migration failed: {e}")
+
         # Hard cleanup to minimal columns: drop anything not in the allowlist
         try:
             cursor.execute("""
@@ -130,7 +188,8 @@ class PostgreSQLDatabase:
             desired_cols = {
                 'id','timestamp','fixture_id','teams','score_at_alert','minute_sent','corners_at_alert',
                 'alert_type','draw_odds','combined_momentum10','momentum_home_total','momentum_away_total',
-                'asian_odds_snapshot','final_corners','result','checked_at','match_finished'
+                'asian_odds_snapshot','final_corners','result','checked_at','match_finished',
+                'alert_key'
             }
             to_drop = [c for c in current_cols if c not in desired_cols]
             for col in to_drop:
@@ -302,6 +361,91 @@ class PostgreSQLDatabase:
             logger.error(traceback.format_exc())
             return False
     
+    def record_alert_key(self, alert_key: str, namespace: str, fixture_id: Optional[int] = None) -> bool:
+        """Store an idempotency key (any namespace; does not need an alert row)"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                INSERT INTO alert_keys (alert_key, namespace, fixture_id)
+                VALUES (%s, %s, %s)
+                ON CONFLICT (alert_key) DO NOTHING
+            """, (alert_key, namespace, fixture_id))
+            inserted = cursor.rowcount
+            
+            conn.commit()
+            cursor.close()
+            conn.close()
+            
+            return inserted > 0
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to record alert key {alert_key}: {e}")
+            return False
+    
+    def get_recent_alert_keys(self, hours: int = 48) -> List[str]:
+        """Get idempotency keys recorded in the last N hours (every namespace)"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                SELECT alert_key FROM alert_keys 
+                WHERE created_at > NOW() - (%s * INTERVAL '1 hour')
+            """, (hours,))
+            
+            keys = [row[0] for row in cursor.fetchall()]
+            
+            cursor.close()
+            conn.close()
+            
+            return keys
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to get recent alert keys: {e}")
+            return []
+    
+    def save_momentum_checkpoint(self, name: str, data: bytes) -> bool:
+        """Store the latest momentum checkpoint under ``name`` (replaces the previous one)"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                INSERT INTO momentum_checkpoints (name, saved_at, data)
+                VALUES (%s, CURRENT_TIMESTAMP, %s)
+                ON CONFLICT (name) DO UPDATE SET saved_at = EXCLUDED.saved_at, data = EXCLUDED.data
+            """, (name, psycopg2.Binary(data)))
+            
+            conn.commit()
+            cursor.close()
+            conn.close()
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to save momentum checkpoint {name}: {e}")
+            return False
+    
+    def get_momentum_checkpoint(self, name: str) -> Optional[bytes]:
+        """Latest momentum checkpoint saved under ``name``, if any"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute("SELECT data FROM momentum_checkpoints WHERE name = %s", (name,))
+            row = cursor.fetchone()
+            
+            cursor.close()
+            conn.close()
+            
+            return bytes(row[0]) if row else None
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to load momentum checkpoint {name}: {e}")
+            return None
+    
     def get_unfinished_alerts(self) -> List[Dict]:
         """Get alerts where match is not finished"""
         try:
@@ -417,9 +561,12 @@ class PostgreSQLDatabase:
             logger.error(f"❌ Failed to get performance stats: {e}")
             return {}
 
-# Global instance
-postgres_db = PostgreSQLDatabase()
+# Global instance (connected on first use, so importing this module never needs a database)
+postgres_db = None
 
 def get_database():
     """Get the PostgreSQL database instance"""
+    global postgres_db
+    if postgres_db is None:
+        postgres_db = PostgreSQLDatabase()
     return postgres_db 
\ No newline at end of file
@@ -6,7 +6,9 @@ Enhanced match state tracker with comprehensive stats and derived metrics
 import logging
 from typing import Dict, List, Optional
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
+
+from stat_window import FixtureStatWindow
 
 logger = logging.getLogger(__name__)
 
@@ -60,20 +62,25 @@ class EnhancedTimeWindowStats:
             if getattr(self, field) is None:
                 setattr(self, field, {'home': 0, 'away': 0})
 
+ENHANCED_STATS = [field for field in EnhancedTimeWindowStats.__dataclass_fields__
+                  if field not in ('window_start', 'window_end')]
+
 class EnhancedMatchTracker:
     """Enhanced match state tracker with derived metrics"""
     
-    def __init__(self, fixture_id: int, window_sizes: List[int] = None):
+    def __init__(self, fixture_id: int, window_sizes: List[int] = None, window: FixtureStatWindow = None):
         """
         Initialize enhanced match tracker
         
         Args:
             fixture_id: Match ID
             window_sizes: List of window sizes in minutes (default: [5, 10, 15])
+            window: Stat window to use (default: a private one; pass stat_windows.fixture(fixture_id)
+                    to share the fixture's window, and then always pass ``minute``)
         """
         self.fixture_id = fixture_id
         self.window_sizes = window_sizes or [5, 10, 15]
-        self.stats_history: List[EnhancedTimeWindowStats] = []
+        self.window = window or FixtureStatWindow()
         self.last_update = None
         
         # SportMonks stat type mapping
@@ -102,74 +109,29 @@ class EnhancedMatchTracker:
         logger.info(f"🎯 Initialized EnhancedMatchTracker for fixture {fixture_id}")
         logger.info(f"   Window sizes: {self.window_sizes} minutes")
     
-    def update_stats(self, current_stats: Dict[str, Dict[str, int]], timestamp: datetime = None) -> None:
-        """Update match statistics"""
+    def update_stats(self, current_stats: Dict[str, Dict[str, int]], timestamp: datetime = None,
+                     minute: int = None) -> None:
+        """Update match statistics (``minute`` defaults to minutes since the first update)"""
         if timestamp is None:
             timestamp = datetime.now()
-            
-        # Create new time window stats
-        window_stats = EnhancedTimeWindowStats(
-            window_start=timestamp,
-            window_end=timestamp
-        )
+        if minute is None:
+            minute = self.window.minute_for(timestamp.timestamp())
         
-        # Update all available stats
-        for field in window_stats.__dataclass_fields__:
-            if field not in ['window_start', 'window_end'] and field in current_stats:
-                setattr(window_stats, field, current_stats[field])
-        
-        # Add to history
-        self.stats_history.append(window_stats)
+        self.window.update(minute, {field: current_stats[field] for field in ENHANCED_STATS if field in current_stats})
         self.last_update = timestamp
-        
-        # Clean old history (keep last 20 minutes)
-        cutoff_time = timestamp - timedelta(minutes=20)
-        self.stats_history = [
-            stats for stats in self.stats_history 
-            if stats.window_start > cutoff_time
-        ]
     
     def get_window_stats(self, minutes: int, current_time: datetime = None) -> Optional[Dict]:
         """Get comprehensive stats for the last X minutes"""
-        if not self.stats_history:
-            return None
-            
-        if current_time is None:
-            current_time = datetime.now()
-            
-        window_start = current_time - timedelta(minutes=minutes)
-        window_entries = [
-            stats for stats in self.stats_history 
-            if stats.window_start >= window_start
-        ]
+        now = None
+        if current_time is not None and self.window.origin is not None:
+            now = self.window.minute_for(current_time.timestamp())
         
-        if not window_entries:
+        raw = self.window.window(minutes, now)
+        if raw is None:
             return None
-            
-        # Get first and last entries
-        first_stats = window_entries[0]
-        last_stats = window_entries[-1]
-        
-        # Calculate basic stats differences
-        window_stats = {}
-        for field in first_stats.__dataclass_fields__:
-            if field not in ['window_start', 'window_end', 'possession', 'pass_accuracy']:
-                first_values = getattr(first_stats, field)
-                last_values = getattr(last_stats, field)
-                
-                window_stats[field] = {
-                    'home': last_values['home'] - first_values['home'],
-                    'away': last_values['away'] - first_values['away']
-                }
         
-        # Calculate averages for percentage-based stats
-        for field in ['possession', 'pass_accuracy']:
-            values = [getattr(stats, field) for stats in window_entries]
-            if values:
-                window_stats[field] = {
-                    'home': sum(v['home'] for v in values) / len(values),
-                    'away': sum(v['away'] for v in values) / len(values)
-                }
+        # Differences for counting stats, averages for percentage-based stats
+        window_stats = {field: raw.get(field) or {'home': 0, 'away': 0} for field in ENHANCED_STATS}
         
         # Add derived metrics
         window_stats.update(self._calculate_derived_metrics(window_stats))
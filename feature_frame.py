@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Feature Frame
+=============
+Derived per-fixture features computed once per data version, as columns
+(one NumPy array per feature, one position per live fixture).
+
+The dashboard updater builds the frame after odds are attached and before
+publishing. The strategy registry, the dashboard stats and the snapshot
+recorder then all read it, so nothing re-derives totals, ratios or deltas
+from the raw match dicts.
+
+Columns (``COLUMNS``):
+- identity and clock: fixture_id, minute, minute_bucket (15-minute buckets, 90+ is 6)
+- score state: home/away score, signed goal_difference, score_state
+  (0 level, 1 one goal apart, 2 two or more), is_draw
+- raw team stats ``home_<stat>``/``away_<stat>`` for ``TEAM_FIELDS`` (-1 when missing)
+- totals (missing counted as 0), ratios (dangerous-attack ratio, shot
+  accuracy, corners per minute) and ``DELTA_MINUTES`` deltas
+- momentum (batch Momentum10) and odds availability (corner odds, lowest
+  active Over line, cached draw price; NaN when unknown)
+- seconds_to_alert: match-clock seconds until 85:00 is surely reached
+  (0 once past, NaN when unknown)
+"""
+
+import logging
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+TEAM_FIELDS = ('corners', 'shots_total', 'shots_on_target', 'dangerous_attacks', 'attacks', 'possession', 'goals')
+# Totals that get a DELTA_MINUTES delta column
+DELTA_FIELDS = ('corners', 'shots_total', 'shots_on_target', 'dangerous_attacks')
+DELTA_MINUTES = 5
+MINUTE_BUCKET_SIZE = 15
+
+COLUMNS = (
+    ('fixture_id', np.int64), ('minute', np.int16), ('minute_bucket', np.int8),
+    ('home_score', np.int16), ('away_score', np.int16), ('goal_difference', np.int16),
+    ('score_state', np.int8), ('is_draw', np.bool_),
+    *((f"{side}_{name}", np.int16) for side in ('home', 'away') for name in TEAM_FIELDS),
+    ('stats_available', np.int16), ('has_corners', np.bool_),
+    ('total_corners', np.int32), ('total_shots', np.int32), ('total_shots_on_target', np.int32),
+    ('total_dangerous_attacks', np.int32), ('total_attacks', np.int32),
+    ('dangerous_attack_ratio', np.float32), ('shot_accuracy', np.float32), ('corners_per_minute', np.float32),
+    ('corners_delta', np.int32), ('shots_delta', np.int32), ('shots_on_target_delta', np.int32),
+    ('dangerous_attacks_delta', np.int32),
+    ('momentum_home', np.int32), ('momentum_away', np.int32), ('momentum_combined', np.int32),
+    ('momentum_window', np.int16),
+    ('corner_odds_available', np.bool_), ('corner_odds_active', np.int16), ('over_line', np.float32),
+    ('draw_odds', np.float64), ('seconds_to_alert', np.float32),
+)
+# Float columns where NaN means "unknown" (None in rows)
+NULLABLE = ('over_line', 'draw_odds', 'seconds_to_alert')
+
+feature_frame_seconds = metrics.registry.histogram(
+    'latecorners_feature_frame_seconds', 'Time to build the per-cycle feature frame',
+    buckets=metrics.COMPUTE_BUCKETS)
+
+
+def team_stat(team: Dict, name: str) -> int:
+    """Integer stat value, -1 when missing or unparseable"""
+    value = team.get(name)
+    try:
+        return int(value) if value is not None else -1
+    except (TypeError, ValueError):
+        return -1
+
+
+def lowest_active_over(corner_odds: Dict) -> float:
+    """Lowest bettable whole-number Over line, the line an alert would be placed on"""
+    lines = []
+    for odds in corner_odds.get('corner_odds_data', []):
+        if odds.get('label') != 'Over' or odds.get('suspended') or odds.get('stopped'):
+            continue
+        try:
+            total = float(odds.get('total'))
+        except (TypeError, ValueError):
+            continue
+        if total == int(total):
+            lines.append(total)
+    return min(lines) if lines else np.nan
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray, scale: float = 1.0) -> np.ndarray:
+    out = np.zeros(len(numerator), dtype=np.float32)
+    np.divide(numerator * scale, denominator, out=out, where=denominator > 0, casting='unsafe')
+    return out
+
+
+class FeatureFrame:
+    """One data version's features, column-major; ``rows()`` gives per-fixture dicts"""
+
+    def __init__(self, columns: Dict[str, np.ndarray], version: int, ts: float):
+        self.columns = columns
+        self.version = version
+        self.ts = ts
+        self.index = {int(fid): i for i, fid in enumerate(columns['fixture_id'])}
+        self._rows: Optional[List[Dict]] = None
+
+    def __len__(self) -> int:
+        return len(self.columns['fixture_id'])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def count(self, mask: np.ndarray) -> int:
+        return int(np.count_nonzero(mask))
+
+    def rows(self) -> List[Dict]:
+        """Per-fixture dicts of plain Python values (built once per frame)"""
+        if self._rows is None:
+            names = list(self.columns)
+            values = [self.columns[name].tolist() for name in names]
+            self._rows = [dict(zip(names, row)) for row in zip(*values)]
+            for row in self._rows:
+                for name in NULLABLE:
+                    if row[name] != row[name]:  # NaN
+                        row[name] = None
+        return self._rows
+
+    def row(self, fixture_id: int) -> Optional[Dict]:
+        i = self.index.get(fixture_id)
+        return None if i is None else self.rows()[i]
+
+
+def _empty_columns() -> Dict[str, np.ndarray]:
+    return {name: np.zeros(0, dtype=dtype) for name, dtype in COLUMNS}
+
+
+class FeatureFrameStage:
+    """Builds the frame once per data version and keeps the short stat history the deltas need"""
+
+    def __init__(self, delta_minutes: int = DELTA_MINUTES):
+        self.delta_minutes = delta_minutes
+        self.frame = FeatureFrame(_empty_columns(), version=0, ts=0.0)
+        # fixture -> (minute, DELTA_FIELDS totals), oldest first
+        self._history: Dict[int, Deque[Tuple[int, Tuple[int, ...]]]] = {}
+
+    def build(self, matches: List[Dict], version: int, ts: Optional[float] = None,
+              draw_odds: Optional[Callable[[int], Optional[float]]] = None,
+              seconds_to_alert: Optional[Callable[[int], Optional[float]]] = None) -> FeatureFrame:
+        """Frame for ``version`` (the cached one when that version was already built)"""
+        if version == self.frame.version and version:
+            return self.frame
+        ts = time.time() if ts is None else ts
+        with feature_frame_seconds.time():
+            self.frame = FeatureFrame(self._compute(matches, draw_odds, seconds_to_alert), version, ts)
+        return self.frame
+
+    def _compute(self, matches: List[Dict], draw_odds, seconds_to_alert) -> Dict[str, np.ndarray]:
+        if not matches:
+            self._history.clear()
+            return _empty_columns()
+
+        base = []
+        team = []
+        momentum = []
+        odds = []
+        for m in matches:
+            stats = m.get('statistics') or {}
+            home = dict(stats.get('home', {}), goals=m.get('home_score'))
+            away = dict(stats.get('away', {}), goals=m.get('away_score'))
+            base.append((m['match_id'], m.get('minute', 0) or 0, m.get('home_score', 0) or 0,
+                         m.get('away_score', 0) or 0, stats.get('total_stats_available', 0),
+                         bool(stats.get('has_corners'))))
+            team.append([team_stat(home, name) for name in TEAM_FIELDS]
+                        + [team_stat(away, name) for name in TEAM_FIELDS])
+            score = m.get('momentum') or {}
+            momentum.append((score.get('home', 0), score.get('away', 0), score.get('combined', 0),
+                             score.get('window_covered', 0)))
+            corner_odds = m.get('corner_odds') or {}
+            draw_price = draw_odds(m['match_id']) if draw_odds else None
+            wait = seconds_to_alert(m['match_id']) if seconds_to_alert else None
+            odds.append((bool(corner_odds.get('available')), corner_odds.get('active_count', 0) or 0,
+                         lowest_active_over(corner_odds), np.nan if draw_price is None else draw_price,
+                         np.nan if wait is None else wait))
+
+        cols: Dict[str, np.ndarray] = {}
+        fixture_id, minute, home_score, away_score, stats_available, has_corners = zip(*base)
+        cols['fixture_id'] = np.array(fixture_id, dtype=np.int64)
+        cols['minute'] = np.array(minute, dtype=np.int16)
+        cols['minute_bucket'] = np.minimum(cols['minute'] // MINUTE_BUCKET_SIZE, 90 // MINUTE_BUCKET_SIZE).astype(np.int8)
+        cols['home_score'] = np.array(home_score, dtype=np.int16)
+        cols['away_score'] = np.array(away_score, dtype=np.int16)
+        cols['goal_difference'] = cols['home_score'] - cols['away_score']
+        cols['score_state'] = np.minimum(np.abs(cols['goal_difference']), 2).astype(np.int8)
+        cols['is_draw'] = cols['goal_difference'] == 0
+
+        team_arr = np.array(team, dtype=np.int16)
+        for j, (side, name) in enumerate((side, name) for side in ('home', 'away') for name in TEAM_FIELDS):
+            cols[f"{side}_{name}"] = team_arr[:, j]
+        cols['stats_available'] = np.array(stats_available, dtype=np.int16)
+        cols['has_corners'] = np.array(has_corners, dtype=np.bool_)
+
+        def total(name):
+            return (np.maximum(cols[f"home_{name}"], 0).astype(np.int32)
+                    + np.maximum(cols[f"away_{name}"], 0).astype(np.int32))
+
+        cols['total_corners'] = total('corners')
+        cols['total_shots'] = total('shots_total')
+        cols['total_shots_on_target'] = total('shots_on_target')
+        cols['total_dangerous_attacks'] = total('dangerous_attacks')
+        cols['total_attacks'] = total('attacks')
+        cols['dangerous_attack_ratio'] = _ratio(cols['total_dangerous_attacks'], cols['total_attacks'], 100.0)
+        cols['shot_accuracy'] = _ratio(cols['total_shots_on_target'], cols['total_shots'], 100.0)
+        cols['corners_per_minute'] = _ratio(cols['total_corners'], cols['minute'])
+
+        totals = np.stack([cols['total_corners'], cols['total_shots'], cols['total_shots_on_target'],
+                           cols['total_dangerous_attacks']], axis=1)
+        deltas = totals - self._delta_bases(cols['fixture_id'], cols['minute'], totals)
+        cols['corners_delta'], cols['shots_delta'], cols['shots_on_target_delta'], cols['dangerous_attacks_delta'] = (
+            np.ascontiguousarray(deltas[:, k]) for k in range(len(DELTA_FIELDS)))
+
+        momentum_arr = np.array(momentum, dtype=np.int32)
+        cols['momentum_home'] = momentum_arr[:, 0]
+        cols['momentum_away'] = momentum_arr[:, 1]
+        cols['momentum_combined'] = momentum_arr[:, 2]
+        cols['momentum_window'] = momentum_arr[:, 3].astype(np.int16)
+
+        available, active, over_line, draw, wait = zip(*odds)
+        cols['corner_odds_available'] = np.array(available, dtype=np.bool_)
+        cols['corner_odds_active'] = np.array(active, dtype=np.int16)
+        cols['over_line'] = np.array(over_line, dtype=np.float32)
+        cols['draw_odds'] = np.array(draw, dtype=np.float64)
+        cols['seconds_to_alert'] = np.array(wait, dtype=np.float32)
+
+        return {name: np.ascontiguousarray(cols[name], dtype=dtype) for name, dtype in COLUMNS}
+
+    def _delta_bases(self, fixture_ids: np.ndarray, minutes: np.ndarray, totals: np.ndarray) -> np.ndarray:
+        """Totals as of ``delta_minutes`` ago (or the oldest snapshot since); records this cycle"""
+        bases = totals.copy()
+        live = set()
+        for i, (fixture_id, minute) in enumerate(zip(fixture_ids.tolist(), minutes.tolist())):
+            live.add(fixture_id)
+            history = self._history.setdefault(fixture_id, deque())
+            if history and minute < history[-1][0]:
+                history.clear()  # Minute regression (feed glitch)
+            while history and history[0][0] < minute - self.delta_minutes:
+                history.popleft()
+            if history:
+                bases[i] = history[0][1]
+            entry = (minute, tuple(totals[i].tolist()))
+            if history and history[-1][0] == minute:
+                history[-1] = entry
+            else:
+                history.append(entry)
+        for fixture_id in [fid for fid in self._history if fid not in live]:
+            del self._history[fixture_id]
+        return bases
+
+
+# Global stage used by the dashboard updater
+feature_stage = FeatureFrameStage()
+
+
+def current_frame() -> FeatureFrame:
+    """The most recently built frame"""
+    return feature_stage.frame
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Feed Recorder
+=============
+Captures raw SportMonks responses (``/livescores/inplay`` and odds) to an
+append-only, gzip-compressed JSON-lines log that ``feed_replay.py`` can play
+back offline.
+
+Enable by setting ``FEED_RECORD_PATH`` (e.g. ``recordings/2026-10-18.jsonl.gz``).
+Only one process should record to a given file - in production mode set it on
+the ingest role, which makes every SportMonks call.
+
+Each line is one frame::
+
+    {"t": <unix time>, "path": "/livescores/inplay", "params": {...},
+     "status": 200, "body": <decoded JSON response>}
+
+``api_token`` is never written. The gzip stream is flushed after every frame,
+so a crash loses at most the frame being written and readers stop cleanly at
+the truncated tail.
+"""
+
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+FEED_RECORD_PATH = os.getenv('FEED_RECORD_PATH', '')
+# Query parameters that must never reach the recording
+_SECRET_PARAMS = {'api_token'}
+
+
+class FeedRecorder:
+    """Appends response frames to a gzip JSON-lines file"""
+
+    def __init__(self, path: str, clock=time):
+        self.path = path
+        self.clock = clock
+        self.frames_written = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Append mode adds a new gzip member per session; gzip readers handle multi-member files
+        self._file = gzip.open(path, 'ab', compresslevel=6)
+
+    def record(self, path: str, params: Optional[Dict], status: int, body) -> None:
+        frame = {
+            't': round(self.clock.time(), 3),
+            'path': path,
+            'params': {k: v for k, v in (params or {}).items() if k not in _SECRET_PARAMS},
+            'status': status,
+            'body': body,
+        }
+        line = json.dumps(frame, separators=(',', ':'), default=str).encode('utf-8') + b'\n'
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            self.frames_written += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def read_frames(path: str) -> Iterator[Dict]:
+    """Yield recorded frames in order, stopping quietly at a truncated tail"""
+    with gzip.open(path, 'rb') as f:
+        try:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # Partial last line from an interrupted write
+                    return
+        except (EOFError, OSError) as e:
+            logger.warning(f"⚠️ FEED: Recording {path} ends early ({e}) - stopping there")
+
+
+# Global recorder (None unless FEED_RECORD_PATH is set)
+feed_recorder: Optional[FeedRecorder] = FeedRecorder(FEED_RECORD_PATH) if FEED_RECORD_PATH else None
+if feed_recorder is not None:
+    logger.info(f"🎙️ FEED: Recording SportMonks responses to {FEED_RECORD_PATH}")
+
+
+def record_response(path: str, params: Optional[Dict], response) -> None:
+    """Record a ``requests`` response if recording is enabled (never raises)"""
+    if feed_recorder is None:
+        return
+    try:
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        feed_recorder.record(path, params, response.status_code, body)
+    except Exception as e:
+        logger.warning(f"⚠️ FEED: Could not record {path}: {e}")
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Feed Replay
+===========
+Plays a recording made by ``feed_recorder.py`` through the real pipeline with
+no network: the dashboard update cycle (``web_dashboard.run_update_cycle``)
+and the alert engine (``LateCornerMonitor.run_cycle``) run against a local
+stub HTTP server that answers SportMonks paths from the recording.
+
+Time is driven by a ``FakeClock``: at ``--speed 1`` cycles are spaced as they
+were recorded, ``--speed 10`` runs ten times faster, and ``--speed 0`` runs as
+fast as possible. Caches and rate limits in web_dashboard follow the fake
+clock, so their behaviour matches the recorded day.
+
+Alerts are captured instead of sent or saved. The idempotency store is
+in-memory only and DATABASE_URL is cleared, so a replay never touches
+Telegram or the production database.
+
+    python feed_replay.py recordings/2026-10-18.jsonl.gz --speed 0
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from feed_recorder import read_frames
+
+logger = logging.getLogger(__name__)
+
+INPLAY_PATH = '/livescores/inplay'
+# Path prefix the stub serves under, mirroring the real base URL
+STUB_BASE_PATH = '/v3/football'
+
+
+class FakeClock:
+    """Virtual clock starting at ``start``; ``speed`` <= 0 means no real waiting at all"""
+
+    def __init__(self, start: float, speed: float = 1.0):
+        self.speed = speed
+        self._virtual = start
+        self._real = time.monotonic()
+
+    def time(self) -> float:
+        if self.speed <= 0:
+            return self._virtual
+        return self._virtual + (time.monotonic() - self._real) * self.speed
+
+    def sleep(self, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        if self.speed <= 0:
+            self._virtual += seconds
+        else:
+            time.sleep(seconds / self.speed)
+
+    def advance_to(self, t: float) -> None:
+        """Wait until virtual time ``t`` (no-op if already past it, e.g. a slow cycle)"""
+        self.sleep(t - self.time())
+
+
+def group_cycles(frames: Iterable[Dict]) -> Iterator[List[Dict]]:
+    """Split frames into cycles: each inplay frame plus the odds frames recorded after it"""
+    cycle: List[Dict] = []
+    for frame in frames:
+        if frame.get('path') == INPLAY_PATH and cycle:
+            yield cycle
+            cycle = []
+        if frame.get('path') == INPLAY_PATH or cycle:
+            cycle.append(frame)
+    if cycle:
+        yield cycle
+
+
+class StubSportmonks:
+    """Local HTTP server answering SportMonks paths from the current cycle's frames"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # path -> responses recorded this cycle, served in order
+        self._queued: Dict[str, Deque[Tuple[int, object]]] = {}
+        # path -> most recent response served or recorded (used once a cycle's queue runs dry)
+        self._latest: Dict[str, Tuple[int, object]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def load_cycle(self, frames: List[Dict]) -> None:
+        with self._lock:
+            self._queued = {}
+            for frame in frames:
+                self._queued.setdefault(frame['path'], deque()).append((frame.get('status', 200), frame.get('body')))
+
+    def respond(self, path: str) -> Tuple[int, object]:
+        with self._lock:
+            queue = self._queued.get(path)
+            if queue:
+                response = queue.popleft()
+                self._latest[path] = response
+                self.hits += 1
+                return response
+            if path in self._latest:
+                self.hits += 1
+                return self._latest[path]
+            self.misses += 1
+            return 404, {'data': [], 'message': f'No recorded response for {path}'}
+
+    def start(self) -> 'StubSportmonks':
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = urlparse(self.path).path
+                if path.startswith(STUB_BASE_PATH):
+                    path = path[len(STUB_BASE_PATH):]
+                status, body = stub.respond(path)
+                payload = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass  # Keep replay output readable
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self._server.serve_forever, name='sportmonks-stub', daemon=True).start()
+        return self
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{STUB_BASE_PATH}"
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+def _prepare_environment(base_url: str) -> None:
+    """Point every SportMonks caller at the stub and disable persistent side effects"""
+    os.environ['SPORTMONKS_BASE_URL'] = base_url
+    os.environ.setdefault('SPORTMONKS_API_KEY', 'replay')
+    os.environ.setdefault('TELEGRAM_BOT_TOKEN', 'replay')
+    os.environ.setdefault('TELEGRAM_CHAT_ID', 'replay')
+    os.environ['IDEMPOTENCY_PERSIST'] = 'false'
+    os.environ['MOMENTUM_CHECKPOINT_PATH'] = ''
+    os.environ['MOMENTUM_CHECKPOINT_DB'] = 'false'
+    os.environ['DATABASE_URL'] = ''
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+async def replay(path: str, speed: float = 1.0, max_cycles: Optional[int] = None,
+                 run_engine: bool = True) -> Dict:
+    """Replay ``path`` through the dashboard updater and alert engine; returns a summary report"""
+    stub = StubSportmonks().start()
+    _prepare_environment(stub.base_url)
+
+    import web_dashboard
+    from idempotency_store import alert_key_for_fixture, alert_store
+    web_dashboard.SPORTMONKS_BASE_URL = stub.base_url
+    alert_store.persist = False
+
+    alerts: List[Dict] = []
+
+    def capture_dashboard_alert(message):
+        alerts.append({'source': 'dashboard', 'message': message})
+        return True
+
+    def capture_engine_alert(match_data, tier, score, conditions):
+        alerts.append({'source': 'engine', 'fixture_id': match_data.get('fixture_id'), 'tier': tier,
+                       'score': score, 'conditions': conditions})
+        if match_data.get('fixture_id') is not None:
+            alert_store.mark(alert_key_for_fixture(match_data['fixture_id']))
+        return True
+
+    web_dashboard.send_telegram_alert = capture_dashboard_alert
+
+    monitor = None
+    if run_engine:
+        from main import LateCornerMonitor
+        monitor = LateCornerMonitor(send_alert=capture_engine_alert, track_alert=lambda **kwargs: True)
+
+    clock: Optional[FakeClock] = None
+    update_ms: List[float] = []
+    engine_ms: List[float] = []
+    frames = 0
+    cycles = 0
+    started = time.perf_counter()
+
+    try:
+        for cycle in group_cycles(read_frames(path)):
+            if max_cycles is not None and cycles >= max_cycles:
+                break
+            recorded_at = cycle[0]['t']
+            if clock is None:
+                clock = FakeClock(recorded_at, speed)
+                web_dashboard.set_clock(clock)
+                if monitor is not None:
+                    monitor.clock = clock
+            clock.advance_to(recorded_at)
+            stub.load_cycle(cycle)
+
+            t0 = time.perf_counter()
+            web_dashboard.run_update_cycle()
+            t1 = time.perf_counter()
+            update_ms.append((t1 - t0) * 1000)
+            if monitor is not None:
+                await monitor.run_cycle(check_results=False)
+                engine_ms.append((time.perf_counter() - t1) * 1000)
+
+            frames += len(cycle)
+            cycles += 1
+    finally:
+        stub.stop()
+        web_dashboard.set_clock(time)
+
+    return {
+        'recording': path,
+        'speed': speed,
+        'cycles': cycles,
+        'frames': frames,
+        'wall_seconds': round(time.perf_counter() - started, 3),
+        'stub_hits': stub.hits,
+        'stub_misses': stub.misses,
+        'update_cycle_ms': {'p50': round(_percentile(update_ms, 50), 2), 'p95': round(_percentile(update_ms, 95), 2),
+                            'max': round(max(update_ms, default=0.0), 2)},
+        'engine_cycle_ms': {'p50': round(_percentile(engine_ms, 50), 2), 'p95': round(_percentile(engine_ms, 95), 2),
+                            'max': round(max(engine_ms, default=0.0), 2)},
+        'alerts': alerts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay a recorded SportMonks feed offline')
+    parser.add_argument('recording', help='gzip JSON-lines file written by feed_recorder')
+    parser.add_argument('--speed', type=float, default=1.0, help='replay speed multiplier (0 = as fast as possible)')
+    parser.add_argument('--max-cycles', type=int, default=None, help='stop after this many update cycles')
+    parser.add_argument('--no-engine', action='store_true', help='only run the dashboard updater')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    report = asyncio.run(replay(args.recording, args.speed, args.max_cycles, not args.no_engine))
+    print(json.dumps(report, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Fixture Metadata Cache
+======================
+Team and league names for live fixtures, fetched once per fixture instead
+of on every inplay poll.
+
+Names never change during a match. The steady-state poll therefore asks for
+the ``live_minimal`` request profile (no participants/league), and ``join`` puts the
+cached ``participants``/``league`` back onto each raw fixture before
+parsing. Parsers see the same shape as a full poll.
+
+The cache is filled:
+- from any payload that already carries the fields (``learn``), e.g. a
+  full poll or a recorded feed
+- in bulk from the day's schedule (``load_schedule``), the first time a
+  poll has unknown fixtures each UTC day
+- for fixtures still unknown after that, with one ``/fixtures/multi`` call
+  per ``MULTI_BATCH`` ids (``fetch_missing``)
+
+If a fixture is still unknown, ``join`` reports it so the caller can fall
+back to a full-include poll for that cycle. The schedule is tried once per
+day; a failed load leaves new fixtures to ``fetch_missing``.
+
+Entries are kept for ``FIXTURE_METADATA_TTL`` seconds after a fixture was
+last seen live.
+"""
+
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+import metrics
+from request_profiles import FIXTURE_METADATA
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_METADATA_CACHE = os.getenv('FIXTURE_METADATA_CACHE', 'true').lower() != 'false'
+FIXTURE_METADATA_TTL = int(os.getenv('FIXTURE_METADATA_TTL', str(24 * 3600)))
+# /fixtures/multi accepts up to 50 ids per call
+MULTI_BATCH = 50
+
+# fetch(path, params) -> list of raw fixtures (None on failure)
+Fetch = Callable[[str, Dict], Optional[List[Dict]]]
+
+
+@dataclass
+class FixtureMetadata:
+    fixture_id: int
+    participants: List[Dict]
+    league: Dict
+    last_seen: float
+
+
+def _slim_participants(participants: Iterable[Dict]) -> List[Dict]:
+    """Only what the parsers read: id, name and home/away location"""
+    return [{'id': p.get('id'), 'name': p.get('name'), 'meta': {'location': (p.get('meta') or {}).get('location')}}
+            for p in participants]
+
+
+class FixtureMetadataCache:
+    """fixture id -> participants and league, joined onto minimal inplay payloads"""
+
+    def __init__(self, fetch: Optional[Fetch] = None, ttl_seconds: float = FIXTURE_METADATA_TTL, clock=time):
+        self.fetch = fetch
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: Dict[int, FixtureMetadata] = {}
+        self._schedule_day: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, fixture_id: int) -> bool:
+        return fixture_id in self._entries
+
+    def learn(self, fixtures: Iterable[Dict]) -> int:
+        """Cache names from raw fixtures that carry participants; returns how many were added"""
+        now = self.clock.time()
+        added = 0
+        for fixture in fixtures:
+            fixture_id = fixture.get('id')
+            participants = fixture.get('participants')
+            if not fixture_id or not participants:
+                continue
+            if fixture_id not in self._entries:
+                added += 1
+            self._entries[fixture_id] = FixtureMetadata(
+                fixture_id, _slim_participants(participants), {'name': (fixture.get('league') or {}).get('name')},
+                now)
+        return added
+
+    def load_schedule(self, day: str) -> int:
+        """Bulk-fill from the day's fixtures (``YYYY-MM-DD``), once per day"""
+        if self.fetch is None or day == self._schedule_day:
+            return 0
+        self._schedule_day = day  # One attempt per day; fetch_missing covers a failed load
+        fixtures = self.fetch(f"/fixtures/date/{day}", FIXTURE_METADATA.params())
+        if fixtures is None:
+            logger.warning(f"⚠️ FIXTURE METADATA: Could not load the {day} schedule")
+            return 0
+        added = self.learn(fixtures)
+        logger.info(f"📅 FIXTURE METADATA: {added} fixtures cached from the {day} schedule")
+        return added
+
+    def fetch_missing(self, fixture_ids: Iterable[int]) -> int:
+        """Fetch names for unknown fixtures, MULTI_BATCH ids per call"""
+        missing = [fid for fid in fixture_ids if fid not in self._entries]
+        if self.fetch is None or not missing:
+            return 0
+        added = 0
+        for start in range(0, len(missing), MULTI_BATCH):
+            batch = missing[start:start + MULTI_BATCH]
+            fixtures = self.fetch(f"/fixtures/multi/{','.join(str(fid) for fid in batch)}", FIXTURE_METADATA.params())
+            if fixtures is not None:
+                added += self.learn(fixtures)
+        return added
+
+    def join(self, fixtures: List[Dict]) -> List[int]:
+        """Attach cached participants/league to raw fixtures lacking them; returns ids still unknown"""
+        now = self.clock.time()
+        unknown = []
+        for fixture in fixtures:
+            fixture_id = fixture.get('id')
+            if not fixture_id:
+                continue
+            entry = self._entries.get(fixture_id)
+            if fixture.get('participants'):
+                # Full payload (fallback poll, recorded feed): nothing to join, keep the names
+                if entry is None:
+                    self.learn([fixture])
+                else:
+                    entry.last_seen = now
+                continue
+            metrics.record_cache('fixture_metadata', hit=entry is not None)
+            if entry is None:
+                self.misses += 1
+                unknown.append(fixture_id)
+                continue
+            self.hits += 1
+            entry.last_seen = now
+            fixture['participants'] = entry.participants
+            fixture.setdefault('league', entry.league)
+        return unknown
+
+    def expire(self) -> None:
+        """Drop fixtures not seen live for ``ttl_seconds``"""
+        cutoff = self.clock.time() - self.ttl_seconds
+        for fixture_id in [fid for fid, entry in self._entries.items() if entry.last_seen < cutoff]:
+            del self._entries[fixture_id]
+
+
+# Global cache used by the dashboard updater (its fetch function is attached by web_dashboard)
+fixture_metadata = FixtureMetadataCache()
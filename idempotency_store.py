@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Alert Idempotency Store
+=======================
+Single dedup store shared by the alert engine, the Telegram sender and the
+dashboard's legacy 85' alerts. The legacy alerts use their own key namespace
+so they never block the engine's alert for the same fixture.
+
+Keys live in a bounded in-memory LRU so the hot-path check never touches the
+database. The ``alert_keys`` table (keyed by alert_key, with its namespace) is
+the durable backing: it is read once to warm the cache after a restart and
+written when a key is marked as sent, whether or not an alert row exists.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# How many keys to keep in memory and how far back to warm from the database
+IDEMPOTENCY_CACHE_SIZE = int(os.getenv('IDEMPOTENCY_CACHE_SIZE', '20000'))
+IDEMPOTENCY_WARM_HOURS = int(os.getenv('IDEMPOTENCY_WARM_HOURS', '48'))
+
+
+# Key namespaces: the alert engine (one alert per fixture, enforced in the DB too) and the legacy dashboard rule
+FIXTURE_NAMESPACE = 'fixture'
+DASHBOARD_85_NAMESPACE = 'dashboard85'
+
+
+def alert_key_for_fixture(fixture_id, namespace: str = FIXTURE_NAMESPACE) -> str:
+    """One alert per fixture - the same rule save_alert enforces in the DB."""
+    return f"{namespace}:{int(fixture_id)}"
+
+
+class IdempotencyStore:
+    """LRU front cache backed by the ``alert_keys`` table."""
+
+    def __init__(self, capacity: int = IDEMPOTENCY_CACHE_SIZE, warm_hours: int = IDEMPOTENCY_WARM_HOURS,
+                 persist: bool = True):
+        self.capacity = capacity
+        self.warm_hours = warm_hours
+        self.persist = persist
+        self._keys: 'OrderedDict[str, None]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._warmed = False
+
+    def _get_db(self):
+        # Imported lazily so the dashboard and Telegram sender work without a database
+        from database import get_database
+        return get_database()
+
+    def _remember(self, key: str) -> None:
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        while len(self._keys) > self.capacity:
+            self._keys.popitem(last=False)
+
+    def warm(self, keys: Optional[Iterable[str]] = None) -> int:
+        """Load recently sent keys (from the DB unless ``keys`` is given). Runs once."""
+        with self._lock:
+            if self._warmed:
+                return 0
+            self._warmed = True
+
+        if keys is None:
+            if not self.persist:
+                return 0
+            try:
+                keys = self._get_db().get_recent_alert_keys(self.warm_hours)
+            except Exception as e:
+                logger.warning(f"⚠️ IDEMPOTENCY: Could not warm cache from database: {e}")
+                return 0
+
+        count = 0
+        with self._lock:
+            for key in keys:
+                if key:
+                    self._remember(key)
+                    count += 1
+        logger.info(f"🔑 IDEMPOTENCY: Warmed {count} alert keys (last {self.warm_hours}h)")
+        return count
+
+    def contains(self, key: str) -> bool:
+        """O(1) in-memory check; warms from the DB on first use only."""
+        if not self._warmed:
+            self.warm()
+        with self._lock:
+            if key in self._keys:
+                self._keys.move_to_end(key)
+                return True
+            return False
+
+    def mark(self, key: str, fixture_id: Optional[int] = None, namespace: str = FIXTURE_NAMESPACE) -> None:
+        """Record ``key`` as sent, in memory and in the database."""
+        with self._lock:
+            self._remember(key)
+
+        if self.persist:
+            try:
+                self._get_db().record_alert_key(key, namespace, fixture_id)
+            except Exception as e:
+                # The in-memory mark still protects this process
+                logger.warning(f"⚠️ IDEMPOTENCY: Could not persist key {key}: {e}")
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+# Global instance shared by every alert path in this process
+alert_store = IdempotencyStore(persist=os.getenv('IDEMPOTENCY_PERSIST', 'true').lower() != 'false')
+
+
+def is_fixture_alerted(fixture_id, namespace: str = FIXTURE_NAMESPACE) -> bool:
+    """Has an alert already been sent for this fixture?"""
+    return alert_store.contains(alert_key_for_fixture(fixture_id, namespace))
+
+
+def mark_fixture_alerted(fixture_id, namespace: str = FIXTURE_NAMESPACE) -> None:
+    """Record that an alert was sent for this fixture."""
+    alert_store.mark(alert_key_for_fixture(fixture_id, namespace), fixture_id=int(fixture_id), namespace=namespace)
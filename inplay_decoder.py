@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Inplay Decoder
+==============
+Decodes a ``/livescores/inplay`` body one fixture at a time, keeping only
+the fixtures the dashboard can use.
+
+``response.json()`` turns the whole payload (every live fixture worldwide,
+with statistics) into Python objects, and the parser then throws most of
+them away: fixtures without a ticking period never become match dicts.
+``decode_inplay`` splits the ``data`` array on the raw bytes instead: each
+fixture's extent comes from the brace depth (one numpy pass over the
+body), the fixture is checked for a ticking period on its bytes
+(``"ticking":true``), and only the survivors are decoded. The rest of the
+payload (``rate_limit``, ``pagination``, ...) is decoded with an empty
+``data`` array.
+
+Brace counting does not parse strings, so a brace inside a team name could
+put a boundary in the wrong place. Every surviving slice must decode to a
+fixture and the array must end exactly where the walk ends; otherwise the
+whole body is decoded the regular way and filtered in Python. The result
+is the same either way.
+"""
+
+import json
+import logging
+import os
+import re
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+INPLAY_STREAM_DECODE = os.getenv('INPLAY_STREAM_DECODE', 'true').lower() != 'false'
+
+_DATA_START = re.compile(rb'\s*\{\s*"data"\s*:\s*\[')
+_TICKING = re.compile(rb'"ticking"\s*:\s*true')
+_OPEN, _CLOSE = ord('{'), ord('}')
+
+decode_seconds = metrics.registry.histogram(
+    'latecorners_inplay_decode_seconds', 'Time to decode one inplay response body', ['mode'],
+    buckets=metrics.COMPUTE_BUCKETS)
+fixtures_total = metrics.registry.counter(
+    'latecorners_inplay_fixtures_total', 'Inplay fixtures seen by the decoder', ['result'])
+
+
+class SliceError(ValueError):
+    """The byte walk lost its place in the data array"""
+
+
+def has_ticking_period(raw) -> bool:
+    return _TICKING.search(raw) is not None
+
+
+def _is_ticking(fixture: Dict) -> bool:
+    return any(period.get('ticking', False) for period in fixture.get('periods') or [])
+
+
+def fixture_slices(body: bytes, start: int) -> Tuple[List[Tuple[int, int]], int]:
+    """(start, end) of each object in the array opening just before ``start``, and the index of its ``]``
+
+    Brace depth is computed over the whole body with numpy; the array's
+    elements are the objects at depth 2 (inside the top-level object).
+    """
+    chars = np.frombuffer(body, dtype=np.uint8)
+    braces = np.flatnonzero((chars == _OPEN) | (chars == _CLOSE))
+    opens = chars[braces] == _OPEN
+    depth = np.cumsum(np.where(opens, 1, -1).astype(np.int16), dtype=np.int16)
+    starts = braces[opens & (depth == 2)].tolist()
+    ends = (braces[~opens & (depth == 1)] + 1).tolist()
+    if len(starts) != len(ends):
+        raise SliceError("unbalanced braces")
+    slices, previous = [], start
+    for first, last in zip(starts, ends):
+        if first < start:
+            continue
+        separator = body[previous:first].strip()
+        if separator.startswith(b']'):
+            break
+        if separator != (b',' if slices else b''):
+            raise SliceError(f"unexpected {separator[:20]!r} before the object at {first}")
+        slices.append((first, last))
+        previous = last
+    closing = body.index(b']', previous)
+    if body[previous:closing].strip():
+        raise SliceError(f"unexpected data after the object at {previous}")
+    return slices, closing
+
+
+def _stream_decode(body: bytes, keep: Callable[[bytes], bool]) -> Tuple[Dict, int]:
+    head = _DATA_START.match(body)
+    if head is None:
+        raise SliceError("data is not the first key")
+    slices, closing = fixture_slices(body, head.end())
+    view = memoryview(body)
+    kept = [view[first:last] for first, last in slices if keep(view[first:last])]
+    # One decode for all survivors, one for everything around the array
+    fixtures = json.loads(b'[' + b','.join(kept) + b']')
+    if not all(isinstance(fixture, dict) and 'id' in fixture and _is_ticking(fixture) for fixture in fixtures):
+        raise SliceError("a kept slice is not a live fixture")
+    payload = json.loads(body[:head.end()] + body[closing:])
+    payload['data'] = fixtures
+    return payload, len(slices) - len(kept)
+
+
+def decode_inplay(body: bytes, keep: Callable[[bytes], bool] = has_ticking_period) -> Dict:
+    """Inplay payload whose ``data`` holds only fixtures with a ticking period"""
+    try:
+        with decode_seconds.time(mode='stream'):
+            payload, skipped = _stream_decode(body, keep)
+    except ValueError as e:
+        logger.debug("⚠️ INPLAY DECODE: Streaming decode failed (%s) - decoding the full body", e)
+        with decode_seconds.time(mode='full'):
+            payload = json.loads(body)
+            data = payload.get('data') or []
+            payload['data'] = [fixture for fixture in data if _is_ticking(fixture)]
+            skipped = len(data) - len(payload['data'])
+    fixtures_total.inc(len(payload['data']), result='decoded')
+    fixtures_total.inc(skipped, result='skipped')
+    return payload
@@ -3,6 +3,7 @@ import requests
 from dotenv import load_dotenv
 from datetime import datetime
 import json
+from request_profiles import LIVE_OVERVIEW, record_response_bytes
 
 load_dotenv()
 
@@ -17,13 +18,11 @@ def get_live_dashboard():
     
     # Get live matches
     url = f"https://api.sportmonks.com/v3/football/livescores/inplay"
-    params = {
-        'api_token': api_key,
-        'include': 'scores;participants;state;periods;league;statistics'
-    }
+    params = dict(LIVE_OVERVIEW.params(), api_token=api_key)
     
     try:
         response = requests.get(url, params=params, timeout=30)
+        record_response_bytes(LIVE_OVERVIEW.name, response)
         response.raise_for_status()
         
         matches = response.json().get('data', [])
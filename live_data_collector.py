@@ -4,6 +4,7 @@ from dotenv import load_dotenv
 import json
 import time
 from datetime import datetime
+from request_profiles import LIVE_COLLECTOR, ODDS_1X2, record_response_bytes
 
 load_dotenv()
 
@@ -23,13 +24,11 @@ class LiveDataCollector:
         
         # Get live matches with all necessary includes
         url = f"https://api.sportmonks.com/v3/football/livescores/inplay"
-        params = {
-            'api_token': self.api_key,
-            'include': 'scores;participants;state;periods;league;statistics'
-        }
+        params = dict(LIVE_COLLECTOR.params(), api_token=self.api_key)
         
         try:
             response = requests.get(url, params=params, timeout=30)
+            record_response_bytes(LIVE_COLLECTOR.name, response)
             response.raise_for_status()
             
             matches = response.json().get('data', [])
@@ -214,12 +213,10 @@ class LiveDataCollector:
         
         try:
             fixture_url = f"https://api.sportmonks.com/v3/football/fixtures/{match_id}"
-            fixture_params = {
-                'api_token': self.api_key,
-                'include': 'odds;participants;scores'
-            }
+            fixture_params = dict(ODDS_1X2.params(), api_token=self.api_key)
             
             response = requests.get(fixture_url, params=fixture_params, timeout=15)
+            record_response_bytes(ODDS_1X2.name, response)
             if response.status_code != 200:
                 return None
                 
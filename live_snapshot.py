@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Live Snapshot Publisher
+=======================
+Versioned copy of the dashboard's live data. The background updater publishes
+once per cycle; every serialization happens here, once per version, so the
+cost of serving viewers no longer depends on how many tabs are open.
+
+Each publish produces:
+- a full snapshot (sent to new / lagging clients)
+- a per-fixture diff against the previous version (upserts + removals)
+both pre-encoded as Server-Sent Events frames, plus the /api/live-matches and
+/api/stats response bodies with their ETags and gzip (and brotli, when the
+``brotli`` package is installed) variants.
+
+Projected / minute-filtered /api/live-matches bodies are rendered on first
+request and cached until the next version.
+"""
+
+import gzip
+import json
+import threading
+import time
+import zlib
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import brotli  # Optional - gzip is always available
+except ImportError:
+    brotli = None
+
+# Number of diffs kept so a slightly lagging client can catch up without a full snapshot
+DIFF_HISTORY = 5
+# Seconds between SSE keep-alive comments (keeps proxies from closing idle streams)
+SSE_HEARTBEAT_SECONDS = 15
+# Bodies smaller than this are not worth compressing
+MIN_COMPRESS_BYTES = 1024
+GZIP_LEVEL = 6
+# Distinct ?fields= / minute-range queries cached per version
+QUERY_CACHE_SIZE = 32
+
+
+def _dumps(obj) -> str:
+    return json.dumps(obj, separators=(',', ':'), sort_keys=True, default=str)
+
+
+def _sse_frame(event: str, epoch: str, version: int, payload: str) -> bytes:
+    # Epoch-qualified like the ETags, so an id from before a restart never matches a new version
+    return f"id: {epoch}-{version}\nevent: {event}\ndata: {payload}\n\n".encode('utf-8')
+
+
+def _accepted_encodings(accept_encoding: str) -> set:
+    """Codings from an Accept-Encoding header, skipping any explicitly refused with q=0"""
+    accepted = set()
+    for part in (accept_encoding or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = params.strip()
+        if q.startswith('q='):
+            try:
+                if float(q[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding)
+    return accepted
+
+
+class CachedBody:
+    """A pre-rendered JSON body with its compressed variants and ETag"""
+
+    __slots__ = ('etag', 'identity', 'gzip', 'br')
+
+    def __init__(self, body: bytes, etag: str):
+        self.etag = etag
+        self.identity = body
+        self.gzip: Optional[bytes] = None
+        self.br: Optional[bytes] = None
+        if len(body) >= MIN_COMPRESS_BYTES:
+            self.gzip = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+            if brotli is not None:
+                self.br = brotli.compress(body)
+
+    def select(self, accept_encoding: str) -> Tuple[bytes, Optional[str], str]:
+        """(body, content-encoding, etag) for the best coding the client accepts"""
+        accepted = _accepted_encodings(accept_encoding)
+        if self.br is not None and 'br' in accepted:
+            return self.br, 'br', f"{self.etag}-br"
+        if self.gzip is not None and ('gzip' in accepted or '*' in accepted):
+            return self.gzip, 'gzip', f"{self.etag}-gz"
+        return self.identity, None, self.etag
+
+
+def _match_in_range(match: Dict, min_minute: Optional[int], max_minute: Optional[int]) -> bool:
+    minute = match.get('minute') or 0
+    if min_minute is not None and minute < min_minute:
+        return False
+    if max_minute is not None and minute > max_minute:
+        return False
+    return True
+
+
+class LiveSnapshotPublisher:
+    """Holds the latest published live data and its pre-encoded forms"""
+
+    def __init__(self, diff_history: int = DIFF_HISTORY):
+        self._cond = threading.Condition()
+        self.version = 0
+        self.published_at: Optional[float] = None
+        # When the published data was fetched (older than published_at while a stale snapshot is served)
+        self.data_at: Optional[float] = None
+        self.matches: List[Dict] = []
+        self.stats: Dict = {}
+        # match_id -> serialized fixture JSON (used for diffing and assembling snapshots)
+        self._fixture_json: Dict[int, str] = {}
+        self._order: List[int] = []
+        self._snapshot_frame: bytes = b''
+        # (base version, version, encoded diff frame) for the most recent versions
+        self._diff_frames: Deque[Tuple[int, int, bytes]] = deque(maxlen=diff_history)
+        # ETags must not repeat across restarts, when the version counter starts over
+        self.epoch = format(int(time.time()), 'x')
+        self._live_body: Optional[CachedBody] = None
+        self._stats_body: Optional[CachedBody] = None
+        self._query_bodies: 'OrderedDict[Tuple, CachedBody]' = OrderedDict()
+        # Called as listener(version, matches, stats, data_at, epoch) after every publish (e.g. the snapshot bus)
+        self._listeners: List[Callable[[int, List[Dict], Dict, Optional[float], str], None]] = []
+
+    def add_listener(self, listener: Callable[[int, List[Dict], Dict, Optional[float], str], None]) -> None:
+        """Register a callback run after every publish, outside the publisher lock"""
+        self._listeners.append(listener)
+
+    def publish(self, matches: List[Dict], stats: Dict, data_at: Optional[float] = None,
+                version: Optional[int] = None, epoch: Optional[str] = None) -> int:
+        """Publish a new version. Serializes each fixture once and diffs by string compare.
+
+        Web workers pass the ingestor's ``version`` and ``epoch`` so every worker
+        numbers (and ETags) the same data the same way; versions the bus skipped
+        leave a gap that lagging clients bridge with a snapshot.
+        """
+        fixture_json: Dict[int, str] = {}
+        order: List[int] = []
+        for match in matches:
+            match_id = match.get('match_id')
+            fixture_json[match_id] = _dumps(match)
+            order.append(match_id)
+
+        stats_json = _dumps(stats)
+        alerts_triggered = stats.get('alerts_triggered', 0)
+
+        with self._cond:
+            previous = self._fixture_json
+            base = self.version
+            if epoch is not None and epoch != self.epoch:
+                # A restarted ingestor numbers from 1 again: nothing published before can be diffed against
+                self.epoch = epoch
+                self._diff_frames.clear()
+                base = 0
+            elif version is not None and version <= self.version:
+                # Redelivered on reconnect - already published
+                return self.version
+            version = self.version + 1 if version is None else version
+
+            upserts = [fixture_json[mid] for mid in order if previous.get(mid) != fixture_json[mid]]
+            removed = [mid for mid in previous if mid not in fixture_json]
+
+            snapshot_json = (
+                '{"version":%d,"matches":[%s],"stats":%s}'
+                % (version, ','.join(fixture_json[mid] for mid in order), stats_json)
+            )
+            diff_json = (
+                '{"version":%d,"base_version":%d,"upserts":[%s],"removed":%s,"stats":%s}'
+                % (version, base, ','.join(upserts), _dumps(removed), stats_json)
+            )
+            live_json = (
+                '{"alerts_triggered":%s,"matches":[%s],"stats":%s}'
+                % (_dumps(alerts_triggered), ','.join(fixture_json[mid] for mid in order), stats_json)
+            )
+
+            self.version = version
+            self.published_at = time.time()
+            self.data_at = self.published_at if data_at is None else data_at
+            epoch = self.epoch
+            self.matches = matches
+            self.stats = stats
+            self._fixture_json = fixture_json
+            self._order = order
+            self._snapshot_frame = _sse_frame('snapshot', self.epoch, version, snapshot_json)
+            if base:
+                self._diff_frames.append((base, version, _sse_frame('diff', self.epoch, version, diff_json)))
+            self._live_body = CachedBody(live_json.encode('utf-8'), self._etag(version, 'live'))
+            self._stats_body = CachedBody(stats_json.encode('utf-8'), self._etag(version, 'stats'))
+            self._query_bodies.clear()
+            self._cond.notify_all()
+
+        for listener in self._listeners:
+            try:
+                listener(version, matches, stats, self.data_at, epoch)
+            except Exception as e:
+                print(f"⚠️ Snapshot listener failed: {e}")
+
+        return version
+
+    def _etag(self, version: int, kind: str) -> str:
+        return f"{self.epoch}-{version}-{kind}"
+
+    def stats_body(self) -> Optional[CachedBody]:
+        """Pre-rendered /api/stats body for the current version (None before the first publish)"""
+        return self._stats_body
+
+    def live_matches_body(self, fields: Optional[Iterable[str]] = None, min_minute: Optional[int] = None,
+                          max_minute: Optional[int] = None) -> Optional[CachedBody]:
+        """/api/live-matches body, optionally projected to ``fields`` and filtered by minute range"""
+        field_key = tuple(sorted(set(fields))) if fields else None
+        if field_key is None and min_minute is None and max_minute is None:
+            return self._live_body
+
+        key = (field_key, min_minute, max_minute)
+        with self._cond:
+            if self._live_body is None:
+                return None
+            cached = self._query_bodies.get(key)
+            if cached is not None:
+                self._query_bodies.move_to_end(key)
+                return cached
+            version = self.version
+            matches = self.matches
+            fixture_json = self._fixture_json
+            stats = self.stats
+
+        # Render outside the lock - the updater must never wait on a viewer's query
+        selected = [m for m in matches if _match_in_range(m, min_minute, max_minute)]
+        if field_key is None:
+            match_parts = [fixture_json[m.get('match_id')] for m in selected]
+        else:
+            wanted = set(field_key) | {'match_id'}
+            match_parts = [_dumps({k: v for k, v in m.items() if k in wanted}) for m in selected]
+        body = (
+            '{"alerts_triggered":%s,"matches":[%s],"stats":%s}'
+            % (_dumps(stats.get('alerts_triggered', 0)), ','.join(match_parts), _dumps(stats))
+        )
+        query_tag = format(zlib.crc32(repr(key).encode('utf-8')), '08x')
+        cached = CachedBody(body.encode('utf-8'), self._etag(version, f"live-{query_tag}"))
+
+        with self._cond:
+            # Only cache if no newer version was published while rendering
+            if self.version == version:
+                self._query_bodies[key] = cached
+                while len(self._query_bodies) > QUERY_CACHE_SIZE:
+                    self._query_bodies.popitem(last=False)
+        return cached
+
+    def frames_since(self, client_version: int) -> Tuple[List[bytes], int]:
+        """Frames that bring a client at ``client_version`` up to date, plus the version they reach"""
+        with self._cond:
+            if client_version >= self.version:
+                return [], client_version
+            # Diffs are only usable if they form an unbroken chain from the client's version
+            diffs, reached = [], client_version
+            for base, version, frame in self._diff_frames:
+                if base == reached:
+                    diffs.append(frame)
+                    reached = version
+            if client_version > 0 and reached == self.version:
+                return diffs, self.version
+            return [self._snapshot_frame], self.version
+
+    def wait_for_version(self, after: int, timeout: float) -> int:
+        """Block until a version newer than ``after`` is published (or timeout)"""
+        with self._cond:
+            if self.version <= after:
+                self._cond.wait(timeout)
+            return self.version
+
+    def sse_stream(self, last_event_id: Optional[str] = None) -> Iterator[bytes]:
+        """Generator for a text/event-stream response: snapshot on connect, then diffs"""
+        # Ids are "<epoch>-<version>"; one from another epoch (a restart) gets a full snapshot
+        epoch, _, version = (last_event_id or '').rpartition('-')
+        try:
+            client_version = int(version) if epoch == self.epoch else 0
+        except ValueError:
+            client_version = 0
+        if client_version > self.version:
+            client_version = 0
+
+        # Tell the browser how long to wait before reconnecting
+        yield b"retry: 5000\n\n"
+
+        while True:
+            frames, reached = self.frames_since(client_version)
+            if frames:
+                for frame in frames:
+                    yield frame
+                client_version = reached
+                continue
+
+            newest = self.wait_for_version(client_version, SSE_HEARTBEAT_SECONDS)
+            if newest <= client_version:
+                yield b": keep-alive\n\n"
+
+
+# Global publisher used by the dashboard updater and its HTTP endpoints
+live_publisher = LiveSnapshotPublisher()
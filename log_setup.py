@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Logging Setup
+=============
+One place to configure logging for every role.
+
+- ``LOG_FORMAT=json`` (default) writes one JSON object per line, which is what
+  Railway's log search indexes. ``LOG_FORMAT=text`` gives the classic
+  ``asctime - name - level - message`` lines for local runs.
+- ``LOG_LEVEL`` sets the root level. ``LOG_LEVELS`` overrides it per subsystem,
+  e.g. ``main=INFO,web_dashboard=WARNING,sportmonks_client=WARNING``.
+- Hot paths log with ``%`` arguments (``logger.debug("x=%s", x)``), so nothing
+  is formatted unless the record is emitted.
+- Per-fixture decision traces go through ``FixtureTrace``. They are emitted at
+  DEBUG, or at INFO for fixtures listed in ``TRACE_FIXTURES`` (or added at runtime
+  with ``trace_fixtures.add``).
+- ``log_summary`` emits a single record with structured fields, e.g. one per
+  update cycle.
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+from typing import Dict, Optional
+
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'json').lower()
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_LEVELS = os.getenv('LOG_LEVELS', '')
+
+# Fixture ids whose decision trace is logged at INFO regardless of level
+trace_fixtures = {int(fid) for fid in os.getenv('TRACE_FIXTURES', '').split(',') if fid.strip().isdigit()}
+
+_HANDLER_MARK = '_latecorners_handler'
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record; ``extra={'fields': {...}}`` is merged in"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'ts': time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        fields = getattr(record, 'fields', None)
+        if fields:
+            payload.update(fields)
+        if record.exc_info:
+            payload['exc'] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class TextFormatter(logging.Formatter):
+    """The repo's classic line format, with structured fields appended as key=value"""
+
+    def __init__(self):
+        super().__init__('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = getattr(record, 'fields', None)
+        if fields:
+            line += ' | ' + ' '.join(f"{key}={value}" for key, value in fields.items())
+        return line
+
+
+def _parse_levels(spec: str) -> Dict[str, int]:
+    levels = {}
+    for part in spec.split(','):
+        if '=' in part:
+            name, level = part.split('=', 1)
+            value = logging.getLevelName(level.strip().upper())
+            if isinstance(value, int):
+                levels[name.strip()] = value
+    return levels
+
+
+def configure_logging(level: Optional[str] = None, fmt: Optional[str] = None) -> logging.Logger:
+    """Install the root handler once (safe to call from every entry point)"""
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, (level or LOG_LEVEL), logging.INFO))
+
+    fmt = (fmt or LOG_FORMAT).lower()
+    if not any(getattr(h, _HANDLER_MARK, False) for h in root.handlers):
+        # Replace basicConfig-style handlers so every line goes out in one format
+        for handler in list(root.handlers):
+            if isinstance(handler, logging.StreamHandler) and getattr(handler, 'stream', None) in (sys.stderr, sys.stdout):
+                root.removeHandler(handler)
+        handler = logging.StreamHandler(sys.stdout)
+        setattr(handler, _HANDLER_MARK, True)
+        root.addHandler(handler)
+    for handler in root.handlers:
+        if getattr(handler, _HANDLER_MARK, False):
+            handler.setFormatter(JsonFormatter() if fmt == 'json' else TextFormatter())
+
+    for name, value in _parse_levels(LOG_LEVELS).items():
+        logging.getLogger(name).setLevel(value)
+    return root
+
+
+class FixtureTrace:
+    """Per-fixture decision trace: DEBUG normally, INFO for traced fixtures, free when disabled"""
+
+    __slots__ = ('logger', 'fixture_id', 'level', 'enabled')
+
+    def __init__(self, logger: logging.Logger, fixture_id):
+        self.logger = logger
+        self.fixture_id = fixture_id
+        self.level = logging.INFO if fixture_id in trace_fixtures else logging.DEBUG
+        self.enabled = logger.isEnabledFor(self.level)
+
+    def __bool__(self) -> bool:
+        return self.enabled
+
+    def __call__(self, msg: str, *args) -> None:
+        if self.enabled:
+            self.logger.log(self.level, msg, *args, extra={'fields': {'fixture_id': self.fixture_id}})
+
+
+def log_summary(logger: logging.Logger, msg: str, level: int = logging.INFO, **fields) -> None:
+    """One structured record (e.g. the per-cycle summary)"""
+    if logger.isEnabledFor(level):
+        logger.log(level, msg, extra={'fields': fields})
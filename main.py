@@ -5,7 +5,7 @@ import copy
 import logging
 import time
 from datetime import datetime
-from typing import Dict, Set, Optional
+from typing import Dict, List, Set, Optional
 import sys
 import os
 
@@ -23,15 +23,39 @@ from result_checker import check_pending_results
 from startup_flag import is_first_startup, mark_startup
 # ReliableCornerSystem removed in favor of Late Momentum alerts
 from momentum_tracker import MomentumTracker
+from match_clock import MatchClock
+from momentum_checkpoint import MomentumCheckpoint, MOMENTUM_CHECKPOINT_INTERVAL
+from idempotency_store import alert_store, alert_key_for_fixture
+import snapshot_bus
+from log_setup import FixtureTrace, configure_logging, log_summary
+import metrics
+from alert_rules import (MAX_DRAW_ODDS, MIN_COMBINED_MOMENTUM, MIN_TOTAL_CORNERS, RuleContext, RuleEngine,
+                         late_momentum_rules)
+
+# First failing predicate -> per-cycle decision counter
+RULE_FAILURE_DECISIONS = {'alert_window': 'outside_window', 'not_alerted': 'already_alerted', 'corner_odds': 'no_odds'}
+
+# Engine sharding (production supervisor): this engine only evaluates fixtures where
+# fixture_id % ENGINE_SHARDS == ENGINE_SHARD_INDEX
+ENGINE_SHARDS = max(1, int(os.getenv('ENGINE_SHARDS', '1')))
+ENGINE_SHARD_INDEX = int(os.getenv('ENGINE_SHARD_INDEX', '0'))
+# How often an engine pushes its metrics to the ingest process's /metrics
+ENGINE_METRICS_PUSH_SECONDS = float(os.getenv('ENGINE_METRICS_PUSH_SECONDS', '15'))
 
 class LateCornerMonitor:
     """Monitor live matches for late corner betting opportunities using shared dashboard data"""
     
-    def __init__(self):
+    def __init__(self, send_alert=None, track_alert=None, clock=None):
         self.config = get_config()
+        # Clock for data ages and the match clock (feed_replay passes its FakeClock, as it does to the dashboard)
+        self.clock = clock or time
+        
+        # Alert side effects (injectable so the replay harness can capture instead of send/save)
+        self.send_alert = send_alert or send_corner_alert_new
+        self.track_alert = track_alert or track_elite_alert
         
-        # Track which matches we've already alerted on
-        self.alerted_matches: Set[int] = set()
+        # Track which matches we've already alerted on (shared, persistent dedup store)
+        self.alert_store = alert_store
         self.monitored_matches: Set[int] = set()
         
         # Track previous stats for momentum calculation
@@ -42,41 +66,72 @@ class LateCornerMonitor:
         self.result_check_counter = 0  # For hourly result checking
         # Momentum tracker (10-minute window)
         self.momentum_tracker = MomentumTracker(window_minutes=10)
+        # Checkpointed so a restart doesn't blank every fixture's window (restored on the first cycle)
+        self.momentum_checkpoint = MomentumCheckpoint(name=f"engine-{ENGINE_SHARD_INDEX}-of-{ENGINE_SHARDS}")
+        self._momentum_restored = False
+        self._last_momentum_checkpoint = 0.0
+        self._last_metrics_push = 0.0
+        # Live clock between polls, so the alert window opens at 85:00 rather than at the next poll
+        self.match_clock = MatchClock()
+        # Late Momentum rules, evaluated cheapest-first (see alert_rules)
+        self.alert_rules = RuleEngine(late_momentum_rules(
+            is_alerted=lambda fixture_id: self.alert_store.contains(alert_key_for_fixture(fixture_id)),
+            fetch_corner_odds=self._get_corner_odds,
+            fetch_draw_odds=self._get_draw_odds,
+        ))
+        # Per-cycle decision counts (one summary record per cycle instead of per-fixture INFO lines)
+        self._decisions: Dict[str, int] = {}
+        # When the live data being evaluated was received (data-age at alert time)
+        self._data_received_at: Optional[float] = None
         
         self.logger = self._setup_logging()
         
     def _setup_logging(self):
-        """Setup logging configuration"""
-        
-        # Create logger
-        logger = logging.getLogger()
-        logger.setLevel(getattr(logging, self.config.LOG_LEVEL))
-        
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        
-        # Create console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(getattr(logging, self.config.LOG_LEVEL))
-        console_handler.setFormatter(formatter)
-        
-        # Add handler to logger
-        if not logger.handlers:
-            logger.addHandler(console_handler)
-        
-        return logger
+        """Setup logging configuration (JSON by default, per-subsystem levels - see log_setup)"""
+        configure_logging()  # LOG_LEVEL / LOG_LEVELS from the environment
+        return logging.getLogger('main')
+    
+    def _count_decision(self, outcome: str):
+        self._decisions[outcome] = self._decisions.get(outcome, 0) + 1
+    
+    def _skip_stale_snapshot(self, stats: Dict) -> List[Dict]:
+        """No evaluation on a stale snapshot: the match clock would carry old stats into the 85' window"""
+        self.logger.warning(f"Skipping alert evaluation - live data is stale "
+                            f"({stats.get('total_live', 0)} matches, {stats.get('data_age_seconds')}s old)")
+        self._count_decision('stale_snapshot')
+        return []
     
     def _get_shared_live_matches(self):
         """Get live matches from the shared dashboard data source"""
         try:
-            # Try dashboard buffer if available; otherwise fallback to direct API client (no console prints)
-            try:
-                from web_dashboard import live_matches_data  # type: ignore
-                source_matches = list(live_matches_data) if live_matches_data else []
-            except Exception:
-                source_matches = []
+            self._data_received_at = self.clock.time()
+            subscriber = snapshot_bus.snapshot_subscriber
+            if subscriber is not None:
+                # Engine role: the ingestor owns the API budget - never fall back to direct calls
+                # A stale snapshot (SportMonks outage) is as old as its data, not its delivery
+                self._data_received_at = subscriber.latest_data_at or subscriber.last_received_at
+                if subscriber.latest_stats.get('stale'):
+                    return self._skip_stale_snapshot(subscriber.latest_stats)
+                source_matches = [
+                    m for m in subscriber.latest_matches
+                    if int(m.get('match_id') or 0) % ENGINE_SHARDS == ENGINE_SHARD_INDEX
+                ]
+                if not source_matches:
+                    self.logger.info(f"Snapshot bus has no live matches yet (v{subscriber.last_version})")
+                    return []
+            else:
+                # Try dashboard buffer if available; otherwise fallback to direct API client (no console prints)
+                try:
+                    from web_dashboard import live_matches_data, live_publisher  # type: ignore
+                    source_matches = list(live_matches_data) if live_matches_data else []
+                    self._data_received_at = getattr(live_publisher, 'data_at', None) or self._data_received_at
+                    dashboard_stats = live_publisher.stats
+                except Exception:
+                    source_matches = []
+                    dashboard_stats = {}
+                if dashboard_stats.get('stale'):
+                    # SportMonks is failing for the dashboard too - a second direct call would only add load
+                    return self._skip_stale_snapshot(dashboard_stats)
 
             if not source_matches:
                 # API fallback to avoid Unicode printing issues in web_dashboard
@@ -290,25 +345,14 @@ class LateCornerMonitor:
             if not match_stats:
                 return None
             
-            # Log minimal live stats only (avoid noisy unused fields)
-            try:
-                minimal_log = {
-                    'fixture_id': fixture_id,
-                    'minute': match_stats.minute,
-                    'home_team': match_stats.home_team,
-                    'away_team': match_stats.away_team,
-                    'score': f"{match_stats.home_score}-{match_stats.away_score}",
-                    'total_corners': match_stats.total_corners,
-                    'shots_on_target': match_stats.shots_on_target,
-                    'shots_total': match_stats.shots_total,
-                    'possession': match_stats.possession,
-                    'dangerous_attacks': match_stats.dangerous_attacks,
-                    'attacks': match_stats.attacks,
-                }
-                self.logger.info(f"🧪 DEBUG (minimal): {minimal_log}")
-            except Exception:
-                # Fallback to raw object if something goes wrong
-            self.logger.info(f"🧪 DEBUG: Stats for match {fixture_id}: {match_stats}")
+            # Decision trace: DEBUG, or INFO for fixtures in TRACE_FIXTURES (no formatting otherwise)
+            trace = FixtureTrace(self.logger, fixture_id)
+            if trace:
+                trace("🧪 Stats: %s vs %s %s-%s %d' corners=%s sot=%s shots=%s pos=%s da=%s att=%s",
+                      match_stats.home_team, match_stats.away_team, match_stats.home_score, match_stats.away_score,
+                      match_stats.minute, match_stats.total_corners, match_stats.shots_on_target,
+                      match_stats.shots_total, match_stats.possession, match_stats.dangerous_attacks,
+                      match_stats.attacks)
             
             # Store current stats for momentum tracking
             current_stats = {
@@ -337,13 +381,10 @@ class LateCornerMonitor:
                     self.monitored_matches.remove(fixture_id)
                     if fixture_id in self.previous_stats:
                         del self.previous_stats[fixture_id]
-                    self.logger.info(f"🏁 REMOVED finished match {fixture_id} from monitoring")
+                    self.logger.info("🏁 REMOVED finished match %s from monitoring", fixture_id)
+                self.match_clock.retain(self.monitored_matches)
+                self._count_decision('finished')
                 return None
-            
-            # PRE-CHECKS: Log basic match info
-            self.logger.info(f"🔍 PRE-CHECKS: Match {fixture_id} ({match_stats.home_team} vs {match_stats.away_team})")
-            self.logger.info(f"   📊 Minute: {match_stats.minute} (need 85-89)")
-            self.logger.info(f"   ⚽ Corners: {match_stats.total_corners}")
             # Update momentum tracker and log 10-minute momentum
             try:
                 self.momentum_tracker.add_snapshot(
@@ -366,101 +407,59 @@ class LateCornerMonitor:
                 home_ms = momentum_scores['home']
                 away_ms = momentum_scores['away']
                 combined_total = home_ms['total'] + away_ms['total']
-                coverage_min = max(home_ms.get('window_covered', 0), away_ms.get('window_covered', 0))
-                self.logger.info(
-                    f"   ⚡ Momentum10 (window {coverage_min}m): HOME {home_ms['total']} pts (SOT {home_ms['on_target_points']}, SOFF {home_ms['off_target_points']}, DA {home_ms['dangerous_points']}, POS {home_ms['possession_points']})"
-                )
-                self.logger.info(
-                    f"                                 AWAY {away_ms['total']} pts (SOT {away_ms['on_target_points']}, SOFF {away_ms['off_target_points']}, DA {away_ms['dangerous_points']}, POS {away_ms['possession_points']})"
-                )
-                self.logger.info(f"   Σ Combined Momentum10: {combined_total} pts")
+                if trace:
+                    coverage_min = max(home_ms.get('window_covered', 0), away_ms.get('window_covered', 0))
+                    trace("⚡ Momentum10 (window %sm): HOME %s (SOT %s SOFF %s DA %s POS %s) "
+                          "AWAY %s (SOT %s SOFF %s DA %s POS %s) combined %s | state %s",
+                          coverage_min, home_ms['total'], home_ms['on_target_points'], home_ms['off_target_points'],
+                          home_ms['dangerous_points'], home_ms['possession_points'], away_ms['total'],
+                          away_ms['on_target_points'], away_ms['off_target_points'], away_ms['dangerous_points'],
+                          away_ms['possession_points'], combined_total, match_stats.state)
             except Exception as e:
                 self.logger.error(f"❌ Momentum tracker error: {e}")
-            self.logger.info(f"   🎮 Match State: {match_stats.state}")
             
-            # First, check if we're in the alert window (85-89th minute)
-            if not (85 <= match_stats.minute <= 89):
-                self.logger.info(f"⏰ Match {fixture_id} outside alert window (need 85-89', currently {match_stats.minute}')")
-                # Update previous stats for momentum tracking on next cycle
-                self.previous_stats[fixture_id] = copy.deepcopy(current_stats)
-                return None
-
-            # Check if we've already alerted on this match
-            if fixture_id in self.alerted_matches:
-                self.logger.info(f"⏭️ Match {fixture_id} already alerted")
-                # Update previous stats for momentum tracking on next cycle
-                self.previous_stats[fixture_id] = copy.deepcopy(current_stats)
-                return None
-
-            # Get corner odds first - no point calculating if we can't bet
-            corner_odds = await self._get_corner_odds(fixture_id)
-            if not corner_odds:
-                self.logger.warning(f"🚫 Match {fixture_id} - No corner odds available")
-                # Update previous stats for momentum tracking on next cycle
-                self.previous_stats[fixture_id] = copy.deepcopy(current_stats)
-                return None
-            # Mark that live asian corners are available
-            current_stats['has_live_asian_corners'] = True
-
-            # Fetch live draw odds (Fulltime Result market)
-            try:
-                from sportmonks_client import SportmonksClient
-                _client = SportmonksClient()
-                draw_odds = _client.get_live_draw_odds(fixture_id)
-                self.logger.info(f"   🧮 Draw odds: {draw_odds}")
-            except Exception as e:
-                draw_odds = None
-                self.logger.error(f"   ❌ Draw odds fetch error: {e}")
-
-            # Get previous stats or empty dict if first time
-            previous_stats = self.previous_stats.get(fixture_id, {})
-            # Compute minutes passed between snapshots (1-5 clamp)
-            if previous_stats and isinstance(previous_stats, dict) and 'minute' in previous_stats:
-                raw_minutes_passed = max(0, match_stats.minute - int(previous_stats.get('minute', match_stats.minute)))
-                minutes_passed = min(5, max(1, raw_minutes_passed))
-            else:
-                minutes_passed = 5
-
-            # New Late Momentum system
+            # The polled minute can be a poll old: use the minute the clock has surely reached by now
+            now = self.clock.time()
+            self.match_clock.observe_minute(fixture_id, match_stats.minute, self._data_received_at or now)
+            alert_minute = max(match_stats.minute, self.match_clock.minute(fixture_id, now, certain=True) or 0)
+            
+            # Alert rules, cheapest predicates first: odds are only fetched for fixtures that can still pass
             combined_momentum = home_ms['total'] + away_ms['total']
-            self.logger.info(f"   🔢 Late Momentum combined: {combined_momentum} pts")
-            late_momentum_ok = (
-                85 <= match_stats.minute <= 89 and
-                current_stats.get('has_live_asian_corners', False) and
-                match_stats.total_corners >= 9 and
-                combined_momentum >= 75
-            )
-
-            # Log the analysis
-            self.logger.info(f"\n📊 ANALYZING MATCH {fixture_id}:")
-            self.logger.info(f"   {match_stats.home_team} vs {match_stats.away_team}")
-            self.logger.info(f"   Score: {match_stats.home_score}-{match_stats.away_score}")
-            self.logger.info(f"   Minute: {match_stats.minute}")
-            self.logger.info(f"   Corners: {match_stats.total_corners}")
+            rule_ctx = RuleContext(fixture_id=fixture_id, minute=alert_minute,
+                                   total_corners=match_stats.total_corners, combined_momentum=combined_momentum)
+            outcome = await self.alert_rules.evaluate(rule_ctx)
+            corner_odds = rule_ctx.values.get('corner_odds')
+            current_stats['has_live_asian_corners'] = bool(corner_odds)
 
-            # New system 2: Late Corner using Draw Odds (now also requires momentum >= 75)
-            draw_odds_ok = (
-                85 <= match_stats.minute <= 89 and
-                current_stats.get('has_live_asian_corners', False) and
-                (draw_odds is not None and draw_odds <= 1.50) and
-                combined_momentum >= 75
-            )
-
-            if not (late_momentum_ok or draw_odds_ok):
-                self.logger.info("\n❌ NO ALERT - Late Momentum system:")
-                self.logger.info(f"   • Odds: {'OK' if current_stats.get('has_live_asian_corners') else 'MISSING'}")
-                self.logger.info(f"   • Combined Momentum10: {combined_momentum} (need ≥ 75)")
-                self.logger.info(f"   • Total corners: {match_stats.total_corners} (need ≥ 9)")
-                self.logger.info("❌ NO ALERT - Draw Odds system:")
-                self.logger.info(f"   • Draw odds: {draw_odds if draw_odds is not None else 'N/A'} (need ≤ 1.50)")
-                self.logger.info(f"   • Combined Momentum10: {combined_momentum} (need ≥ 75)")
+            if outcome.rule is None:
+                failed = outcome.failed[0] if outcome.failed else None
+                self._count_decision(RULE_FAILURE_DECISIONS.get(failed, 'no_alert'))
+                if trace:
+                    trace("❌ NO ALERT %s' | failed %s | momentum %s (need ≥ %s) | corners %s (need ≥ %s) | "
+                          "odds %s | draw odds %s (need ≤ %s) | %d API calls saved",
+                          alert_minute, ', '.join(outcome.failed), combined_momentum, MIN_COMBINED_MOMENTUM,
+                          match_stats.total_corners, MIN_TOTAL_CORNERS, outcome.results.get('corner_odds', 'skipped'),
+                          rule_ctx.values.get('draw_odds', 'skipped'), MAX_DRAW_ODDS, outcome.api_calls_saved)
                 # Update previous stats for momentum tracking on next cycle
                 self.previous_stats[fixture_id] = copy.deepcopy(current_stats)
                 return None
 
+            late_momentum_ok = outcome.rule == 'LATE_MOMENTUM'
+            if 'draw_odds' not in rule_ctx.values:
+                # Not needed for the decision, but shown in the alert and saved with it
+                rule_ctx.values['draw_odds'] = await self._get_draw_odds(fixture_id)
+            draw_odds = rule_ctx.values['draw_odds']
+
             # If we get here, the alert is triggered
             triggered_tier = "LATE_MOMENTUM" if late_momentum_ok else "LATE_MOMENTUM_DRAW"
-            self.logger.info(f"\n✅ ALERT TRIGGERED! ({'Late Momentum' if late_momentum_ok else 'Late Momentum using Draw Odds'})")
+            self._count_decision('alerted')
+            if self._data_received_at is not None:
+                metrics.alert_data_age_seconds.observe(max(0.0, self.clock.time() - self._data_received_at))
+            log_summary(self.logger, "✅ ALERT TRIGGERED", fixture_id=fixture_id, tier=triggered_tier,
+                        minute=alert_minute, polled_minute=match_stats.minute, corners=match_stats.total_corners,
+                        momentum=combined_momentum, draw_odds=draw_odds,
+                        match=f"{match_stats.home_team} vs {match_stats.away_team}",
+                        score=f"{match_stats.home_score}-{match_stats.away_score}")
             momentum_indicators = {
                 'combined_momentum10': combined_momentum,
                 'home_momentum10': home_ms['total'],
@@ -475,7 +474,7 @@ class LateCornerMonitor:
                 'away_team': match_stats.away_team,
                 'home_score': match_stats.home_score,
                 'away_score': match_stats.away_score,
-                'minute': match_stats.minute,
+                'minute': alert_minute,
                 'total_corners': match_stats.total_corners,
                 'tier': triggered_tier,
                 # Store combined probability as the alert score
@@ -517,23 +516,20 @@ class LateCornerMonitor:
                 alert_info['draw_odds'] = draw_odds
                 alert_info['alert_type'] = 'LATE_MOMENTUM' if late_momentum_ok else 'LATE_MOMENTUM_DRAW'
 
-                track_success = track_elite_alert(
-                    match_data=alert_info,
-                    tier=triggered_tier,
-                    score=alert_info['total_probability'],
-                    conditions=alert_conditions,
-                    momentum_indicators=momentum_indicators,
-                    detected_patterns=[]
-                )
+                with metrics.db_save_seconds.time():
+                    track_success = self.track_alert(
+                        match_data=alert_info,
+                        tier=triggered_tier,
+                        score=alert_info['total_probability'],
+                        conditions=alert_conditions,
+                        momentum_indicators=momentum_indicators,
+                        detected_patterns=[]
+                    )
                 
                 if track_success:
-                    self.logger.info(f"✅ ALERT SAVED TO DATABASE")
-                    self.logger.info("   Metrics saved:")
-                    self.logger.info(f"   • Combined Probability: {alert_info['total_probability']:.1f}%")
-                    self.logger.info(f"   • Attack Quality: {momentum_indicators['attack_intensity']:.1f}%")
-                    self.logger.info(f"   • Corner Momentum: {momentum_indicators['corner_momentum']:.1f}%")
-                    self.logger.info(f"   • Score Context: {momentum_indicators['score_context']:.1f}%")
-                    self.logger.info(f"   • Patterns: 0")
+                    self.logger.info("✅ ALERT SAVED TO DATABASE (combined %s, home %s, away %s)",
+                                     momentum_indicators['combined_momentum10'],
+                                     momentum_indicators['home_momentum10'], momentum_indicators['away_momentum10'])
                 else:
                     self.logger.error(f"❌ DATABASE SAVE FAILED: Alert not saved to database")
             except Exception as e:
@@ -545,21 +541,20 @@ class LateCornerMonitor:
             self.logger.info(f"📱 SENDING TELEGRAM ALERT for {triggered_tier} match {fixture_id}...")
             
             try:
-                telegram_success = send_corner_alert_new(
-                    match_data=alert_info,
-                    tier=triggered_tier,
-                    score=alert_info['total_probability'],
-                    conditions=alert_conditions
-                )
+                with metrics.telegram_send_seconds.time():
+                    telegram_success = self.send_alert(
+                        match_data=alert_info,
+                        tier=triggered_tier,
+                        score=alert_info['total_probability'],
+                        conditions=alert_conditions
+                    )
                 
                 if telegram_success:
-                    self.alerted_matches.add(fixture_id)
-                    self.logger.info(f"🎉 TELEGRAM ALERT SENT SUCCESSFULLY")
-                    self.logger.info(f"   ✅ Match added to alerted list")
+                    # The Telegram sender marks the fixture key in the shared store
+                    self.logger.info("🎉 TELEGRAM ALERT SENT SUCCESSFULLY - match %s marked as alerted", fixture_id)
                 else:
-                    self.logger.error(f"❌ TELEGRAM ALERT FAILED")
-                    self.logger.error(f"   ❌ Check Telegram configuration and network")
-                    self.logger.error(f"   ❌ Alert will be retried next cycle")
+                    self.logger.error("❌ TELEGRAM ALERT FAILED for match %s - check Telegram configuration and "
+                                      "network; will retry next cycle", fixture_id)
             except Exception as e:
                 self.logger.error(f"❌ TELEGRAM SEND ERROR: {e}")
                 import traceback
@@ -613,16 +608,33 @@ class LateCornerMonitor:
             self.logger.error(f"❌ Error parsing shared match data: {e}")
             return None
 
+    async def _get_draw_odds(self, fixture_id: int) -> Optional[float]:
+        """Live draw price (Fulltime Result market), or None"""
+        try:
+            if snapshot_bus.service_client is not None:
+                return snapshot_bus.service_client.call('draw_odds', fixture_id)
+            # Shares the dashboard's draw price cache (pre-warmed at 83-84' for candidates)
+            from web_dashboard import get_draw_odds
+            return get_draw_odds(fixture_id)
+        except Exception as e:
+            self.logger.error(f"   ❌ Draw odds fetch error: {e}")
+            return None
+
     async def _get_corner_odds(self, fixture_id: int) -> Optional[Dict]:
         """Get corner odds directly from SportMonks"""
         try:
             self.logger.info(f"🔍 Fetching corner odds for match {fixture_id}")
             
-            # Import the odds checking function
-            from web_dashboard import check_corner_odds_available
-            
-            # Get fresh odds
-            odds_data = check_corner_odds_available(fixture_id)
+            if snapshot_bus.service_client is not None:
+                # Engine role: ask the ingestor (shares its odds cache and API budget)
+                with metrics.odds_fetch_seconds.time(source='bus'):
+                    odds_data = snapshot_bus.service_client.call('corner_odds', fixture_id)
+            else:
+                # Import the odds checking function
+                from web_dashboard import check_corner_odds_available
+                
+                # Get fresh odds
+                odds_data = check_corner_odds_available(fixture_id)
             
             if odds_data and odds_data.get('available', False):
                 total_count = odds_data.get('count', 0)
@@ -648,6 +660,116 @@ class LateCornerMonitor:
             self.logger.error(f"❌ Error getting corner odds for match {fixture_id}: {e}")
             return None
 
+    async def run_cycle(self, check_results: bool = True):
+        """One monitoring cycle over the current shared live data (no sleeping)"""
+        # Discover new matches periodically
+        if self.match_discovery_counter % (self.config.MATCH_DISCOVERY_INTERVAL // self.config.LIVE_POLL_INTERVAL) == 0:
+            await self._discover_new_matches()
+        
+        # Warm restart: bring back momentum windows saved by the previous process
+        if not self._momentum_restored:
+            self._momentum_restored = True
+            if self.momentum_checkpoint.enabled:
+                await asyncio.to_thread(self.momentum_checkpoint.restore, self.momentum_tracker)
+                self._last_momentum_checkpoint = time.time()
+        
+        # Monitor all current matches using shared data
+        cycle_start = time.time()
+        self._decisions = {}
+        shared_live_matches = self._get_shared_live_matches()
+        
+        if shared_live_matches:
+            # Always feed momentum tracker for ALL live matches from minute 0
+            momentum_start = time.perf_counter()
+            try:
+                for m in shared_live_matches:
+                    try:
+                        parsed = self._parse_match_data_from_shared(m)
+                        if not parsed:
+                            continue
+                        self.momentum_tracker.add_snapshot(
+                            fixture_id=parsed.fixture_id,
+                            minute=parsed.minute,
+                            home={
+                                'shots_on_target': parsed.shots_on_target.get('home', 0),
+                                'shots_off_target': parsed.shots_off_target.get('home', 0),
+                                'dangerous_attacks': parsed.dangerous_attacks.get('home', 0),
+                                'possession': parsed.possession.get('home', 0),
+                            },
+                            away={
+                                'shots_on_target': parsed.shots_on_target.get('away', 0),
+                                'shots_off_target': parsed.shots_off_target.get('away', 0),
+                                'dangerous_attacks': parsed.dangerous_attacks.get('away', 0),
+                                'possession': parsed.possession.get('away', 0),
+                            },
+                        )
+                    except Exception:
+                        continue
+            except Exception:
+                pass
+            metrics.momentum_compute_seconds.observe(time.perf_counter() - momentum_start, engine='tracker')
+            metrics.tracked_fixtures.set(len(self.monitored_matches), component='engine_monitored')
+            
+            await self._maybe_checkpoint_momentum()
+            await self._maybe_push_metrics()
+            
+            for match in shared_live_matches:
+                try:
+                    match_id = match.get('id')
+                    if match_id and match_id in self.monitored_matches:
+                        # Monitor this match for alert conditions
+                        await self._monitor_single_match(match)
+                except Exception as e:
+                    self.logger.error(f"❌ Error processing match {match.get('id', 'unknown')}: {e}")
+                    continue
+            log_summary(self.logger, "🔍 MONITORING cycle", live=len(shared_live_matches),
+                        monitored=len(self.monitored_matches), duration_ms=round((time.time() - cycle_start) * 1000, 1),
+                        **self._decisions)
+        else:
+            self.logger.info("📊 No live matches available from shared data source")
+        
+        self.match_discovery_counter += 1
+        self.result_check_counter += 1
+        
+        # HOURLY RESULT CHECKING
+        if check_results and self.result_check_counter >= 120 and ENGINE_SHARD_INDEX == 0:  # One shard owns result checks
+            self.logger.info("🔍 HOURLY CHECK: Checking pending alert results...")
+            try:
+                await check_pending_results()
+                self.logger.info("✅ HOURLY CHECK: Result checking completed")
+            except Exception as e:
+                self.logger.error(f"❌ HOURLY CHECK: Error checking results: {e}")
+            finally:
+                self.result_check_counter = 0  # Reset counter
+    
+    async def _maybe_checkpoint_momentum(self):
+        """Save momentum windows every MOMENTUM_CHECKPOINT_INTERVAL seconds (I/O off the event loop)"""
+        if not self.momentum_checkpoint.enabled:
+            return
+        now = time.time()
+        if now - self._last_momentum_checkpoint < MOMENTUM_CHECKPOINT_INTERVAL:
+            return
+        self._last_momentum_checkpoint = now
+        try:
+            data = self.momentum_checkpoint.snapshot(self.momentum_tracker)
+            await asyncio.to_thread(self.momentum_checkpoint.write, data)
+        except Exception as e:
+            self.logger.warning(f"⚠️ MOMENTUM CHECKPOINT: Save failed: {e}")
+    
+    async def _maybe_push_metrics(self):
+        """Send this engine's metrics to the ingest process every ENGINE_METRICS_PUSH_SECONDS (see metrics.py)"""
+        if snapshot_bus.service_client is None:
+            return  # Dev mode: one process, /metrics already has these series
+        now = time.time()
+        if now - self._last_metrics_push < ENGINE_METRICS_PUSH_SECONDS:
+            return
+        self._last_metrics_push = now
+        try:
+            await asyncio.to_thread(snapshot_bus.service_client.call, 'engine_metrics',
+                                    f"engine-{ENGINE_SHARD_INDEX}", metrics.render())
+        except (ConnectionError, RuntimeError) as e:
+            self.logger.warning("⚠️ METRICS: Push to ingest failed: %s", e)
+    
     async def start_monitoring(self):
         """Start the main monitoring loop using shared dashboard data"""
         self.logger.info("🚀 STARTING Late Corner Monitor with SHARED DATA architecture...")
@@ -687,68 +809,7 @@ class LateCornerMonitor:
             # Main monitoring loop
             while True:
                 try:
-                    # Discover new matches periodically
-                    if self.match_discovery_counter % (self.config.MATCH_DISCOVERY_INTERVAL // self.config.LIVE_POLL_INTERVAL) == 0:
-                        await self._discover_new_matches()
-                    
-                    # Monitor all current matches using shared data
-                    shared_live_matches = self._get_shared_live_matches()
-                    
-                    if shared_live_matches:
-                        self.logger.info(f"🔍 MONITORING: Processing {len(shared_live_matches)} live matches")
-                        # Always feed momentum tracker for ALL live matches from minute 0
-                        try:
-                            for m in shared_live_matches:
-                                try:
-                                    parsed = self._parse_match_data_from_shared(m)
-                                    if not parsed:
-                                        continue
-                                    self.momentum_tracker.add_snapshot(
-                                        fixture_id=parsed.fixture_id,
-                                        minute=parsed.minute,
-                                        home={
-                                            'shots_on_target': parsed.shots_on_target.get('home', 0),
-                                            'shots_off_target': parsed.shots_off_target.get('home', 0),
-                                            'dangerous_attacks': parsed.dangerous_attacks.get('home', 0),
-                                            'possession': parsed.possession.get('home', 0),
-                                        },
-                                        away={
-                                            'shots_on_target': parsed.shots_on_target.get('away', 0),
-                                            'shots_off_target': parsed.shots_off_target.get('away', 0),
-                                            'dangerous_attacks': parsed.dangerous_attacks.get('away', 0),
-                                            'possession': parsed.possession.get('away', 0),
-                                        },
-                                    )
-                                except Exception:
-                                    continue
-                        except Exception:
-                            pass
-                        
-                        for match in shared_live_matches:
-                            try:
-                                match_id = match.get('id')
-                                if match_id and match_id in self.monitored_matches:
-                                    # Monitor this match for alert conditions
-                                    await self._monitor_single_match(match)
-                            except Exception as e:
-                                self.logger.error(f"❌ Error processing match {match.get('id', 'unknown')}: {e}")
-                                continue
-                    else:
-                        self.logger.info("📊 No live matches available from shared data source")
-                    
-                    self.match_discovery_counter += 1
-                    self.result_check_counter += 1
-                    
-                    # HOURLY RESULT CHECKING
-                    if self.result_check_counter >= 120:  
-                        self.logger.info("🔍 HOURLY CHECK: Checking pending alert results...")
-                        try:
-                            await check_pending_results()
-                            self.logger.info("✅ HOURLY CHECK: Result checking completed")
-                        except Exception as e:
-                            self.logger.error(f"❌ HOURLY CHECK: Error checking results: {e}")
-                        finally:
-                            self.result_check_counter = 0  # Reset counter
+                    await self.run_cycle()
                     
                     # Wait before next cycle
                     await asyncio.sleep(self.config.LIVE_POLL_INTERVAL)
@@ -765,10 +826,7 @@ async def main():
     """Main entry point"""
     
     # Setup logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    configure_logging()
     
     logger = logging.getLogger(__name__)
     
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Match Clock
+===========
+Per-fixture estimate of the live match clock between polls.
+
+A poll reporting minute ``M`` at wall time ``t`` means the clock read
+between M:00 and M:59 at ``t``. While a period is ticking the clock runs at
+wall speed, so each observation bounds the period's kick-off offset
+(wall time at match-clock 0:00) to a 60-second interval. Intersecting the
+observations narrows it: after a minute change between two polls, the
+offset is pinned to the poll gap. Sources, best first:
+- ``seconds`` inside the current minute, when the feed carries it (exact)
+- ``started`` (period kick-off timestamp) plus ``counts_from``, accepted
+  within ``STARTED_TOLERANCE_SECONDS`` of the observed minutes
+- minute progression across polls
+
+A new ticking period (half time, restarts) or observations that stop
+fitting (a clock stuck at 45 or 90 in stoppage time) reset the fixture to
+the latest observation. When no period is ticking, the clock is frozen.
+Estimates older than ``MATCH_CLOCK_STALE_SECONDS`` are not extrapolated.
+
+``minute(..., certain=True)`` is the minute the clock has certainly
+reached. Schedulers use it (and ``seconds_until``) to act right at 85:00
+instead of waiting for the next poll to report it.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import metrics
+
+MATCH_CLOCK_STALE_SECONDS = float(os.getenv('MATCH_CLOCK_STALE_SECONDS', '300'))
+STARTED_TOLERANCE_SECONDS = float(os.getenv('MATCH_CLOCK_STARTED_TOLERANCE', '30'))
+
+clock_error_seconds = metrics.registry.histogram(
+    'latecorners_match_clock_error_seconds',
+    'Distance between the predicted clock and the minute a poll then reported', buckets=metrics.DATA_AGE_BUCKETS)
+
+
+@dataclass
+class FixtureClock:
+    period: object          # Identity of the ticking period (None when unknown)
+    lo: float               # Kick-off offset bounds: wall time when the clock read 0:00
+    hi: float
+    ticking: bool
+    minute: int             # Last polled minute
+    observed_at: float
+
+
+def _ticking_period(periods: Iterable[Dict]) -> Optional[Dict]:
+    for period in periods or []:
+        if period.get('ticking'):
+            return period
+    return None
+
+
+class MatchClock:
+    """Live clock estimates for every polled fixture"""
+
+    def __init__(self, stale_seconds: float = MATCH_CLOCK_STALE_SECONDS):
+        self.stale_seconds = stale_seconds
+        self._clocks: Dict[int, FixtureClock] = {}
+
+    def __len__(self) -> int:
+        return len(self._clocks)
+
+    def observe(self, fixture_id: int, periods: List[Dict], observed_at: float) -> None:
+        """Record one poll's ``periods`` for a fixture"""
+        period = _ticking_period(periods)
+        if period is None:
+            state = self._clocks.get(fixture_id)
+            if state is not None:
+                state.ticking = False
+                state.observed_at = observed_at
+            return
+        minute = int(period.get('minutes') or 0)
+        seconds = period.get('seconds')
+        if isinstance(seconds, (int, float)) and 0 <= seconds < 60:
+            elapsed = minute * 60 + seconds
+            lo = hi = observed_at - elapsed
+        else:
+            lo, hi = observed_at - minute * 60 - 59.999, observed_at - minute * 60
+        started = period.get('started')
+        if isinstance(started, (int, float)) and started > 0:
+            offset = started - (period.get('counts_from') or 0) * 60
+            if lo - STARTED_TOLERANCE_SECONDS <= offset <= hi + STARTED_TOLERANCE_SECONDS:
+                lo = hi = min(max(offset, lo), hi)
+        self._update(fixture_id, period.get('id', period.get('type_id')), minute, lo, hi, observed_at)
+
+    def observe_minute(self, fixture_id: int, minute: int, observed_at: float, period: object = None) -> None:
+        """Record a bare polled minute (no period details, e.g. from bus snapshots)"""
+        self._update(fixture_id, period, int(minute),
+                     observed_at - minute * 60 - 59.999, observed_at - minute * 60, observed_at)
+
+    def _update(self, fixture_id: int, period: object, minute: int, lo: float, hi: float,
+                observed_at: float) -> None:
+        state = self._clocks.get(fixture_id)
+        if state is not None and state.ticking and state.observed_at <= observed_at:
+            predicted = self.bounds(fixture_id, observed_at)
+            if predicted is not None:
+                midpoint = (predicted[0] + predicted[1]) / 2
+                clock_error_seconds.observe(max(0.0, minute * 60 - midpoint, midpoint - (minute * 60 + 60)))
+        if (state is None or not state.ticking or state.period != period
+                or minute < state.minute or max(lo, state.lo) > min(hi, state.hi)):
+            self._clocks[fixture_id] = FixtureClock(period, lo, hi, True, minute, observed_at)
+            return
+        state.lo, state.hi = max(lo, state.lo), min(hi, state.hi)
+        state.minute = minute
+        state.observed_at = observed_at
+
+    def retain(self, fixture_ids: Iterable[int]) -> None:
+        keep = set(fixture_ids)
+        for fixture_id in [fid for fid in self._clocks if fid not in keep]:
+            del self._clocks[fixture_id]
+
+    def bounds(self, fixture_id: int, now: float) -> Optional[Tuple[float, float]]:
+        """(earliest, latest) match-clock seconds at ``now``; None when unknown or stale"""
+        state = self._clocks.get(fixture_id)
+        if state is None or now - state.observed_at > self.stale_seconds:
+            return None
+        if not state.ticking:
+            return float(state.minute * 60), float(state.minute * 60 + 59)
+        return max(0.0, now - state.hi), max(0.0, now - state.lo)
+
+    def minute(self, fixture_id: int, now: float, certain: bool = False) -> Optional[int]:
+        """Estimated minute at ``now`` (``certain``: the minute the clock has surely reached)"""
+        bounds = self.bounds(fixture_id, now)
+        if bounds is None:
+            return None
+        seconds = bounds[0] if certain else (bounds[0] + bounds[1]) / 2
+        return int(seconds // 60)
+
+    def seconds_until(self, fixture_id: int, minute: int, now: float, certain: bool = True) -> Optional[float]:
+        """Seconds until the clock reaches ``minute``:00 (surely, with ``certain``); 0 once past"""
+        bounds = self.bounds(fixture_id, now)
+        state = self._clocks.get(fixture_id)
+        if bounds is None or not state.ticking:
+            return None if bounds is None or bounds[0] < minute * 60 else 0.0
+        seconds = bounds[0] if certain else (bounds[0] + bounds[1]) / 2
+        return max(0.0, minute * 60 - seconds)
+
+    def next_crossing(self, minute: int, now: float, certain: bool = True) -> Optional[float]:
+        """Soonest positive ``seconds_until(minute)`` over all ticking fixtures"""
+        waits = [self.seconds_until(fixture_id, minute, now, certain) for fixture_id in self._clocks]
+        waits = [wait for wait in waits if wait]
+        return min(waits) if waits else None
+
+
+# Global clock fed by the dashboard updater's polls
+match_clock = MatchClock()
@@ -6,7 +6,9 @@ Track live match statistics with time windows
 import logging
 from typing import Dict, List, Optional
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
+
+from stat_window import FixtureStatWindow
 
 logger = logging.getLogger(__name__)
 
@@ -30,20 +32,25 @@ class TimeWindowStats:
             if getattr(self, field) is None:
                 setattr(self, field, {'home': 0, 'away': 0})
 
+TRACKED_STATS = ['shots_on_target', 'shots_off_target', 'shots_total',
+                 'dangerous_attacks', 'attacks', 'possession', 'corners']
+
 class MatchStateTracker:
     """Track match state and statistics over time"""
     
-    def __init__(self, fixture_id: int, window_sizes: List[int] = None):
+    def __init__(self, fixture_id: int, window_sizes: List[int] = None, window: FixtureStatWindow = None):
         """
         Initialize match state tracker
         
         Args:
             fixture_id: Match ID
             window_sizes: List of window sizes in minutes to track (default: [5, 10, 15])
+            window: Stat window to use (default: a private one; pass stat_windows.fixture(fixture_id)
+                    to share the fixture's window, and then always pass ``minute``)
         """
         self.fixture_id = fixture_id
         self.window_sizes = window_sizes or [5, 10, 15]  # Default windows: 5, 10, 15 minutes
-        self.stats_history: List[TimeWindowStats] = []
+        self.window = window or FixtureStatWindow()
         self.last_update = None
         
         # SportMonks stat type mapping
@@ -60,42 +67,26 @@ class MatchStateTracker:
         logger.info(f"🎯 Initialized MatchStateTracker for fixture {fixture_id}")
         logger.info(f"   Window sizes: {self.window_sizes} minutes")
     
-    def update_stats(self, current_stats: Dict[str, Dict[str, int]], timestamp: datetime = None) -> None:
+    def update_stats(self, current_stats: Dict[str, Dict[str, int]], timestamp: datetime = None,
+                     minute: int = None) -> None:
         """
         Update match statistics
         
         Args:
             current_stats: Current match statistics
             timestamp: Timestamp for the stats (default: current time)
+            minute: Match minute of the stats (default: minutes since the first update)
         """
         if timestamp is None:
             timestamp = datetime.now()
-            
-        # Create new time window stats
-        window_stats = TimeWindowStats(
-            window_start=timestamp,
-            window_end=timestamp
-        )
-        
-        # Update stats from current values
-        for stat_name in ['shots_on_target', 'shots_off_target', 'shots_total',
-                         'dangerous_attacks', 'attacks', 'possession', 'corners']:
-            if stat_name in current_stats:
-                setattr(window_stats, stat_name, current_stats[stat_name])
+        if minute is None:
+            minute = self.window.minute_for(timestamp.timestamp())
         
-        # Add to history
-        self.stats_history.append(window_stats)
+        self.window.update(minute, {name: current_stats[name] for name in TRACKED_STATS if name in current_stats})
         self.last_update = timestamp
         
-        # Clean old history (keep last 20 minutes)
-        cutoff_time = timestamp - timedelta(minutes=20)
-        self.stats_history = [
-            stats for stats in self.stats_history 
-            if stats.window_start > cutoff_time
-        ]
-        
-        logger.debug(f"📊 Updated stats for fixture {self.fixture_id}")
-        logger.debug(f"   History size: {len(self.stats_history)} entries")
+        logger.debug(f"📊 Updated stats for fixture {self.fixture_id} at minute {minute}")
+        logger.debug(f"   History size: {len(self.window)} minutes")
     
     def get_window_stats(self, minutes: int, current_time: datetime = None) -> Optional[Dict[str, Dict[str, int]]]:
         """
@@ -103,55 +94,21 @@ class MatchStateTracker:
         
         Args:
             minutes: Number of minutes to look back
-            current_time: Current timestamp (default: now)
+            current_time: Current timestamp (default: time of the latest update)
             
         Returns:
             Dict with stats for the time window, or None if not enough history
         """
-        if not self.stats_history:
-            return None
-            
-        if current_time is None:
-            current_time = datetime.now()
-            
-        window_start = current_time - timedelta(minutes=minutes)
+        now = None
+        if current_time is not None and self.window.origin is not None:
+            now = self.window.minute_for(current_time.timestamp())
         
-        # Get stats entries in the window
-        window_entries = [
-            stats for stats in self.stats_history 
-            if stats.window_start >= window_start
-        ]
-        
-        if not window_entries:
+        window_stats = self.window.window(minutes, now)
+        if window_stats is None:
             return None
-            
-        # Get the first and last entries
-        first_stats = window_entries[0]
-        last_stats = window_entries[-1]
-        
-        # Calculate differences for each stat
-        window_stats = {}
-        for stat_name in ['shots_on_target', 'shots_off_target', 'shots_total',
-                         'dangerous_attacks', 'attacks', 'corners']:
-            first_values = getattr(first_stats, stat_name)
-            last_values = getattr(last_stats, stat_name)
-            
-            window_stats[stat_name] = {
-                'home': last_values['home'] - first_values['home'],
-                'away': last_values['away'] - first_values['away']
-            }
-            
-        # For possession, take the average
-        possession_values = [
-            getattr(stats, 'possession') for stats in window_entries
-        ]
-        if possession_values:
-            window_stats['possession'] = {
-                'home': sum(p['home'] for p in possession_values) / len(possession_values),
-                'away': sum(p['away'] for p in possession_values) / len(possession_values)
-            }
         
-        return window_stats
+        # Cumulative stats as differences, possession as the average over the window
+        return {name: window_stats.get(name) or {'home': 0, 'away': 0} for name in TRACKED_STATS}
     
     def get_all_windows_stats(self, current_time: datetime = None) -> Dict[int, Dict[str, Dict[str, int]]]:
         """
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Pipeline Metrics
+================
+In-process histograms, gauges and counters, rendered in the Prometheus text
+exposition format by ``/metrics`` on the dashboard app.
+
+The pipeline metrics are defined here, so every module records into the same
+series. For example:
+
+    with sportmonks_request_seconds.time(entity='odds'):
+        response = requests.get(...)
+
+    alert_data_age_seconds.observe(time.time() - fetched_at)
+
+Metrics live in process memory, so each series belongs to the process that
+records it. In production (snapshot bus roles):
+
+- ingest: SportMonks request latency, response bytes, pages, decode and
+  parse times, odds lookups, rate-limit gauges, caches, circuit breakers,
+  dashboard momentum. Web workers serve ``/metrics`` by asking the ingest
+  process for these over the service bus, so every scrape sees the same
+  series whichever worker answers.
+- engine: alert decisions, engine momentum, database saves, Telegram sends
+  and alert data age. Each engine pushes its render to the ingest process
+  over the service bus (``engine_metrics``), and ingest merges them into its
+  own text with a ``process="engine-<shard>"`` label (``merge_expositions``).
+- web: nothing of interest (workers make no API calls).
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Seconds; covers a fast cache hit up to a SportMonks timeout
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# In-process compute steps (parse, momentum) take milliseconds
+COMPUTE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+# How old the stats were when an alert went out (the 85' budget is measured in tens of seconds)
+DATA_AGE_BUCKETS = (1.0, 2.5, 5.0, 10.0, 15.0, 20.0, 30.0, 45.0, 60.0, 90.0, 120.0, 300.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple, extra: str = '') -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    """Monotonic count per label set"""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items]
+
+
+class Gauge(_Metric):
+    """Current value per label set (set at scrape time or as things change)"""
+
+    kind = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple, float] = {}
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels) -> Optional[float]:
+        return self._values.get(self._key(labels))
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items]
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram per label set"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Iterable[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label key -> [per-bucket counts (non-cumulative, last is +Inf), sum, count]
+        self._series: Dict[Tuple, list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall time of the ``with`` block (also when it raises)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        series = self._series.get(self._key(labels))
+        return series[2] if series else 0
+
+    def sum(self, **labels) -> float:
+        series = self._series.get(self._key(labels))
+        return series[1] if series else 0.0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, (list(s[0]), s[1], s[2])) for key, s in self._series.items())
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics rendered together"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Iterable[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        return '\n'.join(metric.render() for metric in self._metrics.values()) + '\n'
+
+
+# Global registry and the pipeline's metrics
+registry = MetricsRegistry()
+
+sportmonks_request_seconds = registry.histogram(
+    'latecorners_sportmonks_request_seconds', 'SportMonks HTTP request latency', ['entity'])
+parse_seconds = registry.histogram(
+    'latecorners_parse_seconds', 'Time to parse one livescores response into match dicts', buckets=COMPUTE_BUCKETS)
+momentum_compute_seconds = registry.histogram(
+    'latecorners_momentum_compute_seconds', 'Momentum computation time per cycle', ['engine'],
+    buckets=COMPUTE_BUCKETS)
+odds_fetch_seconds = registry.histogram(
+    'latecorners_odds_fetch_seconds', 'Corner odds lookup latency per fixture (cache hits included)', ['source'])
+db_save_seconds = registry.histogram(
+    'latecorners_db_save_seconds', 'Alert database save latency')
+telegram_send_seconds = registry.histogram(
+    'latecorners_telegram_send_seconds', 'Telegram alert send latency')
+alert_data_age_seconds = registry.histogram(
+    'latecorners_alert_data_age_seconds', 'Age of the live stats an alert was decided on', buckets=DATA_AGE_BUCKETS)
+
+rate_limit_remaining = registry.gauge(
+    'latecorners_rate_limit_remaining', 'SportMonks requests remaining in the current window', ['entity'])
+rate_limit_resets_in_seconds = registry.gauge(
+    'latecorners_rate_limit_resets_in_seconds', 'Seconds until the SportMonks rate limit window resets', ['entity'])
+tracked_fixtures = registry.gauge(
+    'latecorners_tracked_fixtures', 'Fixtures currently held by each component', ['component'])
+cache_requests_total = registry.counter(
+    'latecorners_cache_requests_total', 'Cache lookups by outcome', ['cache', 'result'])
+cache_hit_ratio = registry.gauge(
+    'latecorners_cache_hit_ratio', 'Cache hits / lookups since start', ['cache'])
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Count one cache lookup and refresh that cache's hit ratio"""
+    cache_requests_total.inc(cache=cache, result='hit' if hit else 'miss')
+    hits = cache_requests_total.value(cache=cache, result='hit')
+    misses = cache_requests_total.value(cache=cache, result='miss')
+    cache_hit_ratio.set(hits / (hits + misses), cache=cache)
+
+
+def render() -> str:
+    return registry.render()
+
+
+def _with_label(sample: str, label: str) -> str:
+    """Add ``label`` to one exposition sample line"""
+    series, value = sample.rsplit(' ', 1)
+    if series.endswith('}'):
+        series = f"{series[:-1]},{label}}}"
+    else:
+        series = f"{series}{{{label}}}"
+    return f"{series} {value}"
+
+
+def _families(text: str) -> Dict[str, List[str]]:
+    """Exposition text -> {family name: [HELP, TYPE, samples...]} in order"""
+    families: Dict[str, List[str]] = {}
+    current = None
+    for line in text.splitlines():
+        if line.startswith('# HELP '):
+            current = line.split(' ', 3)[2]
+            families.setdefault(current, [])
+        if current is not None and line:
+            families[current].append(line)
+    return families
+
+
+def merge_expositions(local: str, processes: Dict[str, str]) -> str:
+    """Append other processes' samples to this process's families, each labelled with its process name"""
+    families = _families(local)
+    for process, text in sorted(processes.items()):
+        label = f'process="{_escape(process)}"'
+        for name, lines in _families(text).items():
+            samples = [_with_label(line, label) for line in lines if not line.startswith('#')]
+            if name not in families:
+                families[name] = [line for line in lines if line.startswith('#')]
+            families[name].extend(samples)
+    return '\n'.join(line for lines in families.values() for line in lines) + '\n'
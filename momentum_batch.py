@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Batch Momentum Engine
+=====================
+``MomentumTracker``'s formula computed for every live fixture in one NumPy
+call.
+
+Snapshots live in ring buffers shaped (fixtures x slots x teams x stats),
+where slot = minute % (window + 1). All minutes a fixture can hold fall
+within [last - window, last], so slots never collide. Stale slots are masked
+by their stored minute instead of being cleared. The deque semantics are
+kept: duplicate minutes are ignored, a minute regression clears the fixture,
+and minutes below ``max(0, last - window)`` drop out.
+
+``compute_all(window_minutes=N)`` works for any N up to the configured
+window, so 5/10-minute variants come from the same buffers.
+
+Results match ``MomentumTracker.compute_scores`` exactly (integer arithmetic
+throughout).
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Stat order inside each snapshot
+STATS = ('shots_on_target', 'shots_off_target', 'dangerous_attacks', 'possession')
+SOT, SOFF, DANG, POS = range(len(STATS))
+HOME, AWAY = 0, 1
+# Weights for the last 4 per-minute increments (most recent first)
+RECENT_WEIGHTS = (4, 3, 2, 1)
+SCORE_FIELDS = ('total', 'on_target_points', 'off_target_points', 'dangerous_points',
+                'possession_points', 'window_covered')
+
+
+def _team_row(stats: Dict[str, int]) -> List[int]:
+    return [int(stats.get(name, 0) or 0) for name in STATS]
+
+
+class BatchMomentumEngine:
+    """Ring-buffered snapshots for many fixtures, scored together"""
+
+    def __init__(self, window_minutes: int = 10, capacity: int = 256):
+        self.window_minutes = window_minutes
+        self.slots = window_minutes + 1
+        self._rows: Dict[int, int] = {}
+        self._free: List[int] = []
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._minutes = np.full((capacity, self.slots), -1, dtype=np.int64)
+        self._values = np.zeros((capacity, self.slots, 2, len(STATS)), dtype=np.int64)
+        self._last = np.full(capacity, -1, dtype=np.int64)
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._active = np.zeros(capacity, dtype=bool)
+
+    def _grow(self) -> None:
+        old = (self._minutes, self._values, self._last, self._ids, self._active)
+        size = self.capacity
+        self._allocate(size * 2)
+        for new, prev in zip((self._minutes, self._values, self._last, self._ids, self._active), old):
+            new[:size] = prev
+
+    def _row_for(self, fixture_id: int) -> int:
+        row = self._rows.get(fixture_id)
+        if row is None:
+            if self._free:
+                row = self._free.pop()
+            else:
+                if len(self._rows) >= self.capacity:
+                    self._grow()
+                row = len(self._rows)
+            self._rows[fixture_id] = row
+            self._ids[row] = fixture_id
+            self._active[row] = True
+            self._minutes[row] = -1
+            self._last[row] = -1
+        return row
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, fixture_id: int) -> bool:
+        return fixture_id in self._rows
+
+    def remove(self, fixture_id: int) -> None:
+        """Free a finished fixture's row for reuse"""
+        row = self._rows.pop(fixture_id, None)
+        if row is not None:
+            self._active[row] = False
+            self._free.append(row)
+
+    def retain(self, fixture_ids: Iterable[int]) -> None:
+        """Drop every fixture not in ``fixture_ids`` (typically the current live set)"""
+        keep = set(fixture_ids)
+        for fixture_id in [fid for fid in self._rows if fid not in keep]:
+            self.remove(fixture_id)
+
+    # ---- ingest ----
+
+    def add_snapshot(self, fixture_id: int, minute: int, home: Dict[str, int], away: Dict[str, int]) -> None:
+        """Same contract as MomentumTracker.add_snapshot"""
+        self.add_batch([fixture_id], [minute], [_team_row(home)], [_team_row(away)])
+
+    def add_batch(self, fixture_ids: Iterable[int], minutes: Iterable[int], home, away) -> None:
+        """
+        One snapshot per fixture (ids must be unique within a batch). ``home``/``away`` are
+        (n, 4) sequences in STATS order.
+        """
+        rows = np.fromiter((self._row_for(int(fid)) for fid in fixture_ids), dtype=np.int64)
+        if len(rows) == 0:
+            return
+        minutes = np.asarray(minutes, dtype=np.int64)
+        last = self._last[rows]
+
+        regressed = (last >= 0) & (minutes < last)
+        if regressed.any():
+            self._minutes[rows[regressed]] = -1
+            last = np.where(regressed, -1, last)
+
+        fresh = minutes != last  # Duplicate minutes keep the first snapshot
+        rows, minutes = rows[fresh], minutes[fresh]
+        slots = minutes % self.slots
+        self._minutes[rows, slots] = minutes
+        self._values[rows, slots, HOME] = np.asarray(home, dtype=np.int64).reshape(-1, len(STATS))[fresh]
+        self._values[rows, slots, AWAY] = np.asarray(away, dtype=np.int64).reshape(-1, len(STATS))[fresh]
+        self._last[rows] = minutes
+
+    def add_dashboard_matches(self, matches: Iterable[Dict]) -> None:
+        """Feed dashboard match dicts (``statistics.home`` / ``statistics.away``)"""
+        ids, minutes, home, away = [], [], [], []
+        for m in matches:
+            ids.append(m['match_id'])
+            minutes.append(m['minute'])
+            home.append(_team_row(m['statistics'].get('home', {})))
+            away.append(_team_row(m['statistics'].get('away', {})))
+        self.add_batch(ids, minutes, home, away)
+
+    # ---- scoring ----
+
+    def compute_all(self, window_minutes: Optional[int] = None) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Score every tracked fixture. Returns (fixture_ids, scores) where each
+        ``scores[field]`` is an (n, 2) int array of [home, away].
+        """
+        window = self.window_minutes if window_minutes is None else window_minutes
+        if not 0 <= window <= self.window_minutes:
+            raise ValueError(f"window_minutes must be between 0 and {self.window_minutes}")
+
+        rows = np.flatnonzero(self._active & (self._last >= 0))
+        minutes = self._minutes[rows]                          # (n, S)
+        values = self._values[rows]                            # (n, S, 2, 4)
+        last = self._last[rows]                                # (n,)
+        cutoff = np.maximum(0, last - window)
+        valid = (minutes >= 0) & (minutes >= cutoff[:, None])  # (n, S)
+        count = valid.sum(axis=1)
+        n = len(rows)
+        index = np.arange(n)
+
+        first_minute = np.where(valid, minutes, np.iinfo(np.int64).max).min(axis=1)
+        first = values[index, first_minute % self.slots]       # (n, 2, 4)
+        latest = values[index, last % self.slots]
+        totals = np.maximum(0, latest - first)                 # (n, 2, 4)
+
+        # Weighted recent increments: only minutes where both m and m-1 are held
+        recent = np.zeros_like(totals)
+        unweighted = np.zeros_like(totals)
+        for i, weight in enumerate(RECENT_WEIGHTS):
+            m = last - i
+            cur_ok = (m >= cutoff) & (minutes[index, m % self.slots] == m)
+            prev_ok = (m - 1 >= cutoff) & (minutes[index, (m - 1) % self.slots] == m - 1)
+            both = (cur_ok & prev_ok)[:, None, None]
+            step = np.maximum(0, values[index, m % self.slots] - values[index, (m - 1) % self.slots])
+            step = np.where(both, step, 0)
+            recent += weight * step
+            unweighted += step
+        blended = recent + np.maximum(0, totals - unweighted)
+        counts = np.where((count >= 2)[:, None, None], blended, totals)
+
+        possession = np.where(valid[:, :, None], values[:, :, :, POS], 0).sum(axis=1)  # (n, 2)
+        avg_pos = possession // np.maximum(count, 1)[:, None]
+
+        scores = {
+            'on_target_points': 12 * counts[:, :, SOT],
+            'off_target_points': 8 * counts[:, :, SOFF],
+            'dangerous_points': 2 * counts[:, :, DANG],
+            'possession_points': np.maximum(0, avg_pos - 50) // 5,
+            'window_covered': np.repeat((last - first_minute)[:, None], 2, axis=1),
+        }
+        scores['total'] = (scores['on_target_points'] + scores['off_target_points']
+                           + scores['dangerous_points'] + scores['possession_points'])
+        return self._ids[rows].copy(), scores
+
+    def scores_by_fixture(self, window_minutes: Optional[int] = None) -> Dict[int, Dict[str, Dict[str, int]]]:
+        """compute_all reshaped into MomentumTracker.compute_scores dicts, keyed by fixture"""
+        ids, scores = self.compute_all(window_minutes)
+        result = {}
+        for i, fixture_id in enumerate(ids.tolist()):
+            result[fixture_id] = {
+                side: {field: int(scores[field][i, team]) for field in SCORE_FIELDS}
+                for side, team in (('home', HOME), ('away', AWAY))
+            }
+        return result
+
+    def compute_scores(self, fixture_id: int, window_minutes: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+        """Drop-in for MomentumTracker.compute_scores (scores everything; prefer scores_by_fixture)"""
+        empty = {field: 0 for field in SCORE_FIELDS}
+        return self.scores_by_fixture(window_minutes).get(fixture_id, {'home': dict(empty), 'away': dict(empty)})
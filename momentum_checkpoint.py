@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Momentum Checkpoints
+====================
+Saves ``MomentumTracker`` windows periodically so a restarted engine does not
+spend 10 minutes rebuilding Momentum10 for every live fixture.
+
+Each checkpoint (``MomentumTracker.to_checkpoint``) is written to:
+- a local file (atomic replace), which survives process restarts and supervisor respawns
+- the ``momentum_checkpoints`` table, which survives redeploys (new containers)
+
+On startup the newest of the two is restored. Fixtures not updated within
+``MOMENTUM_CHECKPOINT_MAX_AGE`` seconds are dropped (finished matches, or a
+restart so long that the window is worthless).
+
+Each engine shard has its own checkpoint name, so sharded engines never
+restore each other's fixtures.
+"""
+
+import logging
+import os
+from typing import Optional
+
+from momentum_tracker import MomentumTracker, checkpoint_saved_at
+
+logger = logging.getLogger(__name__)
+
+# Empty path disables file checkpoints (the replay harness and benchmarks do this)
+MOMENTUM_CHECKPOINT_PATH = os.getenv('MOMENTUM_CHECKPOINT_PATH', 'momentum_checkpoint.bin')
+MOMENTUM_CHECKPOINT_INTERVAL = int(os.getenv('MOMENTUM_CHECKPOINT_INTERVAL', '60'))
+MOMENTUM_CHECKPOINT_MAX_AGE = int(os.getenv('MOMENTUM_CHECKPOINT_MAX_AGE', '600'))
+MOMENTUM_CHECKPOINT_DB = os.getenv('MOMENTUM_CHECKPOINT_DB', 'true').lower() != 'false'
+
+
+class MomentumCheckpoint:
+    """File + database persistence for one engine's MomentumTracker"""
+
+    def __init__(self, name: str, path: str = MOMENTUM_CHECKPOINT_PATH,
+                 max_age_seconds: float = MOMENTUM_CHECKPOINT_MAX_AGE, use_db: bool = MOMENTUM_CHECKPOINT_DB):
+        self.name = name
+        self.path = path
+        self.max_age_seconds = max_age_seconds
+        self.use_db = use_db and bool(os.getenv('DATABASE_URL'))
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path) or self.use_db
+
+    def _get_db(self):
+        from database import get_database
+        return get_database()
+
+    def snapshot(self, tracker: MomentumTracker) -> bytes:
+        """Drop finished fixtures and serialize the rest (cheap; run on the monitor loop)"""
+        tracker.discard_stale(self.max_age_seconds)
+        return tracker.to_checkpoint()
+
+    def write(self, data: bytes) -> None:
+        """Persist a serialized checkpoint (blocking I/O; run off the event loop)"""
+        if self.path:
+            try:
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                logger.warning(f"⚠️ MOMENTUM CHECKPOINT: Could not write {self.path}: {e}")
+        if self.use_db:
+            try:
+                self._get_db().save_momentum_checkpoint(self.name, data)
+            except Exception as e:
+                logger.warning(f"⚠️ MOMENTUM CHECKPOINT: Could not save to database: {e}")
+
+    def _read_file(self) -> Optional[bytes]:
+        if not self.path or not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'rb') as f:
+                return f.read()
+        except Exception as e:
+            logger.warning(f"⚠️ MOMENTUM CHECKPOINT: Could not read {self.path}: {e}")
+            return None
+
+    def _read_db(self) -> Optional[bytes]:
+        if not self.use_db:
+            return None
+        try:
+            return self._get_db().get_momentum_checkpoint(self.name)
+        except Exception as e:
+            logger.warning(f"⚠️ MOMENTUM CHECKPOINT: Could not load from database: {e}")
+            return None
+
+    def restore(self, tracker: MomentumTracker) -> int:
+        """Restore the newest available checkpoint into ``tracker``; returns fixtures restored"""
+        candidates = [data for data in (self._read_file(), self._read_db()) if data]
+        if not candidates:
+            return 0
+        data = max(candidates, key=checkpoint_saved_at)
+        try:
+            restored = tracker.restore_checkpoint(data, self.max_age_seconds)
+        except Exception as e:
+            logger.warning(f"⚠️ MOMENTUM CHECKPOINT: Ignoring unreadable checkpoint: {e}")
+            return 0
+        logger.info(f"♻️ MOMENTUM CHECKPOINT: Restored {restored} live fixtures ({len(data)} bytes)")
+        return restored
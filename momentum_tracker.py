@@ -1,10 +1,22 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import struct
+import time
 from collections import deque
 from dataclasses import dataclass
 from typing import Deque, Dict, Optional, Tuple
 
+# Checkpoint layout (little-endian):
+#   header:   magic, version, saved_at, fixture count
+#   fixture:  fixture_id, last_seen, home snapshot count, away snapshot count
+#   snapshot: minute, shots on target, shots off target, dangerous attacks, possession
+_CHECKPOINT_MAGIC = b'MOMC'
+_CHECKPOINT_VERSION = 1
+_HEADER = struct.Struct('<4sHdI')
+_FIXTURE = struct.Struct('<qdBB')
+_SNAPSHOT = struct.Struct('<hHHHB')
+
 
 @dataclass
 class TeamSnapshot:
@@ -15,6 +27,14 @@ class TeamSnapshot:
     possession: int  # percentage 0-100
 
 
+def checkpoint_saved_at(data: bytes) -> float:
+    """When a checkpoint was taken (0.0 if ``data`` is not a checkpoint)"""
+    if not data or len(data) < _HEADER.size:
+        return 0.0
+    magic, _version, saved_at, _count = _HEADER.unpack_from(data, 0)
+    return saved_at if magic == _CHECKPOINT_MAGIC else 0.0
+
+
 class MomentumTracker:
     """
     Tracks rolling 10-minute attacking momentum per fixture using live, cumulative stats.
@@ -26,10 +46,13 @@ class MomentumTracker:
       + 1 point per 5% average possession
     """
 
-    def __init__(self, window_minutes: int = 10):
+    def __init__(self, window_minutes: int = 10, clock=time):
         self.window_minutes = window_minutes
+        self.clock = clock
         # fixture_id -> { 'home': deque[TeamSnapshot], 'away': deque[TeamSnapshot] }
         self._history: Dict[int, Dict[str, Deque[TeamSnapshot]]] = {}
+        # fixture_id -> wall-clock time of the last add_snapshot (for stale-fixture cleanup)
+        self._last_seen: Dict[int, float] = {}
 
     def _get_fixture_deques(self, fixture_id: int) -> Tuple[Deque[TeamSnapshot], Deque[TeamSnapshot]]:
         buckets = self._history.setdefault(
@@ -47,6 +70,7 @@ class MomentumTracker:
         Required keys in team dicts: shots_on_target, shots_off_target, dangerous_attacks, possession.
         """
         home_q, away_q = self._get_fixture_deques(fixture_id)
+        self._last_seen[fixture_id] = self.clock.time()
 
         def _append(queue: Deque[TeamSnapshot], stats: Dict[str, int]) -> None:
             # Handle minute regression (HT resets, etc.) by clearing
@@ -173,3 +197,57 @@ class MomentumTracker:
             'away': self._compute_team(away_q),
         }
 
+    def discard_stale(self, max_age_seconds: float) -> int:
+        """Forget fixtures with no snapshot in the last ``max_age_seconds`` (finished matches)"""
+        cutoff = self.clock.time() - max_age_seconds
+        stale = [fid for fid, seen in self._last_seen.items() if seen < cutoff]
+        for fixture_id in stale:
+            self._history.pop(fixture_id, None)
+            self._last_seen.pop(fixture_id, None)
+        return len(stale)
+
+    def to_checkpoint(self) -> bytes:
+        """Serialize every fixture's deques into a compact binary checkpoint"""
+        parts = []
+        for fixture_id, buckets in self._history.items():
+            home_q, away_q = buckets['home'], buckets['away']
+            parts.append(_FIXTURE.pack(fixture_id, self._last_seen.get(fixture_id, 0.0), len(home_q), len(away_q)))
+            for snapshot in list(home_q) + list(away_q):
+                parts.append(_SNAPSHOT.pack(
+                    snapshot.minute,
+                    min(snapshot.shots_on_target, 0xFFFF),
+                    min(snapshot.shots_off_target, 0xFFFF),
+                    min(snapshot.dangerous_attacks, 0xFFFF),
+                    max(0, min(snapshot.possession, 100)),
+                ))
+        header = _HEADER.pack(_CHECKPOINT_MAGIC, _CHECKPOINT_VERSION, self.clock.time(), len(self._history))
+        return header + b''.join(parts)
+
+    def restore_checkpoint(self, data: bytes, max_age_seconds: float) -> int:
+        """
+        Load deques from ``to_checkpoint`` output, skipping fixtures not updated in the last
+        ``max_age_seconds``. Fixtures already tracked in this process are left alone.
+        Returns the number of fixtures restored.
+        """
+        magic, version, _saved_at, count = _HEADER.unpack_from(data, 0)
+        if magic != _CHECKPOINT_MAGIC or version != _CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported momentum checkpoint ({magic!r} v{version})")
+
+        cutoff = self.clock.time() - max_age_seconds
+        offset = _HEADER.size
+        restored = 0
+        for _ in range(count):
+            fixture_id, last_seen, n_home, n_away = _FIXTURE.unpack_from(data, offset)
+            offset += _FIXTURE.size
+            snapshots = [TeamSnapshot(*_SNAPSHOT.unpack_from(data, offset + i * _SNAPSHOT.size))
+                         for i in range(n_home + n_away)]
+            offset += (n_home + n_away) * _SNAPSHOT.size
+            if last_seen < cutoff or fixture_id in self._history:
+                continue
+            self._history[fixture_id] = {
+                'home': deque(snapshots[:n_home]),
+                'away': deque(snapshots[n_home:]),
+            }
+            self._last_seen[fixture_id] = last_seen
+            restored += 1
+        return restored
@@ -12,6 +12,7 @@ import logging
 from typing import Dict, Optional
 import requests
 from datetime import datetime
+from idempotency_store import alert_key_for_fixture, alert_store
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -23,7 +24,8 @@ class NewTelegramSystem:
     def __init__(self):
         self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
         self.chat_id = os.getenv('TELEGRAM_CHAT_ID')
-        self.sent_alerts = set()
+        # Shared, persistent dedup (one alert per fixture across all alert paths)
+        self.sent_alerts = alert_store
         
         logger.info("🆕 NEW TELEGRAM SYSTEM INITIALIZING...")
         logger.info(f"   Bot token: {'✅ SET' if self.bot_token else '❌ MISSING'}")
@@ -43,10 +45,9 @@ class NewTelegramSystem:
         
         # Create unique alert ID
         match_id = match_data.get('fixture_id', 0)
-        minute = match_data.get('minute', 85)
-        alert_id = f"{match_id}_{minute}_{int(score)}"
+        alert_id = alert_key_for_fixture(match_id)
         
-        if alert_id in self.sent_alerts:
+        if self.sent_alerts.contains(alert_id):
             logger.info(f"📵 NEW TELEGRAM: Alert {alert_id} already sent")
             return True
         
@@ -100,7 +101,7 @@ class NewTelegramSystem:
         success = self._send_http_message(message)
         
         if success:
-            self.sent_alerts.add(alert_id)
+            self.sent_alerts.mark(alert_id, fixture_id=match_id)
             logger.info(f"🎉 NEW TELEGRAM: Alert {alert_id} sent successfully!")
             return True
         else:
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Odds Pre-Warming
+================
+Fetches corner odds and draw prices at 83-84' only for fixtures that could
+still qualify at 85', so the caches are hot when the alert window opens.
+
+Each update cycle, ``OddsPrewarmer.select`` projects every late fixture to the
+start of the alert window:
+- Momentum10 is extrapolated along its trend over the last few minutes
+- total corners are extrapolated at the recent corner rate (last 10 minutes,
+  or the whole match before that)
+
+A fixture is a candidate when its momentum can reach the alert threshold
+(minus ``ODDS_PREWARM_MOMENTUM_MARGIN``) and either the corner rule can reach
+its threshold (minus ``ODDS_PREWARM_CORNER_MARGIN``) or the score is level,
+since a draw price of 1.50 or lower needs a level score this late.
+The window uses the match-clock estimate (match_clock) when one is given, so
+a fixture polled at 82:50 is still warmed at 83' rather than a poll later.
+Non-candidates get no odds lookups before 85'. The alert engine still fetches
+on demand (through the same caches) for any fixture that passes its free gates
+inside the window.
+"""
+
+import os
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+import metrics
+from alert_rules import ALERT_WINDOW, MIN_COMBINED_MOMENTUM, MIN_TOTAL_CORNERS
+from match_clock import MatchClock, match_clock
+
+ODDS_PREWARM_ENABLED = os.getenv('ODDS_PREWARM_ENABLED', 'true').lower() != 'false'
+ODDS_PREWARM_FROM_MINUTE = int(os.getenv('ODDS_PREWARM_FROM_MINUTE', '83'))
+ODDS_PREWARM_MOMENTUM_MARGIN = int(os.getenv('ODDS_PREWARM_MOMENTUM_MARGIN', '15'))
+ODDS_PREWARM_CORNER_MARGIN = float(os.getenv('ODDS_PREWARM_CORNER_MARGIN', '1'))
+# Re-fetch a candidate at most this often (odds caches hold entries for 120s)
+ODDS_PREWARM_INTERVAL = int(os.getenv('ODDS_PREWARM_INTERVAL', '60'))
+
+# Minutes of (minute, corners, momentum) history kept per fixture for the projections
+HISTORY_MINUTES = 10
+MOMENTUM_TREND_MINUTES = 5
+
+prewarm_decisions_total = metrics.registry.counter(
+    'latecorners_odds_prewarm_decisions_total', 'Fixtures in the pre-warm window by decision', ['decision'])
+
+
+def _slope(points: List[Tuple[int, float]]) -> float:
+    """Change per minute between the first and last point (0 with fewer than two minutes)"""
+    if len(points) < 2 or points[-1][0] == points[0][0]:
+        return 0.0
+    return (points[-1][1] - points[0][1]) / (points[-1][0] - points[0][0])
+
+
+class OddsPrewarmer:
+    """Chooses which late fixtures get their odds fetched ahead of the alert window"""
+
+    def __init__(self, from_minute: int = ODDS_PREWARM_FROM_MINUTE,
+                 momentum_margin: int = ODDS_PREWARM_MOMENTUM_MARGIN,
+                 corner_margin: float = ODDS_PREWARM_CORNER_MARGIN,
+                 interval_seconds: float = ODDS_PREWARM_INTERVAL, clock: Optional[MatchClock] = None):
+        self.clock = clock
+        self.from_minute = from_minute
+        self.until_minute = ALERT_WINDOW[0] - 1
+        self.momentum_margin = momentum_margin
+        self.corner_margin = corner_margin
+        self.interval_seconds = interval_seconds
+        # fixture -> (minute, total corners, combined momentum), oldest first
+        self._history: Dict[int, Deque[Tuple[int, int, int]]] = {}
+        self._last_warmed: Dict[int, float] = {}
+
+    def observe(self, matches: Iterable[Dict]) -> None:
+        """Record this cycle's corners and momentum (call every cycle, before select)"""
+        live = set()
+        for match in matches:
+            fixture_id = match['match_id']
+            live.add(fixture_id)
+            history = self._history.setdefault(fixture_id, deque())
+            stats = match['statistics']
+            corners = (stats.get('home', {}).get('corners', 0) or 0) + (stats.get('away', {}).get('corners', 0) or 0)
+            entry = (match['minute'], corners, (match.get('momentum') or {}).get('combined', 0))
+            if history and entry[0] < history[-1][0]:
+                history.clear()  # Minute regression (feed glitch)
+            if history and history[-1][0] == entry[0]:
+                history[-1] = entry
+            else:
+                history.append(entry)
+            while history and history[0][0] < entry[0] - HISTORY_MINUTES:
+                history.popleft()
+        for fixture_id in [fid for fid in self._history if fid not in live]:
+            self._history.pop(fixture_id, None)
+            self._last_warmed.pop(fixture_id, None)
+
+    def projection(self, fixture_id: int) -> Tuple[float, float]:
+        """(corners, momentum) projected to the first alert minute"""
+        history = self._history.get(fixture_id)
+        if not history:
+            return 0.0, 0.0
+        minute, corners, momentum = history[-1]
+        minutes_left = max(0, ALERT_WINDOW[0] - minute)
+
+        if len(history) >= 2 and history[-1][0] > history[0][0]:
+            corner_rate = _slope([(m, c) for m, c, _ in history])
+        else:
+            corner_rate = corners / minute if minute > 0 else 0.0
+        trend = _slope([(m, s) for m, _, s in history if m >= minute - MOMENTUM_TREND_MINUTES])
+        return corners + max(0.0, corner_rate) * minutes_left, momentum + trend * minutes_left
+
+    def is_candidate(self, match: Dict) -> bool:
+        corners, momentum = self.projection(match['match_id'])
+        current_momentum = (match.get('momentum') or {}).get('combined', 0)
+        if max(momentum, current_momentum) < MIN_COMBINED_MOMENTUM - self.momentum_margin:
+            return False
+        return corners + self.corner_margin >= MIN_TOTAL_CORNERS or bool(match.get('is_draw'))
+
+    def _minute(self, match: Dict, now: float) -> int:
+        """Polled minute, moved forward by the clock estimate between polls"""
+        estimate = self.clock.minute(match['match_id'], now) if self.clock is not None else None
+        return match['minute'] if estimate is None else max(match['minute'], estimate)
+
+    def select(self, matches: Iterable[Dict], now: float) -> List[Dict]:
+        """Candidates in the pre-warm window that are due for a (re)fetch"""
+        selected = []
+        for match in matches:
+            if not self.from_minute <= self._minute(match, now) <= self.until_minute:
+                continue
+            if not self.is_candidate(match):
+                prewarm_decisions_total.inc(decision='skipped')
+                continue
+            if now - self._last_warmed.get(match['match_id'], 0) < self.interval_seconds:
+                prewarm_decisions_total.inc(decision='fresh')
+                continue
+            prewarm_decisions_total.inc(decision='warmed')
+            self._last_warmed[match['match_id']] = now
+            selected.append(match)
+        return selected
+
+
+# Global pre-warmer used by the dashboard updater
+odds_prewarmer = OddsPrewarmer(clock=match_clock)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Pagination
+==========
+Complete results from paginated SportMonks v3 endpoints.
+
+A v3 page carries ``pagination.has_more`` but no page count, so after the
+first page the remaining pages are fetched speculatively in windows of
+concurrent requests: 2 pages, then 4, ... up to ``SPORTMONKS_PAGE_CONCURRENCY``.
+A window stops at the first page without ``has_more``; requests already
+sent past the end come back empty and are counted as overshoot.
+
+Each window is sized against a rate-limit ``budget`` (``budget(n)``: may
+``n`` more calls be made?). Pages are yielded in order as they arrive, so
+callers can stream items and stop early (remaining requests are cancelled).
+A page that cannot be fetched, or a budget that runs out, raises
+``IncompletePages`` instead of returning a silently truncated result.
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, Optional
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+PAGE_CONCURRENCY = int(os.getenv('SPORTMONKS_PAGE_CONCURRENCY', '4'))
+MAX_PAGES = int(os.getenv('SPORTMONKS_MAX_PAGES', '50'))
+# SportMonks v3 maximum page size
+PER_PAGE = 50
+
+# fetch_page(page) -> decoded payload (None when the page could not be fetched)
+FetchPage = Callable[[int], Optional[Dict]]
+Budget = Callable[[int], bool]
+
+pages_total = metrics.registry.counter(
+    'latecorners_sportmonks_pages_total', 'Paginated SportMonks requests by outcome', ['result'])
+
+
+class IncompletePages(RuntimeError):
+    """Not every page of a paginated result could be fetched"""
+
+    def __init__(self, message: str, pages: int):
+        super().__init__(message)
+        self.pages = pages
+
+
+def page_params(params: Optional[Dict], page: int) -> Dict:
+    """``params`` for one page (``page`` and the maximum ``per_page``)"""
+    return dict(params or {}, page=page, per_page=PER_PAGE)
+
+
+def has_more(payload: Optional[Dict]) -> bool:
+    return bool(((payload or {}).get('pagination') or {}).get('has_more'))
+
+
+def iter_pages(fetch_page: FetchPage, budget: Optional[Budget] = None, concurrency: int = PAGE_CONCURRENCY,
+               max_pages: int = MAX_PAGES) -> Iterator[Dict]:
+    """Every page's payload in order; nothing when the first page fails"""
+    first = fetch_page(1)
+    if first is None:
+        return
+    pages_total.inc(result='used')
+    yield first
+    if not has_more(first):
+        return
+    page, window = 1, 2
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix='sportmonks-page') as pool:
+        futures = []
+        try:
+            while True:
+                size = min(window, concurrency, max_pages - page)
+                while size > 0 and budget is not None and not budget(size):
+                    size //= 2
+                if size <= 0:
+                    reason = 'page limit' if page >= max_pages else 'rate-limit budget'
+                    raise IncompletePages(f"stopped after page {page} ({reason})", page)
+                futures = [pool.submit(fetch_page, number) for number in range(page + 1, page + 1 + size)]
+                for index, future in enumerate(futures):
+                    payload = future.result()
+                    if payload is None:
+                        raise IncompletePages(f"page {page + 1} could not be fetched", page)
+                    page += 1
+                    pages_total.inc(result='used')
+                    yield payload
+                    if not has_more(payload):
+                        # Requests already running past the end (cancel() fails on those)
+                        pages_total.inc(sum(not f.cancel() for f in futures[index + 1:]), result='overshoot')
+                        return
+                window *= 2
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def iter_items(fetch_page: FetchPage, budget: Optional[Budget] = None, **kwargs) -> Iterator[Dict]:
+    """Every ``data`` item across all pages, streamed as pages arrive"""
+    for payload in iter_pages(fetch_page, budget, **kwargs):
+        yield from payload.get('data') or []
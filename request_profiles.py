@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Request Profiles
+================
+Named include / field-selection / filter sets for SportMonks requests.
+
+Each consumer asks for a profile by name instead of hand-writing its
+``include`` string, so it downloads only the relations, fields and
+statistic types it actually reads:
+- ``include``: relations, ``;``-separated, each optionally narrowed to
+  ``relation:field,field``
+- ``select``: fields of the base entity (``id`` is always returned; the
+  foreign keys of included relations are selected with them)
+- ``filters``: e.g. ``fixtureStatisticTypes`` (only the stat type ids the
+  parser maps) or ``markets`` / ``bookmakers`` on odds
+
+Response sizes are recorded per profile in
+``latecorners_response_bytes{profile}``; calls made without a profile are
+recorded under ``none``.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, Optional, Tuple
+
+import metrics
+
+# Statistic type ids each parser maps (see the stat mappings in the consumers)
+LIVE_STAT_TYPES = (33, 34, 42, 43, 44, 45, 86)                    # web_dashboard.extract_live_statistics
+CLIENT_STAT_TYPES = (33, 34, 41, 42, 43, 44, 45, 51, 52, 54, 86)  # sportmonks_client stat parsers
+COLLECTOR_STAT_TYPES = (34, 41, 42, 44, 45, 49, 60, 86)           # live_data_collector
+SETTLEMENT_STAT_TYPES = (34,)                                     # result_checker._extract_corner_count
+CORNER_MARKET_ID = 61    # Asian Total Corners
+BET365_BOOKMAKER_ID = 2
+
+BYTES_BUCKETS = (1e3, 5e3, 1e4, 2.5e4, 5e4, 1e5, 2.5e5, 5e5, 1e6, 2.5e6, 5e6)
+
+response_bytes = metrics.registry.histogram(
+    'latecorners_response_bytes', 'SportMonks response body size per request profile', ['profile'],
+    buckets=BYTES_BUCKETS)
+
+
+@dataclass(frozen=True)
+class RequestProfile:
+    name: str
+    include: Tuple[str, ...] = ()
+    select: Tuple[str, ...] = ()
+    filters: Tuple[Tuple[str, Tuple[int, ...]], ...] = ()
+
+    @property
+    def include_param(self) -> str:
+        return ';'.join(self.include)
+
+    def params(self, filters: Optional[Dict[str, Iterable[int]]] = None) -> Dict[str, str]:
+        """Query parameters for this profile; ``filters`` adds per-call filters (e.g. a fixture id)"""
+        params = {}
+        if self.include:
+            params['include'] = self.include_param
+        if self.select:
+            params['select'] = ','.join(self.select)
+        combined = list(self.filters) + [(key, tuple(values)) for key, values in (filters or {}).items()]
+        if combined:
+            params['filters'] = ';'.join(f"{key}:{','.join(str(v) for v in values)}" for key, values in combined)
+        return params
+
+    def with_stat_types(self, name: str, stat_types: Tuple[int, ...]) -> 'RequestProfile':
+        """The same request with a different statistic type filter"""
+        filters = tuple(f for f in self.filters if f[0] != 'fixtureStatisticTypes')
+        return replace(self, name=name, filters=filters + (('fixtureStatisticTypes', stat_types),))
+
+
+# Narrowed includes shared by the live profiles: only the fields the parsers and the match clock read
+_SCORES = 'scores:description,score'
+_STATE = 'state:state,short_name'
+_PERIODS = 'periods:type_id,ticking,minutes,seconds,started,counts_from'
+_STATISTICS = 'statistics:type_id,location,data'
+
+PROFILES: Dict[str, RequestProfile] = {}
+
+
+def register_profile(profile: RequestProfile) -> RequestProfile:
+    PROFILES[profile.name] = profile
+    return profile
+
+
+LIVE_MINIMAL = register_profile(RequestProfile(
+    'live_minimal', include=(_SCORES, _STATE, _PERIODS, _STATISTICS), select=('name', 'state_id'),
+    filters=(('fixtureStatisticTypes', LIVE_STAT_TYPES),)))
+LIVE_FULL = register_profile(RequestProfile(
+    'live_full', include=(_SCORES, 'participants', _STATE, _PERIODS, 'league:name', _STATISTICS),
+    select=('name', 'state_id', 'league_id'), filters=(('fixtureStatisticTypes', LIVE_STAT_TYPES),)))
+LIVE_OVERVIEW = register_profile(RequestProfile(
+    'live_overview', include=(_SCORES, 'participants', _STATE, _PERIODS, 'league:name'),
+    select=('name', 'state_id', 'league_id')))
+LIVE_COLLECTOR = register_profile(LIVE_FULL.with_stat_types('live_collector', COLLECTOR_STAT_TYPES))
+LIVE_EVENTS = register_profile(RequestProfile(
+    'live_events', include=('scores', 'participants', 'state', 'events', 'periods', 'statistics'),
+    filters=(('fixtureStatisticTypes', CLIENT_STAT_TYPES),)))
+FIXTURE_METADATA = register_profile(RequestProfile(
+    'fixture_metadata', include=('participants', 'league:name'), select=('name', 'league_id')))
+FIXTURE_DETAIL = register_profile(RequestProfile(
+    'fixture_detail', include=('statistics', 'periods.statistics', 'events', 'scores', 'participants', 'state'),
+    filters=(('fixtureStatisticTypes', CLIENT_STAT_TYPES),)))
+SETTLEMENT = register_profile(RequestProfile(
+    'settlement', include=('statistics:type_id,location,data,participant_id', _STATE), select=('name', 'state_id'),
+    filters=(('fixtureStatisticTypes', SETTLEMENT_STAT_TYPES),)))
+ODDS_CORNERS = register_profile(RequestProfile(
+    'odds_corners', filters=(('markets', (CORNER_MARKET_ID,)),)))
+ODDS_1X2 = register_profile(RequestProfile(
+    'odds_1x2', include=('odds',), filters=(('bookmakers', (BET365_BOOKMAKER_ID,)),)))
+
+
+def get_profile(name: str) -> RequestProfile:
+    return PROFILES[name]
+
+
+def record_response_bytes(profile: Optional[str], response) -> int:
+    """Record one response's body size under its profile name; returns the size"""
+    size = len(getattr(response, 'content', b'') or b'')
+    response_bytes.observe(size, profile=profile or 'none')
+    return size
+
+
+def bytes_per_call(profile: str) -> Optional[float]:
+    """Mean response size recorded for a profile (None before its first call)"""
+    count = response_bytes.count(profile=profile)
+    return response_bytes.sum(profile=profile) / count if count else None
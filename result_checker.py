@@ -12,6 +12,8 @@ import requests
 from datetime import datetime
 from typing import Dict, List
 from database import get_database
+from pagination import iter_items, page_params
+from request_profiles import SETTLEMENT, record_response_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -19,9 +21,16 @@ class ResultChecker:
     """Check final results of elite alert matches"""
     
     def __init__(self):
-        self.db = get_database()
+        self._db = None
         self.api_token = os.getenv('SPORTMONKS_API_KEY')
-        self.base_url = "https://api.sportmonks.com/v3/football"
+        self.base_url = os.getenv('SPORTMONKS_BASE_URL', "https://api.sportmonks.com/v3/football")
+    
+    @property
+    def db(self):
+        """Database connection, opened on first use"""
+        if self._db is None:
+            self._db = get_database()
+        return self._db
     
     async def check_all_pending_results(self):
         """Check results for all unfinished alerts"""
@@ -104,31 +113,30 @@ class ResultChecker:
         
         # Method 1: Check if fixture is in finished fixtures list (fixtureStates:5)
         finished_url = f"{self.base_url}/fixtures"
-        finished_params = {
-            'api_token': self.api_token,
-            'filters': f'fixtureStates:5;fixtures:{fixture_id}',  # State 5 = finished
-            'include': 'statistics'
-        }
+        finished_params = dict(SETTLEMENT.params(filters={'fixtureStates': [5], 'fixtures': [fixture_id]}),  # State 5 = finished
+                               api_token=self.api_token)
+        
+        def fetch_finished_page(page):
+            response = requests.get(finished_url, params=page_params(finished_params, page), timeout=10)
+            record_response_bytes(SETTLEMENT.name, response)
+            response.raise_for_status()
+            return response.json()
         
         try:
             logger.info(f"🔍 Checking if fixture {fixture_id} is in finished fixtures list...")
-            response = requests.get(finished_url, params=finished_params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            # Streamed across pages: stops at the first match instead of reading a truncated first page
+            finished = next(iter_items(fetch_finished_page), None)
             
-            if data.get('data') and len(data['data']) > 0:
+            if finished is not None:
                 logger.info("✅ Match found in finished fixtures list!")
                 # Don't return finished fixtures data - get individual fixture for accurate stats
                 logger.info("🔄 Getting individual fixture for accurate statistics...")
                 
                 individual_url = f"{self.base_url}/fixtures/{fixture_id}"
-                individual_params = {
-                    'api_token': self.api_token,
-                    'include': 'statistics'
-                }
+                individual_params = dict(SETTLEMENT.params(), api_token=self.api_token)
                 
                 response = requests.get(individual_url, params=individual_params, timeout=10)
+                record_response_bytes(SETTLEMENT.name, response)
                 response.raise_for_status()
                 
                 individual_data = response.json()
@@ -138,17 +146,15 @@ class ResultChecker:
                     return individual_data['data']
                 else:
                     logger.warning("⚠️ Individual fixture data not found, using finished fixtures data")
-                    return data['data'][0]
+                    return finished
             
             # Method 2: Check individual fixture with statistics
             logger.info(f"📊 Checking individual fixture {fixture_id}...")
             individual_url = f"{self.base_url}/fixtures/{fixture_id}"
-            individual_params = {
-                'api_token': self.api_token,
-                'include': 'statistics'
-            }
+            individual_params = dict(SETTLEMENT.params(), api_token=self.api_token)
             
             response = requests.get(individual_url, params=individual_params, timeout=10)
+            record_response_bytes(SETTLEMENT.name, response)
             response.raise_for_status()
             
             data = response.json()
@@ -1,10 +1,10 @@
 import logging
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from dataclasses import dataclass, fields
 
 from sportmonks_client import MatchStats
 from config import SCORING_MATRIX, get_config
+from stat_window import StatWindowStore, stat_windows
 
 @dataclass
 class ScoringResult:
@@ -18,48 +18,22 @@ class ScoringResult:
     match_context: str
     
 class MatchStateTracker:
-    """Tracks match state changes to calculate 'last X minutes' stats"""
+    """Tracks match state changes to calculate 'last X minutes' stats (match-minute stat windows)"""
     
-    def __init__(self):
-        self.match_states = {}  # fixture_id -> list of (timestamp, MatchStats)
+    def __init__(self, store: StatWindowStore = None):
+        self.store = store or stat_windows
         self.logger = logging.getLogger(__name__)
     
     def update_match_state(self, stats: MatchStats):
-        """Update the tracked state for a match"""
-        fixture_id = stats.fixture_id
-        timestamp = datetime.now()
-        
-        if fixture_id not in self.match_states:
-            self.match_states[fixture_id] = []
-        
-        self.match_states[fixture_id].append((timestamp, stats))
-        
-        # Keep only last 30 minutes of data to manage memory
-        cutoff_time = timestamp - timedelta(minutes=30)
-        self.match_states[fixture_id] = [
-            (ts, st) for ts, st in self.match_states[fixture_id] 
-            if ts > cutoff_time
-        ]
+        """Record the team stats of a snapshot at its match minute (O(1))"""
+        self.store.update(stats.fixture_id, stats.minute, {
+            f.name: getattr(stats, f.name) for f in fields(stats)
+            if isinstance(getattr(stats, f.name), dict)
+        })
     
-    def get_stats_from_minutes_ago(self, fixture_id: int, minutes_ago: int) -> Optional[MatchStats]:
-        """Get match stats from X minutes ago"""
-        if fixture_id not in self.match_states:
-            return None
-        
-        target_time = datetime.now() - timedelta(minutes=minutes_ago)
-        states = self.match_states[fixture_id]
-        
-        # Find the closest state to our target time
-        closest_state = None
-        min_diff = timedelta.max
-        
-        for timestamp, stats in states:
-            diff = abs(timestamp - target_time)
-            if diff < min_diff:
-                min_diff = diff
-                closest_state = stats
-        
-        return closest_state
+    def get_stat_delta(self, fixture_id: int, stat_name: str, minutes: int) -> Optional[Dict[str, float]]:
+        """Change in a stat over the last X match minutes (None without history)"""
+        return self.store.delta(fixture_id, stat_name, minutes)
 
 class ScoringEngine:
     """Main scoring engine that evaluates match conditions"""
@@ -385,23 +359,15 @@ class ScoringEngine:
     def _get_last_minutes_stat(self, current_stats: MatchStats, stat_name: str, minutes: int, team_focus: str) -> int:
         """Calculate stat difference for last X minutes"""
         
-        # Get stats from X minutes ago
-        old_stats = self.state_tracker.get_stats_from_minutes_ago(
-            current_stats.fixture_id, minutes
-        )
+        # O(1) lookup in the fixture's stat window (fed by evaluate_match)
+        delta = self.state_tracker.get_stat_delta(current_stats.fixture_id, stat_name, minutes)
         
-        if not old_stats:
+        if delta is None:
             # If we don't have old data, return current value (conservative estimate)
             current_value = getattr(current_stats, stat_name, {}).get(team_focus, 0)
             return current_value
         
-        # Calculate difference
-        current_value = getattr(current_stats, stat_name, {}).get(team_focus, 0)
-        old_value = getattr(old_stats, stat_name, {}).get(team_focus, 0)
-        
-        return max(0, current_value - old_value)
-    
-
+        return max(0, delta.get(team_focus, 0))
     
     def _is_in_alert_window(self, current_minute: int) -> bool:
         """Check if current minute is in the 85-87 minute alert window"""
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Snapshot Bus
+============
+Local sockets connecting the production roles (a local stand-in for Redis
+pub/sub). Only the ingestor talks to SportMonks; engines and web workers get
+everything through here.
+
+Pub/sub: the ingestor runs a ``SnapshotBusServer``. Every subscriber gets the
+latest live-data version on connect and then every new one. Each subscriber has
+its own sender thread holding only the newest pending version, so a slow or
+stuck subscriber can never block the updater - it just skips versions.
+Web workers feed what they receive into their local ``live_publisher``; alert
+engines read it through ``snapshot_subscriber.latest_matches``.
+
+Request/reply: the ingestor also runs a ``ServiceServer`` answering odds
+lookups (``corner_odds``, ``draw_odds``) from its own caches, so engines never
+spend API budget of their own. Engines call it through ``service_client``.
+
+Both listeners unpickle whatever an authenticated peer sends, so there is no
+default ``SNAPSHOT_BUS_AUTHKEY``: ``combined_runner --production`` generates a
+random key per launch for its children, and roles run as separate services
+(``--role``) must be given one explicitly.
+"""
+
+import ipaddress
+import logging
+import os
+import secrets
+import threading
+import time
+from multiprocessing.connection import Client, Listener
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_BUS_HOST = os.getenv('SNAPSHOT_BUS_HOST', '127.0.0.1')
+SNAPSHOT_BUS_PORT = int(os.getenv('SNAPSHOT_BUS_PORT', '8765'))
+# Seconds between reconnect attempts when the ingestor is not (yet) up
+SNAPSHOT_BUS_RETRY_SECONDS = 2
+SERVICE_BUS_PORT = int(os.getenv('SERVICE_BUS_PORT', '8766'))
+# Seconds an engine waits for the ingestor to answer a request
+SERVICE_CALL_TIMEOUT = float(os.getenv('SERVICE_CALL_TIMEOUT', '20'))
+
+# (version, matches, stats, data_at, epoch) as published by the ingestor
+Snapshot = Tuple[int, List[Dict], Dict, Optional[float], str]
+OnSnapshot = Callable[[int, List[Dict], Dict, Optional[float], str], None]
+
+
+class BusKeyError(RuntimeError):
+    """No usable authkey for the snapshot bus"""
+
+
+def is_loopback(host: str) -> bool:
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def bus_authkey() -> bytes:
+    """The key shared by every role (read when a connection is set up, never defaulted)"""
+    key = os.getenv('SNAPSHOT_BUS_AUTHKEY')
+    if not key:
+        raise BusKeyError("SNAPSHOT_BUS_AUTHKEY is not set (combined_runner --production generates one "
+                          "for its own children; set it explicitly when running roles separately)")
+    return key.encode('utf-8')
+
+
+def ensure_bus_authkey() -> None:
+    """Supervisor: generate a per-launch key for the child roles unless one is configured"""
+    if os.getenv('SNAPSHOT_BUS_AUTHKEY'):
+        return
+    if not is_loopback(SNAPSHOT_BUS_HOST):
+        raise BusKeyError(f"Refusing to run the snapshot bus on {SNAPSHOT_BUS_HOST} without an explicit "
+                          f"SNAPSHOT_BUS_AUTHKEY")
+    os.environ['SNAPSHOT_BUS_AUTHKEY'] = secrets.token_hex(32)
+
+
+class _SubscriberConnection:
+    """One connected subscriber: latest-only mailbox plus a dedicated sender thread"""
+
+    def __init__(self, conn, on_close: Callable[['_SubscriberConnection'], None]):
+        self.conn = conn
+        self._on_close = on_close
+        self._cond = threading.Condition()
+        self._pending: Optional[Snapshot] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='snapshot-bus-sender', daemon=True)
+        self._thread.start()
+
+    def offer(self, snapshot: Snapshot) -> None:
+        """Replace whatever is pending - a lagging worker only ever needs the newest version"""
+        with self._cond:
+            self._pending = snapshot
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                snapshot, self._pending = self._pending, None
+            try:
+                self.conn.send(snapshot)
+            except (OSError, EOFError, BrokenPipeError):
+                self.close()
+                return
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+        self._on_close(self)
+
+
+class SnapshotBusServer:
+    """Runs in the ingestor; fans each published version out to web workers and engines"""
+
+    def __init__(self, host: str = SNAPSHOT_BUS_HOST, port: int = SNAPSHOT_BUS_PORT,
+                 authkey: Optional[bytes] = None):
+        self.address = (host, port)
+        self.authkey = authkey or bus_authkey()
+        self._listener: Optional[Listener] = None
+        self._subscribers: List[_SubscriberConnection] = []
+        self._lock = threading.Lock()
+        self._latest: Optional[Snapshot] = None
+
+    def start(self) -> 'SnapshotBusServer':
+        self._listener = Listener(self.address, authkey=self.authkey)
+        threading.Thread(target=self._accept_loop, name='snapshot-bus-accept', daemon=True).start()
+        logger.info(f"📡 SNAPSHOT BUS: Listening on {self.address[0]}:{self.address[1]}")
+        return self
+
+    def _accept_loop(self) -> None:
+        while True:
+            try:
+                conn = self._listener.accept()
+            except Exception as e:
+                # Failed handshakes (wrong authkey, port scans) must not stop the bus
+                logger.warning(f"⚠️ SNAPSHOT BUS: Rejected connection: {e}")
+                continue
+            subscriber = _SubscriberConnection(conn, self._remove)
+            with self._lock:
+                self._subscribers.append(subscriber)
+                latest = self._latest
+            if latest is not None:
+                subscriber.offer(latest)
+            logger.info(f"📡 SNAPSHOT BUS: Subscriber connected ({len(self._subscribers)} total)")
+
+    def _remove(self, subscriber: _SubscriberConnection) -> None:
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def publish(self, version: int, matches: List[Dict], stats: Dict, data_at: Optional[float] = None,
+                epoch: str = '') -> None:
+        """Publisher listener: hand the new version to every subscriber without blocking"""
+        snapshot = (version, matches, stats, data_at, epoch)
+        with self._lock:
+            self._latest = snapshot
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber.offer(snapshot)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+
+class SnapshotSubscriber:
+    """Runs in a web worker or engine; keeps the latest version and calls ``on_snapshot(*snapshot)``"""
+
+    def __init__(self, on_snapshot: Optional[OnSnapshot] = None,
+                 host: str = SNAPSHOT_BUS_HOST, port: int = SNAPSHOT_BUS_PORT,
+                 authkey: Optional[bytes] = None):
+        self.on_snapshot = on_snapshot
+        self.address = (host, port)
+        self.authkey = authkey or bus_authkey()
+        self.last_version = 0
+        self.last_received_at: Optional[float] = None
+        # When the ingestor fetched the latest data (older than last_received_at while it serves a stale snapshot)
+        self.latest_data_at: Optional[float] = None
+        self.latest_matches: List[Dict] = []
+        self.latest_stats: Dict = {}
+        self.connected = False
+
+    def start(self) -> 'SnapshotSubscriber':
+        threading.Thread(target=self._run, name='snapshot-bus-subscriber', daemon=True).start()
+        return self
+
+    def _run(self) -> None:
+        while True:
+            try:
+                conn = Client(self.address, authkey=self.authkey)
+            except (OSError, EOFError) as e:
+                logger.debug(f"SNAPSHOT BUS: Ingestor not reachable yet ({e})")
+                time.sleep(SNAPSHOT_BUS_RETRY_SECONDS)
+                continue
+
+            self.connected = True
+            logger.info(f"📡 SNAPSHOT BUS: Subscribed to {self.address[0]}:{self.address[1]} (pid {os.getpid()})")
+            try:
+                while True:
+                    version, matches, stats, data_at, epoch = conn.recv()
+                    self.last_version = version
+                    self.last_received_at = time.time()
+                    self.latest_data_at = data_at
+                    self.latest_matches = matches
+                    self.latest_stats = stats
+                    if self.on_snapshot is not None:
+                        self.on_snapshot(version, matches, stats, data_at, epoch)
+            except (OSError, EOFError) as e:
+                logger.warning(f"⚠️ SNAPSHOT BUS: Lost connection to ingestor: {e}")
+            except Exception as e:
+                logger.error(f"❌ SNAPSHOT BUS: Failed to apply snapshot: {e}")
+            finally:
+                self.connected = False
+                try:
+                    conn.close()
+                except OSError:
+                    pass
+            time.sleep(SNAPSHOT_BUS_RETRY_SECONDS)
+
+
+class ServiceServer:
+    """Runs in the ingestor; answers ``(method, args)`` requests with ``('ok', result)`` or ``('error', msg)``"""
+
+    def __init__(self, handlers: Dict[str, Callable], host: str = SNAPSHOT_BUS_HOST,
+                 port: int = SERVICE_BUS_PORT, authkey: Optional[bytes] = None):
+        self.handlers = handlers
+        self.address = (host, port)
+        self.authkey = authkey or bus_authkey()
+        self._listener: Optional[Listener] = None
+
+    def start(self) -> 'ServiceServer':
+        self._listener = Listener(self.address, authkey=self.authkey)
+        threading.Thread(target=self._accept_loop, name='service-bus-accept', daemon=True).start()
+        logger.info(f"📡 SERVICE BUS: Serving {sorted(self.handlers)} on {self.address[0]}:{self.address[1]}")
+        return self
+
+    def _accept_loop(self) -> None:
+        while True:
+            try:
+                conn = self._listener.accept()
+            except Exception as e:
+                logger.warning(f"⚠️ SERVICE BUS: Rejected connection: {e}")
+                continue
+            threading.Thread(target=self._serve, args=(conn,), name='service-bus-conn', daemon=True).start()
+
+    def _serve(self, conn) -> None:
+        try:
+            while True:
+                method, args = conn.recv()
+                handler = self.handlers.get(method)
+                if handler is None:
+                    conn.send(('error', f"unknown method {method}"))
+                    continue
+                try:
+                    conn.send(('ok', handler(*args)))
+                except Exception as e:
+                    conn.send(('error', str(e)))
+        except (OSError, EOFError):
+            pass
+        finally:
+            try:
+                conn.close()
+            except OSError:
+                pass
+
+
+class ServiceClient:
+    """Runs in an engine; one persistent connection to the ingestor, reconnecting on failure"""
+
+    def __init__(self, host: str = SNAPSHOT_BUS_HOST, port: int = SERVICE_BUS_PORT,
+                 authkey: Optional[bytes] = None, timeout: float = SERVICE_CALL_TIMEOUT):
+        self.address = (host, port)
+        self.authkey = authkey or bus_authkey()
+        self.timeout = timeout
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _drop(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except OSError:
+                pass
+        self._conn = None
+
+    def call(self, method: str, *args):
+        """Send a request and wait for its reply. Raises ConnectionError if the ingestor is unavailable."""
+        with self._lock:
+            try:
+                if self._conn is None:
+                    self._conn = Client(self.address, authkey=self.authkey)
+                self._conn.send((method, args))
+                if not self._conn.poll(self.timeout):
+                    # A late reply would be read as the answer to the next call - start over
+                    self._drop()
+                    raise ConnectionError(f"{method} timed out after {self.timeout}s")
+                status, result = self._conn.recv()
+            except (OSError, EOFError) as e:
+                self._drop()
+                raise ConnectionError(f"{method} failed: {e}") from e
+        if status != 'ok':
+            raise RuntimeError(f"{method} failed in ingestor: {result}")
+        return result
+
+
+# Global subscriber / service client for this process (None in dev mode and in the ingestor)
+snapshot_subscriber: Optional[SnapshotSubscriber] = None
+service_client: Optional[ServiceClient] = None
+
+
+def start_snapshot_server(publisher) -> SnapshotBusServer:
+    """Ingestor: start the bus and forward every ``publisher`` version to it"""
+    server = SnapshotBusServer().start()
+    publisher.add_listener(server.publish)
+    return server
+
+
+def start_service_server(handlers: Dict[str, Callable]) -> ServiceServer:
+    """Ingestor: answer engine requests with ``handlers``"""
+    return ServiceServer(handlers).start()
+
+
+def connect_service_client() -> ServiceClient:
+    """Engine: route odds lookups through the ingestor (connects lazily on first call)"""
+    global service_client
+    if service_client is None:
+        service_client = ServiceClient()
+    return service_client
+
+
+def start_snapshot_subscriber(on_snapshot: Optional[OnSnapshot] = None) -> SnapshotSubscriber:
+    """Web worker / engine: start (once) the thread that receives versions from the ingestor"""
+    global snapshot_subscriber
+    if snapshot_subscriber is None:
+        snapshot_subscriber = SnapshotSubscriber(on_snapshot).start()
+    return snapshot_subscriber
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Snapshot Store
+==============
+Persistent minute-by-minute history of every live fixture: team stats and
+corner-odds availability, one fixed-size record per fixture per update cycle.
+
+Layout: one append-only file per UTC day (``<dir>/snapshots-YYYY-MM-DD.v1.bin``),
+raw records of ``SNAPSHOT_DTYPE`` with no header, so a file can be opened
+with ``np.memmap`` and sliced without parsing. A crash can leave at most a
+partial record at the tail, which readers ignore.
+
+Writes never block the update loop: ``record(cycle)`` only enqueues the
+cycle's feature frame (or match list) on a bounded queue, dropping the cycle
+when full. A background thread then converts the queued cycles to records
+and appends them in batches.
+
+Enable by setting ``SNAPSHOT_STORE_DIR``. Only the process running the
+dashboard updater (the ingest role in production mode) should write.
+
+Missing stats are stored as -1 and missing odds lines as NaN.
+"""
+
+import glob
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+from feature_frame import TEAM_FIELDS, FeatureFrame, lowest_active_over, team_stat
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_STORE_DIR = os.getenv('SNAPSHOT_STORE_DIR', '')
+# Update cycles buffered for the writer before new ones are dropped
+SNAPSHOT_QUEUE_MAX = int(os.getenv('SNAPSHOT_QUEUE_MAX', '64'))
+FILE_VERSION = 1
+
+SNAPSHOT_DTYPE = np.dtype(
+    [('ts', '<f8'), ('fixture_id', '<i8'), ('minute', '<i2')]
+    + [(f"{side}_{name}", '<i2') for side in ('home', 'away') for name in TEAM_FIELDS]
+    + [('corner_odds_available', 'i1'), ('corner_odds_active', '<i2'), ('over_line', '<f4')]
+)
+
+DateLike = Union[date, datetime, str]
+
+
+def _day_of(ts: float) -> date:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).date()
+
+
+def _as_date(value: DateLike) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+def matches_to_records(matches: Iterable[Dict], ts: float) -> np.ndarray:
+    """Dashboard match dicts -> structured records (one per fixture)"""
+    rows = []
+    for m in matches:
+        home = m.get('statistics', {}).get('home', {})
+        away = m.get('statistics', {}).get('away', {})
+        home = dict(home, goals=m.get('home_score'))
+        away = dict(away, goals=m.get('away_score'))
+        corner_odds = m.get('corner_odds') or {}
+        rows.append(
+            (ts, m['match_id'], m.get('minute', 0))
+            + tuple(team_stat(home, name) for name in TEAM_FIELDS)
+            + tuple(team_stat(away, name) for name in TEAM_FIELDS)
+            + (1 if corner_odds.get('available') else 0, corner_odds.get('active_count', 0),
+               lowest_active_over(corner_odds))
+        )
+    return np.array(rows, dtype=SNAPSHOT_DTYPE)
+
+
+def frame_to_records(frame: FeatureFrame, ts: float) -> np.ndarray:
+    """The cycle's feature frame -> structured records (columns copied, nothing re-parsed)"""
+    records = np.zeros(len(frame), dtype=SNAPSHOT_DTYPE)
+    records['ts'] = ts
+    for name in SNAPSHOT_DTYPE.names[1:]:
+        records[name] = frame[name]
+    return records
+
+
+def _to_records(cycle: Union[FeatureFrame, List[Dict]], ts: float) -> np.ndarray:
+    if isinstance(cycle, FeatureFrame):
+        return frame_to_records(cycle, ts)
+    return matches_to_records(cycle, ts)
+
+
+class SnapshotStore:
+    """Day-partitioned append-only record files plus a non-blocking background writer"""
+
+    def __init__(self, directory: str, queue_max: int = SNAPSHOT_QUEUE_MAX, clock=time):
+        self.directory = directory
+        self.clock = clock
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_max)
+        self._writer: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.written = 0
+        self.dropped = 0
+
+    def path_for(self, day: DateLike) -> str:
+        return os.path.join(self.directory, f"snapshots-{_as_date(day).isoformat()}.v{FILE_VERSION}.bin")
+
+    # ---- writing ----
+
+    def record(self, cycle: Union[FeatureFrame, List[Dict]], ts: Optional[float] = None) -> bool:
+        """Queue one update cycle (its feature frame or match list); never blocks. False when dropped"""
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait((self.clock.time() if ts is None else ts, cycle))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 100 == 0:
+                logger.warning(f"⚠️ Snapshot store backlog full - dropped {self.dropped} cycles so far")
+            return False
+
+    def append(self, records: np.ndarray) -> None:
+        """Synchronously append records, split by UTC day"""
+        if len(records) == 0:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        days = np.array([_day_of(ts) for ts in records['ts']])
+        for day in sorted(set(days)):
+            chunk = records[days == day]
+            with open(self.path_for(day), 'ab') as f:
+                f.write(chunk.tobytes())
+            self.written += len(chunk)
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Wait until everything queued so far has been written (tests, shutdown)"""
+        if self._writer is None:
+            return
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None:
+            return
+        with self._start_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name='snapshot-store', daemon=True)
+                self._writer.start()
+
+    def _write_loop(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            # Drain whatever else piled up and write it in one go
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                records = [_to_records(cycle, ts) for ts, cycle in batch]
+                self.append(np.concatenate(records))
+            except Exception as e:
+                logger.error(f"❌ Snapshot store write failed ({len(batch)} cycles lost): {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    # ---- reading ----
+
+    def days(self) -> List[date]:
+        pattern = os.path.join(self.directory, f"snapshots-*.v{FILE_VERSION}.bin")
+        found = []
+        for path in glob.glob(pattern):
+            stamp = os.path.basename(path)[len('snapshots-'):-len(f".v{FILE_VERSION}.bin")]
+            try:
+                found.append(date.fromisoformat(stamp))
+            except ValueError:
+                continue
+        return sorted(found)
+
+    def read_day(self, day: DateLike) -> np.ndarray:
+        """Memory-mapped view of one day (read-only, zero-copy)"""
+        path = self.path_for(day)
+        if not os.path.exists(path):
+            return np.empty(0, dtype=SNAPSHOT_DTYPE)
+        count = os.path.getsize(path) // SNAPSHOT_DTYPE.itemsize  # Ignore a torn tail record
+        if count == 0:
+            return np.empty(0, dtype=SNAPSHOT_DTYPE)
+        return np.memmap(path, dtype=SNAPSHOT_DTYPE, mode='r', shape=(count,))
+
+    def read_range(self, start: DateLike, end: Optional[DateLike] = None,
+                   fixture_ids: Optional[Iterable[int]] = None) -> np.ndarray:
+        """Records for every day in [start, end], optionally only for the given fixtures"""
+        first = _as_date(start)
+        last = _as_date(end) if end is not None else first
+        wanted = np.fromiter(fixture_ids, dtype=np.int64) if fixture_ids is not None else None
+        chunks = []
+        day = first
+        while day <= last:
+            records = self.read_day(day)
+            if len(records) and wanted is not None:
+                records = records[np.isin(records['fixture_id'], wanted)]
+            if len(records):
+                chunks.append(np.asarray(records))
+            day += timedelta(days=1)
+        return np.concatenate(chunks) if chunks else np.empty(0, dtype=SNAPSHOT_DTYPE)
+
+    def read_fixture(self, fixture_id: int, around: Optional[DateLike] = None) -> np.ndarray:
+        """One fixture's history in time order. ``around`` limits the scan to that day +/- 1"""
+        if around is not None:
+            day = _as_date(around)
+            records = self.read_range(day - timedelta(days=1), day + timedelta(days=1), [fixture_id])
+        else:
+            days = self.days()
+            records = self.read_range(days[0], days[-1], [fixture_id]) if days else np.empty(0, dtype=SNAPSHOT_DTYPE)
+        return records[np.argsort(records['ts'], kind='stable')]
+
+
+# Global store (disabled unless SNAPSHOT_STORE_DIR is set)
+snapshot_store = SnapshotStore(SNAPSHOT_STORE_DIR) if SNAPSHOT_STORE_DIR else None
+
+
+def record_snapshot(cycle: Union[FeatureFrame, List[Dict]], ts: Optional[float] = None) -> None:
+    """Queue one update cycle if the store is enabled"""
+    if snapshot_store is not None:
+        snapshot_store.record(cycle, ts)
@@ -8,6 +8,11 @@ try:
 except Exception:
     # When imported as a package (python -m latecorners.*)
     from latecorners.config import get_config
+from circuit_breaker import circuit_breaker
+from feed_recorder import record_response
+from metrics import sportmonks_request_seconds
+from pagination import IncompletePages, iter_pages, page_params
+from request_profiles import FIXTURE_DETAIL, LIVE_EVENTS, RequestProfile, record_response_bytes
 
 # Rate limiting tracker
 class RateLimitTracker:
@@ -16,8 +21,8 @@ class RateLimitTracker:
         self.last_429_time = 0
         self.backoff_until = 0
         
-    def can_make_request(self) -> bool:
-        """Check if we can make a request without hitting rate limits"""
+    def can_make_request(self, count: int = 1) -> bool:
+        """Check if we can make ``count`` requests without hitting rate limits"""
         now = time.time()
         
         # If we're in backoff period, wait
@@ -30,7 +35,7 @@ class RateLimitTracker:
         # Check if we're under the limit
         config = get_config()
         max_per_minute = getattr(config, 'MAX_REQUESTS_PER_MINUTE', 100)
-        return len(self.request_times) < max_per_minute
+        return len(self.request_times) + count <= max_per_minute
     
     def record_request(self):
         """Record a successful request"""
@@ -128,17 +133,27 @@ class SportmonksClient:
         self.session = requests.Session()
         self.logger = logging.getLogger(__name__)
         
-    def _make_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
-        """Make a request to the Sportmonks API with rate limiting"""
+    def _make_request(self, endpoint: str, params: Dict = None,
+                      profile: Optional[RequestProfile] = None) -> Optional[Dict]:
+        """Make a request to the Sportmonks API with rate limiting (``profile`` supplies include/select/filters)"""
         # Check rate limiting before making request
         if not rate_limiter.can_make_request():
             self.logger.warning("⚠️ Rate limit check failed, skipping request")
             return None
         
         url = f"{self.base_url}{endpoint}"
+        entity = endpoint.strip('/').split('/')[0] or 'root'
+        
+        # Fail fast while this endpoint is down instead of waiting out another timeout
+        breaker = circuit_breaker(entity)
+        if not breaker.allow():
+            self.logger.warning(f"⚡ Circuit open for {entity}, skipping request to {endpoint}")
+            return None
         
         if params is None:
             params = {}
+        if profile is not None:
+            params = dict(profile.params(), **params)
         
         params['api_token'] = self.api_key
         
@@ -146,7 +161,19 @@ class SportmonksClient:
             # Rate limiting delay
             time.sleep(self.config.API_RATE_LIMIT_DELAY)
             
-            response = self.session.get(url, params=params)
+            with sportmonks_request_seconds.time(entity=entity):
+                try:
+                    response = self.session.get(url, params=params)
+                except requests.exceptions.RequestException:
+                    breaker.record_failure()
+                    raise
+            record_response(endpoint, params, response)
+            record_response_bytes(profile.name if profile else None, response)
+            # Server errors count against the endpoint; 4xx (including 429) are about the request
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
             
             # Handle 429 specifically
             if response.status_code == 429:
@@ -174,6 +201,18 @@ class SportmonksClient:
             self.logger.error(f"JSON decode error for {endpoint}: {e}")
             return None
     
+    def _make_paged_request(self, endpoint: str, params: Dict = None,
+                            profile: Optional[RequestProfile] = None) -> Optional[Dict]:
+        """All pages of a paginated endpoint merged into one ``data`` list (None if incomplete)"""
+        pages = iter_pages(lambda page: self._make_request(endpoint, page_params(params, page), profile),
+                           budget=rate_limiter.can_make_request)
+        try:
+            data = [item for payload in pages for item in payload.get('data') or []]
+        except IncompletePages as e:
+            self.logger.error(f"Incomplete pages for {endpoint}: {e}")
+            return None
+        return {'data': data} if data else None
+    
     def get_live_matches(self, filter_by_minute: bool = False) -> List[Dict]:
         """Get all currently live matches
         
@@ -183,13 +222,8 @@ class SportmonksClient:
         """
         self.logger.info("Fetching live matches...")
         
-        # 🎯 KEY FIX: Add includes to get live data + periods for minute
-        params = {
-            # Include statistics as well to receive full live stat set (e.g., shots_blocked type_id 58)
-            'include': 'scores;participants;state;events;periods;statistics'
-        }
-        
-        data = self._make_request("/livescores/inplay", params=params)
+        # 🎯 KEY FIX: Includes for live data + periods for minute, statistics limited to the mapped types
+        data = self._make_request("/livescores/inplay", profile=LIVE_EVENTS)
         if not data:
             return []
         
@@ -303,7 +337,7 @@ class SportmonksClient:
         """Get the pre-match favorite team ID"""
         self.logger.info(f"Getting pre-match favorite for fixture {fixture_id}")
         
-        data = self._make_request(f"/odds/pre-match/by-fixture/{fixture_id}")
+        data = self._make_paged_request(f"/odds/pre-match/by-fixture/{fixture_id}")
         if not data:
             return None
         
@@ -343,13 +377,8 @@ class SportmonksClient:
         """Get detailed fixture statistics and events"""
         self.logger.info(f"Fetching stats for fixture {fixture_id}")
         
-        # 🎯 KEY FIX: Add includes to get detailed match data + periods for minute
-        # Using exact format from SportMonks documentation: statistics,periods with period-level stats
-        params = {
-            'include': 'statistics,periods.statistics,events,scores,participants,state'  # 🎯 FIXED: Using comma separators + periods.statistics as per docs
-        }
-        
-        data = self._make_request(f"/fixtures/{fixture_id}", params=params)
+        # 🎯 KEY FIX: Detailed match data + periods for minute, with period-level stats (periods.statistics)
+        data = self._make_request(f"/fixtures/{fixture_id}", profile=FIXTURE_DETAIL)
         if not data:
             return None
         
@@ -901,7 +930,7 @@ class SportmonksClient:
         """Get live corner betting odds"""
         self.logger.info(f"Getting live corner odds for fixture {fixture_id}")
         
-        data = self._make_request(f"/odds/in-play/by-fixture/{fixture_id}")
+        data = self._make_paged_request(f"/odds/in-play/by-fixture/{fixture_id}")
         if not data:
             return None
         
@@ -951,7 +980,7 @@ class SportmonksClient:
             draw_labels = {'x', 'draw', 'tie'}
 
             # Approach A: same helper used by Asian odds (nested by bookmaker/market) → strict market match
-            data_nested = self._make_request(f"/odds/in-play/by-fixture/{fixture_id}")
+            data_nested = self._make_paged_request(f"/odds/in-play/by-fixture/{fixture_id}")
             if data_nested and isinstance(data_nested.get('data'), list):
                 collected: List[float] = []
                 for bookmaker in data_nested['data']:
@@ -971,7 +1000,7 @@ class SportmonksClient:
                     return min(collected)
 
             # Approach B: flat odds records with market_description/label/value → strict market match
-            data_flat = self._make_request(f"/odds/inplay/fixtures/{fixture_id}")
+            data_flat = self._make_paged_request(f"/odds/inplay/fixtures/{fixture_id}")
             if data_flat and isinstance(data_flat.get('data'), list):
                 collected: List[float] = []
                 for odd in data_flat['data']:
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Stat Windows
+============
+One per-fixture history of cumulative team stats, indexed by match minute,
+answering "how much did stat X change over the last N minutes" in O(1) for
+any N up to the horizon.
+
+Live stats (corners, shots, attacks...) are already running totals, i.e. prefix
+sums of per-minute events, so a window delta is just ``cum[now] - cum[now - N]``.
+Each minute's row is kept in a ring buffer of ``horizon + 1`` slots, and gaps
+between updates are forward-filled so every minute in range has a row.
+Percentage stats (possession, pass accuracy) are averaged over the window from a
+running prefix sum of their per-minute values.
+
+``stat_windows`` is the shared store, keyed by real match minute (``ScoringEngine``
+feeds it). ``MatchStateTracker`` and ``EnhancedMatchTracker`` count minutes from
+their first update when no match minute is given, so by default they keep a
+private window outside the store; a minute going backwards clears a window,
+and mixing the two clocks in one window would wipe it.
+Updates for the same minute merge, so callers that follow different stats
+can share a fixture as long as they all pass match minutes.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+# Stats averaged over the window instead of differenced
+AVERAGED_STATS = frozenset({'possession', 'pass_accuracy'})
+DEFAULT_HORIZON_MINUTES = 30
+
+
+class FixtureStatWindow:
+    """Minute-indexed ring buffer of cumulative stats for one fixture"""
+
+    def __init__(self, horizon_minutes: int = DEFAULT_HORIZON_MINUTES, averaged: Iterable[str] = AVERAGED_STATS):
+        self.horizon_minutes = horizon_minutes
+        self.size = horizon_minutes + 1
+        self.averaged = frozenset(averaged)
+        # slot -> {stat: (home, away)}; prefix sums of averaged stats are stored as '__sum_<stat>'
+        self._rows: List[Optional[Dict[str, tuple]]] = [None] * self.size
+        self.first_minute: Optional[int] = None
+        self.last_minute: Optional[int] = None
+        # Wall-clock origin for callers that only have timestamps (see minute_for)
+        self.origin: Optional[float] = None
+
+    def __len__(self) -> int:
+        if self.last_minute is None:
+            return 0
+        return self.last_minute - self.first_minute + 1
+
+    def clear(self) -> None:
+        self._rows = [None] * self.size
+        self.first_minute = self.last_minute = None
+
+    def minute_for(self, timestamp: float) -> int:
+        """Whole minutes since the first timestamp seen (for trackers without a match clock)"""
+        if self.origin is None:
+            self.origin = timestamp
+        return max(0, int((timestamp - self.origin) // 60))
+
+    def _row(self, minute: int) -> Dict[str, tuple]:
+        return self._rows[minute % self.size]
+
+    def _next_row(self, previous: Optional[Dict[str, tuple]], values: Dict[str, tuple]) -> Dict[str, tuple]:
+        row = dict(previous) if previous else {}
+        row.update(values)
+        for stat in self.averaged:
+            if stat in row:
+                prior = previous.get(f"__sum_{stat}", (0, 0)) if previous else (0, 0)
+                row[f"__sum_{stat}"] = (prior[0] + row[stat][0], prior[1] + row[stat][1])
+        return row
+
+    def update(self, minute: int, stats: Dict[str, Dict[str, float]]) -> None:
+        """Record cumulative stats ({stat: {'home': x, 'away': y}}) at ``minute``"""
+        values = {name: (team.get('home', 0) or 0, team.get('away', 0) or 0)
+                  for name, team in stats.items() if isinstance(team, dict)}
+
+        if self.last_minute is not None and minute < self.last_minute:
+            self.clear()  # Minute regression (HT reset, feed glitch)
+
+        if self.last_minute is None:
+            self._rows[minute % self.size] = self._next_row(None, values)
+            self.first_minute = self.last_minute = minute
+            return
+
+        if minute == self.last_minute:
+            # Same minute again: merge, rebuilding this minute's prefix sums from the minute before
+            previous = self._row(minute - 1) if minute > self.first_minute else None
+            merged = dict(self._row(minute))
+            merged.update(values)
+            self._rows[minute % self.size] = self._next_row(previous, merged)
+            return
+
+        # Forward-fill skipped minutes with the last known totals, then write this minute
+        previous = self._row(self.last_minute)
+        carried = {k: v for k, v in previous.items() if not k.startswith('__sum_')}
+        for gap_minute in range(max(self.last_minute + 1, minute - self.size + 1), minute):
+            previous = self._next_row(previous, carried)
+            self._rows[gap_minute % self.size] = previous
+        self._rows[minute % self.size] = self._next_row(previous, values)
+        self.last_minute = minute
+        self.first_minute = max(self.first_minute, minute - self.horizon_minutes)
+
+    def _start(self, minutes: int, now: Optional[int]) -> Optional[int]:
+        """First minute of the window ending at ``now`` (default: latest), or None if empty"""
+        if self.last_minute is None:
+            return None
+        end = self.last_minute if now is None else now
+        start = max(self.first_minute, end - minutes)
+        return start if start <= self.last_minute else None
+
+    def delta(self, stat: str, minutes: int, now: Optional[int] = None) -> Optional[Dict[str, float]]:
+        """Change in a cumulative stat over the last ``minutes`` (None without history)"""
+        start = self._start(minutes, now)
+        if start is None:
+            return None
+        first, last = self._row(start).get(stat), self._row(self.last_minute).get(stat)
+        if last is None:
+            return None
+        first = first or (0, 0)
+        return {'home': last[0] - first[0], 'away': last[1] - first[1]}
+
+    def average(self, stat: str, minutes: int, now: Optional[int] = None) -> Optional[Dict[str, float]]:
+        """Per-minute average of a percentage stat over the last ``minutes``"""
+        start = self._start(minutes, now)
+        if start is None or stat not in self.averaged:
+            return None
+        key = f"__sum_{stat}"
+        last, first = self._row(self.last_minute).get(key), self._row(start).get(key)
+        if last is None:
+            return None
+        # Sum over [start, last] = S[last] - S[start] + v[start] (S[start - 1] may already be overwritten)
+        first_sum, first_value = first or (0, 0), self._row(start).get(stat, (0, 0))
+        span = self.last_minute - start + 1
+        return {'home': (last[0] - first_sum[0] + first_value[0]) / span,
+                'away': (last[1] - first_sum[1] + first_value[1]) / span}
+
+    def window(self, minutes: int, now: Optional[int] = None) -> Optional[Dict[str, Dict[str, float]]]:
+        """Every tracked stat over the last ``minutes``: deltas, plus averages for percentages"""
+        if self._start(minutes, now) is None:
+            return None
+        stats = {}
+        for name in self._row(self.last_minute):
+            if name.startswith('__sum_'):
+                continue
+            stats[name] = self.average(name, minutes, now) if name in self.averaged else self.delta(name, minutes, now)
+        return stats
+
+    def value(self, stat: str, minutes_ago: int = 0) -> Optional[Dict[str, float]]:
+        """The cumulative value ``minutes_ago`` minutes before the latest update (or the oldest kept)"""
+        start = self._start(minutes_ago, None)
+        if start is None:
+            return None
+        row = self._row(start).get(stat)
+        return {'home': row[0], 'away': row[1]} if row is not None else None
+
+
+class StatWindowStore:
+    """Shared per-fixture stat windows"""
+
+    def __init__(self, horizon_minutes: int = DEFAULT_HORIZON_MINUTES):
+        self.horizon_minutes = horizon_minutes
+        self._fixtures: Dict[int, FixtureStatWindow] = {}
+
+    def fixture(self, fixture_id: int) -> FixtureStatWindow:
+        window = self._fixtures.get(fixture_id)
+        if window is None:
+            window = self._fixtures[fixture_id] = FixtureStatWindow(self.horizon_minutes)
+        return window
+
+    def update(self, fixture_id: int, minute: int, stats: Dict[str, Dict[str, float]]) -> None:
+        self.fixture(fixture_id).update(minute, stats)
+
+    def delta(self, fixture_id: int, stat: str, minutes: int) -> Optional[Dict[str, float]]:
+        window = self._fixtures.get(fixture_id)
+        return window.delta(stat, minutes) if window else None
+
+    def discard_stale(self, live_fixture_ids: Iterable[int]) -> int:
+        """Forget every fixture that is no longer live"""
+        live = set(live_fixture_ids)
+        stale = [fixture_id for fixture_id in self._fixtures if fixture_id not in live]
+        for fixture_id in stale:
+            del self._fixtures[fixture_id]
+        return len(stale)
+
+    def __contains__(self, fixture_id: int) -> bool:
+        return fixture_id in self._fixtures
+
+
+# Global store shared by every tracker in this process
+stat_windows = StatWindowStore()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Built-in Strategies
+===================
+Pure ``row -> details | None`` functions registered with the strategy
+registry (see strategy_registry). A row is one fixture's features for the
+current cycle; nothing here fetches or parses data.
+
+- late_momentum / late_momentum_draw: the live engine rules (production).
+  Odds availability comes from the cycle's cached lookups.
+- tier1_elite: the dashboard's TIER 1 corner evaluation (evaluate_corner_potential)
+- scoreline_psychology: ScorelineAwareCornerSystem's stats + scoreline urgency score
+
+The other legacy systems score stats the live feed does not carry (crosses,
+territory, blocked shots, key passes), so they have no row-based port yet.
+"""
+
+from typing import Dict, Optional
+
+from alert_rules import ALERT_WINDOW, MAX_DRAW_ODDS, MIN_COMBINED_MOMENTUM, MIN_TOTAL_CORNERS
+from strategy_registry import register_strategy
+
+# TIER 1 scorelines and corner points (as in web_dashboard.is_tier1_elite_scoreline / CORNER_COUNT_SCORING)
+TIER1_SCORELINES = {(0, 1): 'TIER_1_AWAY_LEADING', (1, 1): 'TIER_1_DRAW',
+                    (1, 0): 'TIER_1_HOME_LEADING', (0, 0): 'TIER_1_GOALLESS_DRAW'}
+TIER1_CORNER_POINTS = {6: (10, 'TIER_1_BASELINE'), 7: (12, 'TIER_1_PEAK'), 8: (14, 'TIER_1_PREMIUM'),
+                       9: (16, 'TIER_1_HIGH'), 10: (16, 'TIER_1_HIGH')}
+
+
+def _in_alert_window(row: Dict) -> bool:
+    return ALERT_WINDOW[0] <= row['minute'] <= ALERT_WINDOW[1]
+
+
+@register_strategy('late_momentum', mode='production', budget_ms=2)
+def late_momentum(row: Dict) -> Optional[Dict]:
+    """85-89', corners >= 9, combined Momentum10 >= 75, Asian corner odds available"""
+    if (_in_alert_window(row) and row['corner_odds_available']
+            and row['total_corners'] >= MIN_TOTAL_CORNERS and row['momentum_combined'] >= MIN_COMBINED_MOMENTUM):
+        return {'momentum': row['momentum_combined'], 'corners': row['total_corners']}
+    return None
+
+
+@register_strategy('late_momentum_draw', mode='production', budget_ms=2)
+def late_momentum_draw(row: Dict) -> Optional[Dict]:
+    """85-89', draw price <= 1.50, combined Momentum10 >= 75, Asian corner odds available"""
+    draw_odds = row['draw_odds']
+    if (_in_alert_window(row) and row['corner_odds_available'] and draw_odds is not None
+            and draw_odds <= MAX_DRAW_ODDS and row['momentum_combined'] >= MIN_COMBINED_MOMENTUM):
+        return {'momentum': row['momentum_combined'], 'draw_odds': draw_odds}
+    return None
+
+
+@register_strategy('tier1_elite', mode='shadow', budget_ms=5)
+def tier1_elite(row: Dict) -> Optional[Dict]:
+    """84-85', 0-0/1-0/0-1/1-1, 7-10 corners, 7-9 shots on target, TIER 1 score >= 16"""
+    if not 84 <= row['minute'] <= 85:
+        return None
+    scoreline = TIER1_SCORELINES.get((row['home_score'], row['away_score']))
+    if scoreline is None or row['total_corners'] not in TIER1_CORNER_POINTS:
+        return None
+    if not 7 <= row['total_shots_on_target'] <= 9:
+        return None
+    points, category = TIER1_CORNER_POINTS[row['total_corners']]
+    if category == 'TIER_1_BASELINE':
+        return None  # trigger_85_minute_alert rejects 6-corner matches too
+    score = (points + row['total_corners'] * 3 + row['total_shots_on_target'] * 2
+             + row['total_shots'] * 1.5 + row['total_dangerous_attacks'] * 0.3)
+    if score < 16.0:
+        return None
+    return {'score': round(score, 1), 'category': category, 'scoreline': scoreline}
+
+
+@register_strategy('scoreline_psychology', mode='shadow', budget_ms=5)
+def scoreline_psychology(row: Dict) -> Optional[Dict]:
+    """70-89', stats score + scoreline urgency >= 60 with HIGH/VERY HIGH urgency (STRONG BUY)"""
+    minute = row['minute']
+    if not 70 <= minute <= ALERT_WINDOW[1]:
+        return None
+    margin = abs(row['goal_difference'])
+    if margin == 0:
+        psychology, urgency = (8, 'HIGH') if row['home_score'] == 0 else (12, 'VERY HIGH')
+    elif margin == 1:
+        psychology, urgency = 10, 'HIGH'
+    else:
+        return None  # Two or more goals apart never reaches STRONG BUY urgency
+    psychology *= 1.5 if urgency == 'VERY HIGH' else 1.3  # Late-game multiplier (70+)
+
+    stats_score = (row['total_corners'] * 5 + row['total_dangerous_attacks'] * 0.4
+                   + row['total_shots'] * 1.5)
+    score = stats_score + psychology
+    if score < 60:
+        return None
+    return {'score': round(score, 1), 'urgency': urgency}
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Strategy Registry
+=================
+Alert strategies as pure functions of one fixture's features, all evaluated
+in a single pass over the cycle's feature frame (feature_frame.FeatureFrame
+rows) with no API calls of their own.
+
+    @register_strategy('tier1_elite', mode='shadow', budget_ms=5)
+    def tier1_elite(row):
+        ...
+        return {'score': 21.5}   # would alert (details recorded), or None
+
+Modes:
+- ``production``: mirrors a rule that alerts for real (the engine's
+  ``RuleEngine`` sends those). Its would-be alerts are recorded here too,
+  so shadow strategies can be compared against the same baseline.
+- ``shadow``: only records would-be alerts (``ShadowAlertLog``).
+- ``disabled``: not evaluated.
+
+``STRATEGY_MODES`` overrides modes, e.g. ``tier1_elite=disabled,scoreline_psychology=shadow``.
+
+Each strategy has a CPU budget per cycle (``budget_ms``). A pass stops
+evaluating a strategy for the rest of the cycle once it exceeds its budget.
+After ``STRATEGY_BUDGET_STRIKES`` over-budget cycles in a row, a shadow
+strategy is disabled. Production strategies are only logged.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+MODES = ('production', 'shadow', 'disabled')
+STRATEGY_MODES = os.getenv('STRATEGY_MODES', '')
+STRATEGY_BUDGET_STRIKES = int(os.getenv('STRATEGY_BUDGET_STRIKES', '3'))
+# JSON-lines file for would-be alerts (empty keeps them in memory only)
+SHADOW_ALERTS_PATH = os.getenv('SHADOW_ALERTS_PATH', '')
+SHADOW_ALERTS_KEPT = int(os.getenv('SHADOW_ALERTS_KEPT', '500'))
+
+strategy_eval_seconds = metrics.registry.histogram(
+    'latecorners_strategy_eval_seconds', 'CPU time per strategy per cycle', ['strategy'],
+    buckets=metrics.COMPUTE_BUCKETS)
+strategy_alerts_total = metrics.registry.counter(
+    'latecorners_strategy_alerts_total', 'Would-be alerts per strategy', ['strategy', 'mode'])
+
+
+@dataclass
+class Strategy:
+    name: str
+    evaluate: Callable[[Dict], Optional[Dict]]
+    mode: str = 'shadow'
+    budget_ms: float = 5.0
+    description: str = ''
+    # Running totals
+    evaluations: int = 0
+    alerts: int = 0
+    over_budget_cycles: int = 0
+    strikes: int = 0
+    errors: int = 0
+    cpu_seconds: float = 0.0
+
+
+def _parse_modes(spec: str) -> Dict[str, str]:
+    modes = {}
+    for part in spec.split(','):
+        if '=' in part:
+            name, mode = (piece.strip() for piece in part.split('=', 1))
+            if mode in MODES:
+                modes[name] = mode
+    return modes
+
+
+class ShadowAlertLog:
+    """Would-be alerts, once per (strategy, fixture): recent ones in memory, all of them in a JSONL file"""
+
+    def __init__(self, path: str = SHADOW_ALERTS_PATH, kept: int = SHADOW_ALERTS_KEPT):
+        self.path = path
+        self.recent: deque = deque(maxlen=kept)
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def record(self, strategy: Strategy, row: Dict, details: Dict, ts: float) -> bool:
+        key = (strategy.name, row['fixture_id'])
+        with self._lock:
+            if key in self._seen:
+                return False
+            self._seen.add(key)
+            entry = {
+                'ts': ts,
+                'strategy': strategy.name,
+                'mode': strategy.mode,
+                'fixture_id': row['fixture_id'],
+                'minute': row.get('minute'),
+                'score': f"{row.get('home_score')}-{row.get('away_score')}",
+                'total_corners': row.get('total_corners'),
+                'details': details,
+            }
+            self.recent.append(entry)
+        if self.path:
+            try:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, default=str) + '\n')
+            except Exception as e:
+                logger.warning(f"⚠️ SHADOW ALERTS: Could not append to {self.path}: {e}")
+        return True
+
+    def retain(self, fixture_ids: Iterable[int]) -> None:
+        """Forget dedup keys of fixtures that are no longer live"""
+        keep = set(fixture_ids)
+        with self._lock:
+            self._seen = {key for key in self._seen if key[1] in keep}
+
+
+class StrategyRegistry:
+    """Registered strategies, evaluated together once per cycle"""
+
+    def __init__(self, mode_overrides: Optional[Dict[str, str]] = None, alert_log: Optional[ShadowAlertLog] = None):
+        self.strategies: Dict[str, Strategy] = {}
+        self.mode_overrides = _parse_modes(STRATEGY_MODES) if mode_overrides is None else mode_overrides
+        self.alert_log = alert_log or ShadowAlertLog()
+
+    def register(self, name: str, evaluate: Callable[[Dict], Optional[Dict]], mode: str = 'shadow',
+                 budget_ms: float = 5.0, description: str = '') -> Strategy:
+        if name in self.strategies:
+            raise ValueError(f"Strategy {name} already registered")
+        mode = self.mode_overrides.get(name, mode)
+        if mode not in MODES:
+            raise ValueError(f"Unknown strategy mode {mode!r}")
+        strategy = Strategy(name, evaluate, mode, budget_ms, description or (evaluate.__doc__ or '').strip())
+        self.strategies[name] = strategy
+        return strategy
+
+    def evaluate_cycle(self, rows: List[Dict], ts: Optional[float] = None) -> Dict[str, List[Dict]]:
+        """Run every enabled strategy over the cycle's feature rows; returns new would-be alerts per strategy"""
+        ts = time.time() if ts is None else ts
+        fired: Dict[str, List[Dict]] = {}
+        for strategy in self.strategies.values():
+            if strategy.mode == 'disabled':
+                continue
+            budget = strategy.budget_ms / 1000.0
+            start = time.perf_counter()
+            over_budget = False
+            for row in rows:
+                try:
+                    details = strategy.evaluate(row)
+                except Exception as e:
+                    strategy.errors += 1
+                    logger.debug("Strategy %s failed on fixture %s: %s", strategy.name, row.get('fixture_id'), e)
+                    details = None
+                strategy.evaluations += 1
+                if details is not None and self.alert_log.record(strategy, row, details, ts):
+                    strategy.alerts += 1
+                    strategy_alerts_total.inc(strategy=strategy.name, mode=strategy.mode)
+                    fired.setdefault(strategy.name, []).append({'fixture_id': row['fixture_id'], **details})
+                if time.perf_counter() - start > budget:
+                    over_budget = True
+                    break
+            elapsed = time.perf_counter() - start
+            strategy.cpu_seconds += elapsed
+            strategy_eval_seconds.observe(elapsed, strategy=strategy.name)
+            self._account_budget(strategy, over_budget)
+        self.alert_log.retain(row['fixture_id'] for row in rows)
+        return fired
+
+    def _account_budget(self, strategy: Strategy, over_budget: bool) -> None:
+        if not over_budget:
+            strategy.strikes = 0
+            return
+        strategy.over_budget_cycles += 1
+        strategy.strikes += 1
+        if strategy.strikes < STRATEGY_BUDGET_STRIKES:
+            return
+        if strategy.mode == 'shadow':
+            strategy.mode = 'disabled'
+            logger.warning(f"⚠️ STRATEGY {strategy.name}: over its {strategy.budget_ms}ms budget "
+                           f"{strategy.strikes} cycles running - disabled")
+        else:
+            logger.warning(f"⚠️ STRATEGY {strategy.name}: over its {strategy.budget_ms}ms budget "
+                           f"{strategy.strikes} cycles running (production, still evaluated)")
+
+    def report(self) -> Dict[str, Dict]:
+        return {
+            name: {
+                'mode': s.mode,
+                'description': s.description,
+                'budget_ms': s.budget_ms,
+                'evaluations': s.evaluations,
+                'alerts': s.alerts,
+                'errors': s.errors,
+                'over_budget_cycles': s.over_budget_cycles,
+                'cpu_ms': round(s.cpu_seconds * 1000, 3),
+            }
+            for name, s in self.strategies.items()
+        }
+
+
+# Global registry (built-in strategies live in strategies.py)
+strategy_registry = StrategyRegistry()
+
+
+def register_strategy(name: str, mode: str = 'shadow', budget_ms: float = 5.0, description: str = ''):
+    """Decorator: register a pure ``row -> details | None`` function with the global registry"""
+    def decorator(fn: Callable[[Dict], Optional[Dict]]):
+        strategy_registry.register(name, fn, mode=mode, budget_ms=budget_ms, description=description)
+        return fn
+    return decorator
+
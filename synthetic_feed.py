@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Synthetic Match Day
+===================
+Deterministic generator of SportMonks-shaped inplay and odds payloads for
+benchmarks and offline tests.
+
+Fixtures are spread across the whole 0-95' range, so every cycle has early,
+late and alert-window matches. Stats are cumulative and only ever grow,
+driven by per-team rates (a stronger side shoots, attacks and wins corners
+more). When a fixture finishes, a new one kicks off in its place, so the
+number of concurrent fixtures stays constant.
+
+``inplay_payload()`` matches what ``/livescores/inplay`` returns with
+``include=scores;participants;state;periods;statistics;league`` - the shape
+``web_dashboard.extract_match_data`` and ``SportmonksClient._parse_live_match_data``
+expect. ``odds_payload()`` matches ``/odds/inplay/fixtures/{id}``: bet365 Asian
+Total Corners lines around the live count, buried in other bookmakers and
+markets.
+
+``write_recording()`` writes a ``feed_recorder`` log that ``feed_replay.py``
+can play back.
+
+    python synthetic_feed.py recordings/synthetic.jsonl.gz --fixtures 500 --cycles 120
+"""
+
+import argparse
+import math
+import random
+from typing import Dict, List, Optional
+
+# SportMonks statistic type ids used by the live parsers
+STAT_TYPE_IDS = {
+    'corners': 34,
+    'shots_total': 42,
+    'shots_on_target': 86,
+    'shots_off_target': 41,
+    'attacks': 43,
+    'dangerous_attacks': 44,
+    'possession': 45,
+}
+# Per-team events per minute for an average side (scaled by each fixture's intensity and strength)
+BASE_RATES = {
+    'corners': 5.0 / 90,
+    'shots_off_target': 7.0 / 90,
+    'shots_on_target': 4.5 / 90,
+    'attacks': 100.0 / 90,
+    'dangerous_attacks': 50.0 / 90,
+    'goals': 1.35 / 90,
+}
+FULL_TIME_MINUTE = 95
+CORNER_MARKET_ID = 61
+BET365_BOOKMAKER_ID = 2
+# Decoy markets / bookmakers that pad each odds book
+OTHER_MARKET_IDS = (1, 2, 12, 28, 62, 80, 86)
+OTHER_BOOKMAKER_IDS = (1, 3, 5, 9, 16, 20, 22)
+LEAGUES = ('Premier League', 'La Liga', 'Serie A', 'Bundesliga', 'Ligue 1', 'Eredivisie', 'Championship',
+           'Primeira Liga', 'Super Lig', 'MLS', 'J1 League', 'A-League')
+
+
+def _poisson(rng: random.Random, lam: float) -> int:
+    """Knuth's method - fine for the small per-minute rates used here"""
+    threshold = math.exp(-lam)
+    k, p = 0, 1.0
+    while True:
+        p *= rng.random()
+        if p <= threshold:
+            return k
+        k += 1
+
+
+class _SyntheticFixture:
+    """One fixture's cumulative state"""
+
+    def __init__(self, fixture_id: int, rng: random.Random, minute: float):
+        self.id = fixture_id
+        self.rng = rng
+        self.home_team = f"Home {fixture_id}"
+        self.away_team = f"Away {fixture_id}"
+        self.league_id = rng.randrange(len(LEAGUES))
+        # Share of play the home side gets (0.5 = evenly matched) and overall tempo
+        self.home_share = min(0.75, max(0.25, rng.gauss(0.5, 0.1)))
+        self.intensity = min(1.6, max(0.6, rng.gauss(1.0, 0.2)))
+        self.minute = 0.0
+        self.stats = {side: {name: 0 for name in BASE_RATES} for side in ('home', 'away')}
+        self.possession = round(self.home_share * 100)
+        self.advance_to(minute)
+
+    def advance_to(self, minute: float) -> None:
+        """Simulate every whole minute between the current minute and ``minute``"""
+        for _ in range(int(minute) - int(self.minute)):
+            for side, share in (('home', self.home_share), ('away', 1 - self.home_share)):
+                weight = 2 * share * self.intensity
+                for name, rate in BASE_RATES.items():
+                    self.stats[side][name] += _poisson(self.rng, rate * weight)
+            drift = self.rng.gauss(0, 2)
+            self.possession = int(min(75, max(25, 0.8 * self.possession + 0.2 * self.home_share * 100 + drift)))
+        self.minute = minute
+
+    @property
+    def finished(self) -> bool:
+        return self.minute >= FULL_TIME_MINUTE
+
+    @property
+    def total_corners(self) -> int:
+        return self.stats['home']['corners'] + self.stats['away']['corners']
+
+    def to_inplay(self) -> Dict:
+        minute = int(self.minute)
+        second_half = minute > 45
+        if second_half:
+            periods = [{'id': self.id * 10 + 1, 'type_id': 1, 'ticking': False, 'minutes': 45},
+                       {'id': self.id * 10 + 2, 'type_id': 2, 'ticking': True, 'minutes': minute}]
+        else:
+            periods = [{'id': self.id * 10 + 1, 'type_id': 1, 'ticking': True, 'minutes': minute}]
+
+        statistics = []
+        for side in ('home', 'away'):
+            values = dict(self.stats[side])
+            values['shots_total'] = values['shots_on_target'] + values['shots_off_target']
+            values['possession'] = self.possession if side == 'home' else 100 - self.possession
+            for name, type_id in STAT_TYPE_IDS.items():
+                statistics.append({'fixture_id': self.id, 'type_id': type_id, 'location': side,
+                                   'data': {'value': values[name]}})
+
+        return {
+            'id': self.id,
+            'name': f"{self.home_team} vs {self.away_team}",
+            'participants': [
+                {'id': self.id * 2, 'name': self.home_team, 'meta': {'location': 'home'}},
+                {'id': self.id * 2 + 1, 'name': self.away_team, 'meta': {'location': 'away'}},
+            ],
+            'scores': [
+                {'description': 'CURRENT', 'score': {'goals': self.stats['home']['goals'], 'participant': 'home'}},
+                {'description': 'CURRENT', 'score': {'goals': self.stats['away']['goals'], 'participant': 'away'}},
+            ],
+            'periods': periods,
+            'state': {
+                'short_name': '2nd' if second_half else '1st',
+                'developer_name': 'INPLAY_2ND_HALF' if second_half else 'INPLAY_1ST_HALF',
+            },
+            'league': {'id': self.league_id, 'name': LEAGUES[self.league_id]},
+            'statistics': statistics,
+        }
+
+    def to_odds(self, book_depth: int) -> Dict:
+        rng = self.rng
+        odds: List[Dict] = []
+        base_line = self.total_corners + 1
+        # bet365 Asian Total Corners: whole and half lines around the live count
+        for step in range(8):
+            total = base_line + step * 0.5
+            suspended = rng.random() < 0.1
+            over = round(1.4 + step * 0.25 + rng.random() * 0.2, 2)
+            under = round(max(1.05, 1.0 / max(0.05, 1.05 - 1.0 / over)), 2)  # ~5% bookmaker margin
+            for label, price in (('Over', over), ('Under', under)):
+                odds.append({
+                    'id': len(odds) + 1, 'fixture_id': self.id, 'market_id': CORNER_MARKET_ID,
+                    'bookmaker_id': BET365_BOOKMAKER_ID, 'label': label, 'value': f"{price:.2f}",
+                    'total': f"{total:g}", 'probability': f"{100 / price:.2f}%",
+                    'suspended': suspended, 'stopped': False,
+                })
+        # Everything else the endpoint returns (other bookmakers and markets)
+        while len(odds) < book_depth:
+            odds.append({
+                'id': len(odds) + 1, 'fixture_id': self.id,
+                'market_id': rng.choice(OTHER_MARKET_IDS + (CORNER_MARKET_ID,)),
+                'bookmaker_id': rng.choice(OTHER_BOOKMAKER_IDS),
+                'label': rng.choice(('Over', 'Under', '1', 'X', '2')),
+                'value': f"{1.2 + rng.random() * 4:.2f}", 'total': f"{rng.randrange(1, 14) / 2:g}",
+                'probability': f"{rng.random() * 100:.2f}%", 'suspended': False, 'stopped': False,
+            })
+        return {'data': odds}
+
+
+class SyntheticMatchDay:
+    """A constant number of concurrent fixtures, advanced cycle by cycle"""
+
+    def __init__(self, fixtures: int = 50, seed: int = 42, minutes_per_cycle: float = 0.75,
+                 book_depth: int = 150, first_fixture_id: int = 19_000_000):
+        self.rng = random.Random(seed)
+        self.minutes_per_cycle = minutes_per_cycle
+        self.book_depth = book_depth
+        self._next_id = first_fixture_id
+        self.fixtures: List[_SyntheticFixture] = [
+            self._new_fixture(self.rng.uniform(1, FULL_TIME_MINUTE - 1)) for _ in range(fixtures)
+        ]
+
+    def _new_fixture(self, minute: float) -> _SyntheticFixture:
+        fixture = _SyntheticFixture(self._next_id, self.rng, minute)
+        self._next_id += 1
+        return fixture
+
+    def advance(self) -> None:
+        """Move every fixture one cycle forward, replacing finished ones with fresh kick-offs"""
+        for i, fixture in enumerate(self.fixtures):
+            fixture.advance_to(fixture.minute + self.minutes_per_cycle)
+            if fixture.finished:
+                self.fixtures[i] = self._new_fixture(1)
+
+    def inplay_payload(self) -> Dict:
+        return {'data': [fixture.to_inplay() for fixture in self.fixtures],
+                'rate_limit': {'remaining': 2999, 'resets_in_seconds': 3600, 'requested_entity': 'Livescore'}}
+
+    def fixtures_in_window(self, min_minute: int = 70, max_minute: int = 90) -> List[int]:
+        return [f.id for f in self.fixtures if min_minute <= int(f.minute) <= max_minute]
+
+    def odds_payload(self, fixture_id: int) -> Optional[Dict]:
+        for fixture in self.fixtures:
+            if fixture.id == fixture_id:
+                payload = fixture.to_odds(self.book_depth)
+                payload['rate_limit'] = {'remaining': 2999, 'resets_in_seconds': 3600, 'requested_entity': 'Odds'}
+                return payload
+        return None
+
+    def write_recording(self, path: str, cycles: int, interval_seconds: float = 45,
+                        start_time: float = 1_700_000_000) -> int:
+        """Write ``cycles`` inplay frames (plus odds frames for 70-90' fixtures) as a replayable log"""
+        from feed_recorder import FeedRecorder
+        from feed_replay import FakeClock
+
+        clock = FakeClock(start_time, speed=0)
+        recorder = FeedRecorder(path, clock=clock)
+        frames = 0
+        try:
+            for _ in range(cycles):
+                recorder.record('/livescores/inplay', {}, 200, self.inplay_payload())
+                frames += 1
+                for fixture_id in self.fixtures_in_window():
+                    recorder.record(f"/odds/inplay/fixtures/{fixture_id}", {}, 200, self.odds_payload(fixture_id))
+                    frames += 1
+                clock.sleep(interval_seconds)
+                self.advance()
+        finally:
+            recorder.close()
+        return frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a synthetic match-day recording for feed_replay.py')
+    parser.add_argument('output', help='gzip JSON-lines file to write')
+    parser.add_argument('--fixtures', type=int, default=50)
+    parser.add_argument('--cycles', type=int, default=120)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    frames = SyntheticMatchDay(args.fixtures, args.seed).write_recording(args.output, args.cycles)
+    print(f"✅ Wrote {frames} frames ({args.cycles} cycles, {args.fixtures} concurrent fixtures) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test cost-ordered alert rule evaluation (offline)
+"""
+
+import asyncio
+import logging
+
+from alert_rules import CACHED, FREE, NETWORK, Predicate, Rule, RuleContext, RuleEngine, late_momentum_rules
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+class FakeFeed:
+    """Odds fetchers that count their calls"""
+
+    def __init__(self, corner_odds=True, draw_odds=None, alerted=()):
+        self.corner_odds, self.draw_odds, self.alerted = corner_odds, draw_odds, set(alerted)
+        self.calls = []
+
+    async def fetch_corner_odds(self, fixture_id):
+        self.calls.append(('corner_odds', fixture_id))
+        return {'available': True, 'count': 4} if self.corner_odds else None
+
+    def fetch_draw_odds(self, fixture_id):
+        self.calls.append(('draw_odds', fixture_id))
+        return self.draw_odds
+
+    def engine(self):
+        return RuleEngine(late_momentum_rules(lambda fid: fid in self.alerted, self.fetch_corner_odds,
+                                              self.fetch_draw_odds))
+
+
+def _evaluate(engine, minute=87, corners=10, momentum=80, fixture_id=1):
+    ctx = RuleContext(fixture_id=fixture_id, minute=minute, total_corners=corners, combined_momentum=momentum)
+    return asyncio.run(engine.evaluate(ctx)), ctx
+
+
+def test_momentum_gate_skips_all_odds_calls():
+    """A fixture failing the in-memory momentum gate costs no API calls"""
+    feed = FakeFeed()
+    engine = feed.engine()
+    outcome, _ = _evaluate(engine, momentum=40)
+    assert outcome.rule is None and outcome.failed == ['momentum']
+    assert feed.calls == []
+    assert outcome.api_calls == 0 and outcome.api_calls_saved == 3
+    assert engine.report()['predicates']['momentum']['api_calls_saved'] == 3
+
+    outcome, _ = _evaluate(engine, minute=70)
+    assert outcome.failed == ['alert_window'] and feed.calls == []
+
+
+def test_rule_priority_and_shared_predicates():
+    """Corner rule wins without a draw lookup; the draw rule reuses the single corner odds call"""
+    feed = FakeFeed(draw_odds=1.40)
+    outcome, ctx = _evaluate(feed.engine(), corners=10)
+    assert outcome.rule == 'LATE_MOMENTUM'
+    assert feed.calls == [('corner_odds', 1)] and 'draw_odds' not in ctx.values
+
+    feed = FakeFeed(draw_odds=1.40)
+    outcome, ctx = _evaluate(feed.engine(), corners=5)
+    assert outcome.rule == 'LATE_MOMENTUM_DRAW' and ctx.values['draw_odds'] == 1.40
+    assert feed.calls == [('corner_odds', 1), ('draw_odds', 1)]
+
+    feed = FakeFeed(corner_odds=False, draw_odds=1.40)
+    outcome, _ = _evaluate(feed.engine(), corners=5)
+    assert outcome.rule is None and feed.calls == [('corner_odds', 1)]
+    assert outcome.api_calls_saved == 2  # The draw price lookup, credited to corner_odds
+
+    feed = FakeFeed(alerted={1})
+    outcome, _ = _evaluate(feed.engine())
+    assert outcome.failed == ['not_alerted'] and feed.calls == []
+
+
+def test_cheapest_first_across_rules():
+    """Within one rule, predicates run by cost class rather than declaration order"""
+    order = []
+
+    def predicate(name, cost, result=True):
+        return Predicate(name, cost, lambda ctx: order.append(name) or result, api_calls=int(cost == NETWORK))
+
+    engine = RuleEngine([Rule('only', [predicate('net', NETWORK), predicate('cache', CACHED),
+                                       predicate('free', FREE, result=False)])])
+    outcome, _ = _evaluate(engine)
+    assert order == ['free'] and outcome.api_calls_saved == 1
+
+
+if __name__ == "__main__":
+    test_momentum_gate_skips_all_odds_calls()
+    test_rule_priority_and_shared_predicates()
+    test_cheapest_first_across_rules()
+    logger.info("✅ alert rule tests passed")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test the vectorized backtester against a straightforward per-fixture evaluation (offline)
+"""
+
+import logging
+import os
+import tempfile
+import numpy as np
+from backtester import ALERT_WINDOW, BacktestDataset, DatasetBuilder, dataset_from_synthetic, sweep
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def _reference(dataset, momentum_threshold, corner_threshold, draw_threshold):
+    """Minute-by-minute loop over each fixture, as the live engine would see it"""
+    alerts = wins = refunds = 0
+    for f in range(len(dataset)):
+        for w in range(dataset.momentum.shape[1]):
+            if not (dataset.observed[f, w] and dataset.has_odds[f, w]):
+                continue
+            if dataset.momentum[f, w] < momentum_threshold:
+                continue
+            draw = dataset.draw_odds[f, w]
+            if dataset.corners[f, w] >= corner_threshold or (not np.isnan(draw) and draw <= draw_threshold):
+                line = int(dataset.corners[f, w]) + 1
+                alerts += 1
+                wins += int(dataset.final_corners[f] > line)
+                refunds += int(dataset.final_corners[f] == line)
+                break
+    return alerts, wins, refunds
+
+
+def test_sweep_matches_reference():
+    """Every swept combination agrees with the scalar rule evaluation"""
+    dataset = dataset_from_synthetic(fixtures=60, cycles=160, seed=11)
+    assert len(dataset) > 0
+    # Give some fixtures a draw price so the second rule is exercised too
+    dataset.draw_odds[::3, :] = 1.4
+
+    results = sweep(dataset, [0, 40, 75], [6, 9], [1.3, 1.5])
+    assert len(results) == 3 * 2 * 2
+    for r in results:
+        expected = _reference(dataset, r['momentum_threshold'], r['corner_threshold'], r['draw_threshold'])
+        assert (r['alerts'], r['wins'], r['refunds']) == expected
+        assert r['wins'] + r['refunds'] + r['losses'] == r['alerts']
+
+
+def test_builder_grades_only_finished_fixtures_and_round_trips():
+    """Fixtures never seen past 90' are dropped; datasets survive save/load"""
+    builder = DatasetBuilder()
+    team = {'shots_on_target': 0, 'shots_off_target': 0, 'dangerous_attacks': 0, 'possession': 50}
+    for minute in range(80, 93):
+        builder.add_snapshot(1, minute, dict(team, shots_on_target=minute - 80), team, 9)
+    builder.add_snapshot(2, 86, team, team, 4)
+    builder.add_odds(1, 84, has_corner_odds=True)
+    dataset = builder.build()
+
+    assert list(dataset.fixture_ids) == [1]
+    assert dataset.has_odds[0].all()  # forward-filled from 84'
+    assert dataset.momentum.shape == (1, ALERT_WINDOW[1] - ALERT_WINDOW[0] + 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'dataset.npz')
+        dataset.save(path)
+        loaded = BacktestDataset.load(path)
+        assert np.array_equal(loaded.momentum, dataset.momentum)
+
+
+if __name__ == "__main__":
+    test_sweep_matches_reference()
+    test_builder_grades_only_finished_fixtures_and_round_trips()
+    logger.info("✅ Backtester tests passed")
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Test the SportMonks circuit breakers and the dashboard's last-good-snapshot fallback (offline)
+"""
+
+import logging
+
+import requests
+
+import circuit_breaker
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, circuit_rejections_total
+from feed_replay import FakeClock
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def _fail(breaker, now, error=None):
+    try:
+        with breaker.guard(now):
+            raise error or requests.exceptions.ConnectTimeout("timed out")
+    except requests.exceptions.RequestException:
+        pass
+
+
+def test_breaker_opens_fails_fast_and_probes():
+    """Consecutive failures open the circuit; after the reset one probe decides whether it closes"""
+    breaker = CircuitBreaker('test-endpoint', failure_threshold=2, reset_seconds=60)
+    _fail(breaker, 0)
+    assert breaker.state == CLOSED and breaker.allow(1)
+    _fail(breaker, 1)
+    assert breaker.state == OPEN
+
+    rejected = circuit_rejections_total.value(endpoint='test-endpoint')
+    assert not breaker.allow(30)
+    assert circuit_rejections_total.value(endpoint='test-endpoint') == rejected + 1
+
+    # Half-open: a single probe; a failed probe re-opens straight away
+    assert breaker.allow(61) and breaker.state == HALF_OPEN
+    assert not breaker.allow(62)
+    _fail(breaker, 62)
+    assert breaker.state == OPEN and not breaker.allow(100)
+
+    # A probe that never reports back frees its slot after reset_seconds
+    assert breaker.allow(122) and not breaker.allow(150) and breaker.allow(182)
+    with breaker.guard(183):
+        pass
+    assert breaker.state == CLOSED and breaker.failures == 0 and breaker.allow(184)
+
+
+def test_client_errors_do_not_open_the_circuit():
+    """A 4xx means SportMonks answered; only timeouts, connection errors and 5xx count"""
+    breaker = CircuitBreaker('test-4xx', failure_threshold=1, reset_seconds=60)
+    response = requests.Response()
+    response.status_code = 404
+    _fail(breaker, 0, requests.exceptions.HTTPError("not found", response=response))
+    assert breaker.state == CLOSED
+    response.status_code = 503
+    _fail(breaker, 1, requests.exceptions.HTTPError("unavailable", response=response))
+    assert breaker.state == OPEN
+
+
+def test_update_cycle_serves_the_last_good_snapshot_during_an_outage():
+    """A failing poll republishes the previous matches marked stale, until they are too old"""
+    import web_dashboard
+
+    polls = []
+
+    def poll_down(api_key, profile):
+        polls.append(profile.name)
+        raise requests.exceptions.ConnectionError("SportMonks unreachable")
+
+    clock = FakeClock(1_700_000_000, speed=0)
+    saved = (web_dashboard._clock, web_dashboard._poll_inplay, web_dashboard.live_matches_data,
+             web_dashboard.live_data_fetched_at, web_dashboard.dashboard_stats)
+    circuit_breaker._breakers.pop('livescores', None)
+    match = {'match_id': 1, 'minute': 84, 'home_team': 'A', 'away_team': 'B'}
+    try:
+        web_dashboard.set_clock(clock)
+        web_dashboard._poll_inplay = poll_down
+        web_dashboard.live_matches_data = [match]
+        web_dashboard.live_data_fetched_at = clock.time() - 30
+        web_dashboard.dashboard_stats = {'total_live': 1, 'stale': False}
+
+        assert web_dashboard.run_update_cycle() == [match]
+        assert web_dashboard.live_publisher.matches == [match]
+        stats = web_dashboard.live_publisher.stats
+        assert stats['stale'] is True and stats['data_age_seconds'] == 30
+        assert web_dashboard.live_publisher.data_at == clock.time() - 30
+
+        # Second failure opens the circuit; the next cycle skips the API call entirely
+        web_dashboard.run_update_cycle()
+        assert circuit_breaker.circuit_breaker('livescores').state == OPEN
+        assert web_dashboard.run_update_cycle() == [match] and len(polls) == 2
+
+        clock.sleep(web_dashboard.STALE_SNAPSHOT_MAX_AGE_SECONDS)
+        assert web_dashboard.run_update_cycle() == []
+        assert web_dashboard.live_publisher.stats['stale'] is True
+    finally:
+        (web_dashboard._clock, web_dashboard._poll_inplay, web_dashboard.live_matches_data,
+         web_dashboard.live_data_fetched_at, web_dashboard.dashboard_stats) = saved
+        circuit_breaker._breakers.pop('livescores', None)
+
+
+def test_engine_skips_stale_snapshots():
+    """The alert engine evaluates nothing while the dashboard serves a stale snapshot"""
+    import main
+    import web_dashboard
+
+    monitor = main.LateCornerMonitor(send_alert=lambda *args, **kwargs: True, track_alert=lambda *args, **kwargs: None)
+    saved = web_dashboard.live_matches_data
+    try:
+        web_dashboard.live_matches_data = [{'match_id': 1, 'minute': 86}]
+        web_dashboard.live_publisher.publish(web_dashboard.live_matches_data,
+                                             {'total_live': 1, 'stale': True, 'data_age_seconds': 90})
+        assert monitor._get_shared_live_matches() == []
+        assert monitor._decisions == {'stale_snapshot': 1}
+    finally:
+        web_dashboard.live_matches_data = saved
+
+
+if __name__ == "__main__":
+    test_breaker_opens_fails_fast_and_probes()
+    test_client_errors_do_not_open_the_circuit()
+    test_update_cycle_serves_the_last_good_snapshot_during_an_outage()
+    test_engine_skips_stale_snapshots()
+    logger.info("✅ circuit breaker tests passed")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test the per-cycle feature frame (offline)
+"""
+
+import logging
+
+import numpy as np
+
+import web_dashboard
+from feature_frame import FeatureFrameStage
+from snapshot_store import frame_to_records, matches_to_records
+from synthetic_feed import SyntheticMatchDay
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def _match(fixture_id, minute, corners, shots=10, attacks=None, home_score=0, away_score=0):
+    home = {'corners': corners, 'shots_total': shots, 'shots_on_target': shots // 2, 'dangerous_attacks': 20}
+    if attacks is not None:
+        home['attacks'] = attacks
+    return {
+        'match_id': fixture_id,
+        'minute': minute,
+        'home_score': home_score,
+        'away_score': away_score,
+        'statistics': {'home': home, 'away': {}, 'total_stats_available': len(home), 'has_corners': True},
+        'momentum': {'home': 30, 'away': 10, 'combined': 40, 'window_covered': 10},
+    }
+
+
+def test_columns_ratios_and_deltas():
+    """Totals, ratios, score state and 5-minute deltas come out as one column per feature"""
+    stage = FeatureFrameStage(delta_minutes=5)
+    for version, minute in enumerate(range(80, 87), start=1):
+        frame = stage.build([_match(1, minute, corners=minute - 78, attacks=40, away_score=2),
+                             _match(2, minute, corners=3)], version=version)
+    row = frame.row(1)
+    assert row['total_corners'] == 8 and row['corners_delta'] == 5  # 3 corners at 81' -> 8 at 86'
+    assert row['dangerous_attack_ratio'] == 50.0 and row['shot_accuracy'] == 50.0
+    assert row['goal_difference'] == -2 and row['score_state'] == 2 and row['minute_bucket'] == 5
+    assert row['momentum_combined'] == 40 and row['draw_odds'] is None
+    assert frame.row(2)['dangerous_attack_ratio'] == 0.0 and frame.row(2)['away_corners'] == -1
+    assert frame.count(frame['is_draw']) == 1 and frame['total_corners'].dtype == np.int32
+
+    assert stage.build([], version=len(range(80, 87))) is frame  # Same data version: cached
+
+
+def test_blowouts_are_not_close_games():
+    """A 3-goal margin is not a close game even though score_state caps at 2"""
+    frame = FeatureFrameStage().build([_match(1, 80, 3, home_score=3), _match(2, 80, 3, home_score=5, away_score=2),
+                                       _match(3, 80, 3, away_score=2), _match(4, 80, 3)], version=1)
+    assert frame.row(1)['score_state'] == 2
+    assert web_dashboard.count_close_games(frame) == 2
+
+
+def test_snapshot_records_match_the_legacy_conversion():
+    """Snapshot records copied from the frame equal the ones parsed from match dicts"""
+    day = SyntheticMatchDay(fixtures=12, seed=3)
+    matches = web_dashboard.parse_live_matches(day.inplay_payload()['data'])
+    frame = FeatureFrameStage().build(matches, version=1)
+    expected = matches_to_records(matches, 1000.0)
+    actual = frame_to_records(frame, 1000.0)
+    for name in expected.dtype.names:
+        np.testing.assert_array_equal(actual[name], expected[name], err_msg=name)
+
+
+if __name__ == "__main__":
+    test_columns_ratios_and_deltas()
+    test_blowouts_are_not_close_games()
+    test_snapshot_records_match_the_legacy_conversion()
+    logger.info("✅ feature frame tests passed")
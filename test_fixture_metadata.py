@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test the fixture metadata cache (offline)
+"""
+
+import copy
+import logging
+
+import web_dashboard
+from fixture_metadata import MULTI_BATCH, FixtureMetadataCache
+from synthetic_feed import SyntheticMatchDay
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def _minimal(fixtures):
+    """What a poll with the minimal include set returns"""
+    stripped = copy.deepcopy(fixtures)
+    for fixture in stripped:
+        fixture.pop('participants', None)
+        fixture.pop('league', None)
+    return stripped
+
+
+def test_joined_minimal_poll_parses_like_a_full_poll():
+    """Names from the schedule are joined back, so parsing gives identical match dicts"""
+    full = SyntheticMatchDay(fixtures=20, seed=9).inplay_payload()['data']
+    calls = []
+
+    def fetch(path, params):
+        calls.append(path)
+        return copy.deepcopy(full) if path.startswith('/fixtures/date/') else None
+
+    cache = FixtureMetadataCache(fetch=fetch)
+    assert cache.load_schedule('2025-10-18') == 20
+    assert cache.load_schedule('2025-10-18') == 0 and len(calls) == 1  # Once per day
+
+    minimal = _minimal(full)
+    assert cache.join(minimal) == []
+    assert web_dashboard.parse_live_matches(minimal) == web_dashboard.parse_live_matches(full)
+    assert cache.hits == 20 and cache.misses == 0
+
+
+def test_unknown_fixtures_are_fetched_in_batches():
+    """Fixtures missing from the cache are fetched MULTI_BATCH ids per call; failures stay unknown"""
+    full = SyntheticMatchDay(fixtures=MULTI_BATCH + 5, seed=4).inplay_payload()['data']
+    by_id = {fixture['id']: fixture for fixture in full}
+    calls = []
+
+    def fetch(path, params):
+        calls.append(path)
+        ids = [int(fid) for fid in path.rsplit('/', 1)[1].split(',')]
+        return [copy.deepcopy(by_id[fid]) for fid in ids if fid != full[0]['id']]
+
+    cache = FixtureMetadataCache(fetch=fetch)
+    minimal = _minimal(full)
+    unknown = cache.join(minimal)
+    assert len(unknown) == len(full)
+    assert cache.fetch_missing(unknown) == len(full) - 1 and len(calls) == 2
+    assert cache.join(minimal) == [full[0]['id']]
+
+    cache.join(full)  # A full poll teaches the cache the rest
+    assert full[0]['id'] in cache
+
+
+if __name__ == "__main__":
+    test_joined_minimal_poll_parses_like_a_full_poll()
+    test_unknown_fixtures_are_fetched_in_batches()
+    logger.info("✅ fixture metadata tests passed")
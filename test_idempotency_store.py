@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test the shared alert idempotency store (offline - no database needed)
+"""
+
+import logging
+from idempotency_store import DASHBOARD_85_NAMESPACE, IdempotencyStore, alert_key_for_fixture
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def test_mark_and_contains():
+    """Keys marked as sent are found; unknown keys are not"""
+    store = IdempotencyStore(persist=False)
+    key = alert_key_for_fixture(19371929)
+
+    assert not store.contains(key)
+    store.mark(key, fixture_id=19371929)
+    assert store.contains(key)
+    assert not store.contains(alert_key_for_fixture(1))
+
+
+def test_dashboard_alerts_do_not_block_the_engine():
+    """The legacy dashboard rule has its own namespace"""
+    store = IdempotencyStore(persist=False)
+    store.mark(alert_key_for_fixture(7, DASHBOARD_85_NAMESPACE))
+    assert store.contains(alert_key_for_fixture(7, DASHBOARD_85_NAMESPACE))
+    assert not store.contains(alert_key_for_fixture(7))
+
+
+def test_warm_restores_keys_after_restart():
+    """A fresh store warmed with persisted keys dedups immediately"""
+    store = IdempotencyStore(persist=False)
+    store.warm([alert_key_for_fixture(1), alert_key_for_fixture(2)])
+
+    assert store.contains(alert_key_for_fixture(1))
+    assert store.contains(alert_key_for_fixture(2))
+    # Warming only happens once
+    assert store.warm([alert_key_for_fixture(3)]) == 0
+
+
+def test_lru_is_bounded():
+    """The front cache never grows past its capacity"""
+    store = IdempotencyStore(capacity=3, persist=False)
+    for fixture_id in range(10):
+        store.mark(alert_key_for_fixture(fixture_id))
+
+    assert len(store) == 3
+    assert store.contains(alert_key_for_fixture(9))
+    assert not store.contains(alert_key_for_fixture(0))
+
+
+class _FakeDatabase:
+    """alert_keys table stand-in"""
+
+    def __init__(self):
+        self.rows = {}
+
+    def record_alert_key(self, alert_key, namespace, fixture_id=None):
+        return self.rows.setdefault(alert_key, (namespace, fixture_id)) == (namespace, fixture_id)
+
+    def get_recent_alert_keys(self, hours=48):
+        return list(self.rows)
+
+
+def test_every_namespace_survives_a_restart():
+    """Dashboard keys are persisted without an alert row and warmed back like engine keys"""
+    db = _FakeDatabase()
+    store = IdempotencyStore()
+    store._get_db = lambda: db
+    store.mark(alert_key_for_fixture(7, DASHBOARD_85_NAMESPACE), fixture_id=7, namespace=DASHBOARD_85_NAMESPACE)
+    store.mark(alert_key_for_fixture(8), fixture_id=8)
+    assert db.rows == {'dashboard85:7': (DASHBOARD_85_NAMESPACE, 7), 'fixture:8': ('fixture', 8)}
+
+    restarted = IdempotencyStore()
+    restarted._get_db = lambda: db
+    assert restarted.contains(alert_key_for_fixture(7, DASHBOARD_85_NAMESPACE))
+    assert restarted.contains(alert_key_for_fixture(8))
+
+
+if __name__ == "__main__":
+    test_mark_and_contains()
+    test_dashboard_alerts_do_not_block_the_engine()
+    test_warm_restores_keys_after_restart()
+    test_lru_is_bounded()
+    test_every_namespace_survives_a_restart()
+    logger.info("✅ Idempotency store tests passed")
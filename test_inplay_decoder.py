@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test the streaming inplay decoder (offline)
+"""
+
+import json
+import logging
+
+import web_dashboard
+from inplay_decoder import decode_inplay, decode_seconds
+from synthetic_feed import SyntheticMatchDay
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def _payload(fixtures=30, stopped=10):
+    """Synthetic inplay payload with the first ``stopped`` fixtures not ticking (half time)"""
+    payload = SyntheticMatchDay(fixtures=fixtures, seed=5).inplay_payload()
+    for fixture in payload['data'][:stopped]:
+        for period in fixture['periods']:
+            period['ticking'] = False
+    payload['rate_limit'] = {'remaining': 2900, 'resets_in_seconds': 1800, 'requested_entity': 'Fixture'}
+    return payload
+
+
+def test_stream_decode_matches_the_full_decode():
+    """Only ticking fixtures are kept, the rest of the payload is intact, and parsing is unchanged"""
+    payload = _payload()
+    for body in (json.dumps(payload).encode(), json.dumps(payload, separators=(',', ':')).encode()):
+        decoded = decode_inplay(body)
+        assert [f['id'] for f in decoded['data']] == [f['id'] for f in payload['data'][10:]]
+        assert decoded['rate_limit'] == payload['rate_limit']
+        assert web_dashboard.parse_live_matches(decoded['data']) == web_dashboard.parse_live_matches(payload['data'])
+    assert decode_inplay(b'{"data": [], "pagination": {"has_more": false}}') == {
+        'data': [], 'pagination': {'has_more': False}}
+
+
+def test_braces_in_strings_fall_back_to_the_full_decode():
+    """A brace inside a name throws the byte walk off; the full decode gives the same result"""
+    payload = _payload(fixtures=6, stopped=2)
+    payload['data'][1]['name'] = 'Club {B} vs Club }C'
+    payload['data'][3]['participants'][0]['name'] = 'Club {A'
+    before = decode_seconds.count(mode='full')
+    decoded = decode_inplay(json.dumps(payload).encode())
+    assert decode_seconds.count(mode='full') == before + 1
+    assert decoded['data'] == payload['data'][2:]
+
+
+if __name__ == "__main__":
+    test_stream_decode_matches_the_full_decode()
+    test_braces_in_strings_fall_back_to_the_full_decode()
+    logger.info("✅ inplay decoder tests passed")
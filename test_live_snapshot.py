@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test the live snapshot publisher (offline - no API calls)
+"""
+
+import gzip
+import json
+import logging
+from live_snapshot import LiveSnapshotPublisher
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def _matches(minutes):
+    return [{'match_id': i, 'minute': m, 'home_team': 'Home' * 100, 'corner_odds': {'available': True}}
+            for i, m in enumerate(minutes, start=1)]
+
+
+def test_diff_chain_and_snapshot_fallback():
+    """Clients one version behind get a diff; clients far behind get a snapshot"""
+    publisher = LiveSnapshotPublisher(diff_history=2)
+    publisher.publish(_matches([80, 81]), {'total_live': 2})
+    publisher.publish(_matches([81, 82]), {'total_live': 2})
+
+    frames, reached = publisher.frames_since(1)
+    assert reached == 2
+    assert b'event: diff' in frames[0]
+
+    for minute in (83, 84, 85):
+        publisher.publish(_matches([minute]), {'total_live': 1})
+    frames, reached = publisher.frames_since(1)
+    assert reached == 5
+    assert b'event: snapshot' in frames[0]
+
+
+def test_sse_ids_carry_the_epoch():
+    """A Last-Event-ID from this epoch resumes with diffs; one from before a restart gets a snapshot"""
+    publisher = LiveSnapshotPublisher()
+    publisher.epoch = 'new'
+    for minute in (80, 81, 82):
+        publisher.publish(_matches([minute]), {})
+
+    def first_frame(last_event_id):
+        stream = publisher.sse_stream(last_event_id)
+        next(stream)  # retry: hint
+        return next(stream)
+
+    frame = first_frame('new-2')
+    assert frame.startswith(b'id: new-3\nevent: diff')
+    for stale_id in ('old-2', '2', 'garbage'):
+        assert first_frame(stale_id).startswith(b'id: new-3\nevent: snapshot')
+
+
+def test_web_workers_keep_the_ingestor_numbering():
+    """Versions and epoch come from the ingestor; skipped versions and an ingestor restart force a snapshot"""
+    ingestor, worker = LiveSnapshotPublisher(), LiveSnapshotPublisher()
+    received = []
+    ingestor.add_listener(lambda *snapshot: received.append(snapshot))
+    for minute in (80, 81, 82, 83):
+        ingestor.publish(_matches([minute]), {}, data_at=1000.0)
+
+    # The latest-only mailbox delivered 1, 2 and 4 (3 was skipped)
+    for version, matches, stats, data_at, epoch in (received[0], received[1], received[3]):
+        worker.publish(matches, stats, data_at=data_at, version=version, epoch=epoch)
+    assert worker.version == 4 and worker.data_at == 1000.0 and worker.epoch == ingestor.epoch
+    assert worker.live_matches_body().etag == ingestor.live_matches_body().etag
+    frames, reached = worker.frames_since(2)
+    assert reached == 4 and b'event: diff' in frames[0] and b'"base_version":2' in frames[0]
+    assert b'event: snapshot' in worker.frames_since(3)[0][0]
+    assert worker.publish(*received[3][1:3], version=4, epoch=ingestor.epoch) == 4  # Redelivered on reconnect
+
+    # Restarted ingestor: new epoch, numbering starts over
+    worker.publish(_matches([84]), {}, version=1, epoch='restarted')
+    assert worker.version == 1 and b'event: snapshot' in worker.frames_since(0)[0][0]
+
+
+def test_cached_body_and_compression():
+    """The full body is rendered once per version and has a gzip variant"""
+    publisher = LiveSnapshotPublisher()
+    assert publisher.live_matches_body() is None
+
+    publisher.publish(_matches([70, 80, 90]), {'alerts_triggered': 1})
+    cached = publisher.live_matches_body()
+    assert cached is publisher.live_matches_body()
+
+    body, encoding, etag = cached.select('gzip, deflate')
+    assert encoding == 'gzip' and etag.endswith('-gz')
+    data = json.loads(gzip.decompress(body))
+    assert len(data['matches']) == 3 and data['alerts_triggered'] == 1
+
+    _, encoding, _ = cached.select('gzip;q=0')
+    assert encoding is None
+
+
+def test_projection_and_minute_filter():
+    """?fields= keeps only the requested keys (plus match_id); minute range filters matches"""
+    publisher = LiveSnapshotPublisher()
+    publisher.publish(_matches([70, 80, 90]), {})
+    first_etag = publisher.live_matches_body(['minute'], 75, 85).etag
+
+    data = json.loads(publisher.live_matches_body(['minute'], 75, 85).identity)
+    assert data['matches'] == [{'match_id': 2, 'minute': 80}]
+
+    # A new version invalidates cached query bodies
+    publisher.publish(_matches([70, 80, 90]), {})
+    assert publisher.live_matches_body(['minute'], 75, 85).etag != first_etag
+
+
+def test_stream_slots_are_capped():
+    """Past SSE_MAX_STREAMS open streams the endpoint answers 204 (viewers poll); closing frees the slot"""
+    import threading
+    import web_dashboard
+
+    saved = web_dashboard._sse_slots
+    web_dashboard._sse_slots = threading.BoundedSemaphore(1)
+    client = web_dashboard.app.test_client()
+    try:
+        first = client.get('/api/live-stream', buffered=False)
+        assert first.status_code == 200 and next(first.response) == b'retry: 5000\n\n'
+        assert client.get('/api/live-stream', buffered=False).status_code == 204
+        first.close()
+        second = client.get('/api/live-stream', buffered=False)
+        assert second.status_code == 200
+        second.close()
+    finally:
+        web_dashboard._sse_slots = saved
+
+
+if __name__ == "__main__":
+    test_diff_chain_and_snapshot_fallback()
+    test_sse_ids_carry_the_epoch()
+    test_web_workers_keep_the_ingestor_numbering()
+    test_cached_body_and_compression()
+    test_projection_and_minute_filter()
+    test_stream_slots_are_capped()
+    logger.info("✅ Live snapshot tests passed")
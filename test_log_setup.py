@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test structured logging, per-fixture traces and per-subsystem levels (offline)
+"""
+
+import io
+import json
+import logging
+
+import log_setup
+from log_setup import FixtureTrace, JsonFormatter, configure_logging, log_summary
+
+logger = logging.getLogger(__name__)
+
+
+def _capture(name: str, level: int = logging.DEBUG):
+    """Logger writing JSON lines into a buffer (isolated from the root handler)"""
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JsonFormatter())
+    target = logging.getLogger(name)
+    target.handlers = [handler]
+    target.propagate = False
+    target.setLevel(level)
+    return target, stream
+
+
+def _records(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_json_lines_carry_fields():
+    """Each record is one JSON object with level, logger, message and structured fields"""
+    target, stream = _capture('test_log_setup.json')
+    log_summary(target, "cycle", live=12, alerts=1)
+    target.info("minute %s", 87)
+    first, second = _records(stream)
+    assert first['msg'] == 'cycle' and first['live'] == 12 and first['alerts'] == 1
+    assert first['level'] == 'INFO' and first['logger'] == 'test_log_setup.json'
+    assert second['msg'] == 'minute 87'
+
+
+def test_fixture_trace_is_gated():
+    """Traces are skipped (no formatting) at INFO, unless the fixture is in TRACE_FIXTURES"""
+    target, stream = _capture('test_log_setup.trace', level=logging.INFO)
+
+    class Exploding:
+        def __str__(self):
+            raise AssertionError("formatted a disabled trace")
+
+    quiet = FixtureTrace(target, 1)
+    assert not quiet
+    quiet("stats %s", Exploding())
+
+    log_setup.trace_fixtures.add(2)
+    try:
+        traced = FixtureTrace(target, 2)
+        assert traced
+        traced("corners %s", 9)
+    finally:
+        log_setup.trace_fixtures.discard(2)
+
+    records = _records(stream)
+    assert len(records) == 1
+    assert records[0]['fixture_id'] == 2 and records[0]['level'] == 'INFO' and records[0]['msg'] == 'corners 9'
+
+
+def test_per_subsystem_levels_and_single_handler():
+    """LOG_LEVELS applies per logger, and repeated configure_logging adds no handlers"""
+    original = log_setup.LOG_LEVELS
+    log_setup.LOG_LEVELS = 'test_log_setup.quiet=WARNING,test_log_setup.loud=debug,bogus'
+    try:
+        configure_logging('INFO', 'text')
+        configure_logging('INFO', 'text')
+        marked = [h for h in logging.getLogger().handlers if getattr(h, log_setup._HANDLER_MARK, False)]
+        assert len(marked) == 1
+        assert logging.getLogger('test_log_setup.quiet').level == logging.WARNING
+        assert logging.getLogger('test_log_setup.loud').level == logging.DEBUG
+    finally:
+        log_setup.LOG_LEVELS = original
+
+
+if __name__ == "__main__":
+    configure_logging('INFO', 'text')
+    test_json_lines_carry_fields()
+    test_fixture_trace_is_gated()
+    test_per_subsystem_levels_and_single_handler()
+    logger.info("✅ log_setup tests passed")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test the match-clock model (offline)
+"""
+
+import logging
+
+from match_clock import MatchClock
+from odds_prewarm import OddsPrewarmer
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def _periods(minute, ticking=True, period_id=2, **extra):
+    return [{'id': 1, 'ticking': False, 'minutes': 45},
+            dict({'id': period_id, 'ticking': ticking, 'minutes': minute}, **extra)]
+
+
+def test_minute_progression_narrows_the_estimate():
+    """A minute change between polls pins 85:00 to within the poll gap"""
+    clock = MatchClock()
+    clock.observe(1, _periods(83), 0.0)
+    clock.observe(1, _periods(83), 45.0)
+    clock.observe(1, _periods(84), 90.0)        # 84:00 happened in (45, 60]: at t=0 the clock read >= 83:00
+    assert clock.minute(1, 90.0, certain=True) == 84
+    assert clock.seconds_until(1, 85, 90.0) == 30.0
+    assert clock.minute(1, 121.0, certain=True) == 85  # Between polls, no new data needed
+    assert clock.next_crossing(85, 90.0) == 30.0
+
+    clock.observe(1, _periods(84, ticking=False), 100.0)  # Clock stopped: frozen, 85:00 not in sight
+    assert clock.seconds_until(1, 85, 400.0) is None and clock.minute(1, 400.0) == 84
+
+
+def test_started_timestamp_and_resets():
+    """A consistent period start pins the clock; stuck minutes and new periods reset it"""
+    clock = MatchClock()
+    second_half = 10_000.0  # Clock read 45:00 here
+    clock.observe(2, _periods(80, started=second_half, counts_from=45), second_half + 35 * 60 + 20)
+    assert clock.bounds(2, second_half + 40 * 60) == (85 * 60.0, 85 * 60.0)
+    clock.observe(6, _periods(80, started=second_half - 600, counts_from=45), second_half + 35 * 60 + 20)
+    assert clock.bounds(6, second_half + 35 * 60 + 20)[0] == 80 * 60.0  # Inconsistent start ignored
+
+    clock.observe(3, _periods(90), 0.0)
+    clock.observe(3, _periods(90), 120.0)       # Stoppage time: minute stuck, observations no longer fit
+    assert clock.minute(3, 120.0, certain=True) == 90
+
+    clock.observe(4, _periods(45, period_id=1), 0.0)
+    clock.observe(4, _periods(46, period_id=2), 900.0)  # Second half restarts the clock
+    assert clock.minute(4, 900.0, certain=True) == 46
+    assert clock.minute(4, 900.0 + clock.stale_seconds + 1) is None
+
+
+def test_prewarm_window_follows_the_clock():
+    """A fixture polled at 82' enters the 83' pre-warm window on the clock, before the next poll"""
+    clock = MatchClock()
+    prewarmer = OddsPrewarmer(from_minute=83, clock=clock)
+    match = {'match_id': 5, 'minute': 82, 'is_draw': True,
+             'statistics': {'home': {'corners': 5}, 'away': {'corners': 4}}, 'momentum': {'combined': 80}}
+    clock.observe(5, _periods(82), 0.0)
+    prewarmer.observe([match])
+    assert prewarmer.select([match], now=10.0) == []
+    assert prewarmer.select([match], now=70.0) == [match]
+
+
+if __name__ == "__main__":
+    test_minute_progression_narrows_the_estimate()
+    test_started_timestamp_and_resets()
+    test_prewarm_window_follows_the_clock()
+    logger.info("✅ match clock tests passed")
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test the in-process metrics and the /metrics endpoint (offline)
+"""
+
+import logging
+
+import metrics
+from metrics import MetricsRegistry
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def _sample(text, line_prefix):
+    for line in text.splitlines():
+        if line.startswith(line_prefix):
+            return float(line.rsplit(' ', 1)[1])
+    raise AssertionError(f"no sample {line_prefix!r} in:\n{text}")
+
+
+def test_histogram_exposition():
+    """Buckets are cumulative per label set, with +Inf, _sum and _count"""
+    registry = MetricsRegistry()
+    latency = registry.histogram('t_latency_seconds', 'Test latency', ['entity'], buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        latency.observe(value, entity='odds')
+    latency.observe(0.01, entity='livescores')
+
+    text = registry.render()
+    assert '# TYPE t_latency_seconds histogram' in text
+    assert _sample(text, 't_latency_seconds_bucket{entity="odds",le="0.1"}') == 1
+    assert _sample(text, 't_latency_seconds_bucket{entity="odds",le="1"}') == 3
+    assert _sample(text, 't_latency_seconds_bucket{entity="odds",le="+Inf"}') == 4
+    assert _sample(text, 't_latency_seconds_count{entity="odds"}') == 4
+    assert _sample(text, 't_latency_seconds_sum{entity="odds"}') == 6.05
+    assert _sample(text, 't_latency_seconds_count{entity="livescores"}') == 1
+
+
+def test_timer_and_label_checks():
+    """time() observes even when the block raises; wrong label sets are rejected"""
+    registry = MetricsRegistry()
+    timer = registry.histogram('t_block_seconds', 'Test block')
+    try:
+        with timer.time():
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert timer.count() == 1
+
+    gauge = registry.gauge('t_remaining', 'Test gauge', ['entity'])
+    try:
+        gauge.set(1, other='x')
+        raise AssertionError("accepted wrong labels")
+    except ValueError:
+        pass
+    gauge.set(2950, entity='odds "inplay"')
+    assert 't_remaining{entity="odds \\"inplay\\""} 2950' in registry.render()
+
+
+def test_metrics_endpoint():
+    """/metrics serves rate limit gauges, cache hit ratio and the pipeline histograms"""
+    import web_dashboard
+
+    web_dashboard.rate_limit_info['livescores'] = {'remaining': 2875, 'resets_in_seconds': 1200,
+                                                   'requested_entity': 'livescores'}
+    metrics.record_cache('test_cache', hit=True)
+    metrics.record_cache('test_cache', hit=False)
+    metrics.record_cache('test_cache', hit=True)
+
+    response = web_dashboard.app.test_client().get('/metrics')
+    assert response.status_code == 200
+    text = response.get_data(as_text=True)
+    assert _sample(text, 'latecorners_rate_limit_remaining{entity="livescores"}') == 2875
+    assert abs(_sample(text, 'latecorners_cache_hit_ratio{cache="test_cache"}') - 2 / 3) < 1e-9
+    assert 'latecorners_tracked_fixtures{component="dashboard_live"}' in text
+    for name in ('sportmonks_request_seconds', 'parse_seconds', 'momentum_compute_seconds', 'odds_fetch_seconds',
+                 'db_save_seconds', 'telegram_send_seconds', 'alert_data_age_seconds'):
+        assert f'# TYPE latecorners_{name} histogram' in text
+
+
+def test_web_workers_serve_the_ingest_series():
+    """With a service bus connection, /metrics returns the ingest process's text (503 when it is down)"""
+    import snapshot_bus
+    import web_dashboard
+
+    class _Ingest:
+        def __init__(self, up):
+            self.up = up
+
+        def call(self, method):
+            if not self.up:
+                raise ConnectionError("ingest down")
+            assert method == 'metrics'
+            return 'latecorners_rate_limit_remaining{entity="odds"} 1234\n'
+
+    client = web_dashboard.app.test_client()
+    try:
+        snapshot_bus.service_client = _Ingest(up=True)
+        text = client.get('/metrics').get_data(as_text=True)
+        assert _sample(text, 'latecorners_rate_limit_remaining{entity="odds"}') == 1234
+        snapshot_bus.service_client = _Ingest(up=False)
+        assert client.get('/metrics').status_code == 503
+    finally:
+        snapshot_bus.service_client = None
+
+
+def test_engine_series_are_merged_into_ingest_metrics():
+    """Engine pushes appear on the ingest render under a process label; stale pushes are dropped"""
+    import web_dashboard
+
+    engine = MetricsRegistry()
+    engine.histogram('latecorners_db_save_seconds', 'Alert database save latency').observe(0.2)
+    engine.histogram('latecorners_telegram_send_seconds', 'Telegram alert send latency').observe(0.4)
+    try:
+        web_dashboard.record_engine_metrics('engine-0', engine.render())
+        text = web_dashboard.render_metrics()
+        assert text.count('# TYPE latecorners_db_save_seconds histogram') == 1
+        assert _sample(text, 'latecorners_db_save_seconds_count{process="engine-0"}') == 1
+        assert _sample(text, 'latecorners_telegram_send_seconds_sum{process="engine-0"}') == 0.4
+
+        web_dashboard.engine_metrics['engine-0'] = (0.0, engine.render())
+        assert 'process="engine-0"' not in web_dashboard.render_metrics()
+    finally:
+        web_dashboard.engine_metrics.clear()
+
+
+if __name__ == "__main__":
+    test_histogram_exposition()
+    test_timer_and_label_checks()
+    test_metrics_endpoint()
+    test_web_workers_serve_the_ingest_series()
+    test_engine_series_are_merged_into_ingest_metrics()
+    logger.info("✅ metrics tests passed")
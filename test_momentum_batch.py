@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test that the batch momentum engine matches MomentumTracker exactly (offline)
+"""
+
+import logging
+import random
+from momentum_batch import BatchMomentumEngine
+from momentum_tracker import MomentumTracker
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def _random_feed(rng, fixtures, cycles):
+    """Cumulative stats with gaps, duplicate minutes and the odd minute regression"""
+    state = {fid: {'minute': rng.randrange(0, 80), 'home': [0, 0, 0, 50], 'away': [0, 0, 0, 50]}
+             for fid in range(1, fixtures + 1)}
+    for _ in range(cycles):
+        batch = []
+        for fid, s in state.items():
+            roll = rng.random()
+            if roll < 0.03:
+                s['minute'] = max(0, s['minute'] - rng.randrange(1, 30))  # HT reset / bad feed
+            elif roll > 0.2:
+                s['minute'] += rng.choice((1, 1, 1, 2, 3))
+            for side in ('home', 'away'):
+                team = s[side]
+                team[0] += rng.random() < 0.1
+                team[1] += rng.random() < 0.15
+                team[2] += rng.randrange(0, 3)
+                team[3] = rng.randrange(25, 76)
+            batch.append((fid, s['minute'], dict(zip(('shots_on_target', 'shots_off_target',
+                                                      'dangerous_attacks', 'possession'), s['home'])),
+                          dict(zip(('shots_on_target', 'shots_off_target', 'dangerous_attacks', 'possession'),
+                                   s['away']))))
+        yield batch
+
+
+def test_batch_matches_tracker_for_every_window():
+    """Every fixture, every cycle, windows 5 and 10: identical to the per-fixture tracker"""
+    rng = random.Random(17)
+    trackers = {window: MomentumTracker(window_minutes=window) for window in (5, 10)}
+    engine = BatchMomentumEngine(window_minutes=10, capacity=4)  # Forces growth
+
+    for batch in _random_feed(rng, fixtures=30, cycles=120):
+        for fid, minute, home, away in batch:
+            for tracker in trackers.values():
+                tracker.add_snapshot(fid, minute, home, away)
+        engine.add_batch([b[0] for b in batch], [b[1] for b in batch],
+                         [list(b[2].values()) for b in batch], [list(b[3].values()) for b in batch])
+
+        for window, tracker in trackers.items():
+            batch_scores = engine.scores_by_fixture(window)
+            for fid, *_ in batch:
+                assert batch_scores[fid] == tracker.compute_scores(fid), (window, fid)
+
+
+def test_rows_are_reused_after_removal():
+    """Removed fixtures free their row; a new fixture starts with an empty window"""
+    engine = BatchMomentumEngine(window_minutes=10, capacity=2)
+    team = {'shots_on_target': 3, 'shots_off_target': 1, 'dangerous_attacks': 10, 'possession': 60}
+    engine.add_snapshot(1, 80, team, team)
+    engine.add_snapshot(2, 80, team, team)
+    engine.retain([2])
+    engine.add_snapshot(3, 10, team, team)
+
+    assert 1 not in engine and len(engine) == 2
+    assert engine.compute_scores(3)['home']['window_covered'] == 0
+    assert engine.compute_scores(1)['home']['total'] == 0
+
+
+if __name__ == "__main__":
+    test_batch_matches_tracker_for_every_window()
+    test_rows_are_reused_after_removal()
+    logger.info("✅ Batch momentum tests passed")
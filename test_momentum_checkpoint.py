@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test momentum checkpoint save/restore for warm restarts (offline)
+"""
+
+import logging
+import os
+import tempfile
+from momentum_checkpoint import MomentumCheckpoint
+from momentum_tracker import MomentumTracker
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+class _Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+def _team(minute, boost=0):
+    return {'shots_on_target': minute // 8 + boost, 'shots_off_target': minute // 6,
+            'dangerous_attacks': minute // 2 + boost, 'possession': 55 + boost}
+
+
+def _tracker(clock):
+    tracker = MomentumTracker(window_minutes=10, clock=clock)
+    for minute in range(70, 84):
+        clock.now += 60
+        tracker.add_snapshot(1, minute, _team(minute, 2), _team(minute))
+        tracker.add_snapshot(2, minute, _team(minute), _team(minute, 1))
+    return tracker
+
+
+def test_restored_tracker_scores_identically():
+    """A restored tracker produces the same scores and keeps scoring new minutes"""
+    clock = _Clock(1_700_000_000)
+    original = _tracker(clock)
+    restored = MomentumTracker(window_minutes=10, clock=clock)
+    assert restored.restore_checkpoint(original.to_checkpoint(), max_age_seconds=600) == 2
+
+    for fixture_id in (1, 2):
+        assert restored.compute_scores(fixture_id) == original.compute_scores(fixture_id)
+        assert restored.compute_scores(fixture_id)['home']['window_covered'] == 10
+
+    for tracker in (original, restored):
+        tracker.add_snapshot(1, 84, _team(84, 3), _team(84))
+    assert restored.compute_scores(1) == original.compute_scores(1)
+
+
+def test_stale_fixtures_are_dropped():
+    """Fixtures not updated within the max age are neither restored nor kept"""
+    clock = _Clock(1_700_000_000)
+    tracker = _tracker(clock)
+    clock.now += 300
+    tracker.add_snapshot(2, 85, _team(85), _team(85, 1))  # Fixture 1 has finished
+    data = tracker.to_checkpoint()
+
+    clock.now += 400
+    restored = MomentumTracker(window_minutes=10, clock=clock)
+    assert restored.restore_checkpoint(data, max_age_seconds=600) == 1
+    assert tracker.discard_stale(600) == 1
+    assert restored.compute_scores(2) == tracker.compute_scores(2)
+
+
+def test_file_checkpoint_round_trip():
+    """MomentumCheckpoint writes atomically and restores from its file"""
+    clock = _Clock(1_700_000_000)
+    tracker = _tracker(clock)
+    with tempfile.TemporaryDirectory() as tmp:
+        checkpoint = MomentumCheckpoint('engine-0-of-1', path=os.path.join(tmp, 'momentum.bin'), use_db=False)
+        checkpoint.write(checkpoint.snapshot(tracker))
+        assert not os.path.exists(checkpoint.path + '.tmp')
+
+        restored = MomentumTracker(window_minutes=10, clock=clock)
+        assert checkpoint.restore(restored) == 2
+        assert restored.compute_scores(1) == tracker.compute_scores(1)
+
+
+if __name__ == "__main__":
+    test_restored_tracker_scores_identically()
+    test_stale_fixtures_are_dropped()
+    test_file_checkpoint_round_trip()
+    logger.info("✅ Momentum checkpoint tests passed")
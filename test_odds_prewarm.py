@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test candidate selection for odds pre-warming (offline)
+"""
+
+import logging
+
+from odds_prewarm import OddsPrewarmer
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def _match(fixture_id, minute, corners, momentum, is_draw=False):
+    home = corners // 2
+    return {
+        'match_id': fixture_id,
+        'minute': minute,
+        'is_draw': is_draw,
+        'statistics': {'home': {'corners': home}, 'away': {'corners': corners - home}},
+        'momentum': {'combined': momentum},
+    }
+
+
+def _feed(prewarmer, timeline):
+    """timeline: minute -> list of match dicts; returns the last select() result"""
+    selected = []
+    for minute in sorted(timeline):
+        prewarmer.observe(timeline[minute])
+        selected = prewarmer.select(timeline[minute], now=minute * 60.0)
+    return selected
+
+
+def test_only_plausible_fixtures_are_warmed():
+    """Momentum and corner projections (or a level score) pick the candidates at 83'"""
+    prewarmer = OddsPrewarmer(from_minute=83, momentum_margin=15, corner_margin=1)
+    timeline = {}
+    for minute in range(75, 84):
+        timeline[minute] = [
+            _match(1, minute, 6 + (minute - 75) // 3, 70),     # 8 corners at 83', rising: projects to 9
+            _match(2, minute, 4, 90),                           # Strong momentum, too few corners, not level
+            _match(3, minute, 4, 90, is_draw=True),             # Same, but level: draw rule is plausible
+            _match(4, minute, 12, 30),                          # Plenty of corners, no momentum
+            _match(5, minute, 10, 30 + (minute - 75) * 3),      # Momentum 54 at 83', on course for 60 at 85'
+        ]
+    selected = {m['match_id'] for m in _feed(prewarmer, timeline)}
+    assert selected == {1, 3, 5}, selected
+
+
+def test_window_and_refetch_interval():
+    """Nothing is warmed outside 83-84', and a candidate is re-fetched at most once per interval"""
+    prewarmer = OddsPrewarmer(from_minute=83, interval_seconds=60)
+    early = [_match(1, 80, 10, 90)]
+    prewarmer.observe(early)
+    assert prewarmer.select(early, now=0.0) == []
+
+    at_83 = [_match(1, 83, 10, 90)]
+    prewarmer.observe(at_83)
+    assert len(prewarmer.select(at_83, now=100.0)) == 1
+    assert prewarmer.select(at_83, now=130.0) == []
+    at_84 = [_match(1, 84, 10, 90)]
+    prewarmer.observe(at_84)
+    assert len(prewarmer.select(at_84, now=170.0)) == 1
+    at_85 = [_match(1, 85, 10, 90)]
+    prewarmer.observe(at_85)
+    assert prewarmer.select(at_85, now=240.0) == []
+
+
+if __name__ == "__main__":
+    test_only_plausible_fixtures_are_warmed()
+    test_window_and_refetch_interval()
+    logger.info("✅ odds pre-warm tests passed")
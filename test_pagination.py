@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test the concurrent SportMonks paginator (offline)
+"""
+
+import logging
+import threading
+import time
+
+from pagination import IncompletePages, iter_items, iter_pages, pages_total
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+class _Pages:
+    """Fake endpoint with ``count`` pages of 3 items; tracks calls and peak concurrency"""
+
+    def __init__(self, count, delay=0.02, fail=None):
+        self.count, self.delay, self.fail = count, delay, fail
+        self.calls = []
+        self.running = self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, page):
+        with self._lock:
+            self.calls.append(page)
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        if page == self.fail:
+            return None
+        data = [page * 10 + i for i in range(3)] if page <= self.count else []
+        return {'data': data, 'pagination': {'current_page': page, 'has_more': page < self.count}}
+
+
+def test_all_pages_in_order_fetched_concurrently():
+    """Every item arrives in page order; later windows run in parallel and overshoot is counted"""
+    fetch = _Pages(count=7)
+    overshoot = pages_total.value(result='overshoot')
+    items = list(iter_items(fetch, concurrency=4))
+    assert items == [page * 10 + i for page in range(1, 8) for i in range(3)]
+    assert fetch.peak > 1 and sorted(fetch.calls)[:7] == list(range(1, 8))
+    assert pages_total.value(result='overshoot') - overshoot == len(fetch.calls) - 7  # Windows 2, 4, 4: page 11 past the end
+
+    single = _Pages(count=1)
+    assert [p['data'] for p in iter_pages(single)] == [[10, 11, 12]] and single.calls == [1]
+
+
+def test_failures_and_budget_raise_instead_of_truncating():
+    """A failed later page or an exhausted budget raises; a failed first page yields nothing"""
+    try:
+        list(iter_items(_Pages(count=5, fail=3)))
+        assert False, "expected IncompletePages"
+    except IncompletePages as e:
+        assert e.pages == 2
+
+    granted = []
+    try:
+        list(iter_items(_Pages(count=5), budget=lambda calls: granted.append(calls) or len(granted) < 2))
+        assert False, "expected IncompletePages"
+    except IncompletePages as e:
+        assert 'budget' in str(e) and e.pages == 3
+
+    assert list(iter_pages(_Pages(count=3, fail=1))) == []
+
+
+def test_stopping_early_skips_the_remaining_pages():
+    """Taking the first item fetches only the first page"""
+    fetch = _Pages(count=20)
+    assert next(iter_items(fetch)) == 10 and fetch.calls == [1]
+
+
+if __name__ == "__main__":
+    test_all_pages_in_order_fetched_concurrently()
+    test_failures_and_budget_raise_instead_of_truncating()
+    test_stopping_early_skips_the_remaining_pages()
+    logger.info("✅ pagination tests passed")
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test the SportMonks request profiles (offline)
+"""
+
+import logging
+
+import web_dashboard
+from request_profiles import (LIVE_FULL, LIVE_MINIMAL, LIVE_STAT_TYPES, PROFILES, SETTLEMENT, bytes_per_call,
+                              record_response_bytes)
+from synthetic_feed import SyntheticMatchDay
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+class _Response:
+    def __init__(self, content):
+        self.content = content
+
+
+def test_params_use_semicolon_includes_and_stat_filters():
+    """Profiles render ``;``-separated includes, field selection and stat type filters"""
+    params = LIVE_MINIMAL.params()
+    assert params['include'].split(';')[0] == 'scores:description,score'
+    assert 'participants' not in params['include'] and 'league' not in params['include']
+    assert params['filters'] == 'fixtureStatisticTypes:' + ','.join(str(t) for t in LIVE_STAT_TYPES)
+    assert 'league_id' in LIVE_FULL.params()['select'].split(',')
+
+    settled = SETTLEMENT.params(filters={'fixtureStates': [5], 'fixtures': [19000001]})
+    assert settled['filters'] == 'fixtureStatisticTypes:34;fixtureStates:5;fixtures:19000001'
+    assert all(',' not in include.split(':')[0] for profile in PROFILES.values() for include in profile.include)
+
+
+def test_stat_filter_keeps_everything_the_live_parser_reads():
+    """Dropping the stat types outside the filter leaves parsed matches unchanged"""
+    fixtures = SyntheticMatchDay(fixtures=10, seed=2).inplay_payload()['data']
+    for fixture in fixtures:
+        fixture['statistics'].append({'type_id': 58, 'location': 'home', 'data': {'value': 3}})
+    filtered = [dict(fixture, statistics=[s for s in fixture['statistics'] if s['type_id'] in LIVE_STAT_TYPES])
+                for fixture in fixtures]
+    assert web_dashboard.parse_live_matches(filtered) == web_dashboard.parse_live_matches(fixtures)
+
+
+def test_bytes_are_tracked_per_profile():
+    """Response sizes are averaged per profile name"""
+    assert bytes_per_call('test_profile') is None
+    record_response_bytes('test_profile', _Response(b'x' * 100))
+    record_response_bytes('test_profile', _Response(b'x' * 300))
+    assert bytes_per_call('test_profile') == 200.0
+
+
+if __name__ == "__main__":
+    test_params_use_semicolon_includes_and_stat_filters()
+    test_stat_filter_keeps_everything_the_live_parser_reads()
+    test_bytes_are_tracked_per_profile()
+    logger.info("✅ request profile tests passed")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test ScoringEngine's match-minute state history (offline)
+"""
+
+import logging
+import random
+from dataclasses import MISSING, fields
+from scoring_engine import MatchStateTracker, ScoringEngine
+from sportmonks_client import MatchStats
+from stat_window import StatWindowStore
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def _stats(fixture_id, minute, corners):
+    values = {}
+    for f in fields(MatchStats):
+        if f.default is not MISSING or f.default_factory is not MISSING:
+            continue
+        values[f.name] = [] if f.name in ('substitutions', 'red_cards') else {'home': 0, 'away': 0}
+    values.update(fixture_id=fixture_id, minute=minute, home_team='Home', away_team='Away',
+                  home_score=0, away_score=0, total_corners=corners, state='INPLAY_2ND_HALF')
+    return MatchStats(**values)
+
+
+def _with_attacks(snapshot, home, away):
+    snapshot.dangerous_attacks = {'home': home, 'away': away}
+    return snapshot
+
+
+def test_delta_matches_minute_history():
+    """The engine's last-N-minutes delta equals the forward-filled minute history, differenced"""
+    rng = random.Random(9)
+    tracker = MatchStateTracker(store=StatWindowStore())
+    history, minute, home = {}, 0, 0
+    for _ in range(200):
+        minute += rng.choice((0, 1, 1, 2, 5))
+        home += rng.random() < 0.3
+        tracker.update_match_state(_with_attacks(_stats(1, minute, home), home, 0))
+        history[minute] = home
+
+        for minutes in (1, 3, 5, 10, 29, 45):
+            start = max(minute - minutes, minute - 30, min(history))
+            before = history[max(m for m in history if m <= start)]
+            assert tracker.get_stat_delta(1, 'dangerous_attacks', minutes) == {'home': home - before, 'away': 0}
+
+
+def test_regression_starts_over():
+    """A minute going backwards drops the old history"""
+    tracker = MatchStateTracker(store=StatWindowStore())
+    tracker.update_match_state(_with_attacks(_stats(7, 60, 5), 5, 0))
+    tracker.update_match_state(_with_attacks(_stats(7, 3, 0), 0, 0))
+    assert tracker.get_stat_delta(7, 'dangerous_attacks', 10) == {'home': 0, 'away': 0}
+    assert tracker.get_stat_delta(8, 'dangerous_attacks', 10) is None
+
+
+def test_engine_reads_the_same_history():
+    """ScoringEngine's last-minutes stat comes from the window its tracker writes"""
+    engine = ScoringEngine()
+    engine.state_tracker = MatchStateTracker(store=StatWindowStore())
+    for minute, home in ((70, 2), (75, 4), (80, 7)):
+        engine.evaluate_match(_with_attacks(_stats(3, minute, home), home, 1))
+    current = _with_attacks(_stats(3, 80, 7), 7, 1)
+    assert engine._get_last_minutes_stat(current, 'dangerous_attacks', 5, 'home') == 3
+    assert engine._get_last_minutes_stat(current, 'dangerous_attacks', 10, 'home') == 5
+
+
+if __name__ == "__main__":
+    test_delta_matches_minute_history()
+    test_regression_starts_over()
+    test_engine_reads_the_same_history()
+    logger.info("✅ Scoring state tracker tests passed")
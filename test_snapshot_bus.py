@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test the local snapshot bus (offline - loopback sockets only)
+"""
+
+import logging
+import os
+import time
+
+import snapshot_bus
+from snapshot_bus import BusKeyError, SnapshotBusServer, SnapshotSubscriber, bus_authkey, ensure_bus_authkey
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def _restore_key(saved):
+    if saved is None:
+        os.environ.pop('SNAPSHOT_BUS_AUTHKEY', None)
+    else:
+        os.environ['SNAPSHOT_BUS_AUTHKEY'] = saved
+
+
+def test_no_default_authkey():
+    """Without a configured key the bus refuses to start; the supervisor generates one only on loopback"""
+    saved, host = os.environ.pop('SNAPSHOT_BUS_AUTHKEY', None), snapshot_bus.SNAPSHOT_BUS_HOST
+    try:
+        try:
+            bus_authkey()
+            assert False, "expected BusKeyError"
+        except BusKeyError:
+            pass
+
+        snapshot_bus.SNAPSHOT_BUS_HOST = '0.0.0.0'
+        try:
+            ensure_bus_authkey()
+            assert False, "expected BusKeyError"
+        except BusKeyError:
+            assert 'SNAPSHOT_BUS_AUTHKEY' not in os.environ
+
+        snapshot_bus.SNAPSHOT_BUS_HOST = '127.0.0.1'
+        ensure_bus_authkey()
+        first = bus_authkey()
+        assert len(first) == 64
+        ensure_bus_authkey()  # An existing key is kept
+        assert bus_authkey() == first
+    finally:
+        snapshot_bus.SNAPSHOT_BUS_HOST = host
+        _restore_key(saved)
+
+
+def test_subscriber_receives_version_and_data_at():
+    """Snapshots arrive with the ingestor's version, data_at and epoch"""
+    key = b'test-key'
+    server = SnapshotBusServer(port=0, authkey=key).start()
+    received = []
+    subscriber = SnapshotSubscriber(lambda *snapshot: received.append(snapshot), port=server._listener.address[1],
+                                    authkey=key).start()
+    server.publish(7, [{'match_id': 1}], {'stale': True}, 1000.0, 'abc')
+    deadline = time.time() + 5
+    while not received and time.time() < deadline:
+        time.sleep(0.02)
+    assert received == [(7, [{'match_id': 1}], {'stale': True}, 1000.0, 'abc')]
+    assert subscriber.last_version == 7 and subscriber.latest_data_at == 1000.0
+
+
+if __name__ == "__main__":
+    test_no_default_authkey()
+    test_subscriber_receives_version_and_data_at()
+    logger.info("✅ Snapshot bus tests passed")
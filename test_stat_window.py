@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test the shared minute-indexed stat windows (offline)
+"""
+
+import logging
+import random
+from match_state_tracker import MatchStateTracker
+from stat_window import FixtureStatWindow, StatWindowStore, stat_windows
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def _brute_force(history, minutes, horizon=30):
+    """Forward-filled per-minute history, differenced / averaged the slow way"""
+    last_minute = max(history)
+    filled, current = {}, None
+    for minute in range(min(history), last_minute + 1):
+        current = history.get(minute, current)
+        filled[minute] = current
+    start = max(min(filled), last_minute - horizon, last_minute - minutes)
+    corners = {side: filled[last_minute]['corners'][side] - filled[start]['corners'][side] for side in ('home', 'away')}
+    span = range(start, last_minute + 1)
+    possession = {side: sum(filled[m]['possession'][side] for m in span) / len(span) for side in ('home', 'away')}
+    return corners, possession
+
+
+def test_any_window_matches_brute_force():
+    """Deltas and averages agree with a full recomputation for every N, across gaps"""
+    rng = random.Random(3)
+    window = FixtureStatWindow(horizon_minutes=30)
+    history, minute, corners = {}, 10, {'home': 0, 'away': 0}
+    for _ in range(60):
+        minute += rng.choice((1, 1, 2, 4))
+        corners = {side: corners[side] + (rng.random() < 0.2) for side in corners}
+        stats = {'corners': dict(corners), 'possession': {'home': rng.randrange(30, 70), 'away': 0}}
+        window.update(minute, stats)
+        history[minute] = stats
+        for n in (1, 5, 10, 15, 20, 30):
+            expected_corners, expected_possession = _brute_force(history, n)
+            assert window.delta('corners', n) == expected_corners
+            assert abs(window.average('possession', n)['home'] - expected_possession['home']) < 1e-9
+
+
+def test_regression_clears_and_same_minute_merges():
+    """A minute going backwards starts over; a repeated minute keeps the newest values"""
+    window = FixtureStatWindow()
+    window.update(44, {'corners': {'home': 3, 'away': 2}})
+    window.update(45, {'corners': {'home': 4, 'away': 2}})
+    window.update(45, {'corners': {'home': 5, 'away': 2}, 'attacks': {'home': 40, 'away': 30}})
+    assert window.delta('corners', 5) == {'home': 2, 'away': 0}
+    assert window.value('attacks') == {'home': 40, 'away': 30}
+
+    window.update(1, {'corners': {'home': 0, 'away': 0}})
+    assert len(window) == 1 and window.delta('corners', 10) == {'home': 0, 'away': 0}
+
+
+def test_match_state_tracker_uses_match_minutes():
+    """MatchStateTracker windows follow the minute it is given, not the wall clock"""
+    tracker = MatchStateTracker(fixture_id=1, window=FixtureStatWindow())
+    for minute in range(70, 86):
+        tracker.update_stats({'corners': {'home': minute // 3, 'away': 1},
+                              'possession': {'home': 60, 'away': 40}}, minute=minute)
+    windows = tracker.get_all_windows_stats()
+    assert windows[5]['corners'] == {'home': 85 // 3 - 80 // 3, 'away': 0}
+    assert windows[15]['possession'] == {'home': 60, 'away': 40}
+
+
+def test_wall_clock_trackers_keep_their_own_window():
+    """A tracker counting minutes from its first update never clears the engine's match-minute window"""
+    from datetime import datetime
+    for minute in (80, 81):
+        stat_windows.update(42, minute, {'corners': {'home': minute - 75, 'away': 0}})
+    MatchStateTracker(fixture_id=42).update_stats({'corners': {'home': 0, 'away': 0}}, timestamp=datetime.now())
+    assert stat_windows.delta(42, 'corners', 1) == {'home': 1, 'away': 0}
+    stat_windows.discard_stale(set())
+
+
+def test_discard_stale_keeps_live_fixtures():
+    """Fixtures missing from the live set are forgotten"""
+    store = StatWindowStore()
+    for fixture_id in (1, 2, 3):
+        store.update(fixture_id, 80, {'corners': {'home': 1, 'away': 0}})
+    assert store.discard_stale({2, 9}) == 2
+    assert 2 in store and 1 not in store and 3 not in store
+
+
+if __name__ == "__main__":
+    test_any_window_matches_brute_force()
+    test_regression_clears_and_same_minute_merges()
+    test_match_state_tracker_uses_match_minutes()
+    test_wall_clock_trackers_keep_their_own_window()
+    test_discard_stale_keeps_live_fixtures()
+    logger.info("✅ Stat window tests passed")
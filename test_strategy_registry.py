@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test the strategy registry and built-in strategies (offline)
+"""
+
+import logging
+
+import strategies
+from feature_frame import FeatureFrameStage
+from strategy_registry import ShadowAlertLog, StrategyRegistry
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def _row(fixture_id=1, minute=87, home_score=1, away_score=1, corners=10, shots=14, sot=8, da=60,
+         momentum=80, odds=True, draw_odds=None):
+    match = {
+        'match_id': fixture_id,
+        'minute': minute,
+        'home_score': home_score,
+        'away_score': away_score,
+        'statistics': {
+            'home': {'corners': corners // 2, 'shots_total': shots // 2, 'shots_on_target': sot // 2,
+                     'dangerous_attacks': da // 2},
+            'away': {'corners': corners - corners // 2, 'shots_total': shots - shots // 2,
+                     'shots_on_target': sot - sot // 2, 'dangerous_attacks': da - da // 2},
+        },
+        'momentum': {'home': momentum // 2, 'away': momentum - momentum // 2, 'combined': momentum},
+        'corner_odds': {'available': odds, 'active_count': 3 if odds else 0},
+    }
+    return FeatureFrameStage().build([match], version=1, draw_odds=lambda fid: draw_odds).rows()[0]
+
+
+def _registry(*names):
+    registry = StrategyRegistry(mode_overrides={}, alert_log=ShadowAlertLog(path=''))
+    for name in names:
+        fn = getattr(strategies, name)
+        registry.register(name, fn, mode='shadow', budget_ms=50)
+    return registry
+
+
+def test_builtin_strategies():
+    """Production mirrors follow the engine thresholds; shadow ports follow their legacy systems"""
+    assert strategies.late_momentum(_row()) is not None
+    assert strategies.late_momentum(_row(corners=8)) is None
+    assert strategies.late_momentum(_row(odds=False)) is None
+    assert strategies.late_momentum_draw(_row(corners=3, draw_odds=1.45)) is not None
+    assert strategies.late_momentum_draw(_row(corners=3, draw_odds=1.80)) is None
+
+    tier1 = strategies.tier1_elite(_row(minute=84, corners=7))
+    assert tier1['category'] == 'TIER_1_PEAK' and tier1['scoreline'] == 'TIER_1_DRAW'
+    assert strategies.tier1_elite(_row(minute=84, home_score=2, away_score=0)) is None
+    assert strategies.tier1_elite(_row(minute=84, sot=4)) is None
+
+    assert strategies.scoreline_psychology(_row(minute=82))['urgency'] == 'VERY HIGH'
+    assert strategies.scoreline_psychology(_row(minute=82, home_score=3, away_score=0)) is None
+    assert strategies.scoreline_psychology(_row(minute=82, corners=2, shots=4, da=20)) is None
+
+
+def test_one_alert_per_fixture_and_modes():
+    """Would-be alerts are recorded once per (strategy, fixture); disabled strategies are skipped"""
+    registry = _registry('late_momentum', 'tier1_elite')
+    rows = [_row(fixture_id=1), _row(fixture_id=2, corners=4)]
+    assert registry.evaluate_cycle(rows, ts=0) == {'late_momentum': [{'fixture_id': 1, 'momentum': 80, 'corners': 10}]}
+    assert registry.evaluate_cycle(rows, ts=60) == {}
+    assert len(registry.alert_log.recent) == 1
+
+    registry = StrategyRegistry(mode_overrides={'late_momentum': 'disabled'}, alert_log=ShadowAlertLog(path=''))
+    registry.register('late_momentum', strategies.late_momentum, mode='production')
+    assert registry.evaluate_cycle(rows) == {} and registry.report()['late_momentum']['evaluations'] == 0
+
+
+def test_over_budget_shadow_strategy_is_disabled():
+    """A shadow strategy over its CPU budget for consecutive cycles is switched off"""
+    registry = StrategyRegistry(mode_overrides={}, alert_log=ShadowAlertLog(path=''))
+
+    def slow(row):
+        sum(range(20000))
+        return None
+
+    registry.register('slow', slow, mode='shadow', budget_ms=0.001)
+    rows = [_row(fixture_id=i) for i in range(5)]
+    for _ in range(3):
+        registry.evaluate_cycle(rows)
+    report = registry.report()['slow']
+    assert report['mode'] == 'disabled' and report['over_budget_cycles'] == 3
+    assert report['evaluations'] == 3  # Each pass stopped after the first over-budget fixture
+
+
+def test_tier1_baseline_is_not_an_alert():
+    """A 6-corner TIER_1_BASELINE match is rejected, as the dashboard's 85' alert rejects it"""
+    registry = _registry('tier1_elite')
+    assert registry.evaluate_cycle([_row(fixture_id=1, minute=84, corners=6)], ts=0) == {}
+    fired = registry.evaluate_cycle([_row(fixture_id=2, minute=84, corners=7)], ts=0)
+    assert [alert['category'] for alert in fired['tier1_elite']] == ['TIER_1_PEAK']
+
+
+if __name__ == "__main__":
+    test_builtin_strategies()
+    test_one_alert_per_fixture_and_modes()
+    test_over_budget_shadow_strategy_is_disabled()
+    test_tier1_baseline_is_not_an_alert()
+    logger.info("✅ strategy registry tests passed")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test the synthetic match-day generator and pipeline benchmark (offline)
+"""
+
+import logging
+import web_dashboard
+from synthetic_feed import SyntheticMatchDay
+from benchmark_pipeline import STAGES, run_benchmark
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def test_payloads_parse_like_live_feed():
+    """Every synthetic fixture survives the dashboard parser with its stats and odds"""
+    day = SyntheticMatchDay(fixtures=40, seed=7)
+    matches = web_dashboard.parse_live_matches(day.inplay_payload()['data'])
+
+    assert len(matches) == 40
+    assert all(m['statistics']['has_corners'] for m in matches)
+
+    fixture_id = day.fixtures_in_window(0, 95)[0]
+    odds = web_dashboard.parse_corner_odds(day.odds_payload(fixture_id)['data'])
+    assert odds['available'] and odds['odds_details']
+
+
+def test_stats_are_cumulative_and_concurrency_constant():
+    """Counters never go backwards for a fixture; finished fixtures are replaced"""
+    day = SyntheticMatchDay(fixtures=20, seed=3)
+    before = {f.id: f.total_corners for f in day.fixtures}
+    for _ in range(40):
+        day.advance()
+    assert len(day.fixtures) == 20
+    for fixture in day.fixtures:
+        if fixture.id in before:
+            assert fixture.total_corners >= before[fixture.id]
+
+
+def test_benchmark_reports_every_stage():
+    """A tiny benchmark run produces latency/throughput for each stage"""
+    report = run_benchmark(scales=[10], cycles=2)
+    result = report['results'][0]
+    assert result['fixtures'] == 10
+    assert set(result['stages']) == set(STAGES)
+
+
+if __name__ == "__main__":
+    test_payloads_parse_like_live_feed()
+    test_stats_are_cumulative_and_concurrency_constant()
+    test_benchmark_reports_every_stage()
+    logger.info("✅ Synthetic feed tests passed")
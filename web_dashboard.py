@@ -1,13 +1,38 @@
-from flask import Flask, render_template, jsonify
+from flask import Flask, Response, render_template, jsonify, request
+import logging
 import os
 import requests
 from dotenv import load_dotenv
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import threading
 import time
+import numpy as np
+from idempotency_store import DASHBOARD_85_NAMESPACE, is_fixture_alerted, mark_fixture_alerted
+from live_snapshot import live_publisher
+from feed_recorder import record_response
+from snapshot_store import record_snapshot
+from momentum_batch import BatchMomentumEngine
+from log_setup import configure_logging, log_summary
+import metrics
+import snapshot_bus
+from odds_prewarm import ODDS_PREWARM_ENABLED, odds_prewarmer
+from match_clock import match_clock
+from stat_window import stat_windows
+from alert_rules import ALERT_WINDOW
+from fixture_metadata import FIXTURE_METADATA_CACHE, fixture_metadata
+from inplay_decoder import INPLAY_STREAM_DECODE, decode_inplay
+from circuit_breaker import circuit_breaker, circuit_report
+from pagination import iter_items, iter_pages, page_params
+from request_profiles import FIXTURE_METADATA, LIVE_FULL, LIVE_MINIMAL, ODDS_CORNERS, record_response_bytes
+from strategy_registry import strategy_registry
+from feature_frame import feature_stage
+import strategies  # noqa: F401  (registers the built-in strategies)
 
 load_dotenv()
 
+# Hot-path diagnostics (per match, per call) go through lazy DEBUG records; one summary per cycle at INFO
+logger = logging.getLogger('web_dashboard')
+
 app = Flask(__name__)
 
 # Telegram Configuration
@@ -39,8 +64,36 @@ def send_telegram_alert(message):
         print(f"❌ Failed to send Telegram alert: {e}")
         return False
 
+# SportMonks base URL (overridable so the replay harness can point it at a local stub)
+SPORTMONKS_BASE_URL = os.getenv('SPORTMONKS_BASE_URL', 'https://api.sportmonks.com/v3/football')
+# Seconds between background update cycles
+UPDATE_INTERVAL_SECONDS = 45
+# A cycle is moved forward to land this many seconds after a fixture's clock surely reaches 85:00,
+# but never sooner than UPDATE_MIN_GAP_SECONDS after the previous one
+CLOCK_WAKE_MARGIN_SECONDS = 2
+UPDATE_MIN_GAP_SECONDS = 10
+# The last good snapshot is served during an outage for at most this long
+STALE_SNAPSHOT_MAX_AGE_SECONDS = float(os.getenv('STALE_SNAPSHOT_MAX_AGE_SECONDS', '600'))
+# Open SSE streams per process - each holds a worker thread, so the rest stay free for /api/* and /health
+SSE_MAX_STREAMS = int(os.getenv('SSE_MAX_STREAMS', '64'))
+_sse_slots = threading.BoundedSemaphore(SSE_MAX_STREAMS)
+# Engine metrics pushed over the service bus are dropped from /metrics once this old (engine gone)
+ENGINE_METRICS_MAX_AGE_SECONDS = float(os.getenv('ENGINE_METRICS_MAX_AGE_SECONDS', '120'))
+# engine name -> (received at, Prometheus text)
+engine_metrics = {}
+
+# Clock used for caches, rate limiting and the update loop (replaced by feed_replay's FakeClock)
+_clock = time
+
+def set_clock(clock):
+    """Swap the clock (anything with time() and sleep()) - used for replaying recorded feeds"""
+    global _clock
+    _clock = clock
+
 # Global variables to store live data
 live_matches_data = []
+# When live_matches_data was fetched (it is served, marked stale, while SportMonks is unavailable)
+live_data_fetched_at = None
 dashboard_stats = {
     'total_live': 0,
     'late_games': 0,
@@ -52,33 +105,41 @@ dashboard_stats = {
 # Global cache to avoid re-checking the same matches
 odds_cache = {}
 last_odds_check_time = {}
+# match_id -> (time, draw price or None); shared with the engine through the service bus
+draw_odds_cache = {}
+DRAW_ODDS_CACHE_SECONDS = 120
+_draw_odds_client = None
+
+# Rolling 10-minute momentum for every live match (ring buffers, scored in one batch per cycle)
+momentum_engine = BatchMomentumEngine(window_minutes=10)
 
-# Global alert tracking
+# Global alert tracking (details for /api/alerts; dedup lives in idempotency_store)
 alert_history = {}
 last_alert_check = 0
 
 # Rate limit tracking per entity
 rate_limit_info = {
     'livescores': {'remaining': 3000, 'resets_in_seconds': 3600},
-    'odds': {'remaining': 3000, 'resets_in_seconds': 3600}
+    'odds': {'remaining': 3000, 'resets_in_seconds': 3600},
+    'fixtures': {'remaining': 3000, 'resets_in_seconds': 3600}
 }
 
-def monitor_rate_limits(response, entity_name):
-    """Monitor and track rate limit information from API responses"""
+def monitor_rate_limits(response, entity_name, data=None):
+    """Monitor and track rate limit information from API responses (pass ``data`` if already decoded)"""
     try:
         # Check if response has rate limit headers or data
-        if hasattr(response, 'json'):
+        if data is None and hasattr(response, 'json'):
             data = response.json()
-            if 'rate_limit' in data:
-                rate_limit_data = data['rate_limit']
-                rate_limit_info[entity_name] = {
-                    'remaining': rate_limit_data.get('remaining', 3000),
-                    'resets_in_seconds': rate_limit_data.get('resets_in_seconds', 3600),
-                    'requested_entity': rate_limit_data.get('requested_entity', entity_name)
-                }
-                print(f"📊 Rate limit for {entity_name}: {rate_limit_info[entity_name]['remaining']}/3000 remaining")
+        if data is not None and 'rate_limit' in data:
+            rate_limit_data = data['rate_limit']
+            rate_limit_info[entity_name] = {
+                'remaining': rate_limit_data.get('remaining', 3000),
+                'resets_in_seconds': rate_limit_data.get('resets_in_seconds', 3600),
+                'requested_entity': rate_limit_data.get('requested_entity', entity_name)
+            }
+            logger.debug("📊 Rate limit for %s: %s/3000 remaining", entity_name, rate_limit_info[entity_name]['remaining'])
     except Exception as e:
-        print(f"⚠️ Could not parse rate limit info: {e}")
+        logger.warning("⚠️ Could not parse rate limit info: %s", e)
 
 def can_make_request(entity_name, required_calls=1):
     """Check if we can safely make requests to an entity"""
@@ -94,49 +155,39 @@ def trigger_85_minute_alert(match):
     """Trigger alert for 85-minute corner betting opportunity"""
     match_id = match['match_id']
     
-    print(f"\n🔍 EVALUATING ALERT for Match {match_id}: {match['home_team']} vs {match['away_team']} ({match['minute']}')")
+    logger.debug("🔍 EVALUATING ALERT for Match %s: %s vs %s (%s')",
+                 match_id, match['home_team'], match['away_team'], match['minute'])
     
-    # Prevent duplicate alerts for the same match
-    if match_id in alert_history:
-        print(f"❌ REJECTED: Duplicate alert prevention - match {match_id} already alerted")
+    # Prevent duplicate alerts for the same match (own namespace: never blocks the main alert engine)
+    if is_fixture_alerted(match_id, DASHBOARD_85_NAMESPACE):
+        logger.debug("❌ REJECTED: Duplicate alert prevention - match %s already alerted", match_id)
         return False
     
     # Evaluate corner potential
     evaluation = evaluate_corner_potential(match)
     if not evaluation:
-        print(f"❌ REJECTED: No corner evaluation returned (likely wrong time window)")
+        logger.debug("❌ REJECTED: No corner evaluation returned for match %s", match_id)
         return False
     
-    print(f"📊 CORNER EVALUATION:")
-    print(f"   • Final Score: {evaluation['score']:.1f}")
-    print(f"   • Corner Count: {evaluation['total_corners']}")
-    print(f"   • Corner Category: {evaluation['corner_category']}")
-    print(f"   • Psychology Score: {evaluation['score']:.1f}") # Renamed to 'score'
-    print(f"   • Recommendation: {evaluation['corner_category']} (Score: {evaluation['score']:.1f})") # Renamed to 'corner_category'
-    print(f"   • Reason: {evaluation['corner_category']} (Score: {evaluation['score']:.1f})") # Renamed to 'corner_category'
+    logger.debug("📊 CORNER EVALUATION: match %s score=%.1f corners=%s category=%s",
+                 match_id, evaluation['score'], evaluation['total_corners'], evaluation['corner_category'])
     
     # UPDATED: Allow WEAK BUY alerts (removed from rejection list)
     if evaluation['corner_category'] == "TIER_1_BASELINE":
-        print(f"❌ REJECTED: Recommendation is TIER_1_BASELINE - {evaluation['corner_category']} (Score: {evaluation['score']:.1f})")
+        logger.debug("❌ REJECTED: Match %s is TIER_1_BASELINE (Score: %.1f)", match_id, evaluation['score'])
         return False
     
-    print(f"✅ SCORING PASSED: Action '{evaluation['corner_category']}' is actionable")
-    
     # CRITICAL: Only alert if Asian corner odds are available
     odds_info = match.get('corner_odds', {})
-    print(f"🎯 ODDS CHECK:")
-    print(f"   • Odds Available: {odds_info.get('available', False)}")
-    print(f"   • Odds Count: {odds_info.get('count', 0)}")
-    print(f"   • Total Corner Markets: {odds_info.get('total_corner_markets', 0)}")
-    print(f"   • Cached: {odds_info.get('cached', False)}")
+    logger.debug("🎯 ODDS CHECK: match %s available=%s count=%s markets=%s cached=%s",
+                 match_id, odds_info.get('available', False), odds_info.get('count', 0),
+                 odds_info.get('total_corner_markets', 0), odds_info.get('cached', False))
     
     if not odds_info.get('available', False):
-        print(f"❌ REJECTED: No Asian corner odds available for match {match_id}")
-        print(f"   💡 This means bet365 Market 61 (Asian Total Corners) was not found")
+        # bet365 Market 61 (Asian Total Corners) was not found
+        logger.debug("❌ REJECTED: No Asian corner odds available for match %s", match_id)
         return False
     
-    print(f"✅ ODDS PASSED: {odds_info['count']} Asian corner markets available from bet365")
-    
     # Record alert
     alert_history[match_id] = {
         'timestamp': datetime.now(),
@@ -151,7 +202,7 @@ def trigger_85_minute_alert(match):
         }
     }
     
-    print(f"🚨 ALERT TRIGGERED! All conditions met for {match['home_team']} vs {match['away_team']}")
+    logger.info("🚨 ALERT TRIGGERED! All conditions met for %s vs %s", match['home_team'], match['away_team'])
     
     # Generate comprehensive alert
     alert_data = _generate_alert_message(match, evaluation, odds_info)
@@ -160,17 +211,15 @@ def trigger_85_minute_alert(match):
     # Send Telegram alert
     telegram_sent = send_telegram_alert(telegram_message)
     
-    # Log alert to console
-    print("🚨" * 10)
-    print("⚽ 85-MINUTE CORNER ALERT ⚽")
-    print("🚨" * 10)
-    print(alert_data['message'])
-    print("🚨" * 10)
+    # Log alert
+    logger.info("⚽ 85-MINUTE CORNER ALERT ⚽\n%s", alert_data['message'])
     
     if telegram_sent:
-        print("📱 Alert sent to Telegram successfully!")
+        # Marked only once sent, so a failed send is retried next cycle
+        mark_fixture_alerted(match_id, DASHBOARD_85_NAMESPACE)
+        logger.info("📱 Alert sent to Telegram successfully!")
     else:
-        print("⚠️ Telegram alert failed - check your bot configuration")
+        logger.warning("⚠️ Telegram alert failed for match %s - check your bot configuration", match_id)
     
     return True
 
@@ -279,76 +328,158 @@ def should_check_odds(match):
     
     # EXTENDED WINDOW: Check odds from 70-90 minutes for comprehensive live odds tracking
     if minute < 70:
-        print(f"🕐 Match {match_id} ({minute}'): Too early for odds checking (need 70-90 minutes)")
-        return False
+        return False  # Too early (most live matches - not worth a log line)
     
     if minute > 90:
-        print(f"🕐 Match {match_id} ({minute}'): Beyond odds checking window (70-90 minutes)")
+        logger.debug("🕐 Match %s (%s'): Beyond odds checking window (70-90 minutes)", match_id, minute)
         return False
     
     # Only check odds for matches with corner statistics (essential for corner betting)
     if not match['statistics']['has_corners']:
-        print(f"📊 Match {match_id} ({minute}'): No corner statistics available - skipping odds check")
+        logger.debug("📊 Match %s (%s'): No corner statistics available - skipping odds check", match_id, minute)
         return False
     
     # Rate limiting: Don't check same match more than once every 2 minutes
     last_check = last_odds_check_time.get(match_id, 0)
-    current_time = time.time()
+    current_time = _clock.time()
     if current_time - last_check < 120:
-        time_since_last = int(current_time - last_check)
-        print(f"⏱️ Match {match_id} ({minute}'): Rate limited - last check {time_since_last}s ago (need 120s)")
+        logger.debug("⏱️ Match %s (%s'): Rate limited - last check %ds ago (need 120s)",
+                     match_id, minute, current_time - last_check)
         return False
     
-    print(f"✅ Match {match_id} ({minute}'): Ready for odds checking")
+    logger.debug("✅ Match %s (%s'): Ready for odds checking", match_id, minute)
     return True
 
+def _poll_inplay(api_key, profile):
+    """Raw fixtures from /livescores/inplay with the given request profile"""
+    url = f"{SPORTMONKS_BASE_URL}/livescores/inplay"
+    params = dict(profile.params(), api_token=api_key)
+    logger.debug("🌐 Calling SportMonks API: %s (profile=%s)", url, profile.name)
+    with metrics.sportmonks_request_seconds.time(entity='livescores'):
+        response = requests.get(url, params=params, timeout=30)
+    record_response('/livescores/inplay', params, response)
+    record_response_bytes(profile.name, response)
+    response.raise_for_status()
+    
+    # Non-ticking fixtures are dropped while decoding, before they become Python objects
+    payload = decode_inplay(response.content) if INPLAY_STREAM_DECODE else response.json()
+    # Monitor rate limits
+    monitor_rate_limits(response, 'livescores', payload)
+    return payload.get('data', [])
+
+def _fetch_fixtures(path, params):
+    """All pages of a /fixtures endpoint for the metadata cache (None on failure)"""
+    api_key = os.getenv('SPORTMONKS_API_KEY')
+    breaker = circuit_breaker('fixtures')
+    if not api_key or not can_make_request('fixtures') or not breaker.allow(_clock.time()):
+        return None
+    
+    def fetch_page(page):
+        query = dict(page_params(params, page), api_token=api_key)
+        with metrics.sportmonks_request_seconds.time(entity='fixtures'):
+            response = requests.get(f"{SPORTMONKS_BASE_URL}{path}", params=query, timeout=15)
+        record_response(path, query, response)
+        record_response_bytes(FIXTURE_METADATA.name, response)
+        response.raise_for_status()
+        payload = response.json()
+        monitor_rate_limits(response, 'fixtures', payload)
+        return payload
+    
+    try:
+        with breaker.guard(_clock.time()):
+            return list(iter_items(fetch_page, budget=lambda calls: can_make_request('fixtures', calls)))
+    except Exception as e:
+        logger.warning("⚠️ Fixture metadata fetch failed for %s: %s", path, e)
+        return None
+
+fixture_metadata.fetch = _fetch_fixtures
+
+def join_fixture_metadata(api_key, matches):
+    """Put cached team/league names on a minimal poll; a full poll when some fixture stays unknown"""
+    unknown = fixture_metadata.join(matches)
+    if unknown:
+        # Today's schedule in bulk (once per day), then the stragglers by id
+        fixture_metadata.load_schedule(datetime.fromtimestamp(_clock.time(), timezone.utc).strftime('%Y-%m-%d'))
+        unknown = fixture_metadata.join(matches)
+    if unknown:
+        fixture_metadata.fetch_missing(unknown)
+        unknown = fixture_metadata.join(matches)
+    if unknown:
+        logger.warning("⚠️ No metadata for %d live fixtures - polling with the full include set", len(unknown))
+        matches = _poll_inplay(api_key, LIVE_FULL)
+        fixture_metadata.join(matches)
+    return matches
+
 def get_live_matches():
     """Get current live matches from API"""
+    return fetch_live_matches() or []
+
+def fetch_live_matches():
+    """Current live matches from the API; None when no fresh data could be fetched"""
     
     api_key = os.getenv('SPORTMONKS_API_KEY')
     
     if not api_key:
         print("❌ SPORTMONKS_API_KEY not found in environment!")
-        return []
+        return None
     
     if not can_make_request('livescores'):
         print("⚠️ Rate limit approaching for livescores entity, skipping this update")
-        return []
+        return None
     
-    url = f"https://api.sportmonks.com/v3/football/livescores/inplay"
-    params = {
-        'api_token': api_key,
-        'include': 'scores;participants;state;periods;periods.statistics;league;statistics'
-    }
+    # Fail fast while SportMonks is down instead of waiting out another timeout
+    breaker = circuit_breaker('livescores')
+    if not breaker.allow(_clock.time()):
+        logger.warning("⚡ Livescores circuit open - skipping the API call")
+        return None
     
     try:
-        print(f"🌐 Calling SportMonks API: {url}")
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        # Monitor rate limits
-        monitor_rate_limits(response, 'livescores')
-        
-        matches = response.json().get('data', [])
-        print(f"📥 Raw matches from API: {len(matches)}")
-        
-        live_matches = []
-        
-        for match in matches:
-            periods = match.get('periods', [])
-            has_ticking = any(period.get('ticking', False) for period in periods)
-            
-            if has_ticking:
-                match_data = extract_match_data(match)
-                if match_data and is_valid_live_match(match_data):
-                    live_matches.append(match_data)
+        with breaker.guard(_clock.time()):
+            if FIXTURE_METADATA_CACHE:
+                # Team and league names come from the metadata cache; the poll carries only what changes
+                matches = join_fixture_metadata(api_key, _poll_inplay(api_key, LIVE_MINIMAL))
+                fixture_metadata.expire()
+            else:
+                matches = _poll_inplay(api_key, LIVE_FULL)
+        with metrics.parse_seconds.time():
+            live_matches = parse_live_matches(matches)
+        observe_match_clocks(matches, _clock.time())
         
-        print(f"✅ Filtered live matches: {len(live_matches)}")
+        logger.debug("✅ Filtered live matches: %d of %d from API", len(live_matches), len(matches))
         return live_matches
         
     except Exception as e:
         print(f"❌ Error getting live matches: {e}")
-        return []
+        return None
+
+def parse_live_matches(matches):
+    """Dashboard match dicts for the ticking, displayable fixtures in a raw inplay payload"""
+    live_matches = []
+    
+    for match in matches:
+        periods = match.get('periods', [])
+        has_ticking = any(period.get('ticking', False) for period in periods)
+        
+        if has_ticking:
+            match_data = extract_match_data(match)
+            if match_data and is_valid_live_match(match_data):
+                live_matches.append(match_data)
+    
+    return live_matches
+
+def observe_match_clocks(matches, received_at):
+    """Feed every polled fixture's periods to the match-clock model"""
+    for match in matches:
+        if match.get('id'):
+            match_clock.observe(match['id'], match.get('periods', []), received_at)
+    match_clock.retain(match['id'] for match in matches if match.get('id'))
+
+def next_update_delay():
+    """Seconds until the next cycle: the regular interval, or just after a clock surely reaches 85:00"""
+    crossing = match_clock.next_crossing(ALERT_WINDOW[0], _clock.time())
+    if crossing is None or crossing + CLOCK_WAKE_MARGIN_SECONDS >= UPDATE_INTERVAL_SECONDS:
+        return UPDATE_INTERVAL_SECONDS
+    return max(UPDATE_MIN_GAP_SECONDS, crossing + CLOCK_WAKE_MARGIN_SECONDS)
 
 def is_valid_live_match(match_data):
     """Check if a match is valid for display (has stats and reasonable time)"""
@@ -513,271 +644,392 @@ def extract_live_statistics(match):
             'has_premium_stats': False
         }
 
+def parse_corner_odds(all_odds):
+    """Build the corner odds summary (bet365 Asian Total Corners, whole-number lines) from raw inplay odds"""
+    # Extract bet365 Asian corner odds with detailed values
+    bet365_corner_odds = []
+    total_corner_markets = 0
+    
+    for odds in all_odds:
+        market_id = odds.get('market_id')
+        bookmaker_id = odds.get('bookmaker_id')
+        
+        # Only check Market 61 (Asian Total Corners) from bet365
+        if market_id == 61:  # Only Asian Total Corners, not Asian Handicap (62)
+            total_corner_markets += 1
+            if bookmaker_id == 2:  # bet365 specifically
+                # Extract detailed odds info
+                odds_info = {
+                    'label': odds.get('label', 'Unknown'),
+                    'value': odds.get('value', 'N/A'),
+                    'total': odds.get('total', 'N/A'),
+                    'probability': odds.get('probability', 'N/A'),
+                    'suspended': odds.get('suspended', False),
+                    'stopped': odds.get('stopped', False)
+                }
+                bet365_corner_odds.append(odds_info)
+    
+    # Create readable odds details for logging/display
+    odds_details = []
+    active_odds = []
+    
+    for odds in bet365_corner_odds:
+        total = odds['total']
+        label = odds['label']
+        value = odds['value']
+        suspended = odds['suspended']
+        stopped = odds['stopped']
+        
+        # WHOLE NUMBER FILTER: Only allow whole number corner totals (8, 9, 10, 11...)
+        # Reject .5 totals (8.5, 9.5, 10.5...) to enable refund possibilities
+        try:
+            total_float = float(total)
+            if total_float != int(total_float):  # If it's not a whole number
+                continue  # Skip this odds entry
+        except (ValueError, TypeError):
+            continue  # Skip if total can't be converted to number
+        
+        # Format: "Over 10 = 2.02" or "Under 9 = 1.77 (suspended)"
+        status = ""
+        if suspended or stopped:
+            status = " (suspended)"
+            
+        odds_str = f"{label} {total} = {value}{status}"
+        odds_details.append(odds_str)
+        
+        # Track active (non-suspended) odds
+        if not suspended and not stopped:
+            active_odds.append(odds_str)
+    
+    return {
+        'available': len(bet365_corner_odds) > 0,
+        'count': len(bet365_corner_odds),
+        'active_count': len(active_odds),
+        'total_corner_markets': total_corner_markets,
+        'total_odds': len(all_odds),
+        'odds_details': odds_details,
+        'active_odds': active_odds,
+        'corner_odds_data': bet365_corner_odds  # Full data for alerts
+    }
+
 def check_corner_odds_available(match_id):
     """Quick check if Asian corner odds are available for a match"""
+    with metrics.odds_fetch_seconds.time(source='dashboard'):
+        return _check_corner_odds_available(match_id)
+
+def _check_corner_odds_available(match_id):
     try:
         # Update last check time for rate limiting
-        last_odds_check_time[match_id] = time.time()
+        last_odds_check_time[match_id] = _clock.time()
+        
+        # Check cache first (valid for 2 minutes)
+        if match_id in odds_cache:
+            cache_time, cache_data = odds_cache[match_id]
+            if _clock.time() - cache_time < 120:  # 2 minutes cache
+                metrics.record_cache('odds', hit=True)
+                return cache_data
         
-        # Check if we can make the odds request
-        if not can_make_request('odds'):
-            print(f"⚠️ Rate limit approaching for odds entity, using cache for match {match_id}")
+        # Check if we can make the odds request (rate limit, and no SportMonks outage on odds)
+        odds_breaker = circuit_breaker('odds')
+        rate_limited = not can_make_request('odds')
+        if rate_limited or not odds_breaker.allow(_clock.time()):
+            reason = "Rate limit approaching" if rate_limited else "Circuit open"
+            logger.warning("⚠️ %s for odds entity, using cache for match %s", reason, match_id)
             # Return cached data if available
             if match_id in odds_cache:
                 cache_time, cache_data = odds_cache[match_id]
-                if time.time() - cache_time < 600:  # 10-minute cache for rate-limited scenarios
+                if _clock.time() - cache_time < 600:  # 10-minute cache for rate-limited scenarios
+                    metrics.record_cache('odds', hit=True)
                     return cache_data
+            metrics.record_cache('odds', hit=False)
             return {'available': False, 'count': 0, 'total_corner_markets': 0, 'total_odds': 0, 'cached': True}
-        
-        # Check cache first (valid for 2 minutes)
-        if match_id in odds_cache:
-            cache_time, cache_data = odds_cache[match_id]
-            if time.time() - cache_time < 120:  # 2 minutes cache
-                return cache_data
+        metrics.record_cache('odds', hit=False)
         
         api_key = os.getenv('SPORTMONKS_API_KEY')
         
         # Use the working general inplay endpoint for quick odds check
-        general_url = f"https://api.sportmonks.com/v3/football/odds/inplay/fixtures/{match_id}"
-        params = {'api_token': api_key}
-        
-        # Shorter timeout for faster checking
-        response = requests.get(general_url, params=params, timeout=5)
-        
-        # Monitor rate limits for odds entity
-        monitor_rate_limits(response, 'odds')
+        general_url = f"{SPORTMONKS_BASE_URL}/odds/inplay/fixtures/{match_id}"
         
-        if response.status_code == 200:
-            all_odds = response.json().get('data', [])
-            
-            # Extract bet365 Asian corner odds with detailed values
-            bet365_corner_odds = []
-            total_corner_markets = 0
-            
-            for odds in all_odds:
-                market_id = odds.get('market_id')
-                bookmaker_id = odds.get('bookmaker_id')
-                
-                # Only check Market 61 (Asian Total Corners) from bet365
-                if market_id == 61:  # Only Asian Total Corners, not Asian Handicap (62)
-                    total_corner_markets += 1
-                    if bookmaker_id == 2:  # bet365 specifically
-                        # Extract detailed odds info
-                        odds_info = {
-                            'label': odds.get('label', 'Unknown'),
-                            'value': odds.get('value', 'N/A'),
-                            'total': odds.get('total', 'N/A'),
-                            'probability': odds.get('probability', 'N/A'),
-                            'suspended': odds.get('suspended', False),
-                            'stopped': odds.get('stopped', False)
-                        }
-                        bet365_corner_odds.append(odds_info)
+        def fetch_page(page):
+            params = dict(page_params(ODDS_CORNERS.params(), page), api_token=api_key)
+            # Shorter timeout for faster checking
+            with metrics.sportmonks_request_seconds.time(entity='odds'):
+                response = requests.get(general_url, params=params, timeout=5)
+            record_response(f"/odds/inplay/fixtures/{match_id}", params, response)
+            record_response_bytes(ODDS_CORNERS.name, response)
+            if response.status_code >= 500:
+                response.raise_for_status()  # Server errors count against the odds circuit
             
-            # Create readable odds details for logging/display
-            odds_details = []
-            active_odds = []
+            # Decode once; rate limits are read from the same payload
+            payload = response.json() if response.status_code == 200 else None
             
-            for odds in bet365_corner_odds:
-                total = odds['total']
-                label = odds['label']
-                value = odds['value']
-                suspended = odds['suspended']
-                stopped = odds['stopped']
-                
-                # WHOLE NUMBER FILTER: Only allow whole number corner totals (8, 9, 10, 11...)
-                # Reject .5 totals (8.5, 9.5, 10.5...) to enable refund possibilities
-                try:
-                    total_float = float(total)
-                    if total_float != int(total_float):  # If it's not a whole number
-                        continue  # Skip this odds entry
-                except (ValueError, TypeError):
-                    continue  # Skip if total can't be converted to number
-                
-                # Format: "Over 10 = 2.02" or "Under 9 = 1.77 (suspended)"
-                status = ""
-                if suspended or stopped:
-                    status = " (suspended)"
-                    
-                odds_str = f"{label} {total} = {value}{status}"
-                odds_details.append(odds_str)
-                
-                # Track active (non-suspended) odds
-                if not suspended and not stopped:
-                    active_odds.append(odds_str)
+            # Monitor rate limits for odds entity
+            monitor_rate_limits(response, 'odds', payload)
+            return payload
+        
+        # Every page of the odds book (an unavailable first page means no odds; a later one raises)
+        with odds_breaker.guard(_clock.time()):
+            pages = list(iter_pages(fetch_page, budget=lambda calls: can_make_request('odds', calls)))
+        
+        if pages:
+            all_odds = [odds for payload in pages for odds in payload.get('data', [])]
             
-            result = {
-                'available': len(bet365_corner_odds) > 0,
-                'count': len(bet365_corner_odds),
-                'active_count': len(active_odds),
-                'total_corner_markets': total_corner_markets,
-                'total_odds': len(all_odds),
-                'odds_details': odds_details,
-                'active_odds': active_odds,
-                'corner_odds_data': bet365_corner_odds  # Full data for alerts
-            }
+            result = parse_corner_odds(all_odds)
             
             # Cache the result
-            odds_cache[match_id] = (time.time(), result)
+            odds_cache[match_id] = (_clock.time(), result)
             return result
         else:
             result = {'available': False, 'count': 0, 'total_corner_markets': 0, 'total_odds': 0}
-            odds_cache[match_id] = (time.time(), result)
+            odds_cache[match_id] = (_clock.time(), result)
             return result
             
     except Exception as e:
         # Don't let individual failures break the whole process
         result = {'available': False, 'count': 0, 'total_corner_markets': 0, 'total_odds': 0, 'error': str(e)}
-        odds_cache[match_id] = (time.time(), result)
+        odds_cache[match_id] = (_clock.time(), result)
         return result
 
+def get_draw_odds(match_id):
+    """Live draw price (Fulltime Result), cached for DRAW_ODDS_CACHE_SECONDS"""
+    global _draw_odds_client
+    cached = draw_odds_cache.get(match_id)
+    if cached and _clock.time() - cached[0] < DRAW_ODDS_CACHE_SECONDS:
+        metrics.record_cache('draw_odds', hit=True)
+        return cached[1]
+    metrics.record_cache('draw_odds', hit=False)
+    if not can_make_request('odds', required_calls=2):
+        return cached[1] if cached else None
+    try:
+        if _draw_odds_client is None:
+            from sportmonks_client import SportmonksClient
+            _draw_odds_client = SportmonksClient()
+        draw_odds = _draw_odds_client.get_live_draw_odds(match_id)
+    except Exception as e:
+        logger.warning("⚠️ Draw odds fetch failed for match %s: %s", match_id, e)
+        draw_odds = None
+    draw_odds_cache[match_id] = (_clock.time(), draw_odds)
+    return draw_odds
+
+def attach_momentum(matches):
+    """Feed this cycle's stats to the batch momentum engine and attach match['momentum']"""
+    try:
+        with metrics.momentum_compute_seconds.time(engine='batch'):
+            momentum_engine.add_dashboard_matches(matches)
+            momentum_engine.retain(m['match_id'] for m in matches)
+            scores = momentum_engine.scores_by_fixture()
+        for match in matches:
+            score = scores.get(match['match_id'])
+            if score:
+                match['momentum'] = {
+                    'home': score['home']['total'],
+                    'away': score['away']['total'],
+                    'combined': score['home']['total'] + score['away']['total'],
+                    'window_covered': score['home']['window_covered'],
+                }
+    except Exception as e:
+        logger.warning("⚠️ Momentum batch failed: %s", e)
+
+def cached_draw_odds(match_id):
+    """Fresh cached draw price, never fetched (None when unknown)"""
+    cached = draw_odds_cache.get(match_id)
+    if cached and _clock.time() - cached[0] < DRAW_ODDS_CACHE_SECONDS:
+        return cached[1]
+    return None
+
+def run_strategies(frame):
+    """Evaluate every registered strategy over this cycle's feature frame (no API calls)"""
+    try:
+        fired = strategy_registry.evaluate_cycle(frame.rows(), frame.ts)
+    except Exception as e:
+        logger.warning("⚠️ Strategy evaluation failed: %s", e)
+        return 0
+    for name, alerts in fired.items():
+        for alert in alerts:
+            logger.info("🧪 STRATEGY %s would alert on match %s: %s", name, alert['fixture_id'], alert)
+    return sum(len(alerts) for alerts in fired.values())
+
+def count_close_games(frame):
+    """Matches within two goals (score_state caps at 2, so it cannot tell a 3-0 from a 2-0)"""
+    return frame.count(np.abs(frame['goal_difference']) <= 2)
+
+def run_update_cycle():
+    """One update cycle: fetch live matches, run 85' alerts, attach odds, publish"""
+    global live_matches_data, dashboard_stats, live_data_fetched_at
+    
+    cycle_start = time.time()
+    
+    # Get fresh data
+    matches = fetch_live_matches()
+    if matches is None:
+        # No fresh data (API down, circuit open, rate limited): keep serving the last good snapshot
+        return publish_last_good_snapshot()
+    
+    # Update global data
+    live_matches_data = matches
+    live_data_fetched_at = _clock.time()
+    
+    # Drop stat windows of fixtures that have left the live feed
+    stat_windows.discard_stale(m['match_id'] for m in matches)
+    
+    # Momentum10 for every live match in one batch (shown on late-game cards)
+    attach_momentum(matches)
+    
+    # Calculate stats focused on 85-minute corner alert system
+    alert_ready_matches = [m for m in matches if m['minute'] >= 85]  # Matches at alert time
+    matches_with_stats = [m for m in matches if m['statistics']['total_stats_available'] > 0]
+    
+    # STEP 1: Trigger 85-minute alerts for qualified matches
+    alerts_triggered = 0
+    for match in alert_ready_matches:
+        if match['statistics']['has_corners'] and match.get('corner_odds', {}).get('available', False):
+            if trigger_85_minute_alert(match):
+                alerts_triggered += 1
+                logger.info("✅ ALERT SENT for %s vs %s", match['home_team'], match['away_team'])
+            else:
+                logger.debug("❌ ALERT REJECTED for %s vs %s", match['home_team'], match['away_team'])
+        elif logger.isEnabledFor(logging.DEBUG):
+            reasons = []
+            if not match['statistics']['has_corners']:
+                reasons.append("no corner stats")
+            if not match.get('corner_odds', {}).get('available', False):
+                reasons.append("no Asian corner odds")
+            logger.debug("❌ SKIPPED %s (%s'): Missing requirements - %s", match['match_id'], match['minute'], ', '.join(reasons))
+    
+    # STEP 2: Fetch corner odds ahead of the alert window
+    checked_count = 0
+    if ODDS_PREWARM_ENABLED:
+        # Only fixtures that could still qualify at 85', fetched at 83-84' (see odds_prewarm)
+        odds_prewarmer.observe(matches)
+        check_ids = {m['match_id'] for m in odds_prewarmer.select(matches_with_stats, _clock.time())}
+    else:
+        # Legacy: every 70-90' match with corner stats, every 2 minutes
+        check_ids = {m['match_id'] for m in matches_with_stats if should_check_odds(m)}
+    
+    for match in matches_with_stats:
+        if match['match_id'] in check_ids:
+            checked_count += 1
+            odds_check = check_corner_odds_available(match['match_id'])
+            if ODDS_PREWARM_ENABLED and odds_check['available']:
+                get_draw_odds(match['match_id'])  # Warm the draw price for the draw-odds rule too
+            if odds_check['available']:
+                match['corner_odds'] = odds_check
+                
+                logger.debug("✅ MINUTE %s: match %s has %s bet365 Asian corner markets (%s active): %s",
+                             match['minute'], match['match_id'], odds_check.get('count', 0),
+                             odds_check.get('active_count', 0), odds_check.get('active_odds') or [])
+            else:
+                logger.debug("❌ MINUTE %s: No corner odds available for match %s", match['minute'], match['match_id'])
+                
+                # Attach "no odds" data so dashboard can show NO ODDS section
+                match['corner_odds'] = {
+                    'available': False,
+                    'count': 0,
+                    'active_count': 0,
+                    'total_corner_markets': 0,
+                    'total_odds': 0,
+                    'odds_details': [],
+                    'active_odds': []
+                }
+        else:
+            # Check cached odds for display purposes
+            if match['match_id'] in odds_cache:
+                cache_time, cache_data = odds_cache[match['match_id']]
+                if _clock.time() - cache_time < 300:  # 5-minute cache
+                    if cache_data['available']:
+                        match['corner_odds'] = cache_data
+    
+    # Ensure all matches in 70-90 minute window have corner_odds data for dashboard display
+    for match in matches:
+        if 70 <= match['minute'] <= 90 and 'corner_odds' not in match:
+            # Add default "no odds" data for dashboard display
+            match['corner_odds'] = {
+                'available': False,
+                'count': 0,
+                'active_count': 0,
+                'total_corner_markets': 0,
+                'total_odds': 0,
+                'odds_details': [],
+                'active_odds': []
+            }
+    
+    # Derived features for this data version, computed once and shared by everything below
+    now = _clock.time()
+    frame = feature_stage.build(matches, live_publisher.version + 1, now, draw_odds=cached_draw_odds,
+                                seconds_to_alert=lambda fid: match_clock.seconds_until(fid, ALERT_WINDOW[0], now))
+    minute = frame['minute']
+    ready = (minute >= 85) & frame['has_corners'] & frame['corner_odds_available']
+    
+    # Every registered strategy (production mirrors and shadow candidates) over the same data
+    strategy_alerts = run_strategies(frame)
+    
+    dashboard_stats = {
+        'total_live': len(frame),
+        'late_games': frame.count((minute >= 70) & (minute <= 90)),  # 70-90 minute matches (extended odds window)
+        'draws': frame.count(frame['is_draw']),
+        'close_games': count_close_games(frame),
+        'critical_games': frame.count(minute >= 85),  # 85+ minute matches (alert time)
+        'with_stats': frame.count(frame['stats_available'] > 0),
+        'with_corners': frame.count(frame['has_corners']),
+        'with_odds': frame.count(frame['corner_odds_available']),  # Matches with corner odds available
+        'alerts_triggered': alerts_triggered,  # New: Track alerts sent this cycle
+        'in_alert_window': frame.count((minute >= 70) & (minute <= 90)),  # Matches in 70-90 minute window
+        'ready_for_alerts': frame.count(ready),  # Matches that could trigger alerts
+        'last_update': datetime.now().strftime('%H:%M:%S'),
+        'stale': False,
+        'data_age_seconds': 0
+    }
+    
+    # Publish the finished cycle once; SSE viewers get per-fixture diffs from this version
+    live_publisher.publish(matches, dashboard_stats, data_at=live_data_fetched_at)
+    # Minute-by-minute history for backtests (queued, written off the update thread)
+    record_snapshot(frame, frame.ts)
+    
+    log_summary(logger, "📈 Dashboard updated", version=live_publisher.version, live=len(matches),
+                late=dashboard_stats['late_games'], at_alert_time=dashboard_stats['critical_games'],
+                with_stats=len(matches_with_stats), odds_checked=checked_count, with_odds=dashboard_stats['with_odds'],
+                alerts=alerts_triggered, strategy_alerts=strategy_alerts, duration_ms=round((time.time() - cycle_start) * 1000, 1))
+    
+    return matches
+
+def publish_last_good_snapshot():
+    """Republish the last good matches marked with their age (dropped after STALE_SNAPSHOT_MAX_AGE_SECONDS)"""
+    global live_matches_data, dashboard_stats
+    age = None if live_data_fetched_at is None else _clock.time() - live_data_fetched_at
+    if age is None or age > STALE_SNAPSHOT_MAX_AGE_SECONDS:
+        live_matches_data = []
+    dashboard_stats = dict(dashboard_stats, stale=True, data_age_seconds=None if age is None else round(age),
+                           total_live=len(live_matches_data))
+    live_publisher.publish(live_matches_data, dashboard_stats, data_at=live_data_fetched_at)
+    log_summary(logger, "⚠️ Dashboard serving last good snapshot", version=live_publisher.version,
+                live=len(live_matches_data), data_age_s=dashboard_stats['data_age_seconds'],
+                circuits=','.join(f"{name}={info['state']}" for name, info in circuit_report().items()))
+    return live_matches_data
+
 def update_live_data():
     """Update live data in background"""
     
     print("🔄 Background updater thread started!")
     
-    global live_matches_data, dashboard_stats
-    
     while True:
         try:
-            print(f"🔄 Starting data update at {datetime.now().strftime('%H:%M:%S')}")
-            
-            # Get fresh data
-            matches = get_live_matches()
-            print(f"📊 Got {len(matches)} matches from API")
-            
-            # Update global data
-            live_matches_data = matches
-            
-            # Calculate stats focused on 85-minute corner alert system
-            alert_ready_matches = [m for m in matches if m['minute'] >= 85]  # Matches at alert time
-            approaching_alert_matches = [m for m in matches if 70 <= m['minute'] <= 90]  # Preparing for alerts (extended window)
-            matches_with_stats = [m for m in matches if m['statistics']['total_stats_available'] > 0]
-            
-            print(f"🚨 Alert System Status:")
-            print(f"   • {len(alert_ready_matches)} matches at 85+ minutes (alert time)")
-            print(f"   • {len(approaching_alert_matches)} matches in extended odds window (70-90 min)")
-            print(f"   • {len(matches_with_stats)} matches with live stats total")
-            
-            # STEP 1: Trigger 85-minute alerts for qualified matches
-            alerts_triggered = 0
-            for match in alert_ready_matches:
-                print(f"\n🎯 CHECKING ALERT ELIGIBILITY: {match['home_team']} vs {match['away_team']} ({match['minute']}')")
-                print(f"   • Has corner stats: {match['statistics']['has_corners']}")
-                print(f"   • Has corner odds: {match.get('corner_odds', {}).get('available', False)}")
-                
-                if match['statistics']['has_corners'] and match.get('corner_odds', {}).get('available', False):
-                    if trigger_85_minute_alert(match):
-                        alerts_triggered += 1
-                        print(f"✅ ALERT SENT for {match['home_team']} vs {match['away_team']}")
-                    else:
-                        print(f"❌ ALERT REJECTED for {match['home_team']} vs {match['away_team']}")
-                else:
-                    reasons = []
-                    if not match['statistics']['has_corners']:
-                        reasons.append("no corner stats")
-                    if not match.get('corner_odds', {}).get('available', False):
-                        reasons.append("no Asian corner odds")
-                    print(f"❌ SKIPPED: Missing requirements - {', '.join(reasons)}")
-            
-            if alerts_triggered > 0:
-                print(f"🚨 TRIGGERED {alerts_triggered} CORNER ALERTS!")
-            else:
-                print(f"📊 No alerts triggered this cycle")
-            
-            # STEP 2: Check corner odds for matches in extended window (70-90 minutes)
-            matches_with_odds = 0
-            checked_count = 0
-            
-            for match in matches_with_stats:
-                if should_check_odds(match):  # Now checks 70-90 minute matches
-                    checked_count += 1
-                    print(f"🎯 MINUTE {match['minute']}: Checking odds for match {match['match_id']} ({match['home_team']} vs {match['away_team']})")
-                    odds_check = check_corner_odds_available(match['match_id'])
-                    if odds_check['available']:
-                        matches_with_odds += 1
-                        match['corner_odds'] = odds_check
-                        
-                        total_count = odds_check.get('count', 0)
-                        active_count = odds_check.get('active_count', 0)
-                        suspended_count = total_count - active_count
-                        
-                        print(f"✅ MINUTE {match['minute']}: Corner odds available! {total_count} bet365 Asian corner markets")
-                        print(f"   🟢 ACTIVE (bettable): {active_count} markets | 🔶 SUSPENDED: {suspended_count} markets")
-                        
-                        # Show active odds first (the important ones)
-                        if 'active_odds' in odds_check and odds_check['active_odds']:
-                            print(f"   💎 ACTIVE ODDS (bettable now):")
-                            for odds_str in odds_check['active_odds']:
-                                print(f"      • {odds_str}")
-                        
-                        # Show all odds if there are suspended ones too
-                        if 'odds_details' in odds_check and len(odds_check['odds_details']) > active_count:
-                            print(f"   📊 ALL ODDS (including suspended): {', '.join(odds_check['odds_details'])}")
-                            
-                        print(f"   ⚡ Late Momentum system will use these LIVE odds if match qualifies at 85'")
-                    else:
-                        print(f"❌ MINUTE {match['minute']}: No corner odds available for match {match['match_id']}")
-                        print(f"   ⚠️ Late Momentum system will re-check for odds if this match qualifies at 85'")
-                        
-                        # Attach "no odds" data so dashboard can show NO ODDS section
-                        match['corner_odds'] = {
-                            'available': False,
-                            'count': 0,
-                            'active_count': 0,
-                            'total_corner_markets': 0,
-                            'total_odds': 0,
-                            'odds_details': [],
-                            'active_odds': []
-                        }
-                else:
-                    # Check cached odds for display purposes
-                    if match['match_id'] in odds_cache:
-                        cache_time, cache_data = odds_cache[match['match_id']]
-                        if time.time() - cache_time < 300:  # 5-minute cache
-                            if cache_data['available']:
-                                matches_with_odds += 1
-                                match['corner_odds'] = cache_data
-            
-            print(f"📊 Pre-alert preparation: checked {checked_count} matches, {matches_with_odds} with corner odds ready")
-            
-            # Ensure all matches in 70-90 minute window have corner_odds data for dashboard display
-            for match in matches:
-                if 70 <= match['minute'] <= 90 and 'corner_odds' not in match:
-                    # Add default "no odds" data for dashboard display
-                    match['corner_odds'] = {
-                        'available': False,
-                        'count': 0,
-                        'active_count': 0,
-                        'total_corner_markets': 0,
-                        'total_odds': 0,
-                        'odds_details': [],
-                        'active_odds': []
-                    }
-            
-            dashboard_stats = {
-                'total_live': len(matches),
-                'late_games': len(approaching_alert_matches),  # 70-90 minute matches (extended odds window)
-                'draws': len([m for m in matches if m['is_draw']]),
-                'close_games': len([m for m in matches if m['is_close']]),
-                'critical_games': len(alert_ready_matches),  # 85+ minute matches (alert time)
-                'with_stats': len([m for m in matches if m['statistics']['total_stats_available'] > 0]),
-                'with_corners': len([m for m in matches if m['statistics']['has_corners']]),
-                'with_odds': matches_with_odds,  # Matches with corner odds available
-                'alerts_triggered': alerts_triggered,  # New: Track alerts sent this cycle
-                'in_alert_window': len(approaching_alert_matches),  # Matches in 70-90 minute window
-                'ready_for_alerts': len([m for m in alert_ready_matches if m['statistics']['has_corners'] and m.get('corner_odds', {}).get('available', False)]),  # Matches that could trigger alerts
-                'last_update': datetime.now().strftime('%H:%M:%S')
-            }
-            
-            print(f"📈 Dashboard updated: {dashboard_stats['total_live']} live matches, {dashboard_stats['with_odds']} with odds at {dashboard_stats['last_update']}")
-            print(f"🎯 LATE MOMENTUM: Monitoring draws and up to 2-goal differences (no blowouts)")
-            
+            run_update_cycle()
         except Exception as e:
             print(f"❌ Error updating data: {e}")
             import traceback
             print(f"🔍 Full error: {traceback.format_exc()}")
         
-        time.sleep(45)  # Update every 45 seconds (reduced from 8 to avoid rate limits)
+        # Every 45 seconds (reduced from 8 to avoid rate limits); a cycle due just after a fixture
+        # reaches 85:00 is moved forward to that moment instead, and the cadence continues from there
+        _clock.sleep(next_update_delay())
+
+def apply_shared_snapshot(version, matches, stats, data_at, epoch):
+    """Web worker (production mode): take a version produced by the ingestor, keeping its numbering"""
+    global live_matches_data, dashboard_stats, live_data_fetched_at
+    live_matches_data = matches
+    dashboard_stats = stats
+    live_data_fetched_at = data_at
+    live_publisher.publish(matches, stats, data_at=data_at, version=version, epoch=epoch)
 
 # Corner count sweet spot analysis (research-optimized)
 CORNER_COUNT_SCORING = {
@@ -804,11 +1056,9 @@ def evaluate_corner_potential(match):
     stats = match.get('statistics', {})
     minute = match.get('minute', 0)
     
-    print(f"📊 EVALUATING TIER 1 POTENTIAL for match at {minute} minutes")
-    
     # Only evaluate matches in the 84:30-85:15 window
     if minute < 84 or minute > 85:
-        print(f"❌ Outside TIER 1 window: {minute} minutes (need 84:30-85:15)")
+        logger.debug("❌ Outside TIER 1 window: %s minutes (need 84:30-85:15)", minute)
         return None
     
     # TIER 1 STRICT FILTER: Only allow ultra-profitable score lines (0-1 or 1-1)
@@ -818,12 +1068,10 @@ def evaluate_corner_potential(match):
     is_tier1_eligible, tier1_reason = is_tier1_elite_scoreline(home_score, away_score)
     
     if not is_tier1_eligible:
-        print(f"❌ TIER 1 REJECTED: Score {home_score}-{away_score} - {tier1_reason}")
-        print(f"   💡 TIER 1 STRICT: Only accepts 0-1 (away leading) or 1-1 (draw)")
+        # TIER 1 STRICT: Only accepts 0-1 (away leading) or 1-1 (draw)
+        logger.debug("❌ TIER 1 REJECTED: Score %s-%s - %s", home_score, away_score, tier1_reason)
         return None
     
-    print(f"✅ TIER 1 SCORELINE PASSED: {home_score}-{away_score} ({tier1_reason}) - ELITE opportunity!")
-    
     home_stats = stats.get('home', {})
     away_stats = stats.get('away', {})
     
@@ -833,20 +1081,14 @@ def evaluate_corner_potential(match):
     total_shots_on_target = home_stats.get('shots_on_target', 0) + away_stats.get('shots_on_target', 0)
     dangerous_attacks = home_stats.get('dangerous_attacks', 0) + away_stats.get('dangerous_attacks', 0)
     
-    print(f"📈 TIER 1 CORE STATS:")
-    print(f"   • Total Corners: {total_corners} (need 6-10)")
-    print(f"   • Total Shots on Target: {total_shots_on_target} (need 7-9)")
-    print(f"   • Total Shots: {total_shots}")
-    print(f"   • Dangerous Attacks: {dangerous_attacks}")
-    
     # TIER 1 Corner Range Check
     if total_corners < 6 or total_corners > 10:
-        print(f"❌ TIER 1 REJECTED: Corners {total_corners} outside 6-10 range")
+        logger.debug("❌ TIER 1 REJECTED: Corners %s outside 6-10 range", total_corners)
         return None
     
     # TIER 1 Shots on Target Check
     if total_shots_on_target < 7 or total_shots_on_target > 9:
-        print(f"❌ TIER 1 REJECTED: Shots on Target {total_shots_on_target} outside 7-9 range")
+        logger.debug("❌ TIER 1 REJECTED: Shots on Target %s outside 7-9 range", total_shots_on_target)
         return None
     
     # Calculate base score using TIER 1 corner ranges
@@ -869,8 +1111,6 @@ def evaluate_corner_potential(match):
         base_score += CORNER_COUNT_SCORING['corners_8_to_11_sweet_spot']
         corner_category = "TIER_1_HIGH"
     
-    print(f"🏷️ TIER 1 CATEGORY: {corner_category}")
-    
     # Statistical activity scores
     activity_score = (
         total_corners * 3 +
@@ -880,19 +1120,14 @@ def evaluate_corner_potential(match):
     )
     base_score += activity_score
     
-    print(f"📊 TIER 1 ACTIVITY SCORING:")
-    print(f"   • Corners × 3: {total_corners * 3:.1f}")
-    print(f"   • Shots on Target × 2: {total_shots_on_target * 2:.1f}")
-    print(f"   • Total Shots × 1.5: {total_shots * 1.5:.1f}")
-    print(f"   • Dangerous Attacks × 0.3: {dangerous_attacks * 0.3:.1f}")
-    print(f"   • Activity Subtotal: {activity_score:.1f}")
-    
     # Final TIER 1 threshold check
     if base_score < 16.0:
-        print(f"❌ TIER 1 REJECTED: Score {base_score:.1f} below threshold (need 16.0+)")
+        logger.debug("❌ TIER 1 REJECTED: Score %.1f below threshold (need 16.0+)", base_score)
         return None
     
-    print(f"✅ TIER 1 QUALIFIED: Final Score {base_score:.1f}")
+    logger.debug("✅ TIER 1 QUALIFIED: %s, score %.1f (corners %s, shots on target %s, shots %s, "
+                 "dangerous attacks %s, activity %.1f)", corner_category, base_score, total_corners,
+                 total_shots_on_target, total_shots, dangerous_attacks, activity_score)
     
     return {
         'score': base_score,
@@ -997,19 +1232,79 @@ def api_alerts():
         'last_update': datetime.now().strftime('%H:%M:%S')
     })
 
+def _cached_json_response(cached):
+    """Serve a pre-rendered body: 304 on a matching If-None-Match, else the best pre-compressed variant"""
+    body, encoding, etag = cached.select(request.headers.get('Accept-Encoding', ''))
+    revalidated = request.if_none_match.contains(etag)
+    metrics.record_cache('http_etag', hit=revalidated)
+    if revalidated:
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'  # Always revalidate - the ETag makes that cheap
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+def _optional_int_arg(name):
+    value = request.args.get(name)
+    if value in (None, ''):
+        return None
+    return int(value)
+
 @app.route('/api/live-matches')
 def api_live_matches():
-    """API endpoint for live matches data"""
-    return jsonify({
-        'matches': live_matches_data,
-        'stats': dashboard_stats,
-        'alerts_triggered': dashboard_stats.get('alerts_triggered', 0)  # Include alert count
-    })
+    """API endpoint for live matches data
+
+    Optional query params: ``fields`` (comma-separated match keys to keep;
+    match_id is always included), ``min_minute`` and ``max_minute``.
+    """
+    try:
+        min_minute = _optional_int_arg('min_minute')
+        max_minute = _optional_int_arg('max_minute')
+    except ValueError:
+        return jsonify({'error': 'min_minute and max_minute must be integers'}), 400
+    fields = [f.strip() for f in request.args.get('fields', '').split(',') if f.strip()]
+
+    cached = live_publisher.live_matches_body(fields, min_minute, max_minute)
+    if cached is None:
+        # Nothing published yet (updater still on its first cycle)
+        return jsonify({
+            'matches': live_matches_data,
+            'stats': dashboard_stats,
+            'alerts_triggered': dashboard_stats.get('alerts_triggered', 0)  # Include alert count
+        })
+    return _cached_json_response(cached)
+
+@app.route('/api/live-stream')
+def api_live_stream():
+    """Server-Sent Events: full snapshot on connect, then per-fixture diffs per data version"""
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    if not _sse_slots.acquire(blocking=False):
+        # 204 tells EventSource not to reconnect; the page falls back to polling /api/live-matches
+        return Response(status=204)
+    
+    response = Response(
+        live_publisher.sse_stream(last_event_id),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'  # Disable proxy buffering so events arrive immediately
+        }
+    )
+    # The server closes the response once the client is gone (the next heartbeat write fails)
+    response.call_on_close(_sse_slots.release)
+    return response
 
 @app.route('/api/stats')
 def api_stats():
     """API endpoint for just stats"""
-    return jsonify(dashboard_stats)
+    cached = live_publisher.stats_body()
+    if cached is None:
+        return jsonify(dashboard_stats)
+    return _cached_json_response(cached)
 
 @app.route('/health')
 def health_check():
@@ -1020,6 +1315,45 @@ def health_check():
         'timestamp': datetime.now().isoformat()
     })
 
+def record_engine_metrics(name, text):
+    """Keep an engine's latest metrics render (the ingest role's ``engine_metrics`` handler)"""
+    engine_metrics[name] = (time.time(), text)
+
+def render_metrics():
+    """Prometheus text for this process plus recent engine pushes (web workers' scrapes are answered with it)"""
+    # Gauges over state that is already tracked elsewhere are refreshed at scrape time
+    for entity, info in list(rate_limit_info.items()):
+        metrics.rate_limit_remaining.set(info.get('remaining', 0), entity=entity)
+        metrics.rate_limit_resets_in_seconds.set(info.get('resets_in_seconds', 0), entity=entity)
+    metrics.tracked_fixtures.set(len(live_matches_data), component='dashboard_live')
+    metrics.tracked_fixtures.set(len(momentum_engine), component='momentum_batch')
+    metrics.tracked_fixtures.set(len(odds_cache), component='odds_cache')
+    cutoff = time.time() - ENGINE_METRICS_MAX_AGE_SECONDS
+    engines = {name: text for name, (received_at, text) in list(engine_metrics.items()) if received_at >= cutoff}
+    return metrics.merge_expositions(metrics.render(), engines)
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Prometheus text exposition: pipeline latency histograms, API budget and cache gauges"""
+    if snapshot_bus.service_client is None:
+        return Response(render_metrics(), mimetype='text/plain; version=0.0.4')
+    # Web worker: the series live in the ingest process (see metrics.py)
+    try:
+        body = snapshot_bus.service_client.call('metrics')
+    except (ConnectionError, RuntimeError) as e:
+        return Response(f"# ingest metrics unavailable: {e}\n", status=503, mimetype='text/plain; version=0.0.4')
+    return Response(body, mimetype='text/plain; version=0.0.4')
+
+@app.route('/api/strategy-alerts')
+def api_strategy_alerts():
+    """Recent would-be alerts per strategy, plus each strategy's mode, cost and alert counts"""
+    strategy = request.args.get('strategy')
+    alerts = [a for a in strategy_registry.alert_log.recent if strategy is None or a['strategy'] == strategy]
+    return jsonify({
+        'strategies': strategy_registry.report(),
+        'alerts': alerts[::-1],
+    })
+
 @app.route('/system-status')
 def system_status():
     """Debug endpoint to check if alert system thread is running"""
@@ -1039,6 +1373,9 @@ def system_status():
         'alert_system_detected': alert_system_running,
         'timestamp': datetime.now().isoformat(),
         'live_matches_count': len(live_matches_data),
+        'snapshot_version': live_publisher.version,
+        'circuits': circuit_report(),
+        'process_id': os.getpid(),
         'service': 'Late Corner Monitor - System Status Debug'
     })
 
@@ -1066,7 +1403,7 @@ def get_corner_odds(match_id):
         # This is the CRUCIAL endpoint for real-time betting as it only returns odds that changed recently
         try:
             # Use the correct real-time odds endpoint with specific filters
-            updated_odds_url = "https://api.sportmonks.com/v3/football/odds/inplay/latest"
+            updated_odds_url = f"{SPORTMONKS_BASE_URL}/odds/inplay/latest"
             params = {
                 'api_token': api_key,
                 # Remove includes that don't exist for this endpoint - test basic first
@@ -1141,7 +1478,7 @@ def get_corner_odds(match_id):
             try:
                 print(f"🔄 No recent updates found, trying general inplay endpoint for match {match_id}")
                 
-                general_url = f"https://api.sportmonks.com/v3/football/odds/inplay/fixtures/{match_id}"
+                general_url = f"{SPORTMONKS_BASE_URL}/odds/inplay/fixtures/{match_id}"
                 params = {'api_token': api_key}
                 
                 response = requests.get(general_url, params=params, timeout=15)
@@ -1441,6 +1778,7 @@ if __name__ == '__main__':
     try:
         initial_matches = get_live_matches()
         live_matches_data = initial_matches
+        live_data_fetched_at = _clock.time()
         
         dashboard_stats = {
             'total_live': len(initial_matches),
@@ -1455,6 +1793,7 @@ if __name__ == '__main__':
             'last_update': datetime.now().strftime('%H:%M:%S')
         }
         
+        live_publisher.publish(live_matches_data, dashboard_stats)
         print(f"✅ Initial data loaded: {len(initial_matches)} live matches")
         
     except Exception as e:
@@ -1482,6 +1821,7 @@ def start_dashboard_background_thread():
 
 if __name__ == "__main__":
     # When running web_dashboard.py directly
+    configure_logging()
     start_dashboard_background_thread()
     
     print("📊 Open your browser to: http://localhost:5000")
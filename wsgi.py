@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for the dashboard web workers (production mode)
+
+    gunicorn wsgi:app --worker-class gthread --workers 2 --threads 16
+
+Web workers never call SportMonks for live data and never run the alert loop:
+they subscribe to the ingestor over the local snapshot bus and serve
+whatever version it last published. /metrics is answered by the ingestor
+over the service bus. Do not run gunicorn with --preload - each
+worker must start its own subscriber thread after forking.
+"""
+
+from web_dashboard import app, apply_shared_snapshot
+from snapshot_bus import connect_service_client, start_snapshot_subscriber
+
+start_snapshot_subscriber(apply_shared_snapshot)
+connect_service_client()